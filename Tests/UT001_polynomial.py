@@ -5,8 +5,8 @@ Module math_extra_lib.Tests.UT001_polynomial
 Implements unit testing of the module math_extra_lib.polynomial, see TE001.
 """
 
-__version__ = "1.0.0.0"
-__date__ = "07-12-2022"
+__version__ = "1.1.1.0"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -18,6 +18,8 @@ import os
 import unittest
 import copy
 
+from array import array
+
 from random import randint, random, sample
 
 from math import factorial
@@ -40,9 +42,9 @@ class Test_Polynomial(unittest.TestCase):
     """
     Test cases for the class math_extra_lib.polynomial.Polynomial
     
-    Implements tests: TEST-T-100 to TEST-T-10B.
+    Implements tests: TEST-T-100 to TEST-T-10C.
     
-    Covers the requirements: REQ-FUN-100 to REQ-FUN-108 and REQ-AWM-100 to
+    Covers the requirements: REQ-FUN-100 to REQ-FUN-109 and REQ-AWM-100 to
     REQ-AWM-103.
     """
     
@@ -53,6 +55,7 @@ class Test_Polynomial(unittest.TestCase):
         """
         cls.TestClass = testmodule.Polynomial
         cls.NotRealNumber = ['1', (1, 1), [1, 1], {1 : 1}, int, float, bool]
+        cls.IsExact = True #integer coefficients are stored as integers
     
     def setUp(self):
         """
@@ -800,6 +803,82 @@ class Test_Polynomial(unittest.TestCase):
             self.tearDown()
             self.setUp()
     
+    def test_mulPolyHighDegree(self):
+        """
+        Checks multiplication of high degree polynomials, with and without
+        NumPy: exact for integer coefficients, and within the rounding errors
+        for the floating point coefficients.
+        
+        Test ID: TEST-T-107
+        Covers requirements: REQ-FUN-105
+        """
+        Backend = testmodule.np
+        try:
+            for UseNumpy in (True, False):
+                if not UseNumpy:
+                    testmodule.np = None
+                elif Backend is None:
+                    continue
+                for Length1, Length2 in ((40, 35), (100, 700), (501, 501)):
+                    First = [randint(-1000, 1000) for _ in range(Length1)]
+                    First[-1] = randint(1, 1000)
+                    Second = [randint(-10**12, 10**12) for _ in range(Length2)]
+                    Second[-1] = - randint(1, 1000)
+                    Check = [0] * (Length1 + Length2 - 1)
+                    for Index1, Value1 in enumerate(First):
+                        for Index2, Value2 in enumerate(Second):
+                            Check[Index1 + Index2] += Value1 * Value2
+                    Test = self.TestClass(*First) * self.TestClass(*Second)
+                    self.assertIsInstance(Test, self.TestClass)
+                    if self.IsExact:
+                        self.assertTupleEqual(Test.getCoefficients(),
+                                                                tuple(Check))
+                    else:
+                        Scale = max(map(abs, Check))
+                        for Index, Value in enumerate(Check):
+                            self.assertAlmostEqual(Test[Index], Value,
+                                                        delta = 1E-12 * Scale)
+                    First = [random() - 0.5 for _ in range(Length1)]
+                    Second = [random() - 0.5 for _ in range(Length2)]
+                    Check = [0] * (Length1 + Length2 - 1)
+                    for Index1, Value1 in enumerate(First):
+                        for Index2, Value2 in enumerate(Second):
+                            Check[Index1 + Index2] += Value1 * Value2
+                    Test = self.TestClass(*First) * self.TestClass(*Second)
+                    self.assertIsInstance(Test, self.TestClass)
+                    self.assertEqual(Test.Degree, Length1 + Length2 - 2)
+                    for Index, Value in enumerate(Check):
+                        self.assertAlmostEqual(Test[Index], Value, places = 10)
+                #wide dynamic range - the small coefficients must not be lost
+                Binomial = [float(factorial(399) // (factorial(Index)
+                                                * factorial(399 - Index)))
+                                                    for Index in range(400)]
+                Mixed = [(random() - 0.5) * 10**randint(-8, 8)
+                                                        for _ in range(400)]
+                for First, Second in ((Binomial, Binomial), (Mixed, Mixed),
+                                                        (Binomial, Mixed)):
+                    Check = testmodule._MultiplySchoolbook(First, Second)
+                    Test = self.TestClass(*First) * self.TestClass(*Second)
+                    for Index, Value in enumerate(Check):
+                        Scale = sum(abs(First[Index1] * Second[Index - Index1])
+                                    for Index1 in range(max(0, Index - 399),
+                                                        min(Index, 399) + 1))
+                        self.assertAlmostEqual(Test[Index], Value,
+                                                        delta = 1E-12 * Scale)
+                Test = self.TestClass(1, 1)**300
+                Check = tuple(factorial(300) // (factorial(Index)
+                                                * factorial(300 - Index))
+                                                    for Index in range(301))
+                if self.IsExact:
+                    self.assertTupleEqual(Test.getCoefficients(), Check)
+                else:
+                    Scale = max(Check)
+                    for Index, Value in enumerate(Check):
+                        self.assertAlmostEqual(Test[Index], Value,
+                                                        delta = 1E-12 * Scale)
+        finally:
+            testmodule.np = Backend
+    
     def test_addPoly(self):
         """
         Checks polynomial addition.
@@ -832,7 +911,7 @@ class Test_Polynomial(unittest.TestCase):
         del Poly2
         Poly2 = self.TestClass(0, -2, -3, -1)
         Test = Poly1 + Poly2
-        self.assertIsInstance(Test, int)
+        self.assertIsInstance(Test, int if self.IsExact else float)
         self.assertEqual(Test, 1)
         del Test
         for _ in range(10):
@@ -894,7 +973,7 @@ class Test_Polynomial(unittest.TestCase):
         del Poly2
         Poly2 = self.TestClass(0, 2, 3, 1)
         Test = Poly1 - Poly2
-        self.assertIsInstance(Test, int)
+        self.assertIsInstance(Test, int if self.IsExact else float)
         self.assertEqual(Test, 1)
         del Test
         for _ in range(10):
@@ -1077,6 +1156,50 @@ class Test_Polynomial(unittest.TestCase):
             self.tearDown()
             self.setUp()
     
+    def test_calculus_cache(self):
+        """
+        Checks caching of the derivatives and antiderivative of a polynomial.
+        
+        Test ID: TEST-T-108
+        Covers requirements: REQ-FUN-106, REQ-FUN-107
+        """
+        Depth = testmodule.DERIVATIVES_CACHE_DEPTH
+        for _ in range(10):
+            Degree = randint(2, Depth + 4)
+            Coefficients = [randint(-5, 5) + random() for _ in range(Degree)]
+            Coefficients.append(randint(1, 5))
+            TestObject = self.TestClass(*Coefficients)
+            Orders = list(range(1, Degree + 2))
+            for Order in sample(Orders, len(Orders)):
+                Test = TestObject.getDerivative(Order)
+                if Order > Degree:
+                    self.assertEqual(Test, 0)
+                    continue
+                if Order == Degree:
+                    self.assertAlmostEqual(Test,
+                                        factorial(Degree) * Coefficients[-1])
+                    continue
+                self.assertIsInstance(Test, self.TestClass)
+                self.assertEqual(Test.Degree, Degree - Order)
+                for Index, Value in enumerate(Test.getCoefficients()):
+                    CheckValue = Coefficients[Index + Order] * (
+                            factorial(Index + Order) // factorial(Index))
+                    self.assertAlmostEqual(Value, CheckValue)
+                if Order <= Depth:
+                    self.assertIs(TestObject.getDerivative(Order), Test)
+                else:
+                    self.assertIsNot(TestObject.getDerivative(Order), Test)
+            Test = TestObject.getAntiderivative()
+            self.assertIs(TestObject.getAntiderivative(), Test)
+            self.assertEqual(Test.Degree, Degree + 1)
+            self.assertEqual(Test[0], 0)
+            for Index, Value in enumerate(Coefficients, 1):
+                self.assertAlmostEqual(Test[Index], Value / Index)
+            Test = copy.copy(TestObject)
+            self.assertIsNot(Test.getDerivative(), TestObject.getDerivative())
+            self.assertIsNot(Test.getAntiderivative(),
+                                                TestObject.getAntiderivative())
+    
     def test_derivative(self):
         """
         Checks polynomial anti-derivative calculation.
@@ -1327,14 +1450,153 @@ class Test_Polynomial(unittest.TestCase):
             self.TestObject.getConvolution(1.0)
         with self.assertRaises(TypeError):
             self.TestObject.getConvolution(1)
+    
+    def test_evaluateMany(self):
+        """
+        Checks the batch evaluation of a polynomial with and without NumPy.
+        
+        Test ID: TEST-T-10C
+        Covers requirements: REQ-FUN-109
+        """
+        Backend = testmodule.np
+        try:
+            for UseNumpy in (True, False):
+                if not UseNumpy:
+                    testmodule.np = None
+                elif Backend is None:
+                    continue
+                for _ in range(10):
+                    Values = [randint(-5, 5) + random()
+                                            for _ in range(randint(1, 100))]
+                    Checks = [self.TestObject(Value) for Value in Values]
+                    for Batch in (Values, tuple(Values), array('d', Values),
+                                                    memoryview(array('d', Values))):
+                        Result = self.TestObject.evaluateMany(Batch)
+                        self.assertIsInstance(Result, list)
+                        self.assertEqual(len(Result), len(Values))
+                        for Check, Test in zip(Checks, Result):
+                            self.assertAlmostEqual(Check, Test)
+                    Values = [randint(-5, 5) for _ in range(randint(1, 100))]
+                    Result = self.TestObject.evaluateMany(array('i', Values))
+                    for Value, Test in zip(Values, Result):
+                        self.assertAlmostEqual(self.TestObject(Value), Test)
+                self.assertListEqual(self.TestObject.evaluateMany([]), [])
+                if UseNumpy:
+                    Values = Backend.linspace(-5, 5, 101)
+                    Result = self.TestObject.evaluateMany(Values)
+                    self.assertIsInstance(Result, Backend.ndarray)
+                    for Value, Test in zip(Values.tolist(), Result.tolist()):
+                        self.assertAlmostEqual(self.TestObject(Value), Test)
+        finally:
+            testmodule.np = Backend
+    
+    def test_evaluateMany_TypeError(self):
+        """
+        Checks that improper type arguments are rejected by the batch
+        evaluation.
+        
+        Test ID: TEST-T-10A
+        Covers requirements: REQ-AWM-102
+        """
+        Backend = testmodule.np
+        try:
+            for UseNumpy in (True, False):
+                if not UseNumpy:
+                    testmodule.np = None
+                elif Backend is None:
+                    continue
+                for Value in self.NotRealNumber:
+                    if isinstance(Value, (list, tuple)):
+                        continue
+                    with self.assertRaises(TypeError):
+                        self.TestObject.evaluateMany(Value)
+                    with self.assertRaises(TypeError):
+                        self.TestObject.evaluateMany([1, Value, 2.0])
+                for Value in (1, 1.0, b'12', bytearray(b'12'), array('u', 'ab'),
+                                                            self.SecondObject):
+                    with self.assertRaises(TypeError):
+                        self.TestObject.evaluateMany(Value)
+        finally:
+            testmodule.np = Backend
+
+class Test_CompactPolynomial(Test_Polynomial):
+    """
+    Test cases for the class math_extra_lib.polynomial.CompactPolynomial
+    
+    Implements tests: TEST-T-100 to TEST-T-10D.
+    
+    Covers the requirements: REQ-FUN-100 to REQ-FUN-10A and REQ-AWM-100 to
+    REQ-AWM-103.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        super().setUpClass()
+        cls.TestClass = testmodule.CompactPolynomial
+        cls.IsExact = False #all coefficients are stored as floats
+    
+    def test_compactStorage(self):
+        """
+        Checks the compact storage of the coefficients, the mixed arithmetics
+        with the standard polynomials and the read-only export of the
+        coefficients.
+        
+        Test ID: TEST-T-10D
+        Covers requirements: REQ-FUN-10A
+        """
+        for Object in (self.TestObject, self.SecondObject):
+            self.assertFalse(hasattr(Object, '__dict__'))
+            Buffer = Object.getBuffer()
+            self.assertIsInstance(Buffer, memoryview)
+            self.assertTrue(Buffer.readonly)
+            self.assertEqual(Buffer.format, 'd')
+            self.assertEqual(Buffer.ndim, 1)
+            self.assertListEqual(Buffer.tolist(),
+                                            list(Object.getCoefficients()))
+            with self.assertRaises(TypeError):
+                Buffer[0] = 1.0
+            if sys.version_info[:2] >= (3, 12):
+                Buffer = memoryview(Object)
+                self.assertTrue(Buffer.readonly)
+                self.assertListEqual(Buffer.tolist(),
+                                            list(Object.getCoefficients()))
+            if not (testmodule.np is None):
+                Array = testmodule.np.frombuffer(Object.getBuffer())
+                self.assertFalse(Array.flags.writeable)
+                self.assertListEqual(Array.tolist(),
+                                            list(Object.getCoefficients()))
+            Standard = testmodule.Polynomial(*Object.getCoefficients())
+            self.assertFalse(hasattr(Standard, '__dict__'))
+            self.assertLess(sys.getsizeof(Object)
+                                    + sys.getsizeof(Object.getBuffer().obj),
+                            sys.getsizeof(Standard)
+                                + sys.getsizeof(Standard.getCoefficients())
+                                + sum(map(sys.getsizeof,
+                                                Standard.getCoefficients())))
+            for Result in (Object + Standard, Object - 2 * Standard,
+                            Object * Standard, Object.getConvolution(Standard),
+                            divmod(Object * Standard, Standard)[0]):
+                self.assertIsInstance(Result, self.TestClass)
+            for Result in (Standard + 2 * Object, Standard - 2 * Object,
+                            Standard * Object, Standard.getConvolution(Object)):
+                self.assertIs(type(Result), testmodule.Polynomial)
+        Object = self.TestClass(1, 2, 3)
+        self.assertTupleEqual(Object.getCoefficients(), (1.0, 2.0, 3.0))
+        for Value in Object.getCoefficients():
+            self.assertIsInstance(Value, float)
+        with self.assertRaises(ValueError):
+            self.TestClass(1, 10**400)
 
 class Test_Rational(unittest.TestCase):
     """
     Test cases for the class math_extra_lib.polynomial.RationalFunction
     
-    Implements tests: TEST-T-110 to TEST-T-114.
+    Implements tests: TEST-T-110 to TEST-T-115.
     
-    Covers the requirements: REQ-FUN-110 to REQ-FUN-112 and REQ-AWM-110 to
+    Covers the requirements: REQ-FUN-110 to REQ-FUN-113 and REQ-AWM-110 to
     REQ-AWM-113.
     """
     
@@ -1483,6 +1745,70 @@ class Test_Rational(unittest.TestCase):
             self.assertAlmostEqual(CheckValue, TestValue)
             del TestObject
     
+    def test_evaluateMany(self):
+        """
+        Checks the batch evaluation of a rational function with and without
+        NumPy, including the removable singularities and the division by zero.
+        
+        Test ID: TEST-T-115
+        Covers requirements: REQ-FUN-113, REQ-AWM-113
+        """
+        Backend = testmodule.np
+        try:
+            for UseNumpy in (True, False):
+                if not UseNumpy:
+                    testmodule.np = None
+                elif Backend is None:
+                    continue
+                for _ in range(10):
+                    Degree1 = randint(1, 5)
+                    Degree2 = randint(1, 5)
+                    Coefficients1 = [randint(-5, 5) + random()
+                                                    for _ in range(Degree1)]
+                    Coefficients2 = [randint(-5, 5) + random()
+                                                    for _ in range(Degree2)]
+                    Coefficients1.append(randint(1, 5))
+                    Coefficients2.append(randint(1, 5))
+                    Root = randint(-3, 3)
+                    ExtraPoly = testmodule.Polynomial(-Root, 1)**randint(1, 3)
+                    Divident = testmodule.Polynomial(*Coefficients1)
+                    Divisor = testmodule.Polynomial(*Coefficients2)
+                    TestObject = self.TestClass(Divident * ExtraPoly,
+                                                        Divisor * ExtraPoly)
+                    Values = [randint(-5, 5) + random() for _ in range(50)]
+                    Values = [Value for Value in Values if Divisor(Value)]
+                    Values.insert(randint(0, len(Values)), Root)
+                    Checks = [TestObject(Value) for Value in Values]
+                    for Batch in (Values, tuple(Values), array('d', Values)):
+                        Result = TestObject.evaluateMany(Batch)
+                        self.assertIsInstance(Result, list)
+                        self.assertEqual(len(Result), len(Values))
+                        for Check, Test in zip(Checks, Result):
+                            self.assertAlmostEqual(Check, Test)
+                    if UseNumpy:
+                        Result = TestObject.evaluateMany(
+                                                    Backend.array(Values))
+                        self.assertIsInstance(Result, Backend.ndarray)
+                        for Check, Test in zip(Checks, Result.tolist()):
+                            self.assertAlmostEqual(Check, Test)
+                TestObject = self.TestClass((1,1), (-1, 0, 1))
+                self.assertListEqual(TestObject.evaluateMany([]), [])
+                Result = TestObject.evaluateMany([-1, 0, 2])
+                self.assertAlmostEqual(Result[0], -0.5)
+                self.assertAlmostEqual(Result[1], -1)
+                self.assertAlmostEqual(Result[2], 1)
+                with self.assertRaises(ValueError):
+                    TestObject.evaluateMany([0, 1, 2]) #singularity expected
+                for Value in self.NotRealNumber:
+                    if isinstance(Value, (list, tuple)):
+                        continue
+                    with self.assertRaises(TypeError):
+                        TestObject.evaluateMany(Value)
+                    with self.assertRaises(TypeError):
+                        TestObject.evaluateMany([1, Value, 2.0])
+        finally:
+            testmodule.np = Backend
+    
     def test_call_TypeError(self):
         """
         Checks rejection of improper type arguments.
@@ -1549,9 +1875,11 @@ class Test_Rational(unittest.TestCase):
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Polynomial)
 TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_Rational)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_CompactPolynomial)
 
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1, TestSuite2])
+TestSuite.addTests([TestSuite1, TestSuite3, TestSuite2])
 
 if __name__ == "__main__":
     sys.stdout.write(
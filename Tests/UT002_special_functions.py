@@ -7,8 +7,8 @@ plan / report TE002_special_functions.md
 """
 
 
-__version__= '1.0.0.0'
-__date__ = '08-12-2022'
+__version__= '1.5.0.0'
+__date__ = '17-10-2026'
 __status__ = 'Testing'
 
 #imports
@@ -21,6 +21,8 @@ import unittest
 import random
 import math
 
+from array import array
+
 #+ custom modules
 
 MODULE_PATH = os.path.realpath(__file__)
@@ -33,6 +35,7 @@ if not (ROOT_FOLDER in sys.path):
 #++ actual import
 
 import math_extra_lib.special_functions as test_module
+import math_extra_lib.polynomial as polynomial_module
 
 #globals
 
@@ -658,6 +661,95 @@ class Test_inv_erf(unittest.TestCase):
             self.assertIsInstance(TestResult, float)
             self.assertAlmostEqual(TestResult, Input)
 
+class Test_inv_norm_cdf(unittest.TestCase):
+    """
+    Checks the implementation of the function special_functions.inv_norm_cdf().
+
+    Implements tests: TEST-T-200, TEST-T-201 and TEST-T-231.
+    Covers requirements: REQ-FUN-231, REQ-AWM-200 and REQ-AWM-201.
+
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestFunction = staticmethod(test_module.inv_norm_cdf)
+    
+    def test_TypeError(self):
+        """
+        Checks that sub-class TypeError is raised with non-integer argument.
+
+        Test ID: TEST-T-200
+        Requirement(s): REQ-AWM-200
+
+        Version 1.0.0.0
+        """
+        for Value in [int, float, [1, 2], '1', (1, 1), {1 : 1}, bool, None]:
+            with self.assertRaises(TypeError):
+                self.TestFunction(Value)
+    
+    def test_ValueError(self):
+        """
+        Checks that sub-class ValueError is raised with wrong value argument.
+
+        Test ID: TEST-T-201
+        Requirement(s): REQ-AWM-201
+
+        Version 1.0.0.0
+        """
+        for Value in (0, 1, 0.0, 1.0, -1):
+            with self.assertRaises(ValueError):
+                self.TestFunction(Value)
+        for _ in range(100):
+            Value = random.randint(1, 10) + random.random()
+            with self.assertRaises(ValueError):
+                self.TestFunction(Value)
+            with self.assertRaises(ValueError):
+                self.TestFunction(-Value)
+    
+    def test_OK(self):
+        """
+        Checks that the values are calculated properly. The pre-defined values
+        are the well known quantiles of the standard normal distribution. The
+        random values are checked for the consistency with the function
+        inv_erf() and with the Standard Library math.erfc() implementation.
+
+        Test ID: TEST-T-231
+        Requirement(s): REQ-FUN-231.
+
+        Version 1.0.0.0
+        """
+        for Input, Output in ((0.5, 0.0), (0.975, 1.959963984540054),
+                                (0.95, 1.6448536269514722),
+                                (0.99, 2.3263478740408408),
+                                (0.8413447460685429, 1.0),
+                                (1.0E-10, -6.361340902404056),
+                                (1.0E-300, -37.0471),
+                                (0.9999999999, 6.361340889697422)):
+            TestResult = self.TestFunction(Input)
+            self.assertIsInstance(TestResult, float)
+            self.assertAlmostEqual(TestResult, Output,
+                                                places = FLOAT_CHECK_PRECISION)
+        for _ in range(1000):
+            Input = random.random()
+            if random.random() < 0.1:
+                Input = 10**(- random.uniform(1, 100))
+            if Input > 0:
+                TestResult = self.TestFunction(Input)
+                self.assertIsInstance(TestResult, float)
+                Check = 0.5 * math.erfc(- TestResult / math.sqrt(2))
+                self.assertAlmostEqual(Check / Input, 1.0, places = 12)
+                if Input >= 0.5:
+                    self.assertAlmostEqual(TestResult / math.sqrt(2),
+                                        test_module.inv_erf(2 * Input - 1),
+                                                                places = 12)
+                if Input > 1.0E-10: #1 - Input must not be rounded to 1
+                    self.assertAlmostEqual(self.TestFunction(1 - Input),
+                                                - TestResult, delta = 1.0E-6)
+
 class Test_beta_incomplete_reg(unittest.TestCase):
     """
     Checks the implementation of the function
@@ -1217,6 +1309,669 @@ class Test_log_upper_gamma(Test_lower_gamma_reg):
             self.assertIsInstance(TestValue, float)
             self.assertEqual(TestValue, Check)
 
+class Test_gamma_asymptotic(unittest.TestCase):
+    """
+    Checks the implementation of the regularized incomplete gamma functions
+    special_functions.lower_gamma_reg() and special_functions.upper_gamma_reg()
+    as well as the derived functions for the large values of the power
+    parameter, where the uniform asymptotic expansion is used.
+
+    Implements tests: TEST-T-261.
+    Covers requirements: REQ-FUN-261.
+
+    Version 1.0.0.0
+    """
+    
+    @staticmethod
+    def getPoissonSums(n: int, y: float) -> tuple:
+        """
+        Helper method - calculates P(n, y) and Q(n, y) for an integer n as the
+        sums of the Poisson probabilities with the mean y.
+        """
+        Terms = list()
+        k = 0
+        while True:
+            Term = math.exp(k * math.log(y) - y - math.lgamma(k + 1))
+            Terms.append(Term)
+            k += 1
+            if k > max(n, y) and Term < 1.0E-18 * Terms[n]:
+                break
+        return math.fsum(Terms[n:]), math.fsum(Terms[:n])
+    
+    def test_OK(self):
+        """
+        Checks that the values are calculated properly, comparing them with
+        the sums of the Poisson probabilities for the integer values of the
+        power parameter; that P(x, y) + Q(x, y) = 1; and that the number of
+        the terms of the expansion is bounded for the very large parameters.
+
+        Test ID: TEST-T-261
+        Requirement(s): REQ-FUN-261
+
+        Version 1.0.0.0
+        """
+        for x in (21, 25, 50, 100, 171, 500, 1000, 3000):
+            Limit = min(0.3 * x, 30 * math.sqrt(x))
+            for _ in range(20):
+                y = x + random.uniform(- Limit, Limit)
+                CheckP, CheckQ = self.getPoissonSums(x, y)
+                for Tolerance in ('default', 'precise'):
+                    if Tolerance == 'precise':
+                        Delta = 1.0E-11
+                    else:
+                        Delta = 1.0E-6
+                    P = test_module.lower_gamma_reg(x, y,
+                                                        Tolerance = Tolerance)
+                    Q = test_module.upper_gamma_reg(x, y,
+                                                        Tolerance = Tolerance)
+                    strError = 'for gamma({}, {})'.format(x, y)
+                    self.assertIsInstance(P, float)
+                    self.assertIsInstance(Q, float)
+                    self.assertAlmostEqual(P, CheckP, msg = strError,
+                                                    delta = Delta * CheckP)
+                    self.assertAlmostEqual(Q, CheckQ, msg = strError,
+                                                    delta = Delta * CheckQ)
+                    self.assertAlmostEqual(P + Q, 1.0, delta = 1.0E-15)
+                    self.assertAlmostEqual(
+                        test_module.log_lower_gamma(x, y,
+                                                        Tolerance = Tolerance),
+                                math.log(P) + math.lgamma(x), delta = 1.0E-12
+                                                    * max(1, math.lgamma(x)))
+                    self.assertAlmostEqual(
+                        test_module.log_upper_gamma(x, y,
+                                                        Tolerance = Tolerance),
+                                math.log(Q) + math.lgamma(x), delta = 1.0E-12
+                                                    * max(1, math.lgamma(x)))
+                    if x < 171:
+                        Check = P * math.gamma(x)
+                        self.assertAlmostEqual(
+                            test_module.lower_gamma(x, y,
+                                                        Tolerance = Tolerance),
+                                    Check, delta = 1.0E-12 * Check)
+                        Check = Q * math.gamma(x)
+                        self.assertAlmostEqual(
+                            test_module.upper_gamma(x, y,
+                                                        Tolerance = Tolerance),
+                                    Check, delta = 1.0E-12 * Check)
+        #very large parameters - bounded number of terms
+        for x in (1.0E4, 1.0E5, 1.0E6, 1.0E7, 1.0E9):
+            for Sigma in (-3, -1, 0, 0.5, 2):
+                y = x + Sigma * math.sqrt(x)
+                P = test_module.lower_gamma_reg(x, y)
+                Q = test_module.upper_gamma_reg(x, y)
+                self.assertAlmostEqual(P + Q, 1.0, delta = 1.0E-15)
+                #normal approximation: Q ~ erfc(Sigma / sqrt(2)) / 2
+                self.assertAlmostEqual(Q,
+                        0.5 * math.erfc(Sigma / math.sqrt(2)), delta = 0.01)
+                for Tolerance in ('fast', 'default', 'precise'):
+                    Iterations = test_module.gamma_iterations(x, y,
+                                                        Tolerance = Tolerance)
+                    self.assertGreater(Iterations, 0)
+                    self.assertLessEqual(Iterations, 10)
+        #batch versions
+        Length = 50
+        X = [random.uniform(21, 5000) for _ in range(Length)]
+        Y = [x * random.uniform(0.8, 1.2) for x in X]
+        for Name in ('lower_gamma_reg', 'upper_gamma_reg', 'log_lower_gamma',
+                                                            'log_upper_gamma'):
+            TestFunction = getattr(test_module, '{}_many'.format(Name))
+            CheckFunction = getattr(test_module, Name)
+            for Tolerance in ('fast', 'default', 'precise'):
+                Results = TestFunction(X, Y, Tolerance = Tolerance)
+                for Index, Result in enumerate(Results):
+                    Check = CheckFunction(X[Index], Y[Index],
+                                                        Tolerance = Tolerance)
+                    self.assertAlmostEqual(Result, Check,
+                                        delta = 1.0E-12 * max(1, abs(Check)))
+
+class Test_batch_functions(unittest.TestCase):
+    """
+    Checks the implementation of the batch versions of the functions, e.g.
+    special_functions.lower_gamma_reg_many(), with and without NumPy.
+
+    Implements tests: TEST-T-200, TEST-T-201 and TEST-T-270.
+    Covers requirements: REQ-FUN-270, REQ-AWM-200 and REQ-AWM-201.
+
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        Positive = (0, - 1, - 0.5)
+        NonNegative = (- 1, - 0.5)
+        Beta = (- 0.1, 1.1, - 1)
+        LogBeta = (0, - 0.1, 1.1, - 1)
+        cls.Functions = ( #name, minimum and maximum values, wrong values
+            ('log_beta', (0.1, 0.1), (20, 20), (Positive, Positive)),
+            ('beta', (0.1, 0.1), (20, 20), (Positive, Positive)),
+            ('inv_erf', (-0.999999, ), (0.999999, ), ((1, - 1, 1.5), )),
+            ('inv_norm_cdf', (1.0E-20, ), (0.999999, ), ((0, 1, - 0.5), )),
+            ('lower_gamma', (0.1, 0), (20, 40), (Positive, NonNegative)),
+            ('log_lower_gamma', (0.1, 0.01), (20, 40), (Positive, Positive)),
+            ('lower_gamma_reg', (0.1, 0), (20, 40), (Positive, NonNegative)),
+            ('upper_gamma', (0.1, 0), (20, 40), (Positive, NonNegative)),
+            ('log_upper_gamma', (0.1, 0), (20, 40), (Positive, NonNegative)),
+            ('upper_gamma_reg', (0.1, 0), (20, 40), (Positive, NonNegative)),
+            ('beta_incomplete', (0, 0.1, 0.1), (1, 20, 20),
+                                                (Beta, Positive, Positive)),
+            ('log_beta_incomplete', (0.01, 0.1, 0.1), (1, 20, 20),
+                                                (LogBeta, Positive, Positive)),
+            ('beta_incomplete_reg', (0, 0.1, 0.1), (1, 20, 20),
+                                                (Beta, Positive, Positive)))
+    
+    def setUp(self) -> None:
+        """
+        Preparation for each test case - stores the NumPy backend.
+        """
+        self.Backend = test_module.np
+    
+    def tearDown(self) -> None:
+        """
+        Clean-up after each test case - restores the NumPy backend.
+        """
+        test_module.np = self.Backend
+        polynomial_module.np = self.Backend
+    
+    def getBackends(self):
+        """
+        Generator, which switches between the NumPy and the pure Python
+        backends, skipping the former if NumPy is not installed.
+        """
+        if not (self.Backend is None):
+            test_module.np = self.Backend
+            polynomial_module.np = self.Backend
+            yield True
+        test_module.np = None
+        polynomial_module.np = None
+        yield False
+    
+    def test_TypeError(self):
+        """
+        Checks that sub-class TypeError is raised with improper argument type,
+        including the improper type of an element of a batch.
+
+        Test ID: TEST-T-200
+        Requirement(s): REQ-AWM-200
+
+        Version 1.0.0.0
+        """
+        for _ in self.getBackends():
+            for Name, Low, _, _ in self.Functions:
+                TestFunction = getattr(test_module, '{}_many'.format(Name))
+                Good = list(Low)
+                NArgs = len(Low)
+                for Value in [int, float, '1', {1 : 1}, bool, None, [[1]],
+                                            [0.5, '1'], [0.5, None], b'\x01']:
+                    for Index in range(NArgs):
+                        Args = list(Good)
+                        Args[Index] = Value
+                        with self.assertRaises(TypeError):
+                            TestFunction(*Args)
+    
+    def test_ValueError(self):
+        """
+        Checks that sub-class ValueError is raised with improper value of an
+        argument or of an element of a batch, and with the batches of the
+        different lengths.
+
+        Test ID: TEST-T-201
+        Requirement(s): REQ-AWM-201
+
+        Version 1.0.0.0
+        """
+        for _ in self.getBackends():
+            for Name, Low, High, WrongValues in self.Functions:
+                TestFunction = getattr(test_module, '{}_many'.format(Name))
+                for Index, Values in enumerate(WrongValues):
+                    for Wrong in Values:
+                        Args = list(Low)
+                        Args[Index] = [Low[Index], Wrong, High[Index]]
+                        with self.assertRaises(ValueError):
+                            TestFunction(*Args)
+                        Args[Index] = Wrong
+                        with self.assertRaises(ValueError):
+                            TestFunction(*Args)
+                if len(Low) > 1:
+                    Args = [[Value] * 3 for Value in High]
+                    Args[-1].append(High[-1])
+                    with self.assertRaises(ValueError):
+                        TestFunction(*Args)
+    
+    def test_OK(self):
+        """
+        Checks that the results of the batch functions are equal to those of
+        the scalar functions (within the rounding errors with NumPy), with the
+        scalar arguments broadcast, and with the different types of batches.
+        Also checks the types of the returned values.
+
+        Test ID: TEST-T-270
+        Requirement(s): REQ-FUN-270
+
+        Version 1.0.0.0
+        """
+        for UseNumpy in self.getBackends():
+            for Name, Low, High, _ in self.Functions:
+                TestFunction = getattr(test_module, '{}_many'.format(Name))
+                CheckFunction = getattr(test_module, Name)
+                NArgs = len(Low)
+                for _ in range(10):
+                    Length = random.randint(1, 50)
+                    Args = list()
+                    for Index in range(NArgs):
+                        if random.random() < 0.3:
+                            Args.append(random.uniform(Low[Index],
+                                                                High[Index]))
+                        else:
+                            Batch = [random.uniform(Low[Index], High[Index])
+                                                    for _ in range(Length)]
+                            Batch[0] = Low[Index]
+                            Batch[-1] = High[Index]
+                            Args.append(Batch)
+                    if all(isinstance(Item, float) for Item in Args):
+                        Length = 1
+                    Scalars = [Item if isinstance(Item, list)
+                                        else [Item] * Length for Item in Args]
+                    Checks = list(map(CheckFunction, *Scalars))
+                    Results = TestFunction(*Args)
+                    self.assertIsInstance(Results, list)
+                    self.assertEqual(len(Results), Length)
+                    for Result, Check in zip(Results, Checks):
+                        self.assertIsInstance(Result, float)
+                        if UseNumpy:
+                            self.assertAlmostEqual(Result, Check,
+                                        delta = 1.0E-12 * max(1, abs(Check)))
+                        else:
+                            self.assertEqual(Result, Check)
+                    Args = [array('d', Item) if isinstance(Item, list)
+                                                    else Item for Item in Args]
+                    Results = TestFunction(*Args)
+                    self.assertIsInstance(Results, list)
+                    if UseNumpy:
+                        Args = [test_module.np.array(Item)
+                                    if isinstance(Item, array) else Item
+                                                            for Item in Args]
+                        Results = TestFunction(*Args)
+                        if Length > 1 or not isinstance(Args[0], float):
+                            self.assertIsInstance(Results,
+                                                    test_module.np.ndarray)
+                        for Result, Check in zip(Results, Checks):
+                            self.assertAlmostEqual(Result, Check,
+                                        delta = 1.0E-12 * max(1, abs(Check)))
+                Args = [list() for _ in range(NArgs)]
+                self.assertEqual(TestFunction(*Args), [])
+
+class Test_tolerance(unittest.TestCase):
+    """
+    Checks the convergence tolerance control of the incomplete gamma and beta
+    functions, including the batch versions, and the functions
+    special_functions.gamma_iterations() and
+    special_functions.beta_iterations().
+
+    Implements tests: TEST-T-200, TEST-T-201 and TEST-T-280.
+    Covers requirements: REQ-FUN-280, REQ-AWM-200 and REQ-AWM-201.
+
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        GammaArgs = (2.5, 1.5)
+        BetaArgs = (0.3, 2.5, 1.5)
+        cls.Functions = ( #name, valid arguments
+            ('lower_gamma', GammaArgs),
+            ('log_lower_gamma', GammaArgs),
+            ('lower_gamma_reg', GammaArgs),
+            ('upper_gamma', GammaArgs),
+            ('log_upper_gamma', GammaArgs),
+            ('upper_gamma_reg', GammaArgs),
+            ('beta_incomplete', BetaArgs),
+            ('log_beta_incomplete', BetaArgs),
+            ('beta_incomplete_reg', BetaArgs))
+        cls.Names = list()
+        for Name, Args in cls.Functions:
+            cls.Names.append((Name, Args))
+            cls.Names.append(('{}_many'.format(Name), Args))
+        cls.Names.append(('gamma_iterations', GammaArgs))
+        cls.Names.append(('beta_iterations', BetaArgs))
+    
+    def test_TypeError(self):
+        """
+        Checks that sub-class of TypeError is raised with wrong type of the
+        tolerance argument.
+
+        Test ID: TEST-T-200
+        Requirement(s): REQ-AWM-200
+
+        Version 1.0.0.0
+        """
+        for Name, Args in self.Names:
+            TestFunction = getattr(test_module, Name)
+            for Value in (1, None, [1.0E-5], (1.0E-5, ), {'fast' : 1.0E-4},
+                                                                    int, True):
+                with self.assertRaises(TypeError, msg = Name):
+                    TestFunction(*Args, Tolerance = Value)
+    
+    def test_ValueError(self):
+        """
+        Checks that sub-class of ValueError is raised with wrong value of the
+        tolerance argument - out of range or unknown preset.
+
+        Test ID: TEST-T-201
+        Requirement(s): REQ-AWM-201
+
+        Version 1.0.0.0
+        """
+        for Name, Args in self.Names:
+            TestFunction = getattr(test_module, Name)
+            for Value in (0.0, - 1.0E-5, 1.0, 2.5, 1.0E-16, 'slow', '',
+                                                                'Fast'):
+                with self.assertRaises(ValueError, msg = Name):
+                    TestFunction(*Args, Tolerance = Value)
+    
+    def test_OK(self):
+        """
+        Checks that the presets are equivalent to the respective explicit
+        values of the tolerance, that the number of iterations does not
+        increase with the tolerance, and that the results agree with those
+        obtained with the best precision within the requested tolerance.
+
+        Test ID: TEST-T-280
+        Requirement(s): REQ-FUN-280
+
+        Version 1.0.0.0
+        """
+        for Name, Value in test_module.TOLERANCE_PRESETS.items():
+            for FunctionName, Args in self.Names:
+                TestFunction = getattr(test_module, FunctionName)
+                self.assertEqual(TestFunction(*Args, Tolerance = Name),
+                                    TestFunction(*Args, Tolerance = Value))
+        for Name, _ in self.Functions:
+            TestFunction = getattr(test_module, Name)
+            BatchFunction = getattr(test_module, '{}_many'.format(Name))
+            IsGamma = 'gamma' in Name
+            for _ in range(100):
+                x = random.uniform(0.5, 20)
+                y = random.uniform(0.5, 20)
+                if IsGamma:
+                    Args = (x, y)
+                else:
+                    Args = (random.uniform(0.01, 0.99), x, y)
+                Default = TestFunction(*Args)
+                self.assertEqual(TestFunction(*Args,
+                            Tolerance = test_module.REL_PRECISION), Default)
+                Check = TestFunction(*Args, Tolerance = 'precise')
+                for Tolerance in (1.0E-3, 'fast', 1.0E-6, 1.0E-10):
+                    if isinstance(Tolerance, str):
+                        Delta = test_module.TOLERANCE_PRESETS[Tolerance]
+                    else:
+                        Delta = Tolerance
+                    Result = TestFunction(*Args, Tolerance = Tolerance)
+                    self.assertIsInstance(Result, float)
+                    self.assertAlmostEqual(Result, Check,
+                                    delta = 100 * Delta * max(1, abs(Check)))
+                    Results = BatchFunction(*([Item] * 3 for Item in Args),
+                                                    Tolerance = Tolerance)
+                    for Item in Results:
+                        self.assertAlmostEqual(Item, Result,
+                                        delta = 1.0E-12 * max(1, abs(Result)))
+        for _ in range(100):
+            x = random.uniform(0.1, 30)
+            y = random.uniform(0.01, 30)
+            z = random.uniform(0.01, 0.99)
+            for TestFunction, Args in (
+                                (test_module.gamma_iterations, (x, y)),
+                                (test_module.beta_iterations, (z, x, y))):
+                Previous = None
+                for Tolerance in ('fast', 1.0E-6, 'default', 1.0E-10,
+                                                        'precise', 1.0E-15):
+                    Result = TestFunction(*Args, Tolerance = Tolerance)
+                    self.assertIsInstance(Result, int)
+                    self.assertGreater(Result, 0)
+                    if not (Previous is None):
+                        self.assertGreaterEqual(Result, Previous)
+                    Previous = Result
+        #edge cases - no iterations
+        self.assertEqual(test_module.gamma_iterations(2, 0), 0)
+        self.assertEqual(test_module.gamma_iterations(2.5, 0.0), 0)
+        self.assertEqual(test_module.beta_iterations(0, 2, 3), 0)
+        self.assertEqual(test_module.beta_iterations(1, 2.5, 3), 0)
+        self.assertEqual(test_module.beta_iterations(1.0, 2.5, 3), 0)
+        #the fast preset requires fewer iterations in the long series
+        self.assertLess(
+                    test_module.gamma_iterations(20, 15, Tolerance = 'fast'),
+                                        test_module.gamma_iterations(20, 15))
+        self.assertLess(test_module.gamma_iterations(20, 15),
+                        test_module.gamma_iterations(20, 15,
+                                                    Tolerance = 'precise'))
+
+class Test_frozen_parameters(unittest.TestCase):
+    """
+    Checks the implementation of the classes special_functions.IncompleteGamma
+    and special_functions.IncompleteBeta, with and without NumPy.
+
+    Implements tests: TEST-T-200, TEST-T-201 and TEST-T-290.
+    Covers requirements: REQ-FUN-290, REQ-AWM-200 and REQ-AWM-201.
+
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.GammaMethods = ( #method name, function name
+            ('lower', 'lower_gamma'),
+            ('logLower', 'log_lower_gamma'),
+            ('lowerReg', 'lower_gamma_reg'),
+            ('upper', 'upper_gamma'),
+            ('logUpper', 'log_upper_gamma'),
+            ('upperReg', 'upper_gamma_reg'))
+        cls.BetaMethods = ( #method name, function name
+            ('value', 'beta_incomplete'),
+            ('logValue', 'log_beta_incomplete'),
+            ('valueReg', 'beta_incomplete_reg'))
+    
+    def setUp(self) -> None:
+        """
+        Preparation for each test case - stores the NumPy backend.
+        """
+        self.Backend = test_module.np
+    
+    def tearDown(self) -> None:
+        """
+        Clean-up after each test case - restores the NumPy backend.
+        """
+        test_module.np = self.Backend
+        polynomial_module.np = self.Backend
+    
+    def getBackends(self):
+        """
+        Generator, which switches between the NumPy and the pure Python
+        backends, skipping the former if NumPy is not installed.
+        """
+        if not (self.Backend is None):
+            test_module.np = self.Backend
+            polynomial_module.np = self.Backend
+            yield True
+        test_module.np = None
+        polynomial_module.np = None
+        yield False
+    
+    def test_TypeError(self):
+        """
+        Checks that sub-class TypeError is raised with improper type of the
+        frozen parameters or of the tolerance at the instantiation, and with
+        improper type of the argument of the methods.
+
+        Test ID: TEST-T-200
+        Requirement(s): REQ-AWM-200
+
+        Version 1.0.0.0
+        """
+        for Value in ('1', [1], (1, ), {1 : 1}, None, int, float):
+            with self.assertRaises(TypeError):
+                test_module.IncompleteGamma(Value)
+            with self.assertRaises(TypeError):
+                test_module.IncompleteBeta(Value, 1.5)
+            with self.assertRaises(TypeError):
+                test_module.IncompleteBeta(1.5, Value)
+        for Value in (1, None, [1.0E-5], int):
+            with self.assertRaises(TypeError):
+                test_module.IncompleteGamma(1.5, Tolerance = Value)
+            with self.assertRaises(TypeError):
+                test_module.IncompleteBeta(1.5, 2.5, Tolerance = Value)
+        Gamma = test_module.IncompleteGamma(1.5)
+        Beta = test_module.IncompleteBeta(1.5, 2.5)
+        for Value in ('1', [1], (1, ), {1 : 1}, None, int, float):
+            for Name, _ in self.GammaMethods:
+                with self.assertRaises(TypeError):
+                    getattr(Gamma, Name)(Value)
+            for Name, _ in self.BetaMethods:
+                with self.assertRaises(TypeError):
+                    getattr(Beta, Name)(Value)
+        for _ in self.getBackends():
+            for Value in ('1', [1, '1'], [[1]], None, {1 : 1}):
+                for Name, _ in self.GammaMethods:
+                    with self.assertRaises(TypeError):
+                        getattr(Gamma, '{}Many'.format(Name))(Value)
+                for Name, _ in self.BetaMethods:
+                    with self.assertRaises(TypeError):
+                        getattr(Beta, '{}Many'.format(Name))(Value)
+    
+    def test_ValueError(self):
+        """
+        Checks that sub-class ValueError is raised with improper value of the
+        frozen parameters or of the tolerance at the instantiation, and with
+        improper value of the argument of the methods.
+
+        Test ID: TEST-T-201
+        Requirement(s): REQ-AWM-201
+
+        Version 1.0.0.0
+        """
+        for Value in (0, 0.0, - 1, - 0.5):
+            with self.assertRaises(ValueError):
+                test_module.IncompleteGamma(Value)
+            with self.assertRaises(ValueError):
+                test_module.IncompleteBeta(Value, 1.5)
+            with self.assertRaises(ValueError):
+                test_module.IncompleteBeta(1.5, Value)
+        for Value in (0.0, 1.0, 1.0E-16, 'slow'):
+            with self.assertRaises(ValueError):
+                test_module.IncompleteGamma(1.5, Tolerance = Value)
+            with self.assertRaises(ValueError):
+                test_module.IncompleteBeta(1.5, 2.5, Tolerance = Value)
+        Gamma = test_module.IncompleteGamma(1.5)
+        Beta = test_module.IncompleteBeta(1.5, 2.5)
+        for _ in self.getBackends():
+            for Name, _ in self.GammaMethods:
+                Values = [- 1, - 0.5]
+                if Name == 'logLower':
+                    Values.extend([0, 0.0])
+                for Value in Values:
+                    with self.assertRaises(ValueError):
+                        getattr(Gamma, Name)(Value)
+                    with self.assertRaises(ValueError):
+                        getattr(Gamma, '{}Many'.format(Name))([1, Value, 2])
+            for Name, _ in self.BetaMethods:
+                Values = [- 1, - 0.1, 1.1, 2]
+                if Name == 'logValue':
+                    Values.extend([0, 0.0])
+                for Value in Values:
+                    with self.assertRaises(ValueError):
+                        getattr(Beta, Name)(Value)
+                    with self.assertRaises(ValueError):
+                        getattr(Beta, '{}Many'.format(Name))([0.5, Value])
+    
+    def test_OK(self):
+        """
+        Checks that the frozen parameters and the parsed tolerance are stored,
+        and that the methods, including the batch ones, return exactly the same
+        values as the respective functions.
+
+        Test ID: TEST-T-290
+        Requirement(s): REQ-FUN-290
+
+        Version 1.0.0.0
+        """
+        Gamma = test_module.IncompleteGamma(2.5, Tolerance = 'fast')
+        self.assertEqual(Gamma.Parameters, (2.5, ))
+        self.assertEqual(Gamma.Tolerance,
+                                    test_module.TOLERANCE_PRESETS['fast'])
+        Beta = test_module.IncompleteBeta(2, 3.5)
+        self.assertEqual(Beta.Parameters, (2, 3.5))
+        self.assertEqual(Beta.Tolerance, test_module.REL_PRECISION)
+        for Tolerance in ('fast', 'default', 1.0E-10, 'precise'):
+            for x in (0.5, 1, 2.5, 10, 35.5, 200):
+                Gamma = test_module.IncompleteGamma(x, Tolerance = Tolerance)
+                Values = [0, 0.5 * x, x, x + 0.5, 2 * x + 3]
+                Values.extend(random.uniform(0.01, 3 * x) for _ in range(20))
+                for Name, FunctionName in self.GammaMethods:
+                    TestMethod = getattr(Gamma, Name)
+                    TestFunction = getattr(test_module, FunctionName)
+                    Args = [Value for Value in Values
+                                    if Value or (Name != 'logLower')]
+                    if Name in ('lower', 'upper') and x > 100:
+                        continue #overflow of the non-regularized functions
+                    for y in Args:
+                        self.assertEqual(TestMethod(y),
+                                TestFunction(x, y, Tolerance = Tolerance))
+                    BatchFunction = getattr(test_module,
+                                                '{}_many'.format(FunctionName))
+                    Checks = BatchFunction(x, Args, Tolerance = Tolerance)
+                    for IsNumPy in self.getBackends():
+                        Results = getattr(Gamma, '{}Many'.format(Name))(Args)
+                        self.assertIsInstance(Results, list)
+                        self.assertEqual(len(Results), len(Args))
+                        for Result, Check in zip(Results, Checks):
+                            self.assertAlmostEqual(Result, Check,
+                                        delta = 1.0E-12 * max(1, abs(Check)))
+                        if IsNumPy:
+                            Results = getattr(Gamma, '{}Many'.format(Name))(
+                                                test_module.np.array(Args))
+                            self.assertIsInstance(Results,
+                                                    test_module.np.ndarray)
+                        self.assertEqual(
+                                getattr(Gamma, '{}Many'.format(Name))([]), [])
+                    test_module.np = self.Backend
+                    polynomial_module.np = self.Backend
+            for x, y in ((0.5, 0.5), (1, 3), (2.5, 1.5), (10, 25.5), (60, 40)):
+                Beta = test_module.IncompleteBeta(x, y, Tolerance = Tolerance)
+                Values = [0, 0.5, 1, 1.0, x / (x + y)]
+                Values.extend(random.uniform(0.01, 0.99) for _ in range(20))
+                for Name, FunctionName in self.BetaMethods:
+                    TestMethod = getattr(Beta, Name)
+                    TestFunction = getattr(test_module, FunctionName)
+                    Args = [Value for Value in Values
+                                    if Value or (Name != 'logValue')]
+                    for z in Args:
+                        self.assertEqual(TestMethod(z),
+                                TestFunction(z, x, y, Tolerance = Tolerance))
+                    BatchFunction = getattr(test_module,
+                                                '{}_many'.format(FunctionName))
+                    Checks = BatchFunction(Args, x, y, Tolerance = Tolerance)
+                    for IsNumPy in self.getBackends():
+                        Results = getattr(Beta, '{}Many'.format(Name))(Args)
+                        self.assertIsInstance(Results, list)
+                        self.assertEqual(len(Results), len(Args))
+                        for Result, Check in zip(Results, Checks):
+                            self.assertAlmostEqual(Result, Check,
+                                        delta = 1.0E-12 * max(1, abs(Check)))
+                        if IsNumPy:
+                            Results = getattr(Beta, '{}Many'.format(Name))(
+                                                test_module.np.array(Args))
+                            self.assertIsInstance(Results,
+                                                    test_module.np.ndarray)
+                    test_module.np = self.Backend
+                    polynomial_module.np = self.Backend
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_factorial)
@@ -1238,12 +1993,21 @@ TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(Test_lower_gamma)
 TestSuite15 = unittest.TestLoader().loadTestsFromTestCase(Test_upper_gamma)
 TestSuite16 = unittest.TestLoader().loadTestsFromTestCase(Test_log_lower_gamma)
 TestSuite17 = unittest.TestLoader().loadTestsFromTestCase(Test_log_upper_gamma)
+TestSuite18 = unittest.TestLoader().loadTestsFromTestCase(Test_batch_functions)
+TestSuite19 = unittest.TestLoader().loadTestsFromTestCase(Test_inv_norm_cdf)
+TestSuite20 = unittest.TestLoader().loadTestsFromTestCase(Test_tolerance)
+TestSuite21 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_gamma_asymptotic)
+TestSuite22 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_frozen_parameters)
 
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
                         TestSuite6, TestSuite7, TestSuite8, TestSuite9,
                         TestSuite10, TestSuite11, TestSuite12, TestSuite13,
-                        TestSuite14, TestSuite15, TestSuite16, TestSuite17])
+                        TestSuite14, TestSuite15, TestSuite16, TestSuite17,
+                        TestSuite18, TestSuite19, TestSuite20, TestSuite21,
+                        TestSuite22])
 
 if __name__ == "__main__":
     sys.stdout.write(
@@ -5,8 +5,8 @@ Module math_extra_lib.Tests.UT003_vectors_matrices
 Implements unit testing of the module math_extra_lib.vectors_matrices, see TE003
 """
 
-__version__ = "1.0.0.0"
-__date__ = "02-10-2023"
+__version__ = "1.9.1.0"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -3828,6 +3828,82 @@ class Test_SquareMatrix(Test_Matrix):
             self.tearDown()
             self.setUp()
     
+    def test_getLUPdecomposition_pivoting(self):
+        """
+        Checks that the pivot with the maximum absolute value is selected in
+        the columns and rows (partial) pivoting modes of the decomposition.
+        
+        Test ID: TEST-T-344
+        
+        Covers requirements: REQ-FUN-341
+        """
+        objTest = self.TestClass([[1, 2, 5], [2, 1, 1], [3, 1, 2]])
+        Lower, Upper, Perm, RowPerm, Sign = objTest.getLUPdecomposition()
+        self.assertEqual(Perm[0], 2)
+        self.assertTupleEqual(RowPerm, (0, 1, 2))
+        self.assertEqual(Upper[0, 0], 5)
+        Lower, Upper, Perm, RowPerm, Sign = objTest.getLUPdecomposition(
+                                                    isPartialPivoting = True)
+        self.assertTupleEqual(Perm, (0, 1, 2))
+        self.assertEqual(RowPerm[2], 0)
+        self.assertListEqual(Upper.Data[0], [3, 1, 2])
+        del Lower
+        del Upper
+        del objTest
+        for _ in range(10):
+            Size = random.randint(2, 8)
+            objTest = self.TestClass([[random.uniform(-10, 10)
+                                for _ in range(Size)] for _ in range(Size)])
+            Lower, Upper, Perm, RowPerm, Sign = objTest.getLUPdecomposition(
+                                                    isPartialPivoting = True)
+            self.assertTupleEqual(Perm, tuple(range(Size)))
+            self.assertIsInstance(RowPerm, tuple)
+            self.assertEqual(abs(Sign), 1)
+            for RowIdx in range(Size):
+                for ColIdx in range(Size):
+                    if ColIdx > RowIdx:
+                        self.assertEqual(Lower[ColIdx, RowIdx], 0)
+                    elif ColIdx < RowIdx:
+                        self.assertEqual(Upper[ColIdx, RowIdx], 0)
+                        self.assertLessEqual(abs(Lower[ColIdx, RowIdx]), 1)
+                    else:
+                        self.assertEqual(Lower[ColIdx, RowIdx], 1)
+            Determinant = Sign
+            for Index in range(Size):
+                Determinant *= Upper[Index, Index]
+            Check = objTest.getDeterminant()
+            self.assertAlmostEqual((Determinant - Check) / Check, 0)
+            RowCor = self.TestClass.generatePermutation(RowPerm)
+            Check = RowCor * Lower * Upper
+            for RowIdx in range(Size):
+                for ColIdx in range(Size):
+                    self.assertAlmostEqual(Check[ColIdx, RowIdx],
+                                                    objTest[ColIdx, RowIdx])
+            del Check
+            del RowCor
+            del Lower
+            del Upper
+            del objTest
+    
+    def test_getLUPdecomposition_TypeError(self):
+        """
+        Checks that TypeError compatible exception is raised if the pivoting
+        mode flag is not boolean.
+        
+        Test ID: TEST-T-345
+        
+        Covers requirements: REQ-AWM-344
+        """
+        objTest = self.TestClass.generateIdentity(2)
+        for Value in [1, 0, 1.0, '1', None, [True], int]:
+            with self.assertRaises(TypeError):
+                objTest.getLUPdecomposition(isPartialPivoting = Value)
+            with self.assertRaises(TypeError):
+                objTest.factorize(isPartialPivoting = Value)
+            with self.assertRaises(TypeError):
+                testmodule.LUFactorization(objTest, isPartialPivoting = Value)
+        del objTest
+    
     def test_getFullDecomposition(self):
         """
         Checks implementation of the decomposition of a square matrix into lower
@@ -4144,6 +4220,24 @@ class Test_SquareMatrix(Test_Matrix):
                                                         Check[RowIdx][ColIdx])
         del Test
         del objTest
+        #random matrices - product with the inverse must be an identity matrix
+        for Size in range(2, 12):
+            while True:
+                objTest = self.TestClass([[random.uniform(-5, 5)
+                                for _ in range(Size)] for _ in range(Size)])
+                if objTest.getDeterminant():
+                    break
+            Test = objTest.getInverse()
+            self.assertIsInstance(Test, self.TestClass)
+            self.assertEqual(Test.Size, Size)
+            Product = objTest * Test
+            for RowIdx in range(Size):
+                for ColIdx in range(Size):
+                    self.assertAlmostEqual(Product[ColIdx, RowIdx],
+                                                    int(ColIdx == RowIdx))
+            del Product
+            del Test
+            del objTest
         #special cases
         #+ identity matrices - must be 1 always
         for Size in range(2, 10):
@@ -4302,6 +4396,71 @@ class Test_SquareMatrix(Test_Matrix):
             self.assertIsNone(Test)
             del objTest
     
+    def test_getAllEigenValues(self):
+        """
+        Checks the calculation of all eigenvalues, including the complex ones,
+        by the Hessenberg reduction and the shifted QR-algorithm.
+        
+        Test ID: TEST-T-346
+        
+        Covers requirements: REQ-FUN-342
+        """
+        #known cases
+        objTest = self.TestClass([[0, -1], [1, 0]]) #rotation by 90 degrees
+        self.assertTupleEqual(objTest.getAllEigenValues(), (1j, -1j))
+        self.assertIsNone(objTest.getEigenValues())
+        del objTest
+        objTest = self.TestClass([[1, 1], [0, 1]]) #shear, defective
+        self.assertTupleEqual(objTest.getAllEigenValues(), (1, 1))
+        self.assertTupleEqual(objTest.getEigenValues(), (1, ))
+        del objTest
+        objTest = self.TestClass([[1, 2], [2, 4]]) #singular
+        self.assertTupleEqual(objTest.getAllEigenValues(), (5, 0))
+        self.assertIsNone(objTest.getEigenValues())
+        del objTest
+        objTest = self.TestClass([[1, 0.5, 2, 0], [2, 2, 1, 3], [1, 1, 1, 1],
+                                                            [2.5, 1, 2, 2]])
+        Test = objTest.getAllEigenValues()
+        self.assertIsInstance(Test, tuple)
+        self.assertEqual(len(Test), 4)
+        self.assertEqual(len([Item for Item in Test
+                                            if isinstance(Item, complex)]), 2)
+        self.assertAlmostEqual(Test[1], Test[2].conjugate())
+        self.assertIsNone(objTest.getEigenValues())
+        del objTest
+        #random cases - the sum of all eigenvalues is the trace, and their
+        #+ product is the determinant; symmetric matrices have real spectrum
+        for _ in range(10):
+            Size = random.randint(2, 25)
+            Data = [[random.uniform(-5, 5) for _ in range(Size)]
+                                                        for _ in range(Size)]
+            Symmetric = [[Data[RowIdx][ColIdx] + Data[ColIdx][RowIdx]
+                                                for ColIdx in range(Size)]
+                                                    for RowIdx in range(Size)]
+            for Item in (Data, Symmetric):
+                objTest = self.TestClass(Item)
+                Test = objTest.getAllEigenValues()
+                self.assertIsInstance(Test, tuple)
+                self.assertEqual(len(Test), Size)
+                Sum = sum(Test)
+                self.assertAlmostEqual(Sum.real, objTest.getTrace())
+                self.assertAlmostEqual(Sum.imag, 0)
+                Product = 1
+                for Value in Test:
+                    Product *= Value
+                Check = objTest.getDeterminant()
+                self.assertAlmostEqual(abs(Product - Check) / abs(Check), 0)
+                for Prev, Next in zip(Test[ : -1], Test[1 : ]):
+                    self.assertGreaterEqual(abs(Prev) * (1 + 1.0E-12),
+                                                                    abs(Next))
+                del objTest
+            objTest = self.TestClass(Symmetric)
+            Test = objTest.getEigenValues()
+            self.assertIsInstance(Test, tuple)
+            for Value in Test:
+                self.assertIsInstance(Value, (int, float))
+            del objTest
+    
     def test_getEigenVectors_TypeError(self):
         """
         Checks that TypeError compatible exception is raised if the passed
@@ -4315,6 +4474,91 @@ class Test_SquareMatrix(Test_Matrix):
         for Value in ['1', True, [1], (1, ), {1:1}, int, float]:
             with self.assertRaises(TypeError):
                 objTest.getEigenVectors(Value)
+            with self.assertRaises(TypeError):
+                objTest.getEigenVectors(Eigenvalue = Value)
+        for Value in ['1', 1, 0, 1.0, [True], (True, ), int, bool]:
+            with self.assertRaises(TypeError):
+                objTest.getEigenVectors(isSymmetric = Value)
+            with self.assertRaises(TypeError):
+                objTest.getEigenValues(isSymmetric = Value)
+            with self.assertRaises(TypeError):
+                objTest.getAllEigenValues(isSymmetric = Value)
+        del objTest
+    
+    def test_getEigenVectors_symmetric(self):
+        """
+        Checks the calculation of the eigenvalues and the orthonormal
+        eigenbasis of the symmetric matrices, and that the same results are
+        obtained with the symmetric and generic algorithms.
+        
+        Test ID: TEST-T-347
+        
+        Covers requirements: REQ-FUN-343
+        """
+        for _ in range(10):
+            Size = random.randint(2, 20)
+            Data = [[random.uniform(-5, 5) for _ in range(Size)]
+                                                        for _ in range(Size)]
+            Data = [[Data[RowIdx][ColIdx] + Data[ColIdx][RowIdx]
+                                                for ColIdx in range(Size)]
+                                                    for RowIdx in range(Size)]
+            objTest = self.TestClass(Data)
+            Test = objTest.getAllEigenValues()
+            Check = objTest.getAllEigenValues(isSymmetric = False)
+            self.assertEqual(len(Test), Size)
+            self.assertEqual(len(Check), Size)
+            for Value in Test:
+                self.assertIsInstance(Value, (int, float))
+            for Value, CheckValue in zip(sorted(Test), sorted(Check)):
+                self.assertAlmostEqual(Value, CheckValue)
+            Test = objTest.getEigenVectors()
+            self.assertIsInstance(Test, dict)
+            self.assertTupleEqual(tuple(Test.keys()),
+                                                    objTest.getEigenValues())
+            Vectors = []
+            for Key, Values in Test.items():
+                self.assertIsInstance(Values, tuple)
+                for Vector in Values:
+                    self.assertIsInstance(Vector, testmodule.Column)
+                    ControlVector = objTest * Vector
+                    for PosId in range(Size):
+                        self.assertAlmostEqual(ControlVector[PosId],
+                                                        Vector[PosId] * Key)
+                    Vectors.append(Vector)
+                    del ControlVector
+            self.assertEqual(len(Vectors), Size)
+            for Idx, Vector in enumerate(Vectors):
+                for Second in Vectors[Idx : ]:
+                    DotProd = Vector.transpose() * Second
+                    if Second is Vector:
+                        self.assertAlmostEqual(DotProd, 1)
+                    else:
+                        self.assertAlmostEqual(DotProd, 0)
+            Key = random.choice(list(Test.keys()))
+            Check = objTest.getEigenVectors(Eigenvalue = Key)
+            self.assertListEqual(list(Check.keys()), [Key])
+            self.assertEqual(len(Check[Key]), len(Test[Key]))
+            self.assertIsNone(objTest.getEigenVectors(Eigenvalue = Key + 0.5))
+            del objTest
+        #forced symmetric algorithm uses the symmetric part of the matrix
+        objTest = self.TestClass([[2, 0], [2, 2]])
+        Test = objTest.getEigenVectors(isSymmetric = True)
+        self.assertListEqual(sorted(Test.keys()), [1, 3])
+        self.assertIsNone(objTest.getEigenVectors(isSymmetric = False,
+                                                            Eigenvalue = 3))
+        del objTest
+        #multiple eigenvalue, symmetric singular matrix
+        objTest = self.TestClass([[2, 1, 1], [1, 2, 1], [1, 1, 2]])
+        Test = objTest.getEigenVectors()
+        self.assertListEqual(list(Test.keys()), [4, 1])
+        self.assertEqual(len(Test[4]), 1)
+        self.assertEqual(len(Test[1]), 2)
+        del objTest
+        objTest = self.TestClass([[1, 2], [2, 4]])
+        self.assertIsNone(objTest.getEigenVectors())
+        Test = objTest.getEigenVectors(Eigenvalue = 0)
+        self.assertEqual(len(Test[0]), 1)
+        self.assertAlmostEqual(Test[0][0][0], -2 * Test[0][0][1])
         del objTest
     
     def test_getEigenVectors_Argument(self):
@@ -4397,6 +4641,1057 @@ class Test_SquareMatrix(Test_Matrix):
         self.assertAlmostEqual(Test[1][0].transpose() * Test[1][1], 0)
         del objTest
 
+class Test_FlatStorage(unittest.TestCase):
+    """
+    Set of unit tests for the flat storage of the matrix classes and the
+    zero-copy row and column views.
+    
+    Implements tests: TEST-T-350
+    
+    Covers requirements: REQ-FUN-308, REQ-AWM-307, REQ-AWM-308
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClasses = (testmodule.Array2D, testmodule.Matrix,
+                                                    testmodule.SquareMatrix)
+    
+    def getNested(self, Width: int, Height: int, isFloat: bool) -> list:
+        """
+        Helper method to generate random nested lists of the elements.
+        """
+        if isFloat:
+            Result = [[random.uniform(-5, 5) for _ in range(Width)]
+                                                    for _ in range(Height)]
+        else:
+            Result = [[random.randint(-5, 5) for _ in range(Width)]
+                                                    for _ in range(Height)]
+        return Result
+    
+    def getSizes(self, TestClass: type) -> tuple:
+        """
+        Helper method to generate random dimensions suitable for the class.
+        """
+        Width = random.randint(2, 6)
+        if TestClass is testmodule.SquareMatrix:
+            Height = Width
+        else:
+            Height = random.randint(2, 6)
+        return Width, Height
+    
+    def test_storage_type(self):
+        """
+        Checks that the all floating point elements are packed into an array
+        of C doubles, whereas the integer elements are kept exactly.
+        
+        Test ID: TEST-T-350
+        
+        Covers requirements: REQ-FUN-308
+        """
+        for TestClass in self.TestClasses:
+            for _ in range(10):
+                Width, Height = self.getSizes(TestClass)
+                Nested = self.getNested(Width, Height, True)
+                Test = TestClass(Nested)
+                self.assertIsInstance(Test._Elements, testmodule.array)
+                self.assertEqual(len(Test._Elements), Width * Height)
+                self.assertListEqual(Test.Data, Nested)
+                Nested = self.getNested(Width, Height, False)
+                Nested[-1][-1] = random.random()
+                Test = TestClass(Nested)
+                self.assertIsInstance(Test._Elements, tuple)
+                self.assertEqual(len(Test._Elements), Width * Height)
+                self.assertListEqual(Test.Data, Nested)
+                for Row in Test.Data[:-1]:
+                    for Item in Row:
+                        self.assertIsInstance(Item, int)
+                del Test
+    
+    def test_element_access(self):
+        """
+        Checks the per element access with the positive and negative indexes
+        for the both storage types and both parsing orders.
+        
+        Test ID: TEST-T-350
+        
+        Covers requirements: REQ-FUN-308
+        """
+        for TestClass in self.TestClasses:
+            for isFloat in (True, False):
+                Width, Height = self.getSizes(TestClass)
+                Nested = self.getNested(Width, Height, isFloat)
+                Test = TestClass(Nested)
+                Transposed = TestClass(Nested, isColumnsFirst = True)
+                self.assertEqual(Transposed.Width, Height)
+                self.assertEqual(Transposed.Height, Width)
+                for Row in range(-Height, Height):
+                    for Column in range(-Width, Width):
+                        self.assertEqual(Test[Column, Row],
+                                                        Nested[Row][Column])
+                        self.assertEqual(Transposed[Row, Column],
+                                                        Nested[Row][Column])
+                del Test
+                del Transposed
+    
+    def test_views(self):
+        """
+        Checks the zero-copy row and column views.
+        
+        Test ID: TEST-T-350
+        
+        Covers requirements: REQ-FUN-308
+        """
+        for TestClass in self.TestClasses:
+            for isFloat in (True, False):
+                Width, Height = self.getSizes(TestClass)
+                Nested = self.getNested(Width, Height, isFloat)
+                Test = TestClass(Nested)
+                for Index in range(-Height, Height):
+                    View = Test.getRowView(Index)
+                    self.assertIsInstance(View, testmodule.ArrayView)
+                    self.assertIsInstance(View, Sequence)
+                    self.assertIs(View._Storage, Test._Elements)
+                    self.assertEqual(len(View), Width)
+                    self.assertListEqual(list(View), Nested[Index])
+                    self.assertListEqual(View.Data, Nested[Index])
+                    for Position in range(-Width, Width):
+                        self.assertEqual(View[Position],
+                                                    Nested[Index][Position])
+                    self.assertIn(Nested[Index][0], View)
+                for Index in range(-Width, Width):
+                    View = Test.getColumnView(Index)
+                    Control = [Row[Index] for Row in Nested]
+                    self.assertIs(View._Storage, Test._Elements)
+                    self.assertEqual(len(View), Height)
+                    self.assertListEqual(list(View), Control)
+                    for Position in range(-Height, Height):
+                        self.assertEqual(View[Position], Control[Position])
+                    self.assertIn(Control[-1], View)
+                del Test
+    
+    def test_views_errors(self):
+        """
+        Checks the treatment of the improper type and value indexes of the
+        views and in the view requesting methods.
+        
+        Test ID: TEST-T-350
+        
+        Covers requirements: REQ-AWM-307, REQ-AWM-308
+        """
+        for TestClass in self.TestClasses:
+            Width, Height = self.getSizes(TestClass)
+            Test = TestClass(self.getNested(Width, Height, True))
+            for Index in (1.0, '1', [1], (1, 1), slice(1, 2), None):
+                with self.assertRaises(TypeError):
+                    Test.getRowView(Index)
+                with self.assertRaises(TypeError):
+                    Test.getColumnView(Index)
+                with self.assertRaises(TypeError):
+                    Test.getRowView(0)[Index]
+                with self.assertRaises(TypeError):
+                    Test.getColumnView(0)[Index]
+            for Index in (-Height - 1, Height, Height + 5):
+                with self.assertRaises(ValueError):
+                    Test.getRowView(Index)
+                with self.assertRaises(ValueError):
+                    Test.getColumnView(0)[Index]
+            for Index in (-Width - 1, Width, Width + 5):
+                with self.assertRaises(ValueError):
+                    Test.getColumnView(Index)
+                with self.assertRaises(ValueError):
+                    Test.getRowView(0)[Index]
+            del Test
+    
+    def test_operations(self):
+        """
+        Checks that the transposition, arithmetics and matrix multiplication
+        results are the same as computed directly from the nested lists.
+        
+        Test ID: TEST-T-350
+        
+        Covers requirements: REQ-FUN-308
+        """
+        for isFloat in (True, False):
+            for _ in range(10):
+                Width = random.randint(2, 6)
+                Height = random.randint(2, 6)
+                Size = random.randint(2, 6)
+                Left = self.getNested(Width, Height, isFloat)
+                Right = self.getNested(Size, Width, isFloat)
+                Test = testmodule.Matrix(Left) * testmodule.Matrix(Right)
+                Control = [[sum(Left[Row][Index] * Right[Index][Column]
+                                                for Index in range(Width))
+                                                    for Column in range(Size)]
+                                                    for Row in range(Height)]
+                self.assertListEqual(Test.Data, Control)
+                if Size == Height:
+                    self.assertIsInstance(Test, testmodule.SquareMatrix)
+                else:
+                    self.assertNotIsInstance(Test, testmodule.SquareMatrix)
+                Test = testmodule.Matrix(Left).transpose()
+                self.assertListEqual(Test.Data,
+                                    [list(Column) for Column in zip(*Left)])
+                Test = testmodule.Matrix(Left) - testmodule.Matrix(Left) * 2
+                self.assertListEqual(Test.Data,
+                                    [[-Item for Item in Row] for Row in Left])
+                del Test
+
+class Test_MatrixProduct(unittest.TestCase):
+    """
+    Set of unit tests for the matrix multiplication engine: tiled pure Python
+    implementation and the optional NumPy backend.
+    
+    Implements tests: TEST-T-351
+    
+    Covers requirements: REQ-FUN-306, REQ-FUN-309
+    """
+    
+    def setUp(self) -> None:
+        """
+        Preparation for each test case - stores the NumPy backend.
+        """
+        self.Backend = testmodule.np
+    
+    def tearDown(self) -> None:
+        """
+        Clean-up after each test case - restores the NumPy backend.
+        """
+        testmodule.np = self.Backend
+    
+    def getBackends(self):
+        """
+        Generator, which switches between the NumPy and the pure Python
+        backends, skipping the former if NumPy is not installed.
+        """
+        if not (self.Backend is None):
+            testmodule.np = self.Backend
+            yield True
+        testmodule.np = None
+        yield False
+    
+    def getNested(self, Width: int, Height: int, isFloat: bool) -> list:
+        """
+        Helper method to generate random nested lists of the elements.
+        """
+        if isFloat:
+            Result = [[random.uniform(-5, 5) for _ in range(Width)]
+                                                    for _ in range(Height)]
+        else:
+            Result = [[random.randint(-5, 5) for _ in range(Width)]
+                                                    for _ in range(Height)]
+        return Result
+    
+    def test_large_float(self):
+        """
+        Checks the product of the large floating point matrices, with the
+        sizes not multiple of the tile size. The pure Python implementation
+        must be exact, the NumPy backend - within the rounding errors.
+        
+        Test ID: TEST-T-351
+        
+        Covers requirements: REQ-FUN-306, REQ-FUN-309
+        """
+        Block = testmodule.MATMUL_BLOCK
+        Height = Block + random.randint(1, 9)
+        Inner = Block + random.randint(1, 9)
+        Width = 2 * Block + random.randint(1, 9)
+        Left = self.getNested(Inner, Height, True)
+        Right = self.getNested(Width, Inner, True)
+        Control = [[sum(Left[Row][Index] * Right[Index][Column]
+                                                for Index in range(Inner))
+                                                    for Column in range(Width)]
+                                                    for Row in range(Height)]
+        for isNumPy in self.getBackends():
+            Test = testmodule.Matrix(Left) * testmodule.Matrix(Right)
+            self.assertIsInstance(Test, testmodule.Matrix)
+            self.assertNotIsInstance(Test, testmodule.SquareMatrix)
+            self.assertIsInstance(Test._Elements, testmodule.array)
+            self.assertEqual(Test.Width, Width)
+            self.assertEqual(Test.Height, Height)
+            if isNumPy:
+                for Row, ControlRow in zip(Test.Data, Control):
+                    for Item, ControlItem in zip(Row, ControlRow):
+                        self.assertAlmostEqual(Item, ControlItem, places = 10)
+            else:
+                self.assertListEqual(Test.Data, Control)
+            del Test
+    
+    def test_mixed_types(self):
+        """
+        Checks that the product of the integer matrices stays exact integer
+        with any backend, and the product of the integer and floating point
+        matrices is a floating point matrix.
+        
+        Test ID: TEST-T-351
+        
+        Covers requirements: REQ-FUN-306, REQ-FUN-309
+        """
+        Size = testmodule.MATMUL_BLOCK + random.randint(1, 9)
+        Left = self.getNested(Size, Size, False)
+        Right = self.getNested(Size, Size, False)
+        Control = [[sum(Left[Row][Index] * Right[Index][Column]
+                                                for Index in range(Size))
+                                                    for Column in range(Size)]
+                                                    for Row in range(Size)]
+        FloatRight = self.getNested(Size, Size, True)
+        for _ in self.getBackends():
+            Test = testmodule.SquareMatrix(Left) * testmodule.Matrix(Right)
+            self.assertIsInstance(Test, testmodule.SquareMatrix)
+            self.assertIsInstance(Test._Elements, tuple)
+            self.assertListEqual(Test.Data, Control)
+            for Row in Test.Data:
+                for Item in Row:
+                    self.assertIsInstance(Item, int)
+            Test = testmodule.Matrix(Left) * testmodule.Matrix(FloatRight)
+            self.assertIsInstance(Test._Elements, testmodule.array)
+            for Row in range(Size):
+                for Column in range(Size):
+                    Value = sum(Left[Row][Index] * FloatRight[Index][Column]
+                                                    for Index in range(Size))
+                    self.assertAlmostEqual(Test[Column, Row], Value,
+                                                                places = 10)
+            del Test
+
+class Test_LUFactorization(unittest.TestCase):
+    """
+    Set of unit tests for the class LUFactorization.
+    
+    Implements tests: TEST-T-360, TEST-T-361
+    
+    Covers requirements: REQ-FUN-360, REQ-AWM-360, REQ-AWM-361
+    """
+    
+    def getMatrix(self, Size: int) -> list:
+        """
+        Helper method to generate random nested lists of the elements of a
+        non-singular square matrix.
+        """
+        while True:
+            Result = [[random.randint(-5, 5) + random.random()
+                                for _ in range(Size)] for _ in range(Size)]
+            if testmodule.SquareMatrix(Result).getDeterminant():
+                break
+        return Result
+    
+    def test_factorize(self):
+        """
+        Checks the creation of the factorization and its properties.
+        
+        Test ID: TEST-T-360
+        
+        Covers requirements: REQ-FUN-360
+        """
+        for Size in range(2, 8):
+            Matrix = testmodule.SquareMatrix(self.getMatrix(Size))
+            Test = Matrix.factorize()
+            self.assertIsInstance(Test, testmodule.LUFactorization)
+            self.assertEqual(Test.Size, Size)
+            self.assertAlmostEqual(Test.Determinant, Matrix.getDeterminant())
+            with self.assertRaises(AttributeError):
+                Test.Size = 1
+            with self.assertRaises(AttributeError):
+                Test.Determinant = 1
+            Test = testmodule.LUFactorization(Matrix)
+            self.assertEqual(Test.Size, Size)
+            del Test
+            del Matrix
+    
+    def test_solve(self):
+        """
+        Checks the solution of the systems with a single and many vectors of
+        the free coefficients, with the columns and rows (partial) pivoting.
+        
+        Test ID: TEST-T-360
+        
+        Covers requirements: REQ-FUN-360
+        """
+        for Size in range(2, 8):
+            Matrix = testmodule.SquareMatrix(self.getMatrix(Size))
+            for Flag in (False, True):
+                Test = Matrix.factorize(isPartialPivoting = Flag)
+                self.assertAlmostEqual(Test.Determinant,
+                                                    Matrix.getDeterminant())
+                NVectors = random.randint(1, 5)
+                FreeVectors = [[random.uniform(-5, 5) for _ in range(Size)]
+                                                    for _ in range(NVectors)]
+                Solutions = Test.solveMany(FreeVectors)
+                self.assertIsInstance(Solutions, list)
+                self.assertEqual(len(Solutions), len(FreeVectors))
+                for Free, Solution in zip(FreeVectors, Solutions):
+                    self.assertListEqual(Test.solve(Free), Solution)
+                    self.assertListEqual(Test.solve(testmodule.Column(*Free)),
+                                                                    Solution)
+                    Check = (Matrix * testmodule.Column(*Solution)).Data
+                    for FreeCoeff, CheckValue in zip(Free, Check):
+                        self.assertAlmostEqual(FreeCoeff, CheckValue)
+                self.assertListEqual(Test.solveMany([]), [])
+                FreeMatrix = testmodule.Matrix(FreeVectors + [FreeVectors[0]],
+                                                        isColumnsFirst = True)
+                Solutions = Test.solveMatrix(FreeMatrix)
+                self.assertIsInstance(Solutions, testmodule.Matrix)
+                self.assertEqual(Solutions.Width, NVectors + 1)
+                self.assertEqual(Solutions.Height, Size)
+                for ColIdx, Free in enumerate(FreeVectors):
+                    Solution = Test.solve(Free)
+                    for RowIdx, Value in enumerate(Solution):
+                        self.assertEqual(Solutions[ColIdx, RowIdx], Value)
+                Solutions = Test.solveMatrix(Matrix)
+                self.assertIsInstance(Solutions, testmodule.SquareMatrix)
+                for ColIdx in range(Size):
+                    for RowIdx in range(Size):
+                        self.assertAlmostEqual(Solutions[ColIdx, RowIdx],
+                                                    int(ColIdx == RowIdx))
+                del Test
+            del Matrix
+    
+    def test_singular(self):
+        """
+        Checks that None is returned for a singular matrix.
+        
+        Test ID: TEST-T-360
+        
+        Covers requirements: REQ-FUN-360
+        """
+        WrongMatrices = [[[0.8, -0.6], [0.8, -0.6]],
+                        [[1, 2, 3], [4, 5, 6], [3, 3, 3]],
+                        [[1, 2, 3, 0], [2, 3, 1, 0], [3, 5, 5, 0],
+                        [9, 8, 7, 0]]]
+        for Elements in WrongMatrices:
+            Test = testmodule.SquareMatrix(Elements).factorize()
+            self.assertEqual(Test.Determinant, 0)
+            Free = [1 for _ in Elements]
+            self.assertIsNone(Test.solve(Free))
+            self.assertIsNone(Test.solveMany([Free, Free]))
+            FreeMatrix = testmodule.Matrix([Free, Free],
+                                                        isColumnsFirst = True)
+            self.assertIsNone(Test.solveMatrix(FreeMatrix))
+            del Test
+    
+    def test_TypeError(self):
+        """
+        Checks the treatment of the improper type arguments.
+        
+        Test ID: TEST-T-361
+        
+        Covers requirements: REQ-AWM-360
+        """
+        for Arg in (1, 1.0, [[1, 2], [3, 4]], 'abcd',
+                    testmodule.Matrix([[1, 2], [3, 4]]), None):
+            with self.assertRaises(TypeError):
+                testmodule.LUFactorization(Arg)
+        Test = testmodule.SquareMatrix([[1, 2], [3, 4]]).factorize()
+        for Arg in (1, 1.0, 'ab', [1, '2'], testmodule.Row(1, 2), None,
+                    [[1, 2], [3, 4]]):
+            with self.assertRaises(TypeError):
+                Test.solve(Arg)
+            with self.assertRaises(TypeError):
+                Test.solveMany([[1, 2], Arg])
+        for Arg in (1, 1.0, 'ab', None, testmodule.Column(1, 2)):
+            with self.assertRaises(TypeError):
+                Test.solveMany(Arg)
+        for Arg in (1, 1.0, 'ab', None, testmodule.Column(1, 2),
+                    [[1, 2], [3, 4]], testmodule.Array2D([[1, 2], [3, 4]])):
+            with self.assertRaises(TypeError):
+                Test.solveMatrix(Arg)
+    
+    def test_ValueError(self):
+        """
+        Checks the treatment of the mismatching sizes.
+        
+        Test ID: TEST-T-361
+        
+        Covers requirements: REQ-AWM-361
+        """
+        Test = testmodule.SquareMatrix([[1, 2], [3, 4]]).factorize()
+        for Arg in ([], [1], [1, 2, 3], testmodule.Column(1, 2, 3)):
+            with self.assertRaises(ValueError):
+                Test.solve(Arg)
+            with self.assertRaises(ValueError):
+                Test.solveMany([[1, 2], Arg])
+        for Arg in ([[1, 2]] * 3, [[1, 2, 3]] * 3):
+            with self.assertRaises(ValueError):
+                Test.solveMatrix(testmodule.Matrix(Arg))
+
+class Test_CSRMatrix(unittest.TestCase):
+    """
+    Set of unit tests for the class CSRMatrix and the sparse factorization.
+    
+    Implements tests: TEST-T-370, TEST-T-371, TEST-T-372, TEST-T-373,
+        TEST-T-374, TEST-T-375, TEST-T-376
+    
+    Covers requirements: REQ-FUN-370, REQ-FUN-371, REQ-FUN-372,
+        REQ-AWM-370, REQ-AWM-371
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.CSRMatrix
+        cls.OtherClass = testmodule.COOMatrix
+        cls.FactorizationClass = testmodule.SparseLUFactorization
+    
+    def getElements(self, Width: int, Height: int) -> list:
+        """
+        Helper method to generate random nested lists of the elements of a
+        matrix in the rows-first order with mostly zero elements.
+        """
+        return [[random.choice([0, 0, 0, random.randint(-5, 5),
+                                                random.uniform(-5, 5)])
+                            for _ in range(Width)] for _ in range(Height)]
+    
+    def getTridiagonal(self, Size: int) -> object:
+        """
+        Helper method to generate a non-singular tridiagonal sparse matrix.
+        """
+        Entries = [(Index, Index, 4.0) for Index in range(Size)]
+        for Index in range(Size - 1):
+            Entries.append((Index + 1, Index, -1.0))
+            Entries.append((Index, Index + 1, random.uniform(-1, 1)))
+        return self.TestClass(Entries, Width = Size, Height = Size)
+    
+    def test_init(self):
+        """
+        Checks the instantiation, the properties and the elements access.
+        
+        Test ID: TEST-T-370
+        
+        Covers requirements: REQ-FUN-370
+        """
+        Entries = [(0, 0, 1), (2, 0, 2.5), (1, 1, -3), (0, 2, 4), (2, 0, 1),
+                                                        (3, 2, 0), (1, 2, 0.0)]
+        Test = self.TestClass(Entries, Width = 4, Height = 3)
+        self.assertIsInstance(Test, testmodule.SparseMatrix)
+        self.assertEqual(Test.Width, 4)
+        self.assertEqual(Test.Height, 3)
+        self.assertEqual(Test.NonZeros, 4)
+        self.assertListEqual(Test.Data, [[1, 0, 3.5, 0], [0, -3, 0, 0],
+                                                                [4, 0, 0, 0]])
+        self.assertListEqual(Test.getEntries(), [(0, 0, 1), (2, 0, 3.5),
+                                                        (1, 1, -3), (0, 2, 4)])
+        self.assertEqual(Test[2, 0], 3.5)
+        self.assertEqual(Test[-2, -3], 3.5)
+        self.assertEqual(Test[3, 2], 0)
+        self.assertEqual(Test[-4, -1], 4)
+        Other = self.TestClass({(0, 0) : 1, (2, 0) : 3.5, (1, 1) : -3,
+                            (0, 2) : 4, (3, 1) : 0}, Width = 4, Height = 3)
+        self.assertListEqual(Other.getEntries(), Test.getEntries())
+        Other = self.TestClass([], Width = 2, Height = 2)
+        self.assertEqual(Other.NonZeros, 0)
+        self.assertListEqual(Other.Data, [[0, 0], [0, 0]])
+        for Attribute in ('Width', 'Height', 'NonZeros', 'Data'):
+            with self.assertRaises(AttributeError):
+                setattr(Test, Attribute, 1)
+        with self.assertRaises(TypeError):
+            Test[0, 0] = 1
+        self.assertNotIsInstance(Test, Sequence)
+        del Test
+        del Other
+    
+    def test_conversion(self):
+        """
+        Checks the conversion to and from the dense matrices and between the
+        sparse formats.
+        
+        Test ID: TEST-T-371
+        
+        Covers requirements: REQ-FUN-370
+        """
+        for _ in range(20):
+            Width = random.randint(2, 8)
+            Height = random.randint(2, 8)
+            Elements = self.getElements(Width, Height)
+            Dense = testmodule.Matrix(Elements)
+            for Source in (Elements, Dense):
+                Test = self.TestClass.fromDense(Source)
+                self.assertIsInstance(Test, self.TestClass)
+                self.assertEqual(Test.Width, Width)
+                self.assertEqual(Test.Height, Height)
+                self.assertEqual(Test.NonZeros,
+                                    sum(bool(Item) for Row in Elements
+                                                        for Item in Row))
+                self.assertListEqual(Test.Data, Elements)
+                for ColIdx in range(Width):
+                    for RowIdx in range(Height):
+                        self.assertEqual(Test[ColIdx, RowIdx],
+                                                    Elements[RowIdx][ColIdx])
+            Result = Test.toDense()
+            if Width == Height:
+                self.assertIsInstance(Result, testmodule.SquareMatrix)
+            else:
+                self.assertIsInstance(Result, testmodule.Matrix)
+                self.assertNotIsInstance(Result, testmodule.SquareMatrix)
+            self.assertListEqual(Result.Data, Elements)
+            Result = Test.toCSR()
+            self.assertIsInstance(Result, testmodule.CSRMatrix)
+            self.assertListEqual(Result.getEntries(), Test.getEntries())
+            Result = Test.toCOO()
+            self.assertIsInstance(Result, testmodule.COOMatrix)
+            self.assertListEqual(Result.getEntries(), Test.getEntries())
+            Result = self.TestClass(Test.getEntries(), Width = Width,
+                                                            Height = Height)
+            self.assertListEqual(Result.Data, Elements)
+            del Test
+            del Result
+    
+    def test_arithmetics(self):
+        """
+        Checks the multiplication of the sparse matrices by the scalars,
+        vectors, dense and sparse matrices against the dense matrices.
+        
+        Test ID: TEST-T-372
+        
+        Covers requirements: REQ-FUN-371
+        """
+        for _ in range(20):
+            Width = random.randint(2, 8)
+            Height = random.randint(2, 8)
+            Other = random.randint(2, 8)
+            Elements = self.getElements(Width, Height)
+            Dense = testmodule.Matrix(Elements)
+            Test = self.TestClass.fromDense(Elements)
+            Scalar = random.choice([2, -1.5])
+            for Result in (Test * Scalar, Scalar * Test):
+                self.assertIsInstance(Result, self.TestClass)
+                self.assertListEqual(Result.Data, (Dense * Scalar).Data)
+            Result = Test * 0
+            self.assertIsInstance(Result, self.TestClass)
+            self.assertEqual(Result.NonZeros, 0)
+            Vector = testmodule.Column(*[random.uniform(-5, 5)
+                                                    for _ in range(Width)])
+            Result = Test * Vector
+            self.assertIsInstance(Result, testmodule.Column)
+            for Value, Check in zip(Result.Data, (Dense * Vector).Data):
+                self.assertAlmostEqual(Value, Check)
+            Vector = testmodule.Row(*[random.uniform(-5, 5)
+                                                    for _ in range(Height)])
+            Result = Vector * Test
+            self.assertIsInstance(Result, testmodule.Row)
+            for Value, Check in zip(Result.Data, (Vector * Dense).Data):
+                self.assertAlmostEqual(Value, Check)
+            Right = testmodule.Matrix(self.getElements(Other, Width))
+            Left = testmodule.Matrix(self.getElements(Height, Other))
+            for Result, Check in ((Test * Right, Dense * Right),
+                                            (Left * Test, Left * Dense)):
+                self.assertIsInstance(Result, Check.__class__)
+                self.assertEqual(Result.Width, Check.Width)
+                self.assertEqual(Result.Height, Check.Height)
+                for Row, CheckRow in zip(Result.Data, Check.Data):
+                    for Value, CheckValue in zip(Row, CheckRow):
+                        self.assertAlmostEqual(Value, CheckValue)
+            for Factor in (self.TestClass, self.OtherClass):
+                Right = Factor.fromDense(self.getElements(Other, Width))
+                Result = Test * Right
+                self.assertIsInstance(Result, self.TestClass)
+                Check = Dense * Right.toDense()
+                self.assertEqual(Result.Width, Other)
+                self.assertEqual(Result.Height, Height)
+                for Row, CheckRow in zip(Result.Data, Check.Data):
+                    for Value, CheckValue in zip(Row, CheckRow):
+                        self.assertAlmostEqual(Value, CheckValue)
+            del Test
+            del Result
+    
+    def test_transpose(self):
+        """
+        Checks the transposition of the sparse matrices.
+        
+        Test ID: TEST-T-373
+        
+        Covers requirements: REQ-FUN-371
+        """
+        for _ in range(20):
+            Width = random.randint(2, 8)
+            Height = random.randint(2, 8)
+            Elements = self.getElements(Width, Height)
+            Test = self.TestClass.fromDense(Elements)
+            Result = Test.transpose()
+            self.assertIsInstance(Result, self.TestClass)
+            self.assertEqual(Result.Width, Height)
+            self.assertEqual(Result.Height, Width)
+            self.assertEqual(Result.NonZeros, Test.NonZeros)
+            self.assertListEqual(Result.Data,
+                                testmodule.Matrix(Elements).transpose().Data)
+            self.assertListEqual(Result.transpose().getEntries(),
+                                                        Test.getEntries())
+            del Test
+            del Result
+    
+    def test_factorize(self):
+        """
+        Checks the sparse factorization against the dense one, and the
+        solution of the large tridiagonal systems.
+        
+        Test ID: TEST-T-374
+        
+        Covers requirements: REQ-FUN-372
+        """
+        for Size in range(2, 10):
+            while True:
+                Elements = self.getElements(Size, Size)
+                for Index in range(Size):
+                    Elements[Index][Index] += random.choice([0, 1, 2])
+                Dense = testmodule.SquareMatrix(Elements)
+                Determinant = Dense.getDeterminant()
+                if abs(Determinant) > 0.001: #not even numerically singular
+                    break
+            Test = self.TestClass.fromDense(Elements).factorize()
+            self.assertIsInstance(Test, self.FactorizationClass)
+            self.assertIsInstance(Test, testmodule.LUFactorization)
+            self.assertEqual(Test.Size, Size)
+            self.assertAlmostEqual(Test.Determinant / Determinant, 1)
+            Check = Dense.factorize()
+            FreeVectors = [[random.uniform(-5, 5) for _ in range(Size)]
+                                                            for _ in range(3)]
+            Solutions = Test.solveMany(FreeVectors)
+            for Free, Solution in zip(FreeVectors, Solutions):
+                self.assertListEqual(Test.solve(Free), Solution)
+                for Value, CheckValue in zip(Solution, Check.solve(Free)):
+                    self.assertAlmostEqual(Value, CheckValue)
+            FreeMatrix = testmodule.Matrix(FreeVectors, isColumnsFirst = True)
+            Result = Test.solveMatrix(FreeMatrix)
+            self.assertIsInstance(Result, testmodule.Matrix)
+            for ColIdx, Solution in enumerate(Solutions):
+                for RowIdx, Value in enumerate(Solution):
+                    self.assertEqual(Result[ColIdx, RowIdx], Value)
+            del Test
+            del Check
+        for Elements in ([[0.8, -0.6], [0.8, -0.6]],
+                                [[1, 0, 3], [0, 5, 0], [2, 0, 6]],
+                                [[1, 2, 0], [0, 0, 0], [0, 3, 4]]):
+            Test = self.FactorizationClass(
+                                        self.TestClass.fromDense(Elements))
+            self.assertEqual(Test.Determinant, 0)
+            self.assertIsNone(Test.solve([1] * len(Elements)))
+            self.assertIsNone(Test.solveMany([[1] * len(Elements)]))
+            del Test
+        Size = 2000
+        Matrix = self.getTridiagonal(Size)
+        Test = Matrix.factorize()
+        Free = [random.uniform(-5, 5) for _ in range(Size)]
+        Solution = Test.solve(Free)
+        Check = (Matrix * testmodule.Column(*Solution)).Data
+        for Value, CheckValue in zip(Free, Check):
+            self.assertAlmostEqual(Value, CheckValue)
+        Matrix = Matrix * 0.01 #the determinant underflows to zero
+        Test = Matrix.factorize()
+        Solution = Test.solve(Free)
+        self.assertIsNotNone(Solution)
+        Check = (Matrix * testmodule.Column(*Solution)).Data
+        for Value, CheckValue in zip(Free, Check):
+            self.assertAlmostEqual(Value, CheckValue)
+        del Test
+        del Matrix
+    
+    def test_TypeError(self):
+        """
+        Checks the treatment of the improper type arguments.
+        
+        Test ID: TEST-T-375
+        
+        Covers requirements: REQ-AWM-370
+        """
+        for Arg in (1, 1.0, None, 'abc', {1, 2}, (1, 2, 3),
+                    [(0, 0, 1), 1], [(0, 0, 1), 'abc'], [(0.0, 0, 1)],
+                    [(0, True, 1)], [(0, 0, '1')], [(0, 0, None)],
+                    {0 : 1}, {(0, 0) : '1'}, {(0, 0.5) : 1}):
+            with self.assertRaises(TypeError):
+                self.TestClass(Arg, Width = 2, Height = 2)
+        for Arg in (2.0, None, '2', True, [2]):
+            with self.assertRaises(TypeError):
+                self.TestClass([], Width = Arg, Height = 2)
+            with self.assertRaises(TypeError):
+                self.TestClass([], Width = 2, Height = Arg)
+        for Arg in (1, 1.0, None, 'abc', [[1, 2], [3, '4']], [[1, 2], 3]):
+            with self.assertRaises(TypeError):
+                self.TestClass.fromDense(Arg)
+        Test = self.TestClass([(0, 0, 1), (1, 1, 2)], Width = 2, Height = 2)
+        for Arg in (1, 1.0, None, 'a', [0, 0], (0, 0.0), (0, None)):
+            with self.assertRaises(TypeError):
+                Test[Arg]
+        for Arg in (None, 'a', [1, 2], testmodule.Row(1, 2),
+                    testmodule.Array2D([[1, 2], [3, 4]]), True):
+            with self.assertRaises(TypeError):
+                Test * Arg
+        for Arg in (None, 'a', [1, 2], testmodule.Column(1, 2),
+                    testmodule.Array2D([[1, 2], [3, 4]]), True):
+            with self.assertRaises(TypeError):
+                Arg * Test
+        for Arg in (1, 1.0, None, [[1, 2], [3, 4]],
+                                    testmodule.SquareMatrix([[1, 2], [3, 4]])):
+            with self.assertRaises(TypeError):
+                self.FactorizationClass(Arg)
+        del Test
+    
+    def test_ValueError(self):
+        """
+        Checks the treatment of the improper values of the arguments.
+        
+        Test ID: TEST-T-376
+        
+        Covers requirements: REQ-AWM-371
+        """
+        for Arg in ([(0, 0, 1, 2)], [(0, 0)], [(2, 0, 1)], [(0, 2, 1)],
+                    [(-1, 0, 1)], [(0, -1, 1)], {(0, 0, 0) : 1}, {(0, ) : 1}):
+            with self.assertRaises(ValueError):
+                self.TestClass(Arg, Width = 2, Height = 2)
+        for Arg in (-1, 0, 1):
+            with self.assertRaises(ValueError):
+                self.TestClass([], Width = Arg, Height = 2)
+            with self.assertRaises(ValueError):
+                self.TestClass([], Width = 2, Height = Arg)
+        for Arg in ([[1, 2]], [[1], [2]], [[1, 2], [3, 4, 5]], [], [1, 2]):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromDense(Arg)
+        Test = self.TestClass([(0, 0, 1), (1, 1, 2)], Width = 2, Height = 3)
+        for Arg in ((2, 0), (-3, 0), (0, 3), (0, -4), (0, 0, 0), (0, )):
+            with self.assertRaises(ValueError):
+                Test[Arg]
+        for Arg in (testmodule.Column(1, 2, 3),
+                    testmodule.Matrix([[1, 2], [3, 4], [5, 6]]),
+                    self.TestClass([], Width = 2, Height = 3)):
+            with self.assertRaises(ValueError):
+                Test * Arg
+        for Arg in (testmodule.Row(1, 2), testmodule.Matrix([[1, 2], [3, 4]])):
+            with self.assertRaises(ValueError):
+                Arg * Test
+        with self.assertRaises(ValueError):
+            Test.factorize()
+        with self.assertRaises(ValueError):
+            self.FactorizationClass(Test)
+        del Test
+
+class Test_COOMatrix(Test_CSRMatrix):
+    """
+    Set of unit tests for the class COOMatrix and the sparse factorization.
+    
+    Implements tests: TEST-T-370, TEST-T-371, TEST-T-372, TEST-T-373,
+        TEST-T-374, TEST-T-375, TEST-T-376
+    
+    Covers requirements: REQ-FUN-370, REQ-FUN-371, REQ-FUN-372,
+        REQ-AWM-370, REQ-AWM-371
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.COOMatrix
+        cls.OtherClass = testmodule.CSRMatrix
+        cls.FactorizationClass = testmodule.SparseLUFactorization
+
+class Test_SparseMatrix(Test_CSRMatrix):
+    """
+    Set of unit tests for the base class SparseMatrix with its default storage
+    and the sparse factorization.
+    
+    Implements tests: TEST-T-370, TEST-T-371, TEST-T-372, TEST-T-373,
+        TEST-T-374, TEST-T-375, TEST-T-376
+    
+    Covers requirements: REQ-FUN-370, REQ-FUN-371, REQ-FUN-372,
+        REQ-AWM-370, REQ-AWM-371
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.SparseMatrix
+        cls.OtherClass = testmodule.COOMatrix
+        cls.FactorizationClass = testmodule.SparseLUFactorization
+
+class Test_BandedMatrix(Test_CSRMatrix):
+    """
+    Set of unit tests for the class BandedMatrix and the banded factorization.
+    
+    Implements tests: TEST-T-370, TEST-T-371, TEST-T-372, TEST-T-373,
+        TEST-T-374, TEST-T-375, TEST-T-376, TEST-T-377, TEST-T-378,
+        TEST-T-379
+    
+    Covers requirements: REQ-FUN-370, REQ-FUN-371, REQ-FUN-372,
+        REQ-FUN-373, REQ-FUN-374, REQ-AWM-370, REQ-AWM-371, REQ-AWM-372,
+        REQ-AWM-373
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.BandedMatrix
+        cls.OtherClass = testmodule.CSRMatrix
+        cls.FactorizationClass = testmodule.BandedLUFactorization
+    
+    def getBanded(self, Size: int, Lower: int, Upper: int) -> list:
+        """
+        Helper method to generate random nested lists of the elements of a
+        square matrix in the rows-first order with the non-zero elements only
+        within the band, and with the both outer diagonals not zero.
+        """
+        Result = [[0] * Size for _ in range(Size)]
+        for RowIdx in range(Size):
+            for ColIdx in range(max(0, RowIdx - Lower),
+                                            min(Size, RowIdx + Upper + 1)):
+                if ColIdx - RowIdx in (- Lower, Upper):
+                    Value = random.choice([random.randint(1, 5),
+                                                    random.uniform(-5, -1)])
+                else:
+                    Value = random.choice([0, random.randint(-5, 5),
+                                                    random.uniform(-5, 5)])
+                Result[RowIdx][ColIdx] = Value
+        return Result
+    
+    def test_bandwidths(self):
+        """
+        Checks the automatic detection of the bandwidths of the banded and
+        dense matrices, including the results of the arithmetics.
+        
+        Test ID: TEST-T-377
+        
+        Covers requirements: REQ-FUN-373
+        """
+        for _ in range(20):
+            Size = random.randint(2, 8)
+            Lower = random.randint(0, Size - 1)
+            Upper = random.randint(0, Size - 1)
+            Elements = self.getBanded(Size, Lower, Upper)
+            Dense = testmodule.SquareMatrix(Elements)
+            self.assertTupleEqual(Dense.getBandwidths(), (Lower, Upper))
+            Test = self.TestClass.fromDense(Elements)
+            self.assertEqual(Test.LowerWidth, Lower)
+            self.assertEqual(Test.UpperWidth, Upper)
+            Result = Test.transpose()
+            self.assertEqual(Result.LowerWidth, Upper)
+            self.assertEqual(Result.UpperWidth, Lower)
+            Result = Test * 2
+            self.assertEqual(Result.LowerWidth, Lower)
+            self.assertEqual(Result.UpperWidth, Upper)
+            Result = Test * 0
+            self.assertEqual(Result.LowerWidth, 0)
+            self.assertEqual(Result.UpperWidth, 0)
+            Result = Test * Test
+            Check = (Dense * Dense).getBandwidths()
+            self.assertEqual(Result.LowerWidth, Check[0])
+            self.assertEqual(Result.UpperWidth, Check[1])
+            del Test
+            del Result
+        Test = self.TestClass([(0, 2, 1), (1, 0, 2)], Width = 2, Height = 4)
+        self.assertEqual(Test.LowerWidth, 2)
+        self.assertEqual(Test.UpperWidth, 1)
+        for Attribute in ('LowerWidth', 'UpperWidth'):
+            with self.assertRaises(AttributeError):
+                setattr(Test, Attribute, 1)
+        self.assertTupleEqual(
+                testmodule.SquareMatrix.generateIdentity(3).getBandwidths(),
+                                                                        (0, 0))
+        del Test
+    
+    def test_fromDiagonals(self):
+        """
+        Checks the creation of a banded matrix from its diagonals, and the
+        treatment of the improper arguments.
+        
+        Test ID: TEST-T-378
+        
+        Covers requirements: REQ-FUN-373, REQ-AWM-372, REQ-AWM-373
+        """
+        Test = self.TestClass.fromDiagonals([[1, 2], [3, 4, 5], [6, 7]],
+                                                                    Lower = 1)
+        self.assertIsInstance(Test, self.TestClass)
+        self.assertListEqual(Test.Data, [[3, 6, 0], [1, 4, 7], [0, 2, 5]])
+        self.assertEqual(Test.LowerWidth, 1)
+        self.assertEqual(Test.UpperWidth, 1)
+        Test = self.TestClass.fromDiagonals([[1, 2, 3], [4, 5], [6]],
+                                                                    Lower = 0)
+        self.assertListEqual(Test.Data, [[1, 4, 6], [0, 2, 5], [0, 0, 3]])
+        self.assertEqual(Test.LowerWidth, 0)
+        self.assertEqual(Test.UpperWidth, 2)
+        Test = self.TestClass.fromDiagonals([[0], [1.5, 2], [0]],
+                                                                    Lower = 1)
+        self.assertListEqual(Test.Data, [[1.5, 0], [0, 2]])
+        self.assertEqual(Test.LowerWidth, 0)
+        self.assertEqual(Test.UpperWidth, 0)
+        for Arg in (1, 1.0, None, 'abc', [1, 2], [[1, 2], 'ab'],
+                                                        [[1, 2], [1, None]]):
+            with self.assertRaises(TypeError):
+                self.TestClass.fromDiagonals(Arg, Lower = 0)
+        for Arg in (0.0, None, '0', True, [0]):
+            with self.assertRaises(TypeError):
+                self.TestClass.fromDiagonals([[1, 2]], Lower = Arg)
+        for Arg in (-1, 1, 2):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromDiagonals([[1, 2]], Lower = Arg)
+        for Arg in ([], [[1]], [[1, 2], [3, 4]], [[1], [2, 3], [4, 5]],
+                                                    [[1, 2, 3], [4, 5, 6]]):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromDiagonals(Arg, Lower = 0)
+        del Test
+    
+    def test_banded_factorize(self):
+        """
+        Checks the banded factorization of the diagonally dominant and general
+        banded matrices against the dense one, and the solution of the large
+        systems.
+        
+        Test ID: TEST-T-379
+        
+        Covers requirements: REQ-FUN-374
+        """
+        for _ in range(40):
+            Size = random.randint(2, 10)
+            Lower = random.randint(0, Size - 1)
+            Upper = random.randint(0, Size - 1)
+            while True:
+                Elements = self.getBanded(Size, Lower, Upper)
+                if random.randint(0, 1):
+                    for Index in range(Size):
+                        Elements[Index][Index] = 10 * (Lower + Upper + 1)
+                Dense = testmodule.SquareMatrix(Elements)
+                Determinant = Dense.getDeterminant()
+                if abs(Determinant) > 0.001: #not even numerically singular
+                    break
+            Test = self.TestClass.fromDense(Elements).factorize()
+            self.assertIsInstance(Test, testmodule.BandedLUFactorization)
+            self.assertAlmostEqual(Test.Determinant / Determinant, 1)
+            Check = Dense.factorize()
+            Free = [random.uniform(-5, 5) for _ in range(Size)]
+            for Value, CheckValue in zip(Test.solve(Free), Check.solve(Free)):
+                self.assertAlmostEqual(Value, CheckValue)
+            del Test
+            del Check
+        Test = self.TestClass.fromDiagonals([[1, 1], [0, 1, 1], [1, 1]],
+                                                    Lower = 1).factorize()
+        self.assertEqual(Test.Determinant, -1)
+        for Value, CheckValue in zip(Test.solve([1, 2, 3]), [-1, 1, 2]):
+            self.assertAlmostEqual(Value, CheckValue)
+        with self.assertRaises(TypeError):
+            self.FactorizationClass(testmodule.CSRMatrix([(0, 0, 1),
+                                        (1, 1, 1)], Width = 2, Height = 2))
+        Size = 2000
+        Tridiagonal = self.getTridiagonal(Size)
+        #swapping the pairs of rows breaks the diagonal dominance
+        Swapped = self.TestClass([(ColIdx, RowIdx ^ 1, Value)
+                                for ColIdx, RowIdx, Value
+                                            in Tridiagonal.getEntries()],
+                                                Width = Size, Height = Size)
+        self.assertEqual(Swapped.LowerWidth, 2)
+        self.assertEqual(Swapped.UpperWidth, 2)
+        for Matrix in (Tridiagonal, Swapped):
+            Test = Matrix.factorize()
+            Free = [random.uniform(-5, 5) for _ in range(Size)]
+            Solution = Test.solve(Free)
+            Check = (Matrix * testmodule.Column(*Solution)).Data
+            for Value, CheckValue in zip(Free, Check):
+                self.assertAlmostEqual(Value, CheckValue, places = 6)
+        del Test
+        del Matrix
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_Vector)
@@ -4405,10 +5700,18 @@ TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_Row)
 TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_Array2D)
 TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_Matrix)
 TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_SquareMatrix)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(Test_FlatStorage)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_MatrixProduct)
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_LUFactorization)
+TestSuite10 = unittest.TestLoader().loadTestsFromTestCase(Test_CSRMatrix)
+TestSuite11 = unittest.TestLoader().loadTestsFromTestCase(Test_COOMatrix)
+TestSuite12 = unittest.TestLoader().loadTestsFromTestCase(Test_BandedMatrix)
+TestSuite13 = unittest.TestLoader().loadTestsFromTestCase(Test_SparseMatrix)
 
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
-                    TestSuite6])
+                    TestSuite6, TestSuite7, TestSuite8, TestSuite9,
+                    TestSuite10, TestSuite11, TestSuite12, TestSuite13])
 
 if __name__ == "__main__":
     sys.stdout.write(
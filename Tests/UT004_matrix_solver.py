@@ -5,8 +5,8 @@ Module math_extra_lib.Tests.UT004_matrix_solver
 Implements unit testing of the module math_extra_lib.matrix_solver, see TE004.
 """
 
-__version__ = "1.0.0.0"
-__date__ = "12-10-2023"
+__version__ = "1.5.0.0"
+__date__ = "17-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -30,6 +30,8 @@ if not (ROOT_FOLDER) in sys.path:
 import math_extra_lib.matrix_solver as testmodule
 
 from math_extra_lib.vectors_matrices import Column, SquareMatrix, Matrix, Row
+from math_extra_lib.vectors_matrices import SparseMatrix, CSRMatrix, COOMatrix
+from math_extra_lib.vectors_matrices import BandedMatrix
 
 #classes
 
@@ -109,11 +111,11 @@ class Test_SolveLinearSystem(unittest.TestCase):
     """
     Unit tests for the function SolveLinearSystem.
     
-    Test IDs: TEST-T-420, TEST-T-421, TEST-T-422, TEST-T-423
+    Test IDs: TEST-T-420, TEST-T-421, TEST-T-422, TEST-T-423, TEST-T-424
     
-    Covers requirements: REQ-FUN-420, REQ-AWM-420, REQ-AWM-421
+    Covers requirements: REQ-FUN-420, REQ-FUN-421, REQ-AWM-420, REQ-AWM-421
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     
     def test_TypeError(self):
@@ -132,9 +134,8 @@ class Test_SolveLinearSystem(unittest.TestCase):
             with self.assertRaises(TypeError):
                 Test = testmodule.SolveLinearSystem(Arg, [1, 2])
         WrongArgs = [1, 2.0, int, float, True, None, [1, "2"],
-                    [(1, 2), (1, 2)], (1, "2", 3, 4), Row(1, 2, 3),
-                    Matrix([(1, 2), (1, 2)]), SquareMatrix([(1, 2), (1, 2)]),
-                    "1", str]
+                    [(1, 2), (1, "2")], [(1, 2), Row(1, 2)], (1, "2", 3, 4),
+                    Row(1, 2, 3), [[1, 2], [None, 2]], "1", str]
         for Arg in WrongArgs:
             with self.assertRaises(TypeError):
                 Test = testmodule.SolveLinearSystem(
@@ -156,7 +157,9 @@ class Test_SolveLinearSystem(unittest.TestCase):
         for Arg in WrongArgs:
             with self.assertRaises(ValueError):
                 Test = testmodule.SolveLinearSystem(Arg, [1, 2])
-        WrongArgs = [[], [1], [1, 2, 3]]
+        WrongArgs = [[], [1], [1, 2, 3], [[1, 2], [1, 2, 3]],
+                    [Column(1, 2), Column(1, 2, 3)], Matrix([(1, 2)] * 3),
+                    Matrix([(1, 2, 3)] * 3)]
         for Arg in WrongArgs:
             with self.assertRaises(ValueError):
                 Test = testmodule.SolveLinearSystem([[1, 0], [0, 1]], Arg)
@@ -229,14 +232,656 @@ class Test_SolveLinearSystem(unittest.TestCase):
             for SolutionElement, CheckValue in zip(Solution.Data, Result):
                 self.assertAlmostEqual(SolutionElement, CheckValue)
             del Solution
+    
+    def test_Factorization(self):
+        """
+        Checks that an already calculated factorization of the matrix can be
+        passed instead of the matrix.
+        
+        Test ID: TEST-T-420
+        
+        Covers requirements: REQ-FUN-420
+        """
+        for Size in range(2, 6):
+            while True:
+                Bound = SquareMatrix([[random.uniform(-3, 3)
+                                for _ in range(Size)] for _ in range(Size)])
+                if Bound.getDeterminant():
+                    break
+            Factorization = Bound.factorize()
+            for _ in range(5):
+                Free = [random.uniform(-3, 3) for _ in range(Size)]
+                Result = testmodule.SolveLinearSystem(Factorization, Free)
+                self.assertListEqual(Result,
+                                    testmodule.SolveLinearSystem(Bound, Free))
+                Check = (Bound * Column(*Result)).Data
+                for FreeCoeff, CheckValue in zip(Free, Check):
+                    self.assertAlmostEqual(FreeCoeff, CheckValue)
+            with self.assertRaises(ValueError):
+                testmodule.SolveLinearSystem(Factorization, [1] * (Size + 1))
+            with self.assertRaises(TypeError):
+                testmodule.SolveLinearSystem(Factorization, Row(*Free))
+        Factorization = SquareMatrix([[1, 2], [2, 4]]).factorize()
+        self.assertIsNone(testmodule.SolveLinearSystem(Factorization, [1, 1]))
+    
+    def test_ManyFreeVectors(self):
+        """
+        Checks that several vectors of the free coefficients can be solved at
+        once, passed as a sequence of vectors or as a matrix.
+        
+        Test ID: TEST-T-424
+        
+        Covers requirements: REQ-FUN-421
+        """
+        for Size in range(2, 8):
+            while True:
+                Bound = SquareMatrix([[random.uniform(-3, 3)
+                                for _ in range(Size)] for _ in range(Size)])
+                if Bound.getDeterminant():
+                    break
+            for Number in range(1, 5):
+                Free = [[random.uniform(-3, 3) for _ in range(Size)]
+                                                        for _ in range(Number)]
+                Checks = [testmodule.SolveLinearSystem(Bound, Item)
+                                                            for Item in Free]
+                Args = (Free, [Column(*Item) for Item in Free],
+                                                    [tuple(Free[0])] + Free)
+                for Arg in Args:
+                    Result = testmodule.SolveLinearSystem(Bound, Arg)
+                    self.assertIsInstance(Result, list)
+                    self.assertEqual(len(Result), len(Arg))
+                    for Solution, Check in zip(Result[-Number : ], Checks):
+                        self.assertEqual(len(Solution), Size)
+                        for Value, CheckValue in zip(Solution, Check):
+                            self.assertAlmostEqual(Value, CheckValue)
+                if Number > 1:
+                    FreeMatrix = Matrix(Free, isColumnsFirst = True)
+                    Result = testmodule.SolveLinearSystem(Bound.factorize(),
+                                                                    FreeMatrix)
+                    self.assertIsInstance(Result, Matrix)
+                    self.assertEqual(Result.Width, Number)
+                    self.assertEqual(Result.Height, Size)
+                    Product = Bound * Result
+                    for ColIdx, Check in enumerate(Free):
+                        for RowIdx, CheckValue in enumerate(Check):
+                            self.assertAlmostEqual(Product[ColIdx, RowIdx],
+                                                                    CheckValue)
+        Bound = SquareMatrix([[2, 1], [1, 3]])
+        Result = testmodule.SolveLinearSystem(Bound, SquareMatrix([[2, 1],
+                                                                    [1, 3]]))
+        self.assertIsInstance(Result, SquareMatrix)
+        for ColIdx in range(2):
+            for RowIdx in range(2):
+                self.assertAlmostEqual(Result[ColIdx, RowIdx],
+                                                    int(ColIdx == RowIdx))
+        Bound = SquareMatrix([[1, 2], [2, 4]])
+        self.assertIsNone(testmodule.SolveLinearSystem(Bound,
+                                                        [[1, 1], [1, 2]]))
+        self.assertIsNone(testmodule.SolveLinearSystem(Bound,
+                                                    Matrix([[1, 1], [1, 2]])))
+
+class Test_IterativeSolvers(unittest.TestCase):
+    """
+    Unit tests for the functions SolveConjugateGradient, SolveGMRES and
+    SolveBiCGSTAB.
+    
+    Test IDs: TEST-T-430, TEST-T-431, TEST-T-432, TEST-T-433, TEST-T-434
+    
+    Covers requirements: REQ-FUN-430, REQ-FUN-431, REQ-FUN-432, REQ-FUN-433,
+        REQ-AWM-430, REQ-AWM-431
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Solvers = (testmodule.SolveConjugateGradient,
+                        testmodule.SolveGMRES, testmodule.SolveBiCGSTAB)
+    
+    def getSymmetric(self, Size: int) -> SquareMatrix:
+        """
+        Helper method to generate a random symmetric positive definite matrix.
+        """
+        Base = [[random.uniform(-1, 1) for _ in range(Size)]
+                                                        for _ in range(Size)]
+        Result = SquareMatrix([[sum(Base[Index][RowIdx] * Base[Index][ColIdx]
+                                                for Index in range(Size))
+                                    + (Size if RowIdx == ColIdx else 0)
+                                                for ColIdx in range(Size)]
+                                                for RowIdx in range(Size)])
+        return Result
+    
+    def getGeneral(self, Size: int) -> SquareMatrix:
+        """
+        Helper method to generate a random non-symmetric, diagonally dominant
+        matrix.
+        """
+        Result = SquareMatrix([[random.uniform(-1, 1)
+                                    + (Size / 2 + 3 if RowIdx == ColIdx else 0)
+                                                for ColIdx in range(Size)]
+                                                for RowIdx in range(Size)])
+        return Result
+    
+    def checkSolution(self, Bound: SquareMatrix, Solution: list,
+                                                        Free: list) -> None:
+        """
+        Helper method to verify the found solution of the system.
+        """
+        self.assertIsInstance(Solution, list)
+        self.assertEqual(len(Solution), len(Free))
+        Check = (Bound * Column(*Solution)).Data
+        for FreeCoeff, CheckValue in zip(Free, Check):
+            self.assertAlmostEqual(FreeCoeff, CheckValue, places = 8)
+    
+    def test_Symmetric(self):
+        """
+        Checks that the systems with a symmetric positive definite matrix are
+        solved by all methods, with the matrix or the product function passed.
+        
+        Test ID: TEST-T-430
+        
+        Covers requirements: REQ-FUN-430, REQ-FUN-431, REQ-FUN-432
+        """
+        for Size in (2, 5, 10, 25):
+            Bound = self.getSymmetric(Size)
+            Free = [random.uniform(-5, 5) for _ in range(Size)]
+            def Product(Vector):
+                return (Bound * Column(*Vector)).Data
+            for Solver in self.Solvers:
+                self.checkSolution(Bound, Solver(Bound, Free), Free)
+                self.checkSolution(Bound, Solver(Product, Column(*Free)),
+                                                                        Free)
+        #matrix-free finite-difference 1D Laplace operator
+        Size = 500
+        def Laplace(Vector):
+            Result = [2 * Vector[0] - Vector[1]]
+            Result.extend(2 * Vector[Index] - Vector[Index - 1]
+                                - Vector[Index + 1]
+                                    for Index in range(1, Size - 1))
+            Result.append(2 * Vector[-1] - Vector[-2])
+            return Result
+        Free = [1] * Size
+        Solution = testmodule.SolveConjugateGradient(Laplace, Free)
+        self.assertIsInstance(Solution, list)
+        for Index, Value in enumerate(Solution): #exact: x_i = i * (N - i) / 2
+            Check = (Index + 1) * (Size - Index) / 2
+            self.assertAlmostEqual(Value / Check, 1)
+    
+    def test_General(self):
+        """
+        Checks that the systems with a general (non-symmetric) matrix are
+        solved by the GMRES and BiCGSTAB methods.
+        
+        Test ID: TEST-T-431
+        
+        Covers requirements: REQ-FUN-431, REQ-FUN-432
+        """
+        for Size in (2, 5, 10, 25, 40):
+            Bound = self.getGeneral(Size)
+            Free = [random.uniform(-5, 5) for _ in range(Size)]
+            for Solver in self.Solvers[1 : ]:
+                self.checkSolution(Bound, Solver(Bound, Free), Free)
+            for Restart in (1, 3, 100):
+                Solution = testmodule.SolveGMRES(Bound, Free,
+                                Restart = Restart, MaxIterations = 100 * Size)
+                self.checkSolution(Bound, Solution, Free)
+        Solution = testmodule.SolveGMRES(SquareMatrix([[1, 2], [3, 4]]),
+                                                                    [5, 6])
+        self.checkSolution(SquareMatrix([[1, 2], [3, 4]]), Solution, [5, 6])
+    
+    def test_Options(self):
+        """
+        Checks the initial guess, tolerance, maximum number of iterations and
+        preconditioner options, and the None return value.
+        
+        Test ID: TEST-T-432
+        
+        Covers requirements: REQ-FUN-433
+        """
+        Size = 20
+        Bound = self.getSymmetric(Size)
+        Free = [random.uniform(-5, 5) for _ in range(Size)]
+        Counter = [0]
+        def Preconditioner(Vector):
+            Counter[0] += 1
+            return list(Vector)
+        Solution = testmodule.SolveLinearSystem(Bound, Free)
+        for Solver in self.Solvers:
+            #warm start from the solution - converges without iterations
+            Test = Solver(Bound, Free, InitialGuess = Solution,
+                                                            MaxIterations = 1)
+            self.assertListEqual(Test, Solution)
+            #single iteration is not enough
+            self.assertIsNone(Solver(Bound, Free, MaxIterations = 1))
+            #coarse tolerance
+            Test = Solver(Bound, Free, Tolerance = 0.1)
+            self.assertIsInstance(Test, list)
+            Residual = [Value - Check for Value, Check in
+                                zip(Free, (Bound * Column(*Test)).Data)]
+            Norm = sqrt(sum(Value * Value for Value in Residual))
+            self.assertLessEqual(Norm,
+                            0.1 * sqrt(sum(Value * Value for Value in Free)))
+            #preconditioner hook is called
+            Counter[0] = 0
+            Test = Solver(Bound, Free, Preconditioner = Preconditioner)
+            self.assertGreater(Counter[0], 0)
+            self.checkSolution(Bound, Test, Free)
+        #zero free coefficients - zero solution
+        for Solver in self.Solvers:
+            self.assertListEqual(Solver(Bound, [0] * Size), [0] * Size)
+        #CG breaks down on an indefinite matrix
+        Bound = SquareMatrix([[1, 0], [0, -1]])
+        self.assertIsNone(testmodule.SolveConjugateGradient(Bound, [1, 1]))
+    
+    def test_TypeError(self):
+        """
+        Checks that only proper type arguments can be passed.
+        
+        Test ID: TEST-T-433
+        
+        Covers requirements: REQ-AWM-430
+        """
+        Bound = SquareMatrix([[2, 1], [1, 2]])
+        for Solver in self.Solvers:
+            for Arg in (1, 2.0, int, None, [[2, 1], [1, 2]], 'ab',
+                                                    Matrix([[2, 1], [1, 2]])):
+                with self.assertRaises(TypeError):
+                    Solver(Arg, [1, 2])
+            for Arg in (1, 2.0, int, None, [1, '2'], 'ab', Row(1, 2),
+                                                            [[1, 2], [1, 2]]):
+                with self.assertRaises(TypeError):
+                    Solver(Bound, Arg)
+                if Arg is not None:
+                    with self.assertRaises(TypeError):
+                        Solver(Bound, [1, 2], InitialGuess = Arg)
+            for Arg in ('1', None, True, [1], int):
+                with self.assertRaises(TypeError):
+                    Solver(Bound, [1, 2], Tolerance = Arg)
+            for Arg in ('1', 1.0, True, [1], int):
+                with self.assertRaises(TypeError):
+                    Solver(Bound, [1, 2], MaxIterations = Arg)
+            for Arg in ('1', 1.0, True, [1], int):
+                with self.assertRaises(TypeError):
+                    Solver(Bound, [1, 2], Preconditioner = Arg)
+        for Arg in ('1', 1.0, True, None, int):
+            with self.assertRaises(TypeError):
+                testmodule.SolveGMRES(Bound, [1, 2], Restart = Arg)
+    
+    def test_ValueError(self):
+        """
+        Checks the treatment of the mismatching sizes and non-positive options.
+        
+        Test ID: TEST-T-434
+        
+        Covers requirements: REQ-AWM-431
+        """
+        Bound = SquareMatrix([[2, 1], [1, 2]])
+        for Solver in self.Solvers:
+            for Arg in ([], [1], [1, 2, 3]):
+                with self.assertRaises(ValueError):
+                    Solver(Bound, Arg)
+                with self.assertRaises(ValueError):
+                    Solver(Bound, [1, 2], InitialGuess = Arg)
+            with self.assertRaises(ValueError):
+                Solver(lambda Vector: Vector, [1])
+            with self.assertRaises(ValueError):
+                Solver(lambda Vector: Vector, [1, 2, 3], InitialGuess = [1, 2])
+            for Arg in (0, -1, -0.5):
+                with self.assertRaises(ValueError):
+                    Solver(Bound, [1, 2], Tolerance = Arg)
+                if isinstance(Arg, int):
+                    with self.assertRaises(ValueError):
+                        Solver(Bound, [1, 2], MaxIterations = Arg)
+        for Arg in (0, -1):
+            with self.assertRaises(ValueError):
+                testmodule.SolveGMRES(Bound, [1, 2], Restart = Arg)
+
+class Test_Preconditioners(unittest.TestCase):
+    """
+    Unit tests for the functions GetJacobiPreconditioner and
+    GetILUPreconditioner.
+    
+    Test IDs: TEST-T-440, TEST-T-441
+    
+    Covers requirements: REQ-FUN-440, REQ-AWM-440
+    
+    Version 1.0.0.0
+    """
+    
+    def test_Preconditioners(self):
+        """
+        Checks the action of the preconditioners and their use with the
+        iterative solvers.
+        
+        Test ID: TEST-T-440
+        
+        Covers requirements: REQ-FUN-440
+        """
+        Bound = SquareMatrix([[4, 1, 0], [2, 5, 1], [0, 3, 6]])
+        Test = testmodule.GetJacobiPreconditioner(Bound)
+        self.assertTrue(callable(Test))
+        for Value, Check in zip(Test([4, 10, 3]), [1, 2, 0.5]):
+            self.assertAlmostEqual(Value, Check)
+        #ILU(0) of a tridiagonal matrix is its exact LU-decomposition
+        Test = testmodule.GetILUPreconditioner(Bound)
+        self.assertTrue(callable(Test))
+        Free = [1, 2, 3]
+        Check = testmodule.SolveLinearSystem(Bound, Free)
+        for Value, CheckValue in zip(Test(Free), Check):
+            self.assertAlmostEqual(Value, CheckValue)
+        #the zero elements pattern is kept - not exact for a fill-in matrix
+        Bound = SquareMatrix([[4, 1, 1], [1, 4, 0], [1, 0, 4]])
+        Free = [1, 1, 1]
+        Test = testmodule.GetILUPreconditioner(Bound)(Free)
+        Check = testmodule.SolveLinearSystem(Bound, Free)
+        self.assertGreater(max(abs(Value - CheckValue)
+                                for Value, CheckValue in zip(Test, Check)),
+                                                                        1E-6)
+        #use with the solvers - sparse diagonally dominant matrix
+        Size = 30
+        Elements = [[0] * Size for _ in range(Size)]
+        for Index in range(Size):
+            Elements[Index][Index] = random.uniform(5, 10)
+            Elements[Index][(Index + 1) % Size] = random.uniform(-2, 2)
+            Elements[Index][(Index + 7) % Size] = random.uniform(-2, 2)
+        Bound = SquareMatrix(Elements)
+        Free = [random.uniform(-5, 5) for _ in range(Size)]
+        for Factory in (testmodule.GetJacobiPreconditioner,
+                                            testmodule.GetILUPreconditioner):
+            Preconditioner = Factory(Bound)
+            for Solver in (testmodule.SolveGMRES, testmodule.SolveBiCGSTAB):
+                Solution = Solver(Bound, Free,
+                                            Preconditioner = Preconditioner)
+                self.assertIsInstance(Solution, list)
+                Check = (Bound * Column(*Solution)).Data
+                for FreeCoeff, CheckValue in zip(Free, Check):
+                    self.assertAlmostEqual(FreeCoeff, CheckValue, places = 8)
+        #zero diagonal / pivot
+        Bound = SquareMatrix([[0, 1], [1, 0]])
+        self.assertIsNone(testmodule.GetJacobiPreconditioner(Bound))
+        self.assertIsNone(testmodule.GetILUPreconditioner(Bound))
+        Bound = SquareMatrix([[1, 1], [1, 1]])
+        self.assertIsNotNone(testmodule.GetJacobiPreconditioner(Bound))
+        self.assertIsNone(testmodule.GetILUPreconditioner(Bound))
+    
+    def test_TypeError(self):
+        """
+        Checks that only proper type arguments can be passed.
+        
+        Test ID: TEST-T-441
+        
+        Covers requirements: REQ-AWM-440
+        """
+        for Arg in (1, 2.0, int, None, [[2, 1], [1, 2]], 'ab',
+                                        Matrix([[2, 1], [1, 2], [3, 4]])):
+            for Factory in (testmodule.GetJacobiPreconditioner,
+                                            testmodule.GetILUPreconditioner):
+                with self.assertRaises(TypeError):
+                    Factory(Arg)
+
+class Test_SparseMatrices(unittest.TestCase):
+    """
+    Unit tests for the support of the sparse matrices by the functions
+    FindEigenvector, SolveLinearSystem, SolveConjugateGradient, SolveGMRES,
+    SolveBiCGSTAB, GetJacobiPreconditioner and GetILUPreconditioner.
+    
+    Test IDs: TEST-T-450, TEST-T-451
+    
+    Covers requirements: REQ-FUN-450, REQ-AWM-450
+    
+    Version 1.0.0.0
+    """
+    
+    def getLaplacian(self, Size: int, SparseClass: type) -> SparseMatrix:
+        """
+        Helper method to generate a graph Laplacian of a ring with random
+        chords, shifted to be positive definite.
+        """
+        Entries = []
+        for Index in range(Size):
+            for Other in ((Index + 1) % Size, random.randrange(Size)):
+                if Other != Index:
+                    Weight = random.uniform(0.5, 2)
+                    Entries.extend([(Index, Index, Weight),
+                                    (Other, Other, Weight),
+                                    (Other, Index, - Weight),
+                                    (Index, Other, - Weight)])
+            Entries.append((Index, Index, 0.1))
+        return SparseClass(Entries, Width = Size, Height = Size)
+    
+    def test_Sparse(self):
+        """
+        Checks that the sparse matrices are accepted by all functions, and
+        that the results are the same as for the dense matrices.
+        
+        Test ID: TEST-T-450
+        
+        Covers requirements: REQ-FUN-450
+        """
+        Size = 60
+        for SparseClass in (CSRMatrix, COOMatrix, BandedMatrix):
+            Bound = self.getLaplacian(Size, SparseClass)
+            Dense = Bound.toDense()
+            Free = [random.uniform(-5, 5) for _ in range(Size)]
+            Check = testmodule.SolveLinearSystem(Dense, Free)
+            Solution = testmodule.SolveLinearSystem(Bound, Free)
+            for Value, CheckValue in zip(Solution, Check):
+                self.assertAlmostEqual(Value, CheckValue, places = 6)
+            Solution = testmodule.SolveLinearSystem(Bound, [Free, Free])
+            self.assertEqual(len(Solution), 2)
+            self.assertListEqual(Solution[0], Solution[1])
+            FreeMatrix = Matrix([Free, Free], isColumnsFirst = True)
+            Solution = testmodule.SolveLinearSystem(Bound, FreeMatrix)
+            self.assertIsInstance(Solution, Matrix)
+            for RowIdx, CheckValue in enumerate(Check):
+                self.assertAlmostEqual(Solution[1, RowIdx], CheckValue,
+                                                                places = 6)
+            for Factory in (None, testmodule.GetJacobiPreconditioner,
+                                            testmodule.GetILUPreconditioner):
+                Preconditioner = None if Factory is None else Factory(Bound)
+                if Factory is not None:
+                    Test = Factory(Dense)(Free)
+                    for Value, CheckValue in zip(Preconditioner(Free), Test):
+                        self.assertAlmostEqual(Value, CheckValue)
+                for Solver in (testmodule.SolveConjugateGradient,
+                                testmodule.SolveGMRES,
+                                                testmodule.SolveBiCGSTAB):
+                    Solution = Solver(Bound, Free,
+                                            Preconditioner = Preconditioner)
+                    self.assertIsInstance(Solution, list)
+                    Test = (Bound * Column(*Solution)).Data
+                    for FreeCoeff, CheckValue in zip(Free, Test):
+                        self.assertAlmostEqual(FreeCoeff, CheckValue,
+                                                                places = 7)
+            Bound = SparseClass([(0, 0, 2), (1, 1, 3), (2, 2, 5), (1, 0, 1),
+                                        (2, 1, 1)], Width = 3, Height = 3)
+            self.assertEqual(testmodule.FindEigenvector(Bound), 5)
+            Bound = SparseClass([(0, 0, 0.8), (1, 0, -0.6), (0, 1, 0.6),
+                                        (1, 1, 0.8)], Width = 2, Height = 2)
+            self.assertIsNone(testmodule.FindEigenvector(Bound))
+            Bound = SparseClass([(0, 0, 1), (1, 1, 1)], Width = 3,
+                                                                    Height = 3)
+            self.assertIsNone(testmodule.SolveLinearSystem(Bound, [1, 1, 1]))
+    
+    def test_ValueError(self):
+        """
+        Checks that a non-square sparse matrix is rejected.
+        
+        Test ID: TEST-T-451
+        
+        Covers requirements: REQ-AWM-450
+        """
+        for SparseClass in (CSRMatrix, COOMatrix, BandedMatrix):
+            Bound = SparseClass([(0, 0, 1), (1, 1, 1)], Width = 2, Height = 3)
+            with self.assertRaises(ValueError):
+                testmodule.FindEigenvector(Bound)
+            with self.assertRaises(ValueError):
+                testmodule.SolveLinearSystem(Bound, [1, 1, 1])
+            for Solver in (testmodule.SolveConjugateGradient,
+                            testmodule.SolveGMRES, testmodule.SolveBiCGSTAB):
+                with self.assertRaises(ValueError):
+                    Solver(Bound, [1, 1, 1])
+            for Factory in (testmodule.GetJacobiPreconditioner,
+                                            testmodule.GetILUPreconditioner):
+                with self.assertRaises(ValueError):
+                    Factory(Bound)
+            Bound = SparseClass([(0, 0, 1), (1, 1, 1)], Width = 2, Height = 2)
+            with self.assertRaises(ValueError):
+                testmodule.SolveLinearSystem(Bound, [1, 1, 1])
+
+class Test_BandedSystems(unittest.TestCase):
+    """
+    Unit tests for the banded and tridiagonal systems support by the functions
+    SolveLinearSystem and SolveTridiagonal.
+    
+    Test IDs: TEST-T-460, TEST-T-461, TEST-T-462, TEST-T-463
+    
+    Covers requirements: REQ-FUN-460, REQ-FUN-461, REQ-AWM-460, REQ-AWM-461
+    
+    Version 1.0.0.0
+    """
+    
+    def getDiagonals(self, Size: int, isDominant: bool) -> tuple:
+        """
+        Helper method to generate the random sub-, main and super-diagonals of
+        a tridiagonal matrix, diagonally dominant or not.
+        """
+        Lower = [random.uniform(-1, 1) for _ in range(Size - 1)]
+        Upper = [random.uniform(-1, 1) for _ in range(Size - 1)]
+        if isDominant:
+            Diagonal = [random.choice([-1, 1]) * random.uniform(2, 5)
+                                                        for _ in range(Size)]
+        else:
+            Diagonal = [random.uniform(-0.1, 0.1) for _ in range(Size)]
+        return Lower, Diagonal, Upper
+    
+    def test_Banded(self):
+        """
+        Checks that the dense banded matrices are solved by the banded
+        factorization with the same results as by the dense one.
+        
+        Test ID: TEST-T-460
+        
+        Covers requirements: REQ-FUN-460
+        """
+        for Size in (5, 20, 50):
+            for Width in (0, 1, 3):
+                Elements = [[(random.uniform(-1, 1)
+                                if abs(ColIdx - RowIdx) <= Width else 0)
+                                            for ColIdx in range(Size)]
+                                                for RowIdx in range(Size)]
+                for Index in range(Size):
+                    Elements[Index][Index] += random.choice([0, 3])
+                Bound = SquareMatrix(Elements)
+                if abs(Bound.getDeterminant()) < 0.001:
+                    continue
+                Free = [random.uniform(-5, 5) for _ in range(Size)]
+                Check = Bound.factorize().solve(Free)
+                for Source in (Bound, Elements,
+                                            BandedMatrix.fromDense(Elements)):
+                    Solution = testmodule.SolveLinearSystem(Source, Free)
+                    for Value, CheckValue in zip(Solution, Check):
+                        self.assertAlmostEqual(Value, CheckValue)
+                Solution = testmodule.SolveLinearSystem(Bound, [Free, Free])
+                self.assertEqual(len(Solution), 2)
+                for Value, CheckValue in zip(Solution[1], Check):
+                    self.assertAlmostEqual(Value, CheckValue)
+                FreeMatrix = Matrix([Free, Free], isColumnsFirst = True)
+                Solution = testmodule.SolveLinearSystem(Bound, FreeMatrix)
+                self.assertIsInstance(Solution, Matrix)
+                for RowIdx, CheckValue in enumerate(Check):
+                    self.assertAlmostEqual(Solution[0, RowIdx], CheckValue)
+        Bound = SquareMatrix([[1, 0, 0, 0, 0], [2, 0, 0, 0, 0],
+                                [0, 0, 1, 0, 0], [0, 0, 0, 1, 0],
+                                                            [0, 0, 0, 0, 1]])
+        self.assertIsNone(testmodule.SolveLinearSystem(Bound, [1] * 5))
+    
+    def test_Tridiagonal(self):
+        """
+        Checks the solution of the tridiagonal systems defined by the
+        diagonals, with and without the diagonal dominance.
+        
+        Test ID: TEST-T-461
+        
+        Covers requirements: REQ-FUN-461
+        """
+        for Size in (2, 3, 10, 1000):
+            for isDominant in (True, False):
+                Lower, Diagonal, Upper = self.getDiagonals(Size, isDominant)
+                Bound = BandedMatrix.fromDiagonals([Lower, Diagonal, Upper],
+                                                                    Lower = 1)
+                Free = [random.uniform(-5, 5) for _ in range(Size)]
+                Solution = testmodule.SolveTridiagonal(Lower, Diagonal, Upper,
+                                                                        Free)
+                self.assertIsInstance(Solution, list)
+                Check = (Bound * Column(*Solution)).Data
+                for Value, CheckValue in zip(Free, Check):
+                    self.assertAlmostEqual(Value, CheckValue, places = 6)
+                if Size > 2:
+                    Test = testmodule.SolveTridiagonal(Column(*Lower),
+                                    Column(*Diagonal), Column(*Upper),
+                                                                Column(*Free))
+                    self.assertListEqual(Test, Solution)
+        Solution = testmodule.SolveTridiagonal([1], [0, 0], [1], [2, 3])
+        self.assertListEqual(Solution, [3, 2])
+        self.assertIsNone(testmodule.SolveTridiagonal([1], [1, 1], [1],
+                                                                    [2, 3]))
+        self.assertIsNone(testmodule.SolveTridiagonal([0, 0], [1, 0, 1],
+                                                        [0, 0], [1, 1, 1]))
+    
+    def test_TypeError(self):
+        """
+        Checks the treatment of the improper type arguments.
+        
+        Test ID: TEST-T-462
+        
+        Covers requirements: REQ-AWM-460
+        """
+        for Arg in (1, 1.0, None, 'ab', [1, '1'], Row(1, 2),
+                                            SquareMatrix([[1, 2], [3, 4]])):
+            with self.assertRaises(TypeError):
+                testmodule.SolveTridiagonal(Arg, [1, 2], [1], [1, 2])
+            with self.assertRaises(TypeError):
+                testmodule.SolveTridiagonal([1], Arg, [1], [1, 2])
+            with self.assertRaises(TypeError):
+                testmodule.SolveTridiagonal([1], [1, 2], Arg, [1, 2])
+            with self.assertRaises(TypeError):
+                testmodule.SolveTridiagonal([1], [1, 2], [1], Arg)
+    
+    def test_ValueError(self):
+        """
+        Checks the treatment of the improper values of the arguments.
+        
+        Test ID: TEST-T-463
+        
+        Covers requirements: REQ-AWM-461
+        """
+        with self.assertRaises(ValueError):
+            testmodule.SolveTridiagonal([], [1], [], [1])
+        for Arg in ([], [1, 2]):
+            with self.assertRaises(ValueError):
+                testmodule.SolveTridiagonal(Arg, [1, 2], [1], [1, 2])
+            with self.assertRaises(ValueError):
+                testmodule.SolveTridiagonal([1], [1, 2], Arg, [1, 2])
+        for Arg in ([1], [1, 2, 3]):
+            with self.assertRaises(ValueError):
+                testmodule.SolveTridiagonal([1], [1, 2], [1], Arg)
 
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_FindEigenvalue)
 TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_SolveLinearSystem)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(Test_IterativeSolvers)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_Preconditioners)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_SparseMatrices)
+TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_BandedSystems)
 
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1, TestSuite2])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                    TestSuite5, TestSuite6])
 
 if __name__ == "__main__":
     sys.stdout.write(
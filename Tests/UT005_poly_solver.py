@@ -5,8 +5,8 @@ Module math_extra_lib.Tests.UT004_poly_solver
 Implements unit testing of the module math_extra_lib.poly_solver, see TE005.
 """
 
-__version__ = "1.0.0.0"
-__date__ = "23-02-2024"
+__version__ = "1.5.0.0"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -18,7 +18,7 @@ import os
 import unittest
 import random
 
-from math import sqrt, sin
+from math import sqrt, sin, cos, pi
 
 #+ my libraries
 
@@ -40,7 +40,7 @@ class Test_HelperFunctions(unittest.TestCase):
     """
     Unit tests for the helper functions. Not part of the test plan TE005.
     
-    Version 1.0.0.0
+    Version 1.2.0.0
     """
     
     def test_GenerateBinomialCoefficients(self):
@@ -294,16 +294,103 @@ class Test_HelperFunctions(unittest.TestCase):
                 self.assertAlmostEqual(
                                 abs(testmodule._EvaluatePolynomial(Poly, Root)),
                                 0, msg=f'{Poly}, {Test}, {Root}', delta = 0.001)
+    
+    def test_Kernels(self):
+        """
+        Checks that the unchecked kernels _Differentiate(), _Evaluate(),
+        _Deflate() and _SolvePolynomial() produce the same results as the
+        respective validating functions.
+        """
+        for _ in range(20):
+            Degree = random.randint(3, 7)
+            Poly= [random.randint(-3, 3)+random.random() for _ in range(Degree)]
+            Poly.append(1)
+            Value = complex(random.random(), random.random())
+            self.assertListEqual(testmodule._Differentiate(Poly),
+                                        testmodule._GetDerivative(Poly))
+            self.assertEqual(testmodule._Evaluate(Poly, Value),
+                testmodule._EvaluatePolynomial(Poly, Value, DoNotRound = True))
+            self.assertListEqual(testmodule._SolvePolynomial(Poly, None, None),
+                                        testmodule._FindAllRoots(Poly))
+        Poly = [6, 11, 6, 1] #x^3 + 6x^2 + 11x + 6 = (x + 1) * (x + 2) * (x + 3)
+        for Root in [-1, -2, -3]:
+            Reduced, Remainder = testmodule._Deflate(Poly, Root)
+            self.assertEqual(Remainder, 0)
+            self.assertListEqual(Reduced, testmodule._ReduceByRoot(Poly, Root))
+        Reduced, Remainder = testmodule._Deflate(Poly, 1)
+        self.assertListEqual(Reduced, [18, 7, 1])
+        self.assertEqual(Remainder, 24)
+        self.assertEqual(testmodule._Round(complex(1.0E-14, 2), 1.0E-12),
+                                                                complex(0, 2))
+        self.assertEqual(testmodule._Round(complex(1, 1.0E-14), 1.0E-12), 1)
+    
+    def test_PolishClusters(self):
+        """
+        Checks the detection of the clusters of the approximations of the
+        roots and their polishing.
+        """
+        Poly = [-4, 8, -5, 1] #(x - 1) * (x - 2)^2
+        Guesses = [1, complex(2.00001, 0.00001), complex(2.00001, -0.00001)]
+        Clusters, Radii = testmodule._FindClusters(Poly, Guesses)
+        self.assertEqual(len(Radii), 3)
+        self.assertCountEqual(Clusters, [[0], [1, 2]])
+        Test = testmodule._PolishClusters(Poly, Guesses, 1.0E-12)
+        self.assertEqual(Test[0], 1)
+        for Root in Test[1 : ]:
+            self.assertAlmostEqual(abs(Root - 2), 0, places = 12)
+        Poly = [6, 11, 6, 1] #x^3 + 6x^2 + 11x + 6 = (x + 1) * (x + 2) * (x + 3)
+        Guesses = [-1, -2, -3]
+        Clusters, _ = testmodule._FindClusters(Poly, Guesses)
+        self.assertCountEqual(Clusters, [[0], [1], [2]])
+        self.assertListEqual(
+                    testmodule._PolishClusters(Poly, Guesses, 1.0E-12), Guesses)
+    
+    def test_MultipleRoots(self):
+        """
+        Test ID: TEST-T-518
+        
+        Requirements: REQ-FUN-513
+        """
+        Cases = [
+            [0.5, 0.5, 0.5, 0.5, -2, -2],
+            [0.1, 0.1, 0.1, 0.3, 0.7],
+            [1.3, 1.3, 1.3, 2.7, -1],
+            [1.7, 1.7, 1.7, 1.7, 1.7],
+            [0, 0, 0, 1, 2],
+            [1 for _ in range(10)] + [-2 for _ in range(5)]
+        ]
+        for Method in [None, 'aberth', 'companion']:
+            for Roots in Cases:
+                Test = testmodule.FindRoots(Polynomial.fromRoots(*Roots),
+                                                            Method = Method)
+                self.assertIsInstance(Test, list)
+                self.assertEqual(len(Test), len(Roots))
+                for Root in Test:
+                    self.assertIsInstance(Root, (int, float))
+                for Root, Value in zip(sorted(Test), sorted(Roots)):
+                    self.assertAlmostEqual(Root, Value, places = 10)
+            #(x^2 + 1)^3 - triple complex conjugated roots
+            Test = testmodule.FindRoots(Polynomial(1, 0, 3, 0, 3, 0, 1),
+                                                            Method = Method)
+            self.assertEqual(len(Test), 6)
+            for Root in Test:
+                self.assertAlmostEqual(Root.real, 0, places = 10)
+                self.assertAlmostEqual(abs(Root.imag), 1, places = 10)
+            self.assertAlmostEqual(sum(Root.imag for Root in Test), 0,
+                                                                places = 10)
+
 
 class Test_FindRoots(unittest.TestCase):
     """
     Unit tests for the function FindRoots().
     
-    Test IDs: TEST-T-510 and TEST-T-511
+    Test IDs: TEST-T-510, TEST-T-511, TEST-T-512, TEST-T-513, TEST-T-514 and
+        TEST-T-518
     
-    Covers requirements: REQ-FUN-510 and REQ-AWM-510
+    Covers requirements: REQ-FUN-510, REQ-FUN-511, REQ-FUN-513, REQ-AWM-510,
+        REQ-AWM-511 and REQ-AWM-512
     
-    Version 1.0.0.0
+    Version 1.2.0.0
     """
     
     def test_TypeError(self):
@@ -413,6 +500,327 @@ class Test_FindRoots(unittest.TestCase):
             for CheckValue in Test:
                 self.assertTrue(any(map(
                             lambda x: abs(x - CheckValue) < 0.000001, Check)))
+    
+    def test_Methods(self):
+        """
+        Test ID: TEST-T-512
+        
+        Requirements: REQ-FUN-511
+        """
+        Poly = Polynomial(1, 0, *[0 for _ in range(62)], 1) #x^64 + 1
+        Chebyshev = testmodule.GetChebyshevPolynomial(20)
+        Expected = [cos((2 * Index - 1) * pi / 40) for Index in range(1, 21)]
+        for Method in [None, 'aberth', 'companion']:
+            for Tolerance in [None, 1.0E-14]:
+                Test = testmodule.FindRoots(Polynomial(-1, -1, 1, 1),
+                                    Method = Method, Tolerance = Tolerance)
+                self.assertIsInstance(Test, list)
+                self.assertCountEqual(Test, [-1, -1, 1])
+                Test = testmodule.FindRoots(Polynomial(6, 11, 6, 1),
+                                    Method = Method, Tolerance = Tolerance)
+                self.assertCountEqual(Test, [-1, -2, -3])
+                Test = testmodule.FindRoots(Poly, Method = Method,
+                                                    Tolerance = Tolerance)
+                self.assertEqual(len(Test), 64)
+                self.assertEqual(len(set(Test)), 64) #all roots are unique
+                for Root in Test:
+                    self.assertAlmostEqual(abs(Root), 1, places = 9)
+                    self.assertAlmostEqual(abs(pow(Root, 64) + 1), 0,
+                                                                places = 7)
+                Test = testmodule.FindRoots(Chebyshev, Method = Method,
+                                                    Tolerance = Tolerance)
+                self.assertEqual(len(Test), 20)
+                for Root in Test:
+                    self.assertIsInstance(Root, float)
+                    self.assertAlmostEqual(
+                        min(abs(Root - Value) for Value in Expected), 0,
+                                                                places = 8)
+        for _ in range(10):
+            Poly = Polynomial(*[random.gauss(0, 1) for _ in range(60)], 1)
+            Check = testmodule.FindRoots(Poly, Method = 'aberth')
+            Test = testmodule.FindRoots(Poly, Method = 'companion',
+                                                        Tolerance = 1.0E-14)
+            self.assertEqual(len(Check), len(Test))
+            for CheckValue in Check:
+                self.assertTrue(any(map(
+                            lambda x: abs(x - CheckValue) < 0.000001, Test)))
+    
+    def test_KeywordTypeError(self):
+        """
+        Test ID: TEST-T-513
+        
+        Requirements: REQ-AWM-511
+        """
+        Poly = Polynomial(1, 2, 3, 4)
+        for Item in [1, 1.0, True, b'aberth', ['aberth'], ('companion', ),
+                                                                str, int]:
+            with self.assertRaises(TypeError):
+                testmodule.FindRoots(Poly, Method = Item)
+        for Item in ['1', True, [1.0E-8], (1.0E-8, ), int, float, {1: 1}]:
+            with self.assertRaises(TypeError):
+                testmodule.FindRoots(Poly, Tolerance = Item)
+    
+    def test_ValueError(self):
+        """
+        Test ID: TEST-T-514
+        
+        Requirements: REQ-AWM-512
+        """
+        Poly = Polynomial(1, 2, 3, 4)
+        for Item in ['', 'Aberth', 'qr', 'companion matrix']:
+            with self.assertRaises(ValueError):
+                testmodule.FindRoots(Poly, Method = Item)
+        for Item in [0, 0.0, -1, -1.0E-8]:
+            with self.assertRaises(ValueError):
+                testmodule.FindRoots(Poly, Tolerance = Item)
+
+class Test_FindRootsBatch(unittest.TestCase):
+    """
+    Unit tests for the function FindRootsBatch() with the optional NumPy
+    backend and the pure Python implementation.
+    
+    Test IDs: TEST-T-515, TEST-T-516 and TEST-T-517
+    
+    Covers requirements: REQ-FUN-512, REQ-AWM-513 and REQ-AWM-514
+    
+    Version 1.0.0.0
+    """
+    
+    def setUp(self) -> None:
+        """
+        Preparation for each test case - stores the NumPy backend.
+        """
+        self.Backend = testmodule.np
+    
+    def tearDown(self) -> None:
+        """
+        Clean-up after each test case - restores the NumPy backend.
+        """
+        testmodule.np = self.Backend
+    
+    def getBackends(self):
+        """
+        Generator, which switches between the NumPy and the pure Python
+        backends, skipping the former if NumPy is not installed.
+        """
+        if not (self.Backend is None):
+            testmodule.np = self.Backend
+            yield True
+        testmodule.np = None
+        yield False
+    
+    def getBatch(self, Degree: int, Size: int) -> list:
+        """
+        Helper method to generate a batch of the slowly changing polynomials.
+        """
+        Base = [random.uniform(-3, 3) for _ in range(Degree + 1)]
+        Base[-1] = random.choice([-1, 1]) * random.uniform(0.5, 2)
+        Drift = [random.uniform(-3, 3) / Size for _ in range(Degree)] + [0]
+        Result = [[Item + Index * Change for Item, Change in zip(Base, Drift)]
+                                                    for Index in range(Size)]
+        return Result
+    
+    def test_Calculation(self):
+        """
+        Test ID: TEST-T-515
+        
+        Requirements: REQ-FUN-512
+        """
+        Size = testmodule.BATCH_BLOCK + 44
+        for Degree in [1, 2, 3, 5, 8]:
+            Batch = self.getBatch(Degree, Size)
+            Checks = [testmodule.FindRoots(Polynomial(*Item))
+                                                        for Item in Batch]
+            for isNumPy in self.getBackends():
+                Cases = [Batch, tuple(map(tuple, Batch))]
+                if isNumPy:
+                    Cases.append(self.Backend.array(Batch))
+                for Case in Cases:
+                    for WarmStart in [True, False]:
+                        Test = testmodule.FindRootsBatch(Case,
+                                                    WarmStart = WarmStart)
+                        self.assertIsInstance(Test, list)
+                        self.assertEqual(len(Test), Size)
+                        for Roots, Check in zip(Test, Checks):
+                            self.assertIsInstance(Roots, list)
+                            self.assertEqual(len(Roots), Degree)
+                            for CheckValue in Check:
+                                self.assertTrue(any(map(
+                                    lambda x: abs(x - CheckValue) < 0.000001,
+                                                                    Roots)))
+        #known roots, including multiple ones: (x - 1)^2 * (x^2 + c)
+        Batch = [[c, -2 * c, 1 + c, -2, 1] for c in [1, 2, 4, 9]]
+        Expected = [[1, 1, complex(0, sqrt(c)), complex(0, - sqrt(c))]
+                                                        for c in [1, 2, 4, 9]]
+        for _ in self.getBackends():
+            Test = testmodule.FindRootsBatch(Batch, Tolerance = 1.0E-14)
+            for Roots, Check in zip(Test, Expected):
+                self.assertEqual(len(Roots), 4)
+                for CheckValue in Check:
+                    self.assertTrue(any(map(
+                            lambda x: abs(x - CheckValue) < 0.0001, Roots)))
+    
+    def test_TypeError(self):
+        """
+        Test ID: TEST-T-516
+        
+        Requirements: REQ-AWM-513
+        """
+        for _ in self.getBackends():
+            for Item in [1, 1.0, int, float, True, '1, 2', Polynomial(1, 2),
+                                [1, 2], [[1, 2], 3], [[1, 2], '12'],
+                                ([1, '2'], ), [[1, True]], [[1, 2], [1, None]],
+                                [[1, complex(1, 1)]], {1: [1, 2]}]:
+                with self.assertRaises(TypeError):
+                    testmodule.FindRootsBatch(Item)
+            for Item in ['1', True, [1.0E-8], int]:
+                with self.assertRaises(TypeError):
+                    testmodule.FindRootsBatch([[1, 2, 3]], Tolerance = Item)
+            for Item in [1, 0, None, 'True', [True]]:
+                with self.assertRaises(TypeError):
+                    testmodule.FindRootsBatch([[1, 2, 3]], WarmStart = Item)
+        if not (self.Backend is None):
+            testmodule.np = self.Backend
+            for Item in [self.Backend.array([1.0, 2.0]),
+                            self.Backend.ones((2, 2, 2)),
+                            self.Backend.array([[1, 1j]]),
+                            self.Backend.array([['1', '2']])]:
+                with self.assertRaises(TypeError):
+                    testmodule.FindRootsBatch(Item)
+    
+    def test_ValueError(self):
+        """
+        Test ID: TEST-T-517
+        
+        Requirements: REQ-AWM-514
+        """
+        for _ in self.getBackends():
+            for Item in [[], [[]], [[1]], [[1, 2], [1, 2, 3]], [[1, 0]],
+                            [[1, 2, 3], [1, 2, 0]], [[1, 2], [1]]]:
+                with self.assertRaises(ValueError):
+                    testmodule.FindRootsBatch(Item)
+            for Item in [0, -1, -1.0E-8]:
+                with self.assertRaises(ValueError):
+                    testmodule.FindRootsBatch([[1, 2, 3]], Tolerance = Item)
+        if not (self.Backend is None):
+            testmodule.np = self.Backend
+            for Item in [self.Backend.ones((0, 3)), self.Backend.ones((3, 1)),
+                            self.Backend.array([[1.0, 2.0], [1.0, 0.0]])]:
+                with self.assertRaises(ValueError):
+                    testmodule.FindRootsBatch(Item)
+
+class Test_FindRealRoots(unittest.TestCase):
+    """
+    Unit tests for the function FindRealRoots().
+    
+    Test IDs: TEST-T-506, TEST-T-507 and TEST-T-508
+    
+    Covers requirements: REQ-FUN-514, REQ-AWM-515 and REQ-AWM-516
+    
+    Version 1.0.1.0
+    """
+    
+    def checkRoots(self, Test: list, Check: list, Precision: float) -> None:
+        """
+        Helper method to compare the found and the expected real roots.
+        """
+        self.assertIsInstance(Test, list)
+        self.assertEqual(len(Test), len(Check))
+        for Index, Root in enumerate(Test):
+            self.assertIsInstance(Root, (int, float))
+            if Index:
+                self.assertLessEqual(Test[Index - 1], Root)
+        for Root, CheckValue in zip(Test, sorted(Check)):
+            self.assertAlmostEqual(Root, CheckValue,
+                        delta = Precision * max(1, abs(CheckValue)))
+    
+    def test_Calculation(self):
+        """
+        Test ID: TEST-T-506
+        
+        Requirements: REQ-FUN-514
+        """
+        #simple roots only
+        for _ in range(20):
+            Roots = [random.uniform(-5, 5)
+                                    for _ in range(random.randint(1, 10))]
+            Poly = Polynomial.fromRoots(*Roots) * random.choice([-2.5, 1, 3])
+            self.checkRoots(testmodule.FindRealRoots(Poly), Roots, 1.0E-6)
+        #multiple roots
+        for Roots in [[1, 1], [0, 0, 0, 1, 2], [-1, -1, 0.5, 0.5, 0.5, 3],
+                        [0.25, 0.25, 0.25, 0.25], [-2, 1, 1, 1, 1, 1, 4]]:
+            Test = testmodule.FindRealRoots(Polynomial.fromRoots(*Roots))
+            self.checkRoots(Test, Roots, 1.0E-6)
+        #no real roots and the complex ones
+        for Coefficients, Check in [([1, 0, 1], []), ([4, 0, 5, 0, 1], []),
+                                    ([1, 0, 2, 0, 1], []),
+                                    ([-2, 2, -1, 1], [1]),
+                                    ([0, 0, 1, 0, 1], [0, 0])]:
+            Test = testmodule.FindRealRoots(Polynomial(*Coefficients))
+            self.checkRoots(Test, Check, 1.0E-6)
+        #Chebyshev polynomials - all roots are real and simple
+        for Degree in [5, 10, 20, 30]:
+            Check = [cos(pi * (Index + 0.5) / Degree)
+                                                for Index in range(Degree)]
+            Test = testmodule.FindRealRoots(
+                                    testmodule.GetChebyshevPolynomial(Degree))
+            self.checkRoots(Test, Check, 1.0E-8)
+        #interval of the search, inclusive of its ends
+        Poly = Polynomial.fromRoots(-3, -1, -1, 0, 2, 2, 2, 5)
+        for Interval, Check in [((-1, 2), [-1, -1, 0, 2, 2, 2]),
+                                ([-0.5, 1.5], [0]), ((-10, -4), []),
+                                ((-1.5, 10), [-1, -1, 0, 2, 2, 2, 5]),
+                                ((0, 0.5), [0]), ((4.5, 5), [5])]:
+            Test = testmodule.FindRealRoots(Poly, Interval = Interval)
+            self.checkRoots(Test, Check, 1.0E-6)
+        #non-integer roots at the ends of the interval
+        for Roots, Interval, Check in [
+                    ([0.1, 0.3, 0.7], (0.1, 1), [0.1, 0.3, 0.7]),
+                    ([0.1, 0.1, 0.3, 0.7], (0.1, 0.5), [0.1, 0.1, 0.3]),
+                    ([-2.6, -0.35, 1.45], (-2.6, 1.45), [-2.6, -0.35, 1.45]),
+                    ([-2.6, -0.35, 1.45], (-0.35, 1.4), [-0.35])]:
+            Test = testmodule.FindRealRoots(Polynomial.fromRoots(*Roots),
+                                                        Interval = Interval)
+            self.checkRoots(Test, Check, 1.0E-6)
+        #comparison with all roots, higher degree
+        for _ in range(5):
+            Poly = Polynomial(*[random.gauss(0, 1) for _ in range(40)])
+            Check = [Root for Root in testmodule.FindRoots(Poly)
+                                        if not isinstance(Root, complex)]
+            Test = testmodule.FindRealRoots(Poly, Tolerance = 1.0E-14)
+            self.checkRoots(Test, Check, 0.001)
+    
+    def test_TypeError(self):
+        """
+        Test ID: TEST-T-507
+        
+        Requirements: REQ-AWM-515
+        """
+        for Item in [1, 1.0, int, float, True, '1, 2', [1, 2], (1, 2)]:
+            with self.assertRaises(TypeError):
+                testmodule.FindRealRoots(Item)
+        Poly = Polynomial(1, 2, 3)
+        for Item in [1, 1.0, '12', Polynomial(1, 2), [1], (1, 2, 3), [1, '2'],
+                        (None, 1), [True, 2], [1, complex(2, 1)], {1, 2}]:
+            with self.assertRaises(TypeError):
+                testmodule.FindRealRoots(Poly, Interval = Item)
+        for Item in ['1', True, [1.0E-8], int]:
+            with self.assertRaises(TypeError):
+                testmodule.FindRealRoots(Poly, Tolerance = Item)
+    
+    def test_ValueError(self):
+        """
+        Test ID: TEST-T-508
+        
+        Requirements: REQ-AWM-516
+        """
+        Poly = Polynomial(1, 2, 3)
+        for Item in [(1, 1), [2, 1.5], (0.0, -1.0E-8)]:
+            with self.assertRaises(ValueError):
+                testmodule.FindRealRoots(Poly, Interval = Item)
+        for Item in [0, -1, -1.0E-8]:
+            with self.assertRaises(ValueError):
+                testmodule.FindRealRoots(Poly, Tolerance = Item)
 
 class Test_GetLagrangePolynomial(unittest.TestCase):
     """
@@ -1154,6 +1562,10 @@ TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_HelperFunctions)
 
 TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_FindRoots)
 
+TestSuite15 = unittest.TestLoader().loadTestsFromTestCase(Test_FindRootsBatch)
+
+TestSuite16 = unittest.TestLoader().loadTestsFromTestCase(Test_FindRealRoots)
+
 TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(
                                                     Test_GetLagrangePolynomial)
 
@@ -1193,7 +1605,8 @@ TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
                     TestSuite6, TestSuite7, TestSuite8, TestSuite9, TestSuite10,
-                    TestSuite11, TestSuite12, TestSuite13, TestSuite14])
+                    TestSuite11, TestSuite12, TestSuite13, TestSuite14,
+                    TestSuite15, TestSuite16])
 
 if __name__ == "__main__":
     sys.stdout.write("Conducting math_extra_lib.poly_solver module tests...\n")
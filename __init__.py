@@ -9,20 +9,24 @@ signal processing.
 Modules:
     polynomial: Implements Polynomial class, which supports various arithmetic
         operations and is callable, i.e. it can be evaluated at specific value
-        of its argument. Also implementes RationalFunction class required for
+        of its argument, and its variant CompactPolynomial with array-backed
+        storage. Also implementes RationalFunction class required for
         calculation or approximation of several special functions.
     special_functions: Implements a number of special mathematical functions on
         the field of real numbers.
-    vectors_matrices: Implements matrices, generic vectors, column and row
-        vectors as well as arithmetics involving instances of these classes and
-        real number as operands.
+    vectors_matrices: Implements dense, sparse and banded matrices, generic
+        vectors, column and row vectors as well as arithmetics involving
+        instances of these classes and real number as operands.
     matrix_solver: Implements power iteration method for finding a single
         dominant eigenvalue of a square matrix and solution of a system of
-        linear equations.
+        linear equations, directly (dense, sparse or banded LUP-decomposition,
+        Thomas algorithm) or iteratively (Krylov subspace methods with
+        preconditioning).
     poly_solver: Implements finding all complex roots of a real coefficients
-        polynomial, generation of Lagrange, Legendre, Chebyshev and Bernstein
-        polynomials, and interpolation of univariate real functions using these
-        polynomials.
+        polynomial (Aberth method or eigenvalues of the companion matrix) or
+        only its real roots (Sturm sequence), generation of Lagrange,
+        Legendre, Chebyshev and Bernstein polynomials, and interpolation of
+        univariate real functions using these polynomials.
 """
 
 __project__ = 'Linear algebra, special functions, polynomial interpolation'
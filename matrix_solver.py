@@ -2,19 +2,59 @@
 """
 Module math_extra_lib.matrix_solver.
 
-Implements power iteration method for finding an eigenvector of a matrix, and
-solution of a determined system of linear equations.
+Implements power iteration method for finding an eigenvector of a matrix,
+solution of a determined system of linear equations with one or many vectors
+of the free coefficients, and the iterative (Krylov subspace) solvers of large
+systems, which require only the matrix x vector product. The dense as well as
+the sparse matrices are supported, and the banded (including tridiagonal)
+systems are solved in time linear in their size.
 
 Functions:
     FindEigenvector(Matrix)
-        SquareMatrix -> int OR float OR None
+        SquareMatrix OR SparseMatrix -> int OR float OR None
     SolveLinearSystem(BoundCoeffs, FreeCoeffs)
-        SquareMatrix OR seq(seq(int OR float)) OR seq(int OR float),
-            Column OR seq(int OR float) -> list(int OR float) OR None
+        LUFactorization OR SquareMatrix OR SparseMatrix
+            OR seq(seq(int OR float))
+            OR seq(int OR float), Column OR seq(int OR float) OR Matrix
+                OR seq(Column OR seq(int OR float))
+                    -> list(int OR float) OR Matrix
+                        OR list(list(int OR float)) OR None
+    SolveTridiagonal(SubDiagonal, Diagonal, SuperDiagonal, FreeCoeffs)
+        Column OR seq(int OR float), Column OR seq(int OR float),
+            Column OR seq(int OR float), Column OR seq(int OR float)
+                -> list(int OR float) OR None
+    SolveConjugateGradient(Operator, FreeCoeffs, *, InitialGuess = None,
+                            Tolerance = TOLERANCE, MaxIterations = None,
+                                Preconditioner = None)
+        SquareMatrix OR SparseMatrix OR callable,
+            Column OR seq(int OR float)/,
+            *, Column OR seq(int OR float) OR None, int > 0 OR float > 0,
+                int > 0 OR None, callable OR None/
+                    -> list(int OR float) OR None
+    SolveGMRES(Operator, FreeCoeffs, *, InitialGuess = None,
+                Tolerance = TOLERANCE, MaxIterations = None,
+                    Preconditioner = None, Restart = GMRES_RESTART)
+        SquareMatrix OR SparseMatrix OR callable,
+            Column OR seq(int OR float)/,
+            *, Column OR seq(int OR float) OR None, int > 0 OR float > 0,
+                int > 0 OR None, callable OR None, int > 0/
+                    -> list(int OR float) OR None
+    SolveBiCGSTAB(Operator, FreeCoeffs, *, InitialGuess = None,
+                    Tolerance = TOLERANCE, MaxIterations = None,
+                        Preconditioner = None)
+        SquareMatrix OR SparseMatrix OR callable,
+            Column OR seq(int OR float)/,
+            *, Column OR seq(int OR float) OR None, int > 0 OR float > 0,
+                int > 0 OR None, callable OR None/
+                    -> list(int OR float) OR None
+    GetJacobiPreconditioner(BoundCoeffs)
+        SquareMatrix OR SparseMatrix -> callable OR None
+    GetILUPreconditioner(BoundCoeffs)
+        SquareMatrix OR SparseMatrix -> callable OR None
 """
 
-__version__= '1.0.0.0'
-__date__ = '12-10-2023'
+__version__= '1.5.0.0'
+__date__ = '17-10-2026'
 __status__ = 'Production'
 
 #imports
@@ -24,8 +64,11 @@ __status__ = 'Production'
 import sys
 import os
 import random
+import collections.abc as c_abc
 
-from typing import Sequence, Union, List
+from math import sqrt, hypot
+from operator import mul
+from typing import Sequence, Union, List, Any, Optional, Callable, Tuple
 
 #+ custom modules
 
@@ -40,7 +83,9 @@ if not (ROOT_FOLDER in sys.path):
 
 from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
 
-from math_extra_lib.vectors_matrices import Column, SquareMatrix
+from math_extra_lib.vectors_matrices import Column, Matrix, SquareMatrix
+from math_extra_lib.vectors_matrices import LUFactorization, SparseMatrix
+from math_extra_lib.vectors_matrices import BandedMatrix
 from math_extra_lib.vectors_matrices import _CheckIfRealSequence
 
 #types
@@ -51,6 +96,13 @@ TRealSequence = Sequence[TReal]
 
 TNestedSequence = Sequence[TRealSequence]
 
+TFreeCoeffs = Union[Column, TRealSequence, Matrix,
+                                        Sequence[Union[Column, TRealSequence]]]
+
+TOperator = Callable[[List[TReal]], List[TReal]]
+
+TSquare = Union[SquareMatrix, SparseMatrix]
+
 #globals
 
 MAX_ITER = 1000000 #1E6, maximum number of power iteration
@@ -59,9 +111,259 @@ ALMOST_ZERO = 1.0E-12 #aimed relative error level in the eigenvalue
 
 ROUND_PRECISION = 1.0E-4 #rounding to integer precision
 
+TOLERANCE = 1.0E-10 #default relative residual level of the iterative solvers
+
+GMRES_RESTART = 30 #default number of GMRES iterations between the restarts
+
+BANDED_RATIO = 2 #minimum ratio of size to total bandwidth for the banded LU
+
 #functions
 
-def FindEigenvector(Matrix: SquareMatrix) -> Union[TReal, None]:
+#+ private helper functions
+
+def _Norm(Vector: List[TReal]) -> float:
+    """
+    Calculates the Euclidean norm of a vector. It does not any data sanity
+    checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(int OR float) -> float >= 0
+    
+    Version 1.0.0.0
+    """
+    return sqrt(sum(map(mul, Vector, Vector)))
+
+def _ParseVector(Value: Any, Size: Optional[int], *,
+                                    SkipFrames: int = 2) -> List[TReal]:
+    """
+    Helper function to check that the received argument is a vector of real
+    numbers of the required length, and to copy its elements into a new list.
+    
+    Signature:
+        type A, int >= 2 OR None/, *, int > 0/ -> list(int OR float)
+    
+    Args:
+        Value: type A; the parameter to be checked
+        Size: int >= 2 OR None; the required length of the vector, or None if
+            any length >= 2 is acceptable
+        SkipFrame: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
+    
+    Raises:
+        UT_TypeError: the argument is neither an instance of Column class nor
+            a flat sequence of real numbers
+        UT_ValueError: the length of the vector does not match the required
+            size, OR it is less than 2 if the size is not specified
+    
+    Version 1.0.0.0
+    """
+    if not isinstance(Value, Column):
+        try:
+            _CheckIfRealSequence(Value)
+        except UT_TypeError as err:
+            Error = UT_TypeError(Value, Column, SkipFrames = SkipFrames)
+            Error.setMessage(err.getMessage())
+            raise Error from None
+        Result = list(Value)
+    else:
+        Result = Value.Data
+    if Size is None:
+        if len(Result) < 2:
+            raise UT_ValueError(len(Result), '>= 2 - vector length',
+                                                    SkipFrames = SkipFrames)
+    elif len(Result) != Size:
+        raise UT_ValueError(len(Result), f'={Size} - mismatching sizes',
+                                                    SkipFrames = SkipFrames)
+    return Result
+
+def _GetSparseSize(Value: SparseMatrix, *, SkipFrames: int = 2) -> int:
+    """
+    Helper function to check that a sparse matrix is square, and to return its
+    size.
+    
+    Signature:
+        SparseMatrix/, *, int > 0/ -> int >= 2
+    
+    Args:
+        Value: SparseMatrix; the matrix to check
+        SkipFrame: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
+    
+    Raises:
+        UT_ValueError: the matrix is not square
+    
+    Version 1.0.0.0
+    """
+    Result = Value.Height
+    if Value.Width != Result:
+        raise UT_ValueError(Value.Width,
+                                f'== {Result} - width of a square matrix',
+                                                    SkipFrames = SkipFrames)
+    return Result
+
+def _SolveThomas(Lower: List[TReal], Diagonal: List[TReal],
+                        Upper: List[TReal], Free: List[TReal]
+                                                ) -> Optional[List[TReal]]:
+    """
+    Solves a tridiagonal system of linear equations by the Thomas algorithm,
+    i.e. the Gaussian elimination without pivoting, which requires O(N)
+    operations. Stable for the diagonally dominant matrices. It does not any
+    data sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(int OR float), list(int OR float), list(int OR float),
+            list(int OR float) -> list(int OR float) OR None
+    
+    Args:
+        Lower: list(int OR float); N - 1 elements of the sub-diagonal
+        Diagonal: list(int OR float); N elements of the main diagonal
+        Upper: list(int OR float); N - 1 elements of the super-diagonal
+        Free: list(int OR float); N free coefficients
+    
+    Returns:
+        list(int OR float): the found solution of the system
+        None: a zero pivot is met, i.e. the matrix is singular or requires
+            pivoting
+    
+    Version 1.0.0.0
+    """
+    Size = len(Diagonal)
+    Ratios = [0] * (Size - 1)
+    Solution = list(Free)
+    Pivot = Diagonal[0]
+    for Index in range(1, Size):
+        if not Pivot:
+            break
+        Ratio = Upper[Index - 1] / Pivot
+        Ratios[Index - 1] = Ratio
+        Solution[Index - 1] /= Pivot
+        Factor = Lower[Index - 1]
+        Pivot = Diagonal[Index] - Factor * Ratio
+        Solution[Index] -= Factor * Solution[Index - 1]
+    if Pivot:
+        Solution[-1] /= Pivot
+        for Index in range(Size - 2, -1, -1):
+            Solution[Index] -= Ratios[Index] * Solution[Index + 1]
+        Result = Solution
+    else:
+        Result = None
+    return Result
+
+def _ParseIterativeArguments(Operator: Any, FreeCoeffs: Any,
+                    InitialGuess: Any, Tolerance: Any, MaxIterations: Any,
+                        Preconditioner: Any, *, SkipFrames: int = 2
+                            ) -> Tuple[TOperator, List[TReal], List[TReal],
+                                                    float, int, TOperator]:
+    """
+    Helper function to check the arguments common for all iterative solvers,
+    and to convert them into the form used by the algorithms.
+    
+    Signature:
+        type A, type B, type C, type D, type E, type F/, *, int > 0/
+            -> tuple(callable, list(int OR float), list(int OR float),
+                                                float >= 0, int > 0, callable)
+    
+    Args:
+        Operator: type A; the matrix of the bound coefficients or the function
+            calculating its product with a vector
+        FreeCoeffs: type B; the vector of the free coefficients
+        InitialGuess: type C; the initial approximation of the solution
+        Tolerance: type D; the relative residual level to be reached
+        MaxIterations: type E; the maximum number of iterations
+        Preconditioner: type F; the function applying the inverse of the
+            preconditioning matrix to a vector
+        SkipFrame: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
+    
+    Returns:
+        tuple(callable, list(int OR float), list(int OR float), float >= 0,
+                int > 0, callable): the matrix x vector product function, the
+            free coefficients, the initial approximation, the absolute
+            residual norm threshold, the maximum number of iterations and the
+            preconditioning function
+    
+    Raises:
+        UT_TypeError: the operator is neither an instance of SquareMatrix
+            or SparseMatrix classes nor a callable object, OR any of the
+            vectors is neither an instance of Column class nor a flat
+            sequence of real numbers, OR
+            the tolerance is not a real number, OR the maximum number of
+            iterations is neither an integer number nor None, OR the
+            preconditioner is neither a callable object nor None
+        UT_ValueError: the sparse matrix is not square, OR the sizes of the
+            matrix and vectors do not match, OR
+            the free coefficients vector has less than 2 elements, OR the
+            tolerance or the maximum number of iterations is not positive
+    
+    Version 1.1.0.0
+    """
+    SubFrames = SkipFrames + 1
+    isMatrix = isinstance(Operator, SquareMatrix)
+    isSparse = isinstance(Operator, SparseMatrix)
+    if not (isMatrix or isSparse or (callable(Operator)
+                                    and (not isinstance(Operator, type)))):
+        Error = UT_TypeError(Operator, (SquareMatrix, SparseMatrix),
+                                                    SkipFrames = SkipFrames)
+        Error.appendMessage('OR a callable object - Operator argument')
+        raise Error
+    if isMatrix:
+        Size = Operator.Size
+    elif isSparse:
+        Size = _GetSparseSize(Operator, SkipFrames = SubFrames)
+    else:
+        Size = None
+    Free = _ParseVector(FreeCoeffs, Size, SkipFrames = SubFrames)
+    Size = len(Free)
+    if InitialGuess is None:
+        Solution = [0] * Size
+    else:
+        Solution = _ParseVector(InitialGuess, Size, SkipFrames = SubFrames)
+    if ((not isinstance(Tolerance, (int, float)))
+                                            or isinstance(Tolerance, bool)):
+        Error = UT_TypeError(Tolerance, (int, float), SkipFrames = SkipFrames)
+        Error.appendMessage('- Tolerance argument')
+        raise Error
+    if Tolerance <= 0:
+        raise UT_ValueError(Tolerance, '> 0 - Tolerance argument',
+                                                    SkipFrames = SkipFrames)
+    if MaxIterations is None:
+        MaxIterations = 10 * Size
+    elif ((not isinstance(MaxIterations, int))
+                                        or isinstance(MaxIterations, bool)):
+        Error = UT_TypeError(MaxIterations, int, SkipFrames = SkipFrames)
+        Error.appendMessage('OR None - MaxIterations argument')
+        raise Error
+    elif MaxIterations <= 0:
+        raise UT_ValueError(MaxIterations, '> 0 - MaxIterations argument',
+                                                    SkipFrames = SkipFrames)
+    if Preconditioner is None:
+        def Precondition(Vector: List[TReal]) -> List[TReal]:
+            return Vector
+    elif callable(Preconditioner) and (not isinstance(Preconditioner, type)):
+        Precondition = Preconditioner
+    else:
+        Error = UT_TypeError(Preconditioner, type(None),
+                                                    SkipFrames = SkipFrames)
+        Error.appendMessage('OR a callable object - Preconditioner argument')
+        raise Error
+    if isMatrix:
+        Rows = Operator.Data
+        def Product(Vector: List[TReal]) -> List[TReal]:
+            return [sum(map(mul, Row, Vector)) for Row in Rows]
+    elif isSparse:
+        Product = Operator._multiplyRight
+    else:
+        Product = Operator
+    FreeNorm = _Norm(Free)
+    Threshold = Tolerance * FreeNorm if FreeNorm else Tolerance
+    return Product, Free, Solution, Threshold, MaxIterations, Precondition
+
+#+ public functions
+
+def FindEigenvector(Matrix: TSquare) -> Union[TReal, None]:
     """
     Finds a real number eigenvalue of a square matrix using the power iteration
     method. The found eigenvalue, if exists, is most likely the highest absolute
@@ -70,10 +372,11 @@ def FindEigenvector(Matrix: SquareMatrix) -> Union[TReal, None]:
     found eigenvalue is not the largest by the amplitude.
     
     Signature:
-        SquareMatrix -> int OR float OR None
+        SquareMatrix OR SparseMatrix -> int OR float OR None
     
     Args:
-        Matrix: SquareMatrix; instance of the class implementing a square matrix
+        Matrix: SquareMatrix OR SparseMatrix; instance of the class
+            implementing a square matrix, dense or sparse
     
     Returns:
         int OR float: the found eigenvalue
@@ -81,13 +384,18 @@ def FindEigenvector(Matrix: SquareMatrix) -> Union[TReal, None]:
     
     Raises:
         UT_TypeError: the passed argument is not an instance of SquareMatrix
-            class
+            or SparseMatrix classes
+        UT_ValueError: the passed sparse matrix is not square
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    if not isinstance(Matrix, SquareMatrix):
-        raise UT_TypeError(Matrix, SquareMatrix, SkipFrames = 1)
-    Size = Matrix.Size
+    if isinstance(Matrix, SparseMatrix):
+        Size = _GetSparseSize(Matrix)
+    elif isinstance(Matrix, SquareMatrix):
+        Size = Matrix.Size
+    else:
+        raise UT_TypeError(Matrix, (SquareMatrix, SparseMatrix),
+                                                                SkipFrames = 1)
     #generate random vector
     Elements = [0.001 + random.random() for _ in range(Size)]
     Vector = Column(*Elements)
@@ -142,41 +450,79 @@ def FindEigenvector(Matrix: SquareMatrix) -> Union[TReal, None]:
     return Result
 
 def SolveLinearSystem(
-        BoundCoeffs: Union[SquareMatrix, TNestedSequence, TRealSequence],
-        FreeCoeffs: Union[Column, TRealSequence]) -> Union[List[TReal], None]:
+        BoundCoeffs: Union[LUFactorization, TSquare, TNestedSequence,
+                                                                TRealSequence],
+        FreeCoeffs: TFreeCoeffs
+                    ) -> Union[List[TReal], Matrix, List[List[TReal]], None]:
     """
     Solves a system of linear equations using Gauss-Jordan elimination with
-    rows / columns pivoting (LUP-decomposition) and back-substition.
+    rows / columns pivoting (LUP-decomposition) and back-substition. An already
+    calculated factorization of the matrix of the bound coefficients can be
+    passed instead of the matrix itself, in which case the decomposition is
+    not repeated.
+    
+    Several vectors of the free coefficients can be passed at once, either as
+    a sequence of vectors or as the columns of a matrix. All of them are solved
+    against the same factorization with the batched forward and back
+    substitution.
+    
+    A sparse matrix of the bound coefficients is factorized by the sparse
+    LUP-decomposition, which preserves the sparsity of the factors. The
+    bandwidths of a dense square matrix are detected automatically, and if all
+    its non-zero elements are within a narrow band around the main diagonal
+    (the total bandwidth is less than 1 / BANDED_RATIO of the size) the banded
+    LUP-decomposition is used instead of the dense one, with the cost
+    O(N * L * (L + U)) instead of O(N^3) operations.
     
     Signature:
-        SquareMatrix OR seq(seq(int OR float)) OR seq(int OR float),
-            Column OR seq(int OR float) -> list(int OR float) OR None
+        LUFactorization OR SquareMatrix OR SparseMatrix
+            OR seq(seq(int OR float)) OR seq(int OR float),
+                Column OR seq(int OR float) OR Matrix
+                OR seq(Column OR seq(int OR float))
+                    -> list(int OR float) OR Matrix
+                        OR list(list(int OR float)) OR None
     
     Args:
-        BoundCoeffs: SquareMatrix OR seq(seq(int OR float)) OR seq(int OR float)
-            ; the matrix of the bound coefficients of the system in the
-            row-first order
-        FreeCoeffs: Column OR seq(int OR float); the free coefficients of the
-            system
+        BoundCoeffs: LUFactorization OR SquareMatrix OR SparseMatrix
+            OR seq(seq(int OR float)) OR seq(int OR float); the matrix of the
+            bound coefficients of the system in the row-first order, dense or
+            sparse, or its LUP-decomposition
+        FreeCoeffs: Column OR seq(int OR float) OR Matrix
+            OR seq(Column OR seq(int OR float)); the free coefficients of the
+            system, a single vector, OR a matrix with one vector per column,
+            OR a sequence of the vectors
     
     Returns:
-        list(int OR float): the found solution of the system
+        list(int OR float): the found solution of the system, if a single
+            vector of the free coefficients is passed
+        Matrix: the found solutions as the columns of a matrix of the same
+            class and dimensions as the passed matrix of the free coefficients
+        list(list(int OR float)): the found solutions, one per vector of the
+            free coefficients, in the same order
         None: the system is undertermined (no solution or multiple solutions)
     
     Raises:
-        UT_TypeError: the first argument is neigther an instance of SquareMatrix
-            class nor a flat or nested sequence of real numbers, OR the second
-            argument is neigther an instance of Column class nor a flat
-            sequence of real numbers
+        UT_TypeError: the first argument is neigther an instance of
+            LUFactorization, SquareMatrix or SparseMatrix classes nor a flat
+            or nested sequence of real numbers, OR the second
+            argument is neigther an instance of Column or Matrix classes nor a
+            flat sequence of real numbers, nor a sequence of such vectors
         UT_ValueError: the content of the first argument (as a sequence) is
             incompatible with the initilization method of SquareMatrix class,
-            OR the second argument (as a sequence) has less than 2 elements, OR
-            the size of the free coefficients vector does not match the size of
-            the bound coefficients matrix
+            OR the sparse matrix is not square, OR the second argument (as a
+            sequence) has less than 2 elements, OR the size of the free
+            coefficients vector(s) or the height of the free coefficients
+            matrix does not match the size of the bound coefficients matrix
     
-    Version 1.0.0.0
+    Version 1.4.0.0
     """
-    if not isinstance(BoundCoeffs, SquareMatrix):
+    if isinstance(BoundCoeffs, (LUFactorization, SquareMatrix)):
+        _Matrix = BoundCoeffs
+        Size = _Matrix.Size
+    elif isinstance(BoundCoeffs, SparseMatrix):
+        _Matrix = BoundCoeffs
+        Size = _GetSparseSize(_Matrix)
+    else:
         try:
             _Matrix = SquareMatrix(BoundCoeffs)
         except UT_TypeError as err:
@@ -187,52 +533,569 @@ def SolveLinearSystem(
             Error = UT_ValueError(BoundCoeffs, 'whatever', SkipFrames = 1)
             Error.setMessage(err1.getMessage())
             raise Error from None
+        Size = _Matrix.Size
+    isMatrix = isinstance(FreeCoeffs, Matrix)
+    isBatch = ((not isMatrix) and isinstance(FreeCoeffs, c_abc.Sequence)
+                and (not isinstance(FreeCoeffs, str)) and len(FreeCoeffs) > 0
+                    and all(isinstance(Item, Column)
+                            or (isinstance(Item, c_abc.Sequence)
+                                            and (not isinstance(Item, str)))
+                                                    for Item in FreeCoeffs))
+    if isMatrix:
+        if FreeCoeffs.Height != Size:
+            raise UT_ValueError(FreeCoeffs.Height,
+                            f'={Size} - mismatching sizes', SkipFrames = 1)
+        Vectors = None
     else:
-        _Matrix = BoundCoeffs
-    if not isinstance(FreeCoeffs, Column):
-        try:
-            _CheckIfRealSequence(FreeCoeffs)
-        except UT_TypeError as err:
-            Error = UT_TypeError(FreeCoeffs, Column, SkipFrames = 1)
-            Error.setMessage(err.getMessage())
-            raise Error from None
-        _Column = list(FreeCoeffs)
+        Vectors = [_ParseVector(Item, Size)
+                    for Item in (FreeCoeffs if isBatch else (FreeCoeffs, ))]
+    if isinstance(_Matrix, LUFactorization):
+        Factorization = _Matrix
+    else:
+        if isinstance(_Matrix, SquareMatrix):
+            Lower, Upper = _Matrix.getBandwidths()
+            if (Lower + Upper) * BANDED_RATIO < Size:
+                _Matrix = BandedMatrix.fromDense(_Matrix)
+        Factorization = _Matrix.factorize()
+    del _Matrix
+    if isMatrix:
+        Result = Factorization.solveMatrix(FreeCoeffs)
+    elif isBatch:
+        Result = Factorization.solveMany(Vectors)
+    else:
+        Result = Factorization.solve(Vectors[0])
+    return Result
+
+def SolveTridiagonal(SubDiagonal: Union[Column, TRealSequence],
+                        Diagonal: Union[Column, TRealSequence],
+                        SuperDiagonal: Union[Column, TRealSequence],
+                        FreeCoeffs: Union[Column, TRealSequence]
+                                                ) -> Union[List[TReal], None]:
+    """
+    Solves a system of linear equations with a tridiagonal matrix of the bound
+    coefficients, passed as its three diagonals, as produced by the spline
+    fitting and the finite differences schemes. A diagonally dominant system
+    is solved directly by the Thomas algorithm in O(N) operations without
+    creating any matrix object. Otherwise, or if a zero pivot is met, the
+    banded LUP-decomposition with the partial pivoting is used, which is still
+    O(N).
+    
+    Signature:
+        Column OR seq(int OR float), Column OR seq(int OR float),
+            Column OR seq(int OR float), Column OR seq(int OR float)
+                -> list(int OR float) OR None
+    
+    Args:
+        SubDiagonal: Column OR seq(int OR float); N - 1 elements below the
+            main diagonal
+        Diagonal: Column OR seq(int OR float); N >= 2 elements of the main
+            diagonal
+        SuperDiagonal: Column OR seq(int OR float); N - 1 elements above the
+            main diagonal
+        FreeCoeffs: Column OR seq(int OR float); N free coefficients of the
+            system
+    
+    Returns:
+        list(int OR float): the found solution of the system
+        None: the system is undertermined (no solution or multiple solutions)
+    
+    Raises:
+        UT_TypeError: any of the arguments is neither an instance of Column
+            class nor a flat sequence of real numbers
+        UT_ValueError: the main diagonal has less than 2 elements, OR the
+            length of any other argument is inconsistent with it
+    
+    Version 1.0.0.0
+    """
+    _Diagonal = _ParseVector(Diagonal, None)
+    Size = len(_Diagonal)
+    Lower = _ParseVector(SubDiagonal, Size - 1)
+    Upper = _ParseVector(SuperDiagonal, Size - 1)
+    Free = _ParseVector(FreeCoeffs, Size)
+    isDominant = all(abs(Value) >= abs(Left) + abs(Right)
+                        for Value, Left, Right in zip(_Diagonal, [0] + Lower,
+                                                                Upper + [0]))
+    if isDominant:
+        Result = _SolveThomas(Lower, _Diagonal, Upper, Free)
+    else:
+        Result = None
+    if Result is None:
+        Factorization = BandedMatrix.fromDiagonals([Lower, _Diagonal, Upper],
+                                                    Lower = 1).factorize()
+        Result = Factorization.solve(Free)
+    return Result
+
+def SolveConjugateGradient(Operator: Union[TSquare, TOperator],
+                            FreeCoeffs: Union[Column, TRealSequence], *,
+                            InitialGuess: Optional[Union[Column,
+                                                    TRealSequence]] = None,
+                            Tolerance: TReal = TOLERANCE,
+                            MaxIterations: Optional[int] = None,
+                            Preconditioner: Optional[TOperator] = None
+                                                ) -> Union[List[TReal], None]:
+    """
+    Solves a system of linear equations with a symmetric positive definite
+    matrix of the bound coefficients using the (preconditioned) conjugate
+    gradient method. Only the product of the matrix with a vector is used,
+    thus the matrix can be passed as a function calculating this product.
+    
+    Signature:
+        SquareMatrix OR SparseMatrix OR callable,
+            Column OR seq(int OR float)/,
+            *, Column OR seq(int OR float) OR None, int > 0 OR float > 0,
+                int > 0 OR None, callable OR None/
+                    -> list(int OR float) OR None
+    
+    Args:
+        Operator: SquareMatrix OR SparseMatrix OR callable; the dense or
+            sparse matrix of the bound coefficients, OR a function, which
+            accepts a list of real numbers and returns the product of the
+            matrix with it as a list
+        FreeCoeffs: Column OR seq(int OR float); the free coefficients of the
+            system
+        InitialGuess: (keyword) Column OR seq(int OR float) OR None; the
+            initial approximation of the solution (warm start), defaults to
+            None, i.e. the zero vector
+        Tolerance: (keyword) int > 0 OR float > 0; the required norm of the
+            residual relative to the norm of the free coefficients vector,
+            defaults to TOLERANCE
+        MaxIterations: (keyword) int > 0 OR None; the maximum number of the
+            iterations, defaults to None, i.e. 10 times the size of the system
+        Preconditioner: (keyword) callable OR None; a function, which applies
+            the inverse of a symmetric positive definite preconditioning
+            matrix to a list of real numbers, defaults to None (no
+            preconditioning)
+    
+    Returns:
+        list(int OR float): the found solution of the system
+        None: the required tolerance is not reached within the maximum number
+            of iterations, OR the method breaks down (the matrix is not
+            positive definite)
+    
+    Raises:
+        UT_TypeError: the operator is neither an instance of SquareMatrix
+            or SparseMatrix classes nor a callable object, OR any of the
+            vectors is neither an instance of Column class nor a flat
+            sequence of real numbers, OR
+            the tolerance is not a real number, OR the maximum number of
+            iterations is neither an integer number nor None, OR the
+            preconditioner is neither a callable object nor None
+        UT_ValueError: the sparse matrix is not square, OR the sizes of the
+            matrix and vectors do not match, OR
+            the free coefficients vector has less than 2 elements, OR the
+            tolerance or the maximum number of iterations is not positive
+    
+    Version 1.1.0.0
+    """
+    Product, Free, Solution, Threshold, MaxIterations, Precondition = (
+                _ParseIterativeArguments(Operator, FreeCoeffs, InitialGuess,
+                            Tolerance, MaxIterations, Preconditioner))
+    Residual = [Value - Image for Value, Image in zip(Free, Product(Solution))]
+    Preconditioned = Precondition(Residual)
+    Direction = list(Preconditioned)
+    Projection = sum(map(mul, Residual, Preconditioned))
+    isConverged = _Norm(Residual) <= Threshold
+    Iteration = 0
+    while (not isConverged) and (Iteration < MaxIterations):
+        Iteration += 1
+        Image = Product(Direction)
+        Curvature = sum(map(mul, Direction, Image))
+        if Curvature <= 0 or Projection <= 0:
+            break #not positive definite matrix or preconditioner
+        Step = Projection / Curvature
+        Solution = [Value + Step * Other
+                                for Value, Other in zip(Solution, Direction)]
+        Residual = [Value - Step * Other
+                                    for Value, Other in zip(Residual, Image)]
+        isConverged = _Norm(Residual) <= Threshold
+        if not isConverged:
+            Preconditioned = Precondition(Residual)
+            NewProjection = sum(map(mul, Residual, Preconditioned))
+            Ratio = NewProjection / Projection
+            Direction = [Value + Ratio * Other
+                            for Value, Other in zip(Preconditioned, Direction)]
+            Projection = NewProjection
+    if isConverged:
+        Result = Solution
     else:
-        _Column = FreeCoeffs.Data
-    if len(_Column) != _Matrix.Size:
-        raise UT_ValueError(len(_Column),
-                            f'={_Matrix.Size} - mismatching sizes',
+        Result = None
+    return Result
+
+def SolveGMRES(Operator: Union[TSquare, TOperator],
+                FreeCoeffs: Union[Column, TRealSequence], *,
+                InitialGuess: Optional[Union[Column, TRealSequence]] = None,
+                Tolerance: TReal = TOLERANCE,
+                MaxIterations: Optional[int] = None,
+                Preconditioner: Optional[TOperator] = None,
+                Restart: int = GMRES_RESTART) -> Union[List[TReal], None]:
+    """
+    Solves a system of linear equations with a general non-singular matrix of
+    the bound coefficients using the restarted generalized minimal residual
+    method (GMRES) with the right preconditioning. Only the product of the
+    matrix with a vector is used, thus the matrix can be passed as a function
+    calculating this product.
+    
+    Signature:
+        SquareMatrix OR SparseMatrix OR callable,
+            Column OR seq(int OR float)/,
+            *, Column OR seq(int OR float) OR None, int > 0 OR float > 0,
+                int > 0 OR None, callable OR None, int > 0/
+                    -> list(int OR float) OR None
+    
+    Args:
+        Operator: SquareMatrix OR SparseMatrix OR callable; the dense or
+            sparse matrix of the bound coefficients, OR a function, which
+            accepts a list of real numbers and returns the product of the
+            matrix with it as a list
+        FreeCoeffs: Column OR seq(int OR float); the free coefficients of the
+            system
+        InitialGuess: (keyword) Column OR seq(int OR float) OR None; the
+            initial approximation of the solution (warm start), defaults to
+            None, i.e. the zero vector
+        Tolerance: (keyword) int > 0 OR float > 0; the required norm of the
+            residual relative to the norm of the free coefficients vector,
+            defaults to TOLERANCE
+        MaxIterations: (keyword) int > 0 OR None; the maximum total number of
+            the iterations (matrix x vector products), defaults to None, i.e.
+            10 times the size of the system
+        Preconditioner: (keyword) callable OR None; a function, which applies
+            the inverse of a preconditioning matrix to a list of real numbers,
+            defaults to None (no preconditioning)
+        Restart: (keyword) int > 0; the maximum dimension of the Krylov
+            subspace, after which the method is restarted from the current
+            approximation, defaults to GMRES_RESTART
+    
+    Returns:
+        list(int OR float): the found solution of the system
+        None: the required tolerance is not reached within the maximum number
+            of iterations, OR the method breaks down (singular matrix)
+    
+    Raises:
+        UT_TypeError: the operator is neither an instance of SquareMatrix
+            or SparseMatrix classes nor a callable object, OR any of the
+            vectors is neither an instance of Column class nor a flat
+            sequence of real numbers, OR
+            the tolerance is not a real number, OR the maximum number of
+            iterations is neither an integer number nor None, OR the
+            preconditioner is neither a callable object nor None, OR the
+            restart length is not an integer number
+        UT_ValueError: the sparse matrix is not square, OR the sizes of the
+            matrix and vectors do not match, OR
+            the free coefficients vector has less than 2 elements, OR the
+            tolerance, the maximum number of iterations or the restart length
+            is not positive
+    
+    Version 1.1.0.0
+    """
+    Product, Free, Solution, Threshold, MaxIterations, Precondition = (
+                _ParseIterativeArguments(Operator, FreeCoeffs, InitialGuess,
+                            Tolerance, MaxIterations, Preconditioner))
+    if (not isinstance(Restart, int)) or isinstance(Restart, bool):
+        Error = UT_TypeError(Restart, int, SkipFrames = 1)
+        Error.appendMessage('- Restart argument')
+        raise Error
+    if Restart <= 0:
+        raise UT_ValueError(Restart, '> 0 - Restart argument', SkipFrames = 1)
+    Residual = [Value - Image for Value, Image in zip(Free, Product(Solution))]
+    ResidualNorm = _Norm(Residual)
+    isConverged = ResidualNorm <= Threshold
+    isBreakdown = False
+    Iteration = 0
+    while not (isConverged or isBreakdown or (Iteration >= MaxIterations)):
+        #Arnoldi process with the Givens rotations of the Hessenberg columns
+        Basis = [[Value / ResidualNorm for Value in Residual]]
+        Triangular = [] #columns of the rotated Hessenberg matrix
+        Cosines = []
+        Sines = []
+        Rotated = [ResidualNorm] #rotated residual norm vector
+        for Index in range(min(Restart, MaxIterations - Iteration)):
+            Iteration += 1
+            Vector = Product(Precondition(Basis[Index]))
+            Coefficients = []
+            for BaseVector in Basis: #modified Gram-Schmidt
+                Coefficient = sum(map(mul, Vector, BaseVector))
+                Vector = [Value - Coefficient * Other
+                                for Value, Other in zip(Vector, BaseVector)]
+                Coefficients.append(Coefficient)
+            VectorNorm = _Norm(Vector)
+            for Position, Cosine in enumerate(Cosines):
+                Sine = Sines[Position]
+                First = Coefficients[Position]
+                Second = Coefficients[Position + 1]
+                Coefficients[Position] = Cosine * First + Sine * Second
+                Coefficients[Position + 1] = Cosine * Second - Sine * First
+            Radius = hypot(Coefficients[Index], VectorNorm)
+            if Radius:
+                Cosine = Coefficients[Index] / Radius
+                Sine = VectorNorm / Radius
+            else:
+                Cosine, Sine = 1.0, 0.0
+            Coefficients[Index] = Radius
+            Cosines.append(Cosine)
+            Sines.append(Sine)
+            Rotated.append(- Sine * Rotated[Index])
+            Rotated[Index] *= Cosine
+            Triangular.append(Coefficients)
+            if (abs(Rotated[-1]) <= Threshold) or (not VectorNorm):
+                break
+            Basis.append([Value / VectorNorm for Value in Vector])
+        #back-substitution for the least squares problem
+        Count = len(Triangular)
+        Weights = [0] * Count
+        for Index in range(Count - 1, -1, -1):
+            Diagonal = Triangular[Index][Index]
+            if Diagonal:
+                Resolved = sum(Triangular[Position][Index] * Weights[Position]
+                                    for Position in range(Index + 1, Count))
+                Weights[Index] = (Rotated[Index] - Resolved) / Diagonal
+            else:
+                isBreakdown = True
+        Combined = [0] * len(Free)
+        for Weight, BaseVector in zip(Weights, Basis):
+            Combined = [Value + Weight * Other
+                                for Value, Other in zip(Combined, BaseVector)]
+        Solution = [Value + Correction
+                for Value, Correction in zip(Solution, Precondition(Combined))]
+        Residual = [Value - Image
+                            for Value, Image in zip(Free, Product(Solution))]
+        ResidualNorm = _Norm(Residual)
+        isConverged = ResidualNorm <= Threshold
+    if isConverged:
+        Result = Solution
+    else:
+        Result = None
+    return Result
+
+def SolveBiCGSTAB(Operator: Union[TSquare, TOperator],
+                    FreeCoeffs: Union[Column, TRealSequence], *,
+                    InitialGuess: Optional[Union[Column,
+                                                    TRealSequence]] = None,
+                    Tolerance: TReal = TOLERANCE,
+                    MaxIterations: Optional[int] = None,
+                    Preconditioner: Optional[TOperator] = None
+                                                ) -> Union[List[TReal], None]:
+    """
+    Solves a system of linear equations with a general non-singular matrix of
+    the bound coefficients using the (right preconditioned) biconjugate
+    gradient stabilized method (BiCGSTAB). Only the product of the matrix with
+    a vector is used, thus the matrix can be passed as a function calculating
+    this product.
+    
+    Signature:
+        SquareMatrix OR SparseMatrix OR callable,
+            Column OR seq(int OR float)/,
+            *, Column OR seq(int OR float) OR None, int > 0 OR float > 0,
+                int > 0 OR None, callable OR None/
+                    -> list(int OR float) OR None
+    
+    Args:
+        Operator: SquareMatrix OR SparseMatrix OR callable; the dense or
+            sparse matrix of the bound coefficients, OR a function, which
+            accepts a list of real numbers and returns the product of the
+            matrix with it as a list
+        FreeCoeffs: Column OR seq(int OR float); the free coefficients of the
+            system
+        InitialGuess: (keyword) Column OR seq(int OR float) OR None; the
+            initial approximation of the solution (warm start), defaults to
+            None, i.e. the zero vector
+        Tolerance: (keyword) int > 0 OR float > 0; the required norm of the
+            residual relative to the norm of the free coefficients vector,
+            defaults to TOLERANCE
+        MaxIterations: (keyword) int > 0 OR None; the maximum number of the
+            iterations, defaults to None, i.e. 10 times the size of the system
+        Preconditioner: (keyword) callable OR None; a function, which applies
+            the inverse of a preconditioning matrix to a list of real numbers,
+            defaults to None (no preconditioning)
+    
+    Returns:
+        list(int OR float): the found solution of the system
+        None: the required tolerance is not reached within the maximum number
+            of iterations, OR the method breaks down
+    
+    Raises:
+        UT_TypeError: the operator is neither an instance of SquareMatrix
+            or SparseMatrix classes nor a callable object, OR any of the
+            vectors is neither an instance of Column class nor a flat
+            sequence of real numbers, OR
+            the tolerance is not a real number, OR the maximum number of
+            iterations is neither an integer number nor None, OR the
+            preconditioner is neither a callable object nor None
+        UT_ValueError: the sparse matrix is not square, OR the sizes of the
+            matrix and vectors do not match, OR
+            the free coefficients vector has less than 2 elements, OR the
+            tolerance or the maximum number of iterations is not positive
+    
+    Version 1.1.0.0
+    """
+    Product, Free, Solution, Threshold, MaxIterations, Precondition = (
+                _ParseIterativeArguments(Operator, FreeCoeffs, InitialGuess,
+                            Tolerance, MaxIterations, Preconditioner))
+    Residual = [Value - Image for Value, Image in zip(Free, Product(Solution))]
+    Shadow = list(Residual)
+    Rho = Alpha = Omega = 1.0
+    Direction = [0] * len(Free)
+    Image = [0] * len(Free)
+    isConverged = _Norm(Residual) <= Threshold
+    Iteration = 0
+    while (not isConverged) and (Iteration < MaxIterations):
+        Iteration += 1
+        NewRho = sum(map(mul, Shadow, Residual))
+        if not NewRho:
+            break
+        Beta = (NewRho / Rho) * (Alpha / Omega)
+        Rho = NewRho
+        Direction = [Value + Beta * (Other - Omega * Correction)
+                            for Value, Other, Correction in zip(Residual,
+                                                            Direction, Image)]
+        Corrected = Precondition(Direction)
+        Image = Product(Corrected)
+        Denominator = sum(map(mul, Shadow, Image))
+        if not Denominator:
+            break
+        Alpha = Rho / Denominator
+        Intermediate = [Value - Alpha * Other
+                                    for Value, Other in zip(Residual, Image)]
+        if _Norm(Intermediate) <= Threshold:
+            Solution = [Value + Alpha * Other
+                                for Value, Other in zip(Solution, Corrected)]
+            isConverged = True
+        else:
+            Stabilizer = Precondition(Intermediate)
+            Target = Product(Stabilizer)
+            Denominator = sum(map(mul, Target, Target))
+            if not Denominator:
+                break
+            Omega = sum(map(mul, Target, Intermediate)) / Denominator
+            Solution = [Value + Alpha * Other + Omega * Correction
+                            for Value, Other, Correction in zip(Solution,
+                                                    Corrected, Stabilizer)]
+            Residual = [Value - Omega * Other
+                                for Value, Other in zip(Intermediate, Target)]
+            isConverged = _Norm(Residual) <= Threshold
+            if not Omega:
+                break
+    if isConverged:
+        Result = Solution
+    else:
+        Result = None
+    return Result
+
+def GetJacobiPreconditioner(BoundCoeffs: TSquare
+                                                ) -> Union[TOperator, None]:
+    """
+    Creates the Jacobi (diagonal) preconditioner for the iterative solvers,
+    i.e. a function applying the inverse of the main diagonal of the matrix
+    to a vector.
+    
+    Signature:
+        SquareMatrix OR SparseMatrix -> callable OR None
+    
+    Args:
+        BoundCoeffs: SquareMatrix OR SparseMatrix; the dense or sparse matrix
+            of the bound coefficients
+    
+    Returns:
+        callable: a function, which accepts a list of real numbers and returns
+            the list of these numbers divided by the respective diagonal
+            elements of the matrix
+        None: at least, one of the diagonal elements is zero
+    
+    Raises:
+        UT_TypeError: the argument is not an instance of SquareMatrix or
+            SparseMatrix classes
+        UT_ValueError: the sparse matrix is not square
+    
+    Version 1.1.0.0
+    """
+    if isinstance(BoundCoeffs, SparseMatrix):
+        Size = _GetSparseSize(BoundCoeffs)
+    elif isinstance(BoundCoeffs, SquareMatrix):
+        Size = BoundCoeffs.Size
+    else:
+        raise UT_TypeError(BoundCoeffs, (SquareMatrix, SparseMatrix),
                                                                 SkipFrames = 1)
-    LowerMatrix, UpperMatrix, ColsPerm, _, _ = _Matrix.getLUPdecomposition()
-    #rows pivoting should not be applied unless det=0, thus ignore it, as well
-    #+ as the sign of the permutation
-    GJE = LowerMatrix.Data
-    del LowerMatrix
-    Bound = UpperMatrix.Data
-    del UpperMatrix
-    Size = _Matrix.Size
-    #check determinant
-    Det = 1 #use prod() in Python v3.10+
-    for Index in range(Size):
-        Det *= Bound[Index][Index]
-    if not Det:
+    Diagonal = [BoundCoeffs[Index, Index] for Index in range(Size)]
+    if all(Diagonal):
+        Inverse = [1 / Value for Value in Diagonal]
+        def Result(Vector: List[TReal]) -> List[TReal]:
+            return [Value * Other for Value, Other in zip(Vector, Inverse)]
+    else:
         Result = None
+    return Result
+
+def GetILUPreconditioner(BoundCoeffs: TSquare
+                                                ) -> Union[TOperator, None]:
+    """
+    Creates the incomplete LU-factorization preconditioner ILU(0) for the
+    iterative solvers, i.e. a function applying the inverse of the product of
+    the lower- and upper-triangular factors with the same pattern of the
+    non-zero elements as the matrix itself to a vector.
+    
+    Signature:
+        SquareMatrix OR SparseMatrix -> callable OR None
+    
+    Args:
+        BoundCoeffs: SquareMatrix OR SparseMatrix; the dense or sparse matrix
+            of the bound coefficients
+    
+    Returns:
+        callable: a function, which accepts a list of real numbers and returns
+            the result of the forward and back substitution with the
+            incomplete factors as a list
+        None: a zero pivot (diagonal element) is encountered in the process
+    
+    Raises:
+        UT_TypeError: the argument is not an instance of SquareMatrix or
+            SparseMatrix classes
+        UT_ValueError: the sparse matrix is not square
+    
+    Version 1.1.0.0
+    """
+    if isinstance(BoundCoeffs, SparseMatrix):
+        Rows = [dict() for _ in range(_GetSparseSize(BoundCoeffs))]
+        for Index, RowIdx, Value in BoundCoeffs.getEntries():
+            Rows[RowIdx][Index] = Value
+    elif isinstance(BoundCoeffs, SquareMatrix):
+        Rows = [{Index : Value for Index, Value in enumerate(Row) if Value}
+                                                for Row in BoundCoeffs.Data]
     else:
-        #transform free coefficents
-        for ColIndex in range(Size - 1):
-            for RowIndex in range(ColIndex + 1, Size):
-                _Column[RowIndex] -= _Column[ColIndex] * GJE[RowIndex][ColIndex]
-        #back-substitution
-        Solution = list()
-        for ColIndex in range(Size - 1, - 1, -1):
-            Free = _Column[ColIndex]
-            Resolved = Bound[ColIndex][ColIndex + 1 : Size]
-            NewValue = (Free - sum(Coeff * Value for Coeff, Value
-                        in zip(Resolved, Solution))) / Bound[ColIndex][ColIndex]
-            Solution.insert(0, NewValue)
-        #apply reverse columns permuation
-        Result = list(Solution)
-        for Index, Value in enumerate(Solution):
-            Result[ColsPerm[Index]] = Value
-    del _Matrix
+        raise UT_TypeError(BoundCoeffs, (SquareMatrix, SparseMatrix),
+                                                                SkipFrames = 1)
+    isSingular = False
+    for RowIdx, Row in enumerate(Rows):
+        for Pivot in sorted(Index for Index in Row if Index < RowIdx):
+            PivotRow = Rows[Pivot]
+            Factor = Row[Pivot] / PivotRow[Pivot]
+            Row[Pivot] = Factor
+            for Index, Value in PivotRow.items():
+                if Index > Pivot and Index in Row:
+                    Row[Index] -= Factor * Value
+        if not Row.get(RowIdx, 0):
+            isSingular = True
+            break
+    if not isSingular:
+        Lower = []
+        Upper = []
+        for RowIdx, Row in enumerate(Rows):
+            Indexes = sorted(Index for Index in Row if Index < RowIdx)
+            Lower.append((Indexes, [Row[Index] for Index in Indexes]))
+            Indexes = sorted(Index for Index in Row if Index > RowIdx)
+            Upper.append((Indexes, [Row[Index] for Index in Indexes],
+                                                                Row[RowIdx]))
+        Upper.reverse()
+        Size = len(Rows)
+        def Result(Vector: List[TReal]) -> List[TReal]:
+            Solution = list(Vector)
+            Getter = Solution.__getitem__
+            for RowIdx, (Indexes, Values) in enumerate(Lower):
+                if Indexes:
+                    Solution[RowIdx] -= sum(map(mul, Values,
+                                                        map(Getter, Indexes)))
+            for RowIdx, (Indexes, Values, Diagonal) in zip(
+                                        range(Size - 1, -1, -1), Upper):
+                Solution[RowIdx] = (Solution[RowIdx] - sum(map(mul, Values,
+                                        map(Getter, Indexes)))) / Diagonal
+            return Solution
+    else:
+        Result = None
     return Result
\ No newline at end of file
@@ -2,12 +2,22 @@
 """
 Module math_extra_lib.poly_solver.
 
-Implements Aberth method for finding all roots of a polynomial and polynomial
-interpolation using Lagrange, Legende, Chebyshev and Bernstein basis.
+Implements finding of all roots of a polynomial (Aberth method or eigenvalues
+of the companion matrix), finding of only real roots of a polynomial (Sturm
+sequence) and polynomial interpolation using Lagrange, Legende, Chebyshev and
+Bernstein basis.
 
 Functions:
-    FindRoots(Poly)
-        Polynomial -> list(int OR float OR complex)
+    FindRoots(Poly, *, Method = None, Tolerance = None)
+        Polynomial/, *, str OR None, int > 0 OR float > 0 OR None/
+            -> list(int OR float OR complex)
+    FindRootsBatch(Coefficients, *, Tolerance = None, WarmStart = True)
+        seq(seq(int OR float)) OR numpy.ndarray
+            /, *, int > 0 OR float > 0 OR None, bool/
+                -> list(list(int OR float OR complex))
+    FindRealRoots(Poly, *, Interval = None, Tolerance = None)
+        Polynomial/, *, seq(int OR float, int OR float) OR None,
+            int > 0 OR float > 0 OR None/ -> list(int OR float)
     GetLagrangePolynomial(Node, Roots)
         int OR float, seq(int OR float) -> Polynomial
     GetLagrangeBasis(XGrid)
@@ -34,8 +44,8 @@ Functions:
         seq(seq(int OR float, int OR float)) -> Polynomial OR int OR float
 """
 
-__version__= '1.0.0.0'
-__date__ = '29-02-2024'
+__version__= '1.5.0.0'
+__date__ = '18-10-2026'
 __status__ = 'Production'
 
 #imports
@@ -48,11 +58,18 @@ import os
 from typing import List, Union, Sequence, Tuple, Any, Callable
 
 from math import sqrt, pi
-from cmath import rect
+from cmath import rect, isfinite
 from random import random
 
 from collections.abc import Sequence as GSequence
 
+#+ 3rd party libraries (optional)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 #+ custom modules
 
 MODULE_PATH = os.path.realpath(__file__)
@@ -68,6 +85,7 @@ from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
 
 from math_extra_lib.polynomial import Polynomial
 from math_extra_lib.matrix_solver import SolveLinearSystem
+from math_extra_lib.vectors_matrices import SquareMatrix
 
 #types
 
@@ -90,35 +108,35 @@ ALMOST_ZERO = 1.0E-12 #rounding precision threshold for calculations
 
 ROOTS_PRECISION = 1.0E-4 #precision of the found roots rounding
 
+RESIDUAL_LEVEL = 1.0E-15 #relative value of a polynomial at a root, which is
+#+ achievable with the double precision floating point numbers
+
+ROOTS_METHODS = ('aberth', 'companion') #supported root finding engines
+
+BATCH_BLOCK = 256 #number of polynomials iterated simultaneously with NumPy
+
+WARM_START_ROTATION = 1.0E-3 #rotation angle (rad) of the warm start guesses
+
+STURM_LEVEL = 1.0E-4 #relative value of a remainder in the Sturm sequence, below
+#+ which the sequence is not reliable (multiple or very close roots)
+
 NOT_SEQUENCE = (str, bytes, bytearray)
 
 #functions
 
-#+ private helper functions
+#+ unchecked kernels
 
-def _RoundAndConvert(Value: TNumber, *,
-                                Precision: float = ALMOST_ZERO) -> TNumber:
+def _Round(Value: TNumber, Precision: float) -> TNumber:
     """
     Performs complex -> real number conversion and rounding to integer if
-    possible.
+    possible. It does not any data sanity checks! It is not supposed to be
+    used outside the module.
     
     Signature:
-        int OR float OR complex /, float/ -> int OR float OR complex
-    
-    Args:
-        Value: int OR float OR complex; the value to be rounded and converted if
-            needed
-        Precision: (keyword) float; the desired precision of float -> int
-            rounding, defaults to ALMOST_ZERO constant
-    
-    Raises:
-        UT_TypeError: the passed argument is not a number
+        int OR float OR complex, float > 0 -> int OR float OR complex
     
     Version 1.0.0.0
     """
-    if ((not isinstance(Value, (int, float, complex))) or
-                                                    isinstance(Value, bool)):
-        raise UT_TypeError(Value, (int, float, complex), SkipFrames = 1)
     if isinstance(Value, complex):
         if abs(Value.imag) < Precision:
             Result = Value.real
@@ -132,13 +150,140 @@ def _RoundAndConvert(Value: TNumber, *,
             if abs(ImagPart - round(ImagPart)) < Precision:
                 ImagPart = round(ImagPart)
             Result = complex(RealPart, ImagPart)
+    elif abs(Value - round(Value)) < Precision:
+        Result = round(Value)
     else:
-        if abs(Value - round(Value)) < Precision:
-            Result = round(Value)
-        else:
-            Result = Value
+        Result = Value
     return Result
 
+def _Differentiate(Coefficients: List[TNumber]) -> List[TNumber]:
+    """
+    Calculates the coefficients of the derivative of a polynomial passed as
+    a list of its coefficients (zero to the highest power). It does not any
+    data sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(int OR float OR complex) -> list(int OR float OR complex)
+    
+    Version 1.0.0.0
+    """
+    return [Index * Item for Index, Item in enumerate(Coefficients)][1 : ]
+
+def _Evaluate(Coefficients: List[TNumber], Value: TNumber) -> TNumber:
+    """
+    Evaluates a polynomial passed as a list of its coefficients (zero to the
+    highest power) at the given value of its argument using the Horner scheme,
+    without rounding. It does not any data sanity checks! It is not supposed to
+    be used outside the module.
+    
+    Signature:
+        list(int OR float OR complex), int OR float OR complex
+            -> int OR float OR complex
+    
+    Version 1.0.0.0
+    """
+    Result = Coefficients[-1]
+    for Item in Coefficients[-2 : : -1]:
+        Result = Item + Value * Result
+    return Result
+
+def _Deflate(Coefficients: List[TNumber], Root: TNumber, *,
+                Precision: Union[float, None] = None
+                    ) -> Tuple[List[TNumber], TNumber]:
+    """
+    Divides a polynomial passed as a list of its coefficients (zero to the
+    highest power) by (x - Root) using the synthetic division. It does not any
+    data sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(int OR float OR complex), int OR float OR complex
+            /, *, float > 0 OR None/
+                -> tuple(list(int OR float OR complex), int OR float OR complex)
+    
+    Args:
+        Coefficients: list(int OR float OR complex); coefficients of the
+            polynomial, at least 2 elements
+        Root: int OR float OR complex; the root to be removed
+        Precision: (keyword) float > 0 OR None; precision of the rounding of
+            each calculated coefficient, defaults to None - no rounding
+    
+    Returns:
+        tuple(list(int OR float OR complex), int OR float OR complex): unpacked
+            tuple of the coefficients of the quotient (zero to the highest
+            power) and the remainder
+    
+    Version 1.0.0.0
+    """
+    Value = Coefficients[-1]
+    Reduced = [Value]
+    for Item in Coefficients[-2 : 0 : -1]:
+        Value = Item + Root * Value
+        if not (Precision is None):
+            Value = _Round(Value, Precision)
+        Reduced.append(Value)
+    Reduced.reverse()
+    Remainder = Coefficients[0] + Root * Value
+    return Reduced, Remainder
+
+def _DividePolynomials(Dividend: List[TNumber], Divisor: List[TNumber]
+                            ) -> Tuple[List[TNumber], List[TNumber]]:
+    """
+    Divides a polynomial by another polynomial, both passed as the lists of
+    their coefficients (zero to the highest power), using the long division.
+    The dividend should be, at least, of the same degree as the divisor. It
+    does not any data sanity checks! It is not supposed to be used outside the
+    module.
+    
+    Signature:
+        list(int OR float OR complex), list(int OR float OR complex)
+            -> tuple(list(int OR float OR complex),
+                                            list(int OR float OR complex))
+    
+    Returns:
+        tuple(list(int OR float OR complex), list(int OR float OR complex)):
+            unpacked tuple of the coefficients of the quotient and the
+            remainder, the latter being one element shorter than the divisor
+    
+    Version 1.0.0.0
+    """
+    Remainder = list(Dividend)
+    Degree = len(Divisor) - 1
+    Quotient = [0 for _ in range(len(Dividend) - Degree)]
+    for Index in range(len(Remainder) - 1, Degree - 1, -1):
+        Ratio = Remainder[Index] / Divisor[-1]
+        Quotient[Index - Degree] = Ratio
+        for Shift, Element in enumerate(Divisor[ : -1]):
+            Remainder[Index - Degree + Shift] -= Ratio * Element
+    del Remainder[Degree : ]
+    return Quotient, Remainder
+
+#+ private helper functions
+
+def _RoundAndConvert(Value: TNumber, *,
+                                Precision: float = ALMOST_ZERO) -> TNumber:
+    """
+    Performs complex -> real number conversion and rounding to integer if
+    possible. Checks the argument and calls the function _Round().
+    
+    Signature:
+        int OR float OR complex /, float/ -> int OR float OR complex
+    
+    Args:
+        Value: int OR float OR complex; the value to be rounded and converted if
+            needed
+        Precision: (keyword) float; the desired precision of float -> int
+            rounding, defaults to ALMOST_ZERO constant
+    
+    Raises:
+        UT_TypeError: the passed argument is not a number
+    
+    Version 1.1.0.0
+    """
+    if ((not isinstance(Value, (int, float, complex))) or
+                                                    isinstance(Value, bool)):
+        raise UT_TypeError(Value, (int, float, complex), SkipFrames = 1)
+    return _Round(Value, Precision)
+
 def _GenerateBinomialCoefficients(Power: int) -> List[int]:
     """
     Generates a list of all binomial coefficients for the specified power.
@@ -171,7 +316,8 @@ def _GetDerivative(Coefficients: List[TNumber]) -> List[TNumber]:
     """
     Calculates a derivative of a polynomial using only list of the coefficients
     (zero to the highest power order sorted) without using the actual polynomial
-    class implementation.
+    class implementation. Checks the argument and calls the function
+    _Differentiate().
     
     Signature:
         list(int OR float OR complex) -> list(int OR float OR complex)
@@ -181,28 +327,22 @@ def _GetDerivative(Coefficients: List[TNumber]) -> List[TNumber]:
             numbers
         UT_ValueError: the passed list has less than 2 elements
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(Coefficients, list):
         raise UT_TypeError(Coefficients, list, SkipFrames = 1)
     Length = len(Coefficients)
     if Length < 2:
         raise UT_ValueError(Length, '>1 - length of the list', SkipFrames = 1)
-    Result = list()
-    for Index, Item in enumerate(Coefficients):
-        if not isinstance(Item, (int, float, complex)):
-            Error = UT_TypeError(Item, (int, float, complex), SkipFrames = 1)
-            Error.appendMessage(f'at index {Index} in the passed list')
-            raise Error
-        Result.append(Index * Item)
-    del Result[0]
-    return Result
+    _CheckCoefficients(Coefficients)
+    return _Differentiate(Coefficients)
 
 def _EvaluatePolynomial(Coefficients: List[TNumber], Value: TNumber, *,
                         DoNotRound = False) -> TNumber:
     """
     Evaluates a generic polynomial (even with the complex coefficients) at any
-    value of its argument (including complex values).
+    value of its argument (including complex values). Checks the arguments and
+    calls the function _Evaluate().
     
     Signature:
         list(int OR float OR complex), int OR float OR complex /, bool/
@@ -220,36 +360,27 @@ def _EvaluatePolynomial(Coefficients: List[TNumber], Value: TNumber, *,
             number, OR the second argument is not a real or complex number
         UT_ValueError: the passed list has less than 2 elements
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(Coefficients, list):
         raise UT_TypeError(Coefficients, list, SkipFrames = 1)
     Length = len(Coefficients)
     if Length < 2:
         raise UT_ValueError(Length, '>1 - length of the list', SkipFrames = 1)
-    for Index, Item in enumerate(Coefficients):
-        if not isinstance(Item, (int, float, complex)):
-            Error = UT_TypeError(Item, (int, float, complex), SkipFrames = 1)
-            Error.appendMessage(f'at index {Index} in the passed list')
-            raise Error
+    _CheckCoefficients(Coefficients)
     if not isinstance(Value, (int, float, complex)):
         Error = UT_TypeError(Value, (int, float, complex), SkipFrames = 1)
         Error.appendMessage(f'argument of a polynomial')
         raise Error
-    Evaluated = Coefficients[-1]
-    for Index in range(Length - 2, -1, -1):
-        Evaluated = Coefficients[Index] + Value * Evaluated
-    if DoNotRound:
-        Result = Evaluated
-    else:
-        Result = _RoundAndConvert(Evaluated)
-    if isinstance(Evaluated, complex):
-        del Evaluated
+    Result = _Evaluate(Coefficients, Value)
+    if not DoNotRound:
+        Result = _Round(Result, ALMOST_ZERO)
     return Result
 
 def _ReduceByRoot(Coefficients: List[TNumber], Root: TNumber) -> List[TNumber]:
     """
     Reduces a polynomial by removing one of its roots (in the factorized form).
+    Checks the arguments and calls the function _Deflate().
     
     Signature:
         list(int OR float OR complex), int OR float OR complex
@@ -261,40 +392,456 @@ def _ReduceByRoot(Coefficients: List[TNumber], Root: TNumber) -> List[TNumber]:
         UT_ValueError: the passed list has less than 3 elements, OR the passed
             second argument is not a root
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(Coefficients, list):
         raise UT_TypeError(Coefficients, list, SkipFrames = 1)
     Length = len(Coefficients)
     if Length < 3:
         raise UT_ValueError(Length, '>2 - length of the list', SkipFrames = 1)
-    for Index, Item in enumerate(Coefficients):
-        if not isinstance(Item, (int, float, complex)):
-            Error = UT_TypeError(Item, (int, float, complex), SkipFrames = 1)
-            Error.appendMessage(f'at index {Index} in the passed list')
-            raise Error
+    _CheckCoefficients(Coefficients)
     if not isinstance(Root, (int, float, complex)):
         Error = UT_TypeError(Root, (int, float, complex), SkipFrames = 1)
         Error.appendMessage(f'passed root value')
         raise Error
-    Reduced = [Coefficients[-1]]
-    for Element in reversed(Coefficients[1:-1]):
-        NewElement = Element + Root * Reduced[0]
-        Reduced.insert(0, _RoundAndConvert(NewElement))
-    Remainder = Coefficients[0] + Root * Reduced[0]
+    Reduced, Remainder = _Deflate(Coefficients, Root, Precision = ALMOST_ZERO)
     if abs(Remainder) > 2 * ALMOST_ZERO:
         raise UT_ValueError(Root, 'is a root', SkipFrames = 1)
     return Reduced
 
-def _FindAllRoots(Coefficients: List[TNumber]) -> List[TNumber]:
+def _FindRootsAberth(Coefficients: List[TNumber], Tolerance: float, *,
+                        Guesses: Union[List[TNumber], None] = None
+                            ) -> Tuple[List[TNumber], bool]:
+    """
+    Implementation of the Aberth method (in the Gauss-Seidel form, i.e. each
+    improved guess is used immediately) for finding all roots of a monic
+    polynomial passed as a list of its coefficients. The value of the
+    polynomial and its derivative at each guess are calculated in a single
+    Horner scheme pass. A guess is not improved anymore when the relative
+    displacement falls below the required tolerance or the polynomial
+    evaluates to the rounding error level at it. It does not any data sanity
+    checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(int OR float OR complex), float > 0
+            /, *, list(int OR float OR complex) OR None/
+                -> tuple(list(int OR float OR complex), bool)
+    
+    Args:
+        Coefficients: list(int OR float OR complex); coefficients of a monic
+            polynomial from zero to N-th power, at least 3 elements
+        Tolerance: float > 0; the required relative precision of the roots
+        Guesses: (keyword) list(int OR float OR complex) OR None; the initial
+            approximations of all N roots, defaults to None, in which case
+            they are distributed uniformly along a circle, which encloses the
+            roots
+    
+    Returns:
+        tuple(list(int OR float OR complex), bool): unpacked tuple of the
+            approximations of all roots and a flag if the method has converged
+    
+    Version 1.0.0.0
+    """
+    Degree = len(Coefficients) - 1
+    Reversed = Coefficients[-2 : : -1]
+    Moduli = [abs(Item) for Item in Reversed]
+    if Guesses is None:
+        Centre = - Coefficients[-2] / Degree
+        Radius = max(Modulus ** (1 / Index)
+                                for Index, Modulus in enumerate(Moduli, 1))
+        phi = 2 * pi / Degree
+        #shift by 0.4 rad prevents the guesses on the real axis
+        Guesses = [Centre + rect(Radius, phi * Index + 0.4)
+                                                for Index in range(Degree)]
+    else:
+        Guesses = list(Guesses)
+    Active = list(range(Degree))
+    for _ in range(MAX_ITER):
+        NotConverged = list()
+        for Index in Active:
+            Guess = Guesses[Index]
+            Modulus = abs(Guess)
+            P_Value = 1
+            D_Value = 0
+            Bound = 1
+            for Item, ItemModulus in zip(Reversed, Moduli):
+                D_Value = D_Value * Guess + P_Value
+                P_Value = P_Value * Guess + Item
+                Bound = Bound * Modulus + ItemModulus
+            if abs(P_Value) <= RESIDUAL_LEVEL * Bound: #root within precision
+                continue
+            if D_Value:
+                Ratio = P_Value / D_Value
+                try:
+                    Weight = (
+                        sum([1 / (Guess - Other) for Other in Guesses[:Index]])
+                        + sum([1 / (Guess - Other)
+                                        for Other in Guesses[Index + 1 : ]]))
+                    Shift = Ratio / (1 - Ratio * Weight)
+                except ZeroDivisionError: #coinciding guesses
+                    Shift = - 0.05 * (random() + 0.1)
+            else: #found extremum but not a root
+                Shift = - 0.05 * (random() + 0.1)
+            Guesses[Index] = Guess - Shift
+            if not (abs(Shift) <= Tolerance * Modulus):
+                NotConverged.append(Index)
+        Active = NotConverged
+        if (not Active) or (not isfinite(sum(Guesses))):
+            break
+    isConverged = (not Active) and isfinite(sum(Guesses))
+    return Guesses, isConverged
+
+def _FindRootsAberthBatch(Coefficients: Any, Tolerance: float, *,
+                            Guesses: Any = None) -> Tuple[Any, Any]:
+    """
+    Vectorized (NumPy) implementation of the Aberth method (in the Jacobi form,
+    i.e. all guesses of a polynomial are improved simultaneously) for finding
+    all roots of several monic polynomials of the same degree at once. The
+    convergence criteria are the same as in the function _FindRootsAberth(),
+    and the fixed guesses as well as the polynomials with all guesses fixed are
+    excluded from the further calculations. It does not any data sanity
+    checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        numpy.ndarray, float > 0/, *, numpy.ndarray OR None/
+            -> tuple(numpy.ndarray, numpy.ndarray)
+    
+    Args:
+        Coefficients: numpy.ndarray; 2D array of shape (M, N + 1) of the
+            coefficients of M monic polynomials of the degree N >= 2, each row
+            from zero to N-th power
+        Tolerance: float > 0; the required relative precision of the roots
+        Guesses: (keyword) numpy.ndarray OR None; 2D complex array of shape
+            (M, N) of the initial approximations of the roots, modified in
+            place, defaults to None, in which case they are distributed
+            uniformly along a circle for each polynomial, as in the function
+            _FindRootsAberth()
+    
+    Returns:
+        tuple(numpy.ndarray, numpy.ndarray): unpacked tuple of the 2D complex
+            array of the approximations of all roots of all polynomials and
+            the 1D boolean array of the flags if the method has converged for
+            the respective polynomial
+    
+    Version 1.0.0.0
+    """
+    Size = Coefficients.shape[0]
+    Degree = Coefficients.shape[1] - 1
+    Reversed = Coefficients[:, -2 : : -1]
+    Moduli = np.abs(Reversed)
+    if Guesses is None:
+        Centre = - Coefficients[:, -2] / Degree
+        Radius = (Moduli ** (1 / np.arange(1, Degree + 1))).max(axis = 1)
+        Angles = (2 * pi / Degree) * np.arange(Degree) + 0.4
+        Guesses = Centre[:, None] + Radius[:, None] * np.exp(1j * Angles)
+    Diagonal = np.eye(Degree, dtype = bool)
+    Active = np.ones((Size, Degree), dtype = bool)
+    for _ in range(MAX_ITER):
+        Rows = np.flatnonzero(Active.any(axis = 1))
+        if not Rows.size:
+            break
+        Values = Guesses[Rows]
+        Mask = Active[Rows]
+        Modulus = np.abs(Values)
+        Items = Reversed[Rows]
+        ItemModuli = Moduli[Rows]
+        P_Value = np.ones_like(Values)
+        D_Value = np.zeros_like(Values)
+        Bound = np.ones_like(Modulus)
+        for Index in range(Degree):
+            D_Value = D_Value * Values + P_Value
+            P_Value = P_Value * Values + Items[:, Index, None]
+            Bound = Bound * Modulus + ItemModuli[:, Index, None]
+        Mask &= np.abs(P_Value) > RESIDUAL_LEVEL * Bound #root not reached
+        with np.errstate(divide = 'ignore', invalid = 'ignore',
+                                                            over = 'ignore'):
+            Ratio = P_Value / D_Value
+            Inverse = 1 / (Values[:, :, None] - Values[:, None, :])
+            Inverse[:, Diagonal] = 0
+            Weight = Inverse.sum(axis = 2)
+            Shift = Ratio / (1 - Ratio * Weight)
+        Shift[~Mask] = 0
+        Failed = ~np.isfinite(Shift) #extremum or coinciding guesses
+        if Failed.any():
+            Shift[Failed] = [- 0.05 * (random() + 0.1)
+                                        for _ in range(int(Failed.sum()))]
+        Values -= Shift
+        Guesses[Rows] = Values
+        Mask &= ~(np.abs(Shift) <= Tolerance * Modulus)
+        Mask &= np.isfinite(Values) #overflow - not converged
+        Active[Rows] = Mask
+    isConverged = (~ Active.any(axis = 1)) & np.isfinite(Guesses).all(axis = 1)
+    return Guesses, isConverged
+
+def _BalanceMatrix(Rows: List[List[float]]) -> None:
+    """
+    Balances a square matrix by the diagonal similarity transformation with
+    the powers of 2 (Parlett and Reinsch algorithm), thus the norms of each
+    row and the respective column become comparable. The eigenvalues are not
+    changed, but they are less sensitive to the rounding errors. The passed
+    nested lists are modified in place. It does not any data sanity checks!
+    It is not supposed to be used outside the module.
+    
+    Signature:
+        list(list(float)) -> None
+    
+    Version 1.0.0.0
+    """
+    Size = len(Rows)
+    isDone = False
+    while not isDone:
+        isDone = True
+        for Index in range(Size):
+            ColNorm = sum(abs(Rows[RowIdx][Index])
+                                for RowIdx in range(Size) if RowIdx != Index)
+            RowNorm = sum(abs(Item) for ColIdx, Item in enumerate(Rows[Index])
+                                                        if ColIdx != Index)
+            if ColNorm and RowNorm:
+                Total = ColNorm + RowNorm
+                Factor = 1.0
+                while ColNorm < 0.5 * RowNorm:
+                    Factor *= 2.0
+                    ColNorm *= 4.0
+                while ColNorm > 2.0 * RowNorm:
+                    Factor *= 0.5
+                    ColNorm *= 0.25
+                if (ColNorm + RowNorm) / Factor < 0.95 * Total:
+                    isDone = False
+                    Rows[Index] = [Item / Factor for Item in Rows[Index]]
+                    for RowItems in Rows:
+                        RowItems[Index] *= Factor
+
+def _FindRootsCompanion(Coefficients: List[TReal]
+                                    ) -> Union[List[TNumber], None]:
+    """
+    Finds all roots of a monic polynomial with the real coefficients as the
+    eigenvalues of its balanced companion matrix, which is already in the
+    upper Hessenberg form, using the Francis double shift QR-algorithm. It
+    does not any data sanity checks! It is not supposed to be used outside the
+    module.
+    
+    Signature:
+        list(int OR float) -> list(int OR float OR complex) OR None
+    
+    Args:
+        Coefficients: list(int OR float); coefficients of a monic polynomial
+            from zero to N-th power, at least 3 elements
+    
+    Returns:
+        list(int OR float OR complex): all roots of the polynomial
+        None: the QR-algorithm has failed to converge
+    
+    Version 1.0.0.0
+    """
+    Degree = len(Coefficients) - 1
+    Rows = [[0.0 for _ in range(Degree)] for _ in range(Degree)]
+    Rows[0] = [- float(Item) for Item in Coefficients[-2 : : -1]]
+    for Index in range(1, Degree):
+        Rows[Index][Index - 1] = 1.0
+    _BalanceMatrix(Rows)
+    Values = SquareMatrix(Rows).getAllEigenValues(isSymmetric = False)
+    if Values is None:
+        Result = None
+    else:
+        Result = list(Values)
+    return Result
+
+def _FindClusters(Coefficients: List[TNumber], Guesses: List[TNumber]
+                        ) -> Tuple[List[List[int]], List[float]]:
+    """
+    Groups the approximations of the roots of a monic polynomial into the
+    clusters using the inclusion discs centred at the approximations with the
+    radii N * (|P(z_k)| + rounding error) / |prod_(i!=k) (z_k - z_i)|. The
+    overlapping discs form a cluster, which contains as many roots as the
+    discs; thus the size of a cluster is the estimation of the multiplicity of
+    a root. It does not any data sanity checks! It is not supposed to be used
+    outside the module.
+    
+    Signature:
+        list(int OR float OR complex), list(int OR float OR complex)
+            -> tuple(list(list(int >= 0)), list(float >= 0))
+    
+    Args:
+        Coefficients: list(int OR float OR complex); coefficients of a monic
+            polynomial from zero to N-th power
+        Guesses: list(int OR float OR complex); approximations of all N roots
+    
+    Returns:
+        tuple(list(list(int >= 0)), list(float >= 0)): unpacked tuple of the
+            clusters as the lists of indexes of the approximations, and the
+            radii of the inclusion discs
+    
+    Version 1.0.0.0
+    """
+    Degree = len(Guesses)
+    Reversed = Coefficients[ : : -1]
+    Moduli = [abs(Item) for Item in Reversed]
+    Radii = list()
+    for Guess in Guesses:
+        Modulus = abs(Guess)
+        P_Value = 0
+        Bound = 0
+        for Item, ItemModulus in zip(Reversed, Moduli):
+            P_Value = P_Value * Guess + Item
+            Bound = Bound * Modulus + ItemModulus
+        Product = 1
+        for Other in Guesses:
+            if Other != Guess: #coinciding guesses are clustered anyway
+                Product *= Guess - Other
+        if Product:
+            Error = abs(P_Value) + RESIDUAL_LEVEL * Bound
+            Radii.append(Degree * Error / abs(Product))
+        else: #underflow
+            Radii.append(0.0)
+    Labels = list(range(Degree))
+    for Index, Guess in enumerate(Guesses):
+        for Other in range(Index + 1, Degree):
+            if ((Labels[Index] != Labels[Other]) and
+                    (abs(Guess - Guesses[Other]) <=
+                                            Radii[Index] + Radii[Other])):
+                OldLabel = Labels[Other]
+                Labels = [Labels[Index] if Label == OldLabel else Label
+                                                        for Label in Labels]
+    Clusters = dict()
+    for Index, Label in enumerate(Labels):
+        Clusters.setdefault(Label, []).append(Index)
+    return list(Clusters.values()), Radii
+
+def _PolishClusters(Coefficients: List[TNumber], Guesses: List[TNumber],
+                                    Tolerance: float) -> List[TNumber]:
+    """
+    Post-processing of the approximations of the roots of a monic polynomial.
+    The approximations are grouped into the clusters, see _FindClusters(). A
+    cluster of M approximations is considered as a root of the multiplicity
+    M, which is a simple root of the (M-1)-th derivative of the polynomial.
+    This root is found by the Newton iterations on the derivative starting at
+    the centre of the cluster, and it replaces all approximations in the
+    cluster, unless it falls outside the cluster. It does not any data sanity
+    checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(int OR float OR complex), list(int OR float OR complex),
+            float > 0 -> list(int OR float OR complex)
+    
+    Args:
+        Coefficients: list(int OR float OR complex); coefficients of a monic
+            polynomial from zero to N-th power
+        Guesses: list(int OR float OR complex); approximations of all N roots
+        Tolerance: float > 0; the required relative precision of the roots
+    
+    Returns:
+        list(int OR float OR complex): the polished approximations of all roots
+    
+    Version 1.0.0.0
+    """
+    Result = list(Guesses)
+    Clusters, Radii = _FindClusters(Coefficients, Guesses)
+    for Cluster in Clusters:
+        Multiplicity = len(Cluster)
+        if Multiplicity < 2:
+            continue
+        Centre = sum(Guesses[Index] for Index in Cluster) / Multiplicity
+        Spread = max(abs(Guesses[Index] - Centre) + Radii[Index]
+                                                        for Index in Cluster)
+        Derivative = Coefficients
+        for _ in range(Multiplicity - 1):
+            Derivative = _Differentiate(Derivative)
+        Slope = _Differentiate(Derivative)
+        Root = Centre
+        for _ in range(MAX_ITER):
+            SlopeValue = _Evaluate(Slope, Root)
+            if not SlopeValue:
+                break
+            Shift = _Evaluate(Derivative, Root) / SlopeValue
+            Root -= Shift
+            if not (abs(Shift) > Tolerance * abs(Root)):
+                break
+        if isfinite(Root) and (abs(Root - Centre) <= Spread):
+            for Index in Cluster:
+                Result[Index] = Root
+    return Result
+
+def _SolvePolynomial(Coefficients: List[TNumber],
+                        Method: Union[str, None],
+                            Tolerance: Union[float, None]) -> List[TNumber]:
+    """
+    Calculates all roots of a monic polynomial passed as a list of coefficients
+    (from zero to N-th power, N >= 1) - see the function _FindAllRoots(). It
+    does not any data sanity checks! It is not supposed to be used outside the
+    module.
+    
+    Signature:
+        list(int OR float OR complex), str OR None, float > 0 OR None
+            -> list(int OR float OR complex)
+    
+    Version 1.1.0.0
+    """
+    Length = len(Coefficients)
+    if Length == 2:
+        Roots = [-Coefficients[0]]
+    elif Length == 3:
+        p = Coefficients[1]
+        q = Coefficients[0]
+        Determinant = p*p - 4 * q
+        if Determinant >= 0:
+            Roots = [_Round(-0.5 * p + 0.5 * sqrt(Determinant), ALMOST_ZERO),
+                        _Round(-0.5 * p - 0.5 * sqrt(Determinant), ALMOST_ZERO)]
+        else:
+            Real = -0.5 * p
+            Imaginary = 0.5 * sqrt(-Determinant)
+            Roots = [_Round(complex(Real, Imaginary), ALMOST_ZERO),
+                        _Round(complex(Real, -Imaginary), ALMOST_ZERO)]
+    else:
+        isReal = not any(isinstance(Item, complex) for Item in Coefficients)
+        Precision = ALMOST_ZERO if Tolerance is None else Tolerance
+        Guesses = None
+        if Method == 'companion' and isReal:
+            Guesses = _FindRootsCompanion(Coefficients)
+            if not ((Guesses is None) or (Tolerance is None)): #refinement
+                Guesses, _ = _FindRootsAberth(Coefficients, Tolerance,
+                                                        Guesses = Guesses)
+        if Guesses is None:
+            Guesses, isConverged = _FindRootsAberth(Coefficients, Precision)
+            if (Method is None) and isReal and (not isConverged): #fallback
+                Eigenvalues = _FindRootsCompanion(Coefficients)
+                if not (Eigenvalues is None):
+                    Guesses, _ = _FindRootsAberth(Coefficients, Precision,
+                                                    Guesses = Eigenvalues)
+        Guesses = _PolishClusters(Coefficients, Guesses, Precision)
+        Roots = [_Round(Guess, ROOTS_PRECISION) for Guess in Guesses]
+    return Roots
+
+def _FindAllRoots(Coefficients: List[TNumber], *,
+                    Method: Union[str, None] = None,
+                        Tolerance: Union[float, None] = None) -> List[TNumber]:
     """
     Actual function performing the calculation of all roots of a polynomial
-    passed as a list of coefficients using a modified Aberth method. The
-    introduced modification concerns roots with multiplicity > 1. The found
-    roots are returned as a list of complex or real numbers.
+    passed as a list of coefficients. The polynomials of the 1st and 2nd degree
+    are solved analytically. For the higher degrees one of the root finding
+    engines is used: the Aberth method ('aberth') or the eigenvalues of the
+    companion matrix ('companion'), which are refined by the Aberth iterations
+    if the tolerance is specified. By default (None), the Aberth method is
+    used, and the companion matrix is used as the fallback if it fails to
+    converge. The companion matrix is applicable only to the polynomials with
+    the real coefficients, otherwise the Aberth method is always used. The
+    clusters of the found roots are considered as the multiple roots, which
+    are polished by the Newton iterations on the respective derivative of the
+    polynomial. The found roots are returned as a list of complex or real
+    numbers. Checks the arguments and calls the function _SolvePolynomial().
     
     Signature:
-        list(int OR float OR complex) -> list(int OR float OR complex)
+        list(int OR float OR complex)/, *, str OR None, float > 0 OR None/
+            -> list(int OR float OR complex)
+    
+    Args:
+        Coefficients: list(int OR float OR complex); coefficients of a monic
+            polynomial from zero to N-th power
+        Method: (keyword) str OR None; the root finding engine, either of
+            ROOTS_METHODS or None (default) for the automatic choice
+        Tolerance: (keyword) float > 0 OR None; the required relative
+            precision of the roots, defaults to None - ALMOST_ZERO for the
+            Aberth method and no refinement of the companion matrix
+            eigenvalues
     
     Raises:
         UT_TypeError: the passed argument is not a list of real or complex
@@ -302,89 +849,254 @@ def _FindAllRoots(Coefficients: List[TNumber]) -> List[TNumber]:
         UT_ValueError: the passed list has less than 2 elements, OR the highest
             power coefficient is not 1.
     
-    Version 1.0.0.0
+    Version 2.2.0.0
     """
     if not isinstance(Coefficients, list):
         raise UT_TypeError(Coefficients, list, SkipFrames = 1)
     Length = len(Coefficients)
     if Length < 2:
         raise UT_ValueError(Length, '>1 - length of the list', SkipFrames = 1)
-    for Index, Item in enumerate(Coefficients):
-        if not isinstance(Item, (int, float, complex)):
-            Error = UT_TypeError(Item, (int, float, complex), SkipFrames = 1)
-            Error.appendMessage(f'at index {Index} in the passed list')
-            raise Error
+    _CheckCoefficients(Coefficients)
     if Coefficients[-1] != 1:
         raise UT_ValueError(Coefficients[-1], '=1 - highest power coefficient',
                                                                 SkipFrames = 1)
-    if Length == 2:
-        Roots = [-Coefficients[0]]
-    elif Length == 3:
-        p = Coefficients[1]
-        q = Coefficients[0]
-        Determinant = p*p - 4 * q
-        if Determinant >= 0:
-            Roots = [_RoundAndConvert(-0.5 * p + 0.5 * sqrt(Determinant)),
-                        _RoundAndConvert(-0.5 * p - 0.5 * sqrt(Determinant))]
+    Result = _SolvePolynomial(Coefficients, Method, Tolerance)
+    return Result
+
+def _IsRealRoot(Coefficients: List[TReal], Value: TReal) -> bool:
+    """
+    Checks if a polynomial with the real coefficients passed as a list (zero
+    to the highest power) evaluates to zero within the rounding error at the
+    given point. It does not any data sanity checks! It is not supposed to be
+    used outside the module.
+    
+    Signature:
+        list(int OR float), int OR float -> bool
+    
+    Version 1.0.0.0
+    """
+    Modulus = abs(Value)
+    P_Value = 0
+    Bound = 0
+    for Item in reversed(Coefficients):
+        P_Value = P_Value * Value + Item
+        Bound = Bound * Modulus + abs(Item)
+    return abs(P_Value) <= RESIDUAL_LEVEL * Bound
+
+def _GetSturmSequence(Coefficients: List[TReal]
+                                        ) -> Union[List[List[TReal]], None]:
+    """
+    Calculates the Sturm sequence of a polynomial with the real coefficients
+    passed as a list (zero to the highest power): the polynomial itself, its
+    derivative and the negated remainders of the consecutive polynomial
+    divisions. Each element is scaled by its largest absolute coefficient,
+    which does not change its signs. The leading coefficients of a remainder,
+    which are negligible (ALMOST_ZERO level) with respect to the dividend, are
+    discarded. If a remainder is zero or negligible (STURM_LEVEL), i.e. the
+    polynomial has multiple or very close roots, the sequence is not reliable,
+    and None is returned instead. It does not any data sanity checks! It is
+    not supposed to be used outside the module.
+    
+    Signature:
+        list(int OR float) -> list(list(int OR float)) OR None
+    
+    Version 1.0.0.0
+    """
+    Result = list()
+    for Item in (Coefficients, _Differentiate(Coefficients)):
+        Scale = max(abs(Element) for Element in Item)
+        Result.append([Element / Scale for Element in Item])
+    while (not (Result is None)) and (len(Result[-1]) > 1):
+        _, Remainder = _DividePolynomials(Result[-2], Result[-1])
+        while Remainder and (abs(Remainder[-1]) <= ALMOST_ZERO):
+            Remainder.pop()
+        Scale = max(abs(Element) for Element in Remainder) if Remainder else 0
+        if Scale < STURM_LEVEL:
+            Result = None
         else:
-            Roots = [_RoundAndConvert(complex(-0.5*p, 0.5*sqrt(-Determinant))),
-                    _RoundAndConvert(complex(-0.5*p, -0.5*sqrt(-Determinant)))]
-    else: #actual Aberth method
-        Derivative = _GetDerivative(Coefficients)
-        Radius= 1 + max([abs(Coefficient) for Coefficient in Coefficients[:-1]])
-        phi = 2 * pi / (Length-1)
-        Guesses = [rect(Radius, phi * Index) for Index in range(Length - 1)]
-        for _ in range(MAX_ITER):
-            Displacements = list()
-            FoundAll = False
-            for Index, Guess in enumerate(Guesses):
-                P_Value = _EvaluatePolynomial(Coefficients, Guess,
-                                                            DoNotRound = True)
-                D_Value = _EvaluatePolynomial(Derivative, Guess,
-                                                            DoNotRound = True)
-                if (not P_Value) and D_Value: #found a precise single root
-                    Shift = 0
-                elif (not P_Value) and (not D_Value): #found a multiple root
-                    #this is just a precaution against unlucky guess
-                    #+ the algorithm should not normally go to this branch
-                    Guesses = [Guess]
-                    Reduced = list(Coefficients)
-                    while len(Reduced) > 2:
-                        Reduced = _ReduceByRoot(Reduced, Guess)
-                        CheckNotRoot = _EvaluatePolynomial(Reduced, Guess,
-                                                            DoNotRound = True)
-                        if not CheckNotRoot:
-                            Guesses.append(Guess)
-                        else:
-                            break
-                    if len(Reduced) == 2:
-                        Guesses.append(-Reduced[0])
-                    else:
-                        Guesses.extend(_FindAllRoots(Reduced))
-                    FoundAll = True
-                    break
-                elif P_Value and (not D_Value): #found extremum but not a root
-                    Shift = - 0.05 * (random() + 0.1)
-                else:
-                    Ratio = P_Value / D_Value
-                    Weight = sum(1/(Guess - Second)
-                                    for NewIndex, Second in enumerate(Guesses)
-                                                        if NewIndex != Index)
-                    Shift = Ratio / (1 - Ratio * Weight)
-                Displacements.append(Shift)
-            if not FoundAll:
-                Guesses = [Guess - Shift
-                                for Guess, Shift in zip(Guesses, Displacements)]
-            if all(map(lambda x: abs(x) < ALMOST_ZERO / (Length - 1),
-                       Displacements)):
-                if not any(_EvaluatePolynomial(Coefficients, Guess)
-                                                        for Guess in Guesses):
-                    break
-            elif FoundAll:
-                break
-        Roots = [_RoundAndConvert(Guess, Precision = ROOTS_PRECISION)
-                                                        for Guess in Guesses]
-    return Roots
+            Result.append([- Element / Scale for Element in Remainder])
+    return Result
+
+def _CountSignChanges(Sequence: List[List[TReal]], Value: TReal) -> int:
+    """
+    Calculates the number of the sign changes in the Sturm sequence evaluated
+    at the given point. The zero values are skipped, as well as the values
+    within the rounding error, which sign is undefined. It does not any data
+    sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(list(int OR float)), int OR float -> int >= 0
+    
+    Version 1.0.0.0
+    """
+    Result = 0
+    Previous = 0
+    Modulus = abs(Value)
+    for Item in Sequence:
+        Current = 0
+        Bound = 0
+        for Element in reversed(Item):
+            Current = Current * Value + Element
+            Bound = Bound * Modulus + abs(Element)
+        if abs(Current) > RESIDUAL_LEVEL * Bound:
+            if Previous and ((Current > 0) != (Previous > 0)):
+                Result += 1
+            Previous = Current
+    return Result
+
+def _BracketRealRoot(Coefficients: List[TReal], Left: TReal, Right: TReal,
+                                        Tolerance: float) -> TReal:
+    """
+    Refines a real root of a polynomial within the interval [Left, Right], at
+    the ends of which the polynomial has the opposite signs, by the Newton
+    iterations safeguarded by the bisection - a Newton step outside the
+    current bracket is replaced by the bisection step. It does not any data
+    sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(int OR float), int OR float, int OR float, float > 0
+            -> int OR float
+    
+    Version 1.0.0.0
+    """
+    Slope = _Differentiate(Coefficients)
+    isLeftPositive = _Evaluate(Coefficients, Left) > 0
+    Result = 0.5 * (Left + Right)
+    for _ in range(MAX_ITER):
+        Value = _Evaluate(Coefficients, Result)
+        if not Value:
+            break
+        if (Value > 0) == isLeftPositive:
+            Left = Result
+        else:
+            Right = Result
+        SlopeValue = _Evaluate(Slope, Result)
+        Next = Result - Value / SlopeValue if SlopeValue else Left
+        if not (Left < Next < Right):
+            Next = 0.5 * (Left + Right)
+        Shift = Next - Result
+        Result = Next
+        if ((abs(Shift) <= Tolerance * abs(Result)) or
+                                            (not (Left < Result < Right))):
+            break
+    return Result
+
+def _IsolateRealRoots(Coefficients: List[TReal], Sequence: List[List[TReal]],
+                        Lower: TReal, Upper: TReal, Tolerance: float
+                                                        ) -> List[TReal]:
+    """
+    Finds all real roots of a polynomial without multiple roots, passed as a
+    list of coefficients (zero to the highest power) together with its Sturm
+    sequence, within the interval (Lower, Upper]. The roots are isolated by
+    the bisection using the numbers of the sign changes in the Sturm sequence.
+    Then each isolating interval is bisected further until the polynomial has
+    the opposite signs at its ends, and the root is refined by the bracketed
+    Newton iterations. It does not any data sanity checks! It is not supposed
+    to be used outside the module.
+    
+    Signature:
+        list(int OR float), list(list(int OR float)), int OR float,
+            int OR float, float > 0 -> list(int OR float)
+    
+    Version 1.0.0.0
+    """
+    Result = list()
+    Stack = [(Lower, Upper, _CountSignChanges(Sequence, Lower),
+                                        _CountSignChanges(Sequence, Upper))]
+    while Stack:
+        Left, Right, LeftChanges, RightChanges = Stack.pop()
+        if LeftChanges <= RightChanges:
+            continue
+        Middle = 0.5 * (Left + Right)
+        if not (Left < Middle < Right): #cannot be separated anymore
+            Result.append(Right)
+            continue
+        if LeftChanges - RightChanges > 1:
+            MiddleChanges = _CountSignChanges(Sequence, Middle)
+            Stack.append((Middle, Right, MiddleChanges, RightChanges))
+            Stack.append((Left, Middle, LeftChanges, MiddleChanges))
+            continue
+        if _IsRealRoot(Coefficients, Right):
+            Result.append(Right)
+            continue
+        LeftValue = _Evaluate(Coefficients, Left)
+        RightValue = _Evaluate(Coefficients, Right)
+        while ((not (LeftValue and RightValue and
+                                ((LeftValue > 0) != (RightValue > 0)))) and
+                (Right - Left > Tolerance * max(abs(Left), abs(Right))) and
+                                                    (Left < Middle < Right)):
+            MiddleChanges = _CountSignChanges(Sequence, Middle)
+            if LeftChanges > MiddleChanges:
+                Right = Middle
+                RightValue = _Evaluate(Coefficients, Right)
+            else:
+                Left = Middle
+                LeftChanges = MiddleChanges
+                LeftValue = _Evaluate(Coefficients, Left)
+            Middle = 0.5 * (Left + Right)
+        if LeftValue and RightValue and ((LeftValue > 0) != (RightValue > 0)):
+            Result.append(_BracketRealRoot(Coefficients, Left, Right,
+                                                                    Tolerance))
+        else: #the interval is already narrow enough
+            Result.append(Middle)
+    return Result
+
+def _SolveRealPolynomial(Coefficients: List[TReal], Lower: TReal,
+                            Upper: TReal, Tolerance: float
+                                        ) -> List[Tuple[TReal, int]]:
+    """
+    Finds all distinct real roots of a polynomial with the real coefficients
+    passed as a list (zero to the highest power) within the interval (Lower,
+    Upper], as well as their multiplicities, in the ascending order. If the
+    Sturm sequence of the polynomial is reliable, the roots are isolated
+    using it, see _IsolateRealRoots(). Otherwise, the real roots of the
+    derivative (critical points) are found recursively. A critical point of
+    the multiplicity M, at which the polynomial evaluates to zero, is a root of
+    the multiplicity M + 1; and each interval between the consecutive critical
+    points, at the ends of which the polynomial has the opposite signs,
+    contains a single simple root, which is refined by the bracketed Newton
+    iterations. It does not any data sanity checks! It is not supposed to be
+    used outside the module.
+    
+    Signature:
+        list(int OR float), int OR float, int OR float, float > 0
+            -> list(tuple(int OR float, int > 0))
+    
+    Version 1.0.0.0
+    """
+    Sequence = _GetSturmSequence(Coefficients)
+    if not (Sequence is None):
+        Result = [(Root, 1) for Root in _IsolateRealRoots(Coefficients,
+                                        Sequence, Lower, Upper, Tolerance)]
+    else:
+        Result = list()
+        Points = [Lower]
+        Signs = [None if _IsRealRoot(Coefficients, Lower)
+                                else _Evaluate(Coefficients, Lower) > 0]
+        for Point, Multiplicity in _SolveRealPolynomial(
+                _Differentiate(Coefficients), Lower, Upper, Tolerance):
+            Points.append(Point)
+            if _IsRealRoot(Coefficients, Point):
+                Result.append((Point, Multiplicity + 1))
+                Signs.append(None)
+            else:
+                Signs.append(_Evaluate(Coefficients, Point) > 0)
+        if Points[-1] < Upper:
+            Points.append(Upper)
+            if _IsRealRoot(Coefficients, Upper):
+                Result.append((Upper, 1))
+                Signs.append(None)
+            else:
+                Signs.append(_Evaluate(Coefficients, Upper) > 0)
+        for Index in range(len(Points) - 1):
+            LeftSign = Signs[Index]
+            RightSign = Signs[Index + 1]
+            if not ((LeftSign is None) or (RightSign is None) or
+                                                    (LeftSign == RightSign)):
+                Result.append((_BracketRealRoot(Coefficients, Points[Index],
+                                        Points[Index + 1], Tolerance), 1))
+    Result.sort()
+    return Result
 
 def _ReducePolynomialDegree(Poly: Polynomial) -> Union[Polynomial, TReal]:
     """
@@ -510,6 +1222,195 @@ def _CheckDegree(Value: Any, *, SkipFrames : int = 2) -> None:
     if Value < 0:
         raise UT_ValueError(Value, '>= 0', SkipFrames = SkipFrames)
 
+def _CheckCoefficients(Value: List[Any], *, SkipFrames : int = 2) -> None:
+    """
+    Helper function to perform a routine check if all elements of the received
+    list (coefficients of a polynomial) are real or complex numbers.
+    
+    Signature:
+        list(type A)/, *, int > 0/ -> None
+    
+    Args:
+        Value: list(type A); the list to be checked
+        SkipFrame: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function or method
+    
+    Raises:
+        UT_TypeError: any element of the list is not a real or complex number
+    
+    Version 1.0.0.0
+    """
+    for Index, Item in enumerate(Value):
+        if not isinstance(Item, (int, float, complex)):
+            Error = UT_TypeError(Item, (int, float, complex),
+                                                        SkipFrames = SkipFrames)
+            Error.appendMessage(f'at index {Index} in the passed list')
+            raise Error
+
+def _CheckTolerance(Value: Any, *, SkipFrames : int = 2) -> None:
+    """
+    Helper function to perform a routine check if the received argument is
+    None or a positive real number - the required precision of the roots.
+    
+    Signature:
+        type A/, *, int > 0/ -> None
+    
+    Args:
+        Value: type A; the parameter to be checked
+        SkipFrame: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function or method
+    
+    Raises:
+        UT_TypeError: the passed argument is neither None nor a real number
+        UT_ValueError: the passed argument is not positive
+    
+    Version 1.0.0.0
+    """
+    if not (Value is None):
+        if (not isinstance(Value, (int, float))) or isinstance(Value, bool):
+            Error = UT_TypeError(Value, (int, float, type(None)),
+                                                        SkipFrames = SkipFrames)
+            Error.appendMessage('- Tolerance argument')
+            raise Error
+        if Value <= 0:
+            raise UT_ValueError(Value, '> 0 - Tolerance argument',
+                                                        SkipFrames = SkipFrames)
+
+def _CheckInterval(Value: Any, *, SkipFrames : int = 2) -> None:
+    """
+    Helper function to perform a routine check if the received argument is
+    None or a sequence of two real numbers in the ascending order - the
+    interval of the search of the real roots.
+    
+    Signature:
+        type A/, *, int > 0/ -> None
+    
+    Args:
+        Value: type A; the parameter to be checked
+        SkipFrame: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function or method
+    
+    Raises:
+        UT_TypeError: the passed argument is neither None nor a sequence of
+            two real numbers
+        UT_ValueError: the first element is not less than the second one
+    
+    Version 1.0.0.0
+    """
+    if not (Value is None):
+        if ((not isinstance(Value, GSequence))
+                                        or isinstance(Value, NOT_SEQUENCE)):
+            Error = UT_TypeError(Value, (list, tuple, type(None)),
+                                                        SkipFrames = SkipFrames)
+            Error.appendMessage('- Interval argument')
+            raise Error
+        if len(Value) != 2:
+            Error = UT_TypeError(Value, (list, tuple), SkipFrames = SkipFrames)
+            Error.setMessage(f'Interval {Value} is not of the length 2')
+            raise Error
+        for Index, Item in enumerate(Value):
+            if (not isinstance(Item, (int, float))) or isinstance(Item, bool):
+                Error = UT_TypeError(Item, (int, float),
+                                                        SkipFrames = SkipFrames)
+                Error.appendMessage(f'at index {Index} in Interval argument')
+                raise Error
+        if not (Value[0] < Value[1]):
+            raise UT_ValueError(Value[0],
+                        f'< {Value[1]} - ends of the Interval argument',
+                                                        SkipFrames = SkipFrames)
+
+def _ParseCoefficientsBatch(Value: Any, *, SkipFrames : int = 2) -> Any:
+    """
+    Helper function to check, only once for the entire batch, that the passed
+    argument is a matrix of the coefficients of the polynomials of the same
+    degree N >= 1, i.e. a sequence of the equal length (N + 1) sequences of
+    real numbers, or a 2D NumPy array of real numbers. Each polynomial is
+    normalized, i.e. its coefficients are divided by the highest power one.
+    
+    Signature:
+        type A/, *, int > 0/ -> list(list(int OR float)) OR numpy.ndarray
+    
+    Args:
+        Value: type A; the parameter to be checked
+        SkipFrame: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function or method
+    
+    Returns:
+        list(list(int OR float)): the coefficients of the monic polynomials,
+            if NumPy is not installed
+        numpy.ndarray: the same coefficients as 2D floating point array, if
+            NumPy is installed
+    
+    Raises:
+        UT_TypeError: the passed argument is neither a sequence nor a 2D NumPy
+            array, OR any of its elements is not a sequence of real numbers
+        UT_ValueError: the passed argument is empty, OR the sub-sequences are
+            shorter than 2 elements or of the different length, OR the highest
+            power coefficient is zero for any of the polynomials
+    
+    Version 1.0.0.0
+    """
+    if (not (np is None)) and isinstance(Value, np.ndarray):
+        if Value.ndim != 2 or not (Value.dtype.kind in 'biuf'):
+            Error = UT_TypeError(Value, (list, tuple), SkipFrames = SkipFrames)
+            Error.appendMessage('OR 2D real numbers numpy.ndarray')
+            raise Error
+        Rows = Value.astype(float)
+    else:
+        if ((not isinstance(Value, GSequence))
+                                        or isinstance(Value, NOT_SEQUENCE)):
+            raise UT_TypeError(Value, (list, tuple), SkipFrames = SkipFrames)
+        for Index, Item in enumerate(Value):
+            if ((not isinstance(Item, GSequence))
+                                        or isinstance(Item, NOT_SEQUENCE)):
+                Error = UT_TypeError(Item, (list, tuple),
+                                                    SkipFrames = SkipFrames)
+                Error.appendMessage(f'at index {Index} in the batch')
+                raise Error
+            for ItemType in set(map(type, Item)):
+                if ((not issubclass(ItemType, (int, float)))
+                                            or issubclass(ItemType, bool)):
+                    Error = UT_TypeError(ItemType, (int, float),
+                                                    SkipFrames = SkipFrames)
+                    Error.appendMessage(
+                        f'- type of a coefficient at index {Index} in batch')
+                    raise Error
+        Rows = [list(Item) for Item in Value]
+    NumberPolynomials = len(Rows)
+    if not NumberPolynomials:
+        raise UT_ValueError(NumberPolynomials, '> 0 - number of polynomials',
+                                                        SkipFrames = SkipFrames)
+    Length = len(Rows[0])
+    if Length < 2:
+        raise UT_ValueError(Length, '> 1 - number of coefficients',
+                                                        SkipFrames = SkipFrames)
+    if isinstance(Rows, list):
+        for Index, Item in enumerate(Rows):
+            if len(Item) != Length:
+                raise UT_ValueError(len(Item),
+                    f'== {Length} - number of coefficients at index {Index}',
+                                                        SkipFrames = SkipFrames)
+            if not Item[-1]:
+                raise UT_ValueError(Item[-1],
+                    f'!= 0 - highest power coefficient at index {Index}',
+                                                        SkipFrames = SkipFrames)
+        Rows = [[Coefficient / Item[-1] for Coefficient in Item[:-1]] + [1]
+                                                            for Item in Rows]
+        if not (np is None):
+            Rows = np.array(Rows, dtype = float)
+    else:
+        Zeroes = np.flatnonzero(Rows[:, -1] == 0)
+        if Zeroes.size:
+            raise UT_ValueError(0,
+                    f'!= 0 - highest power coefficient at index {Zeroes[0]}',
+                                                        SkipFrames = SkipFrames)
+        Rows /= Rows[:, -1, None]
+    return Rows
+
 def _GetGeneralizedBinomialCoefficient(n: TReal, k: int) -> TReal:
     """
     Calculates a generalized binomial coefficient 'n choose k', where the n
@@ -603,28 +1504,233 @@ def _FitPolynomialBase(XGrid: TRealSequence, YGrid: TRealSequence,
 
 #+ public functions
 
-def FindRoots(Poly: Polynomial) -> List[TNumber]:
+def FindRoots(Poly: Polynomial, *, Method: Union[str, None] = None,
+                Tolerance: Union[TReal, None] = None) -> List[TNumber]:
     """
     Calculates all roots of a polynomial passed as an instance of Polynomial
-    class using Alberth method, and returns them as a list of real or complex
-    numbers. Each root with multiplicity K is included exactly K times; thus for
-    a polynomial of the degree N the length of the list is exactly N.
+    class, and returns them as a list of real or complex numbers. Each root
+    with multiplicity K is included exactly K times; thus for a polynomial of
+    the degree N the length of the list is exactly N.
+    
+    The root finding engine can be chosen: 'aberth' - Aberth method, or
+    'companion' - eigenvalues of the companion matrix found by the Francis QR
+    algorithm (O(N^3) operations, but not sensitive to the initial guesses).
+    By default, the Aberth method is used with the companion matrix as the
+    fallback, if the Aberth iterations do not converge. The clusters of the
+    found approximations are treated as the multiple roots, and they are
+    polished by the Newton iterations on the respective derivative of the
+    polynomial, which ensures the precision well below ROOTS_PRECISION.
     
     Signature:
-        Polynomial -> list(int OR float OR complex)
+        Polynomial/, *, str OR None, int > 0 OR float > 0 OR None/
+            -> list(int OR float OR complex)
+    
+    Args:
+        Poly: Polynomial; instance of, the polynomial to be solved
+        Method: (keyword) str OR None; name of the root finding engine, either
+            of 'aberth' or 'companion', defaults to None - automatic choice
+        Tolerance: (keyword) int > 0 OR float > 0 OR None; the required
+            relative precision of the roots, with the companion matrix method
+            its eigenvalues are refined by the Aberth iterations until this
+            precision is reached, defaults to None - ALMOST_ZERO for the Aberth
+            method and no refinement of the eigenvalues
+    
+    Returns:
+        list(int OR float OR complex): all roots of the polynomial
     
     Raises:
-        UT_TypeError: argument is not an instance of Polynomial class
+        UT_TypeError: argument is not an instance of Polynomial class, OR the
+            Method is not a string or None, OR the Tolerance is not a real
+            number or None
+        UT_ValueError: the Method is not one of the supported names, OR the
+            Tolerance is not positive
     
-    Version 1.0.0.0
+    Version 1.2.0.0
     """
     if not isinstance(Poly, Polynomial):
         raise UT_TypeError(Poly, Polynomial, SkipFrames = 1)
+    if not ((Method is None) or isinstance(Method, str)):
+        Error = UT_TypeError(Method, (str, type(None)), SkipFrames = 1)
+        Error.appendMessage('- Method argument')
+        raise Error
+    if not ((Method is None) or (Method in ROOTS_METHODS)):
+        raise UT_ValueError(Method, f'in {ROOTS_METHODS} - Method argument',
+                                                                SkipFrames = 1)
+    _CheckTolerance(Tolerance)
     Coefficients = Poly.getCoefficients()
     HighestOrder = Coefficients[-1]
     Coefficients = [Item / HighestOrder for Item in Coefficients]
     Coefficients[-1] = 1
-    Result = _FindAllRoots(Coefficients)
+    Result = _SolvePolynomial(Coefficients, Method, Tolerance)
+    return Result
+
+def FindRootsBatch(Coefficients: Any, *,
+                    Tolerance: Union[TReal, None] = None,
+                        WarmStart: bool = True) -> List[List[TNumber]]:
+    """
+    Calculates all roots of each of many polynomials of the same degree passed
+    as a matrix of their coefficients, and returns them as a list of lists of
+    real or complex numbers. The data sanity checks are performed only once
+    for the entire batch. With NumPy installed, the Aberth iterations are
+    performed simultaneously for the blocks of BATCH_BLOCK polynomials using
+    the vectorized complex arithmetics; otherwise, the polynomials are solved
+    one by one. The polynomials, for which the Aberth method does not
+    converge, are solved by the function FindRoots() with the automatic choice
+    of the engine.
+    
+    With the warm start the initial guesses are the roots of the previous
+    polynomial in the batch (of the last one in the previous block with NumPy)
+    slightly rotated around zero, which is efficient if the consecutive
+    polynomials differ only slightly. Also, the order of the roots of the
+    consecutive polynomials is then, usually, preserved.
+    
+    Signature:
+        seq(seq(int OR float)) OR numpy.ndarray
+            /, *, int > 0 OR float > 0 OR None, bool/
+                -> list(list(int OR float OR complex))
+    
+    Args:
+        Coefficients: seq(seq(int OR float)) OR numpy.ndarray; sequence of M
+            equal length sequences (or 2D array of the shape (M, N + 1)) of the
+            coefficients of M polynomials of the degree N >= 1, each from zero
+            to N-th power
+        Tolerance: (keyword) int > 0 OR float > 0 OR None; the required
+            relative precision of the roots, defaults to None - ALMOST_ZERO
+        WarmStart: (keyword) bool; flag if the roots of the previous
+            polynomial are to be used as the initial guesses, defaults to True
+    
+    Returns:
+        list(list(int OR float OR complex)): all roots of each polynomial, in
+            the same order as the polynomials
+    
+    Raises:
+        UT_TypeError: the Coefficients is neither a sequence of sequences of
+            real numbers nor a 2D NumPy array of real numbers, OR the Tolerance
+            is not a real number or None, OR the WarmStart is not a boolean
+        UT_ValueError: the batch is empty, OR the polynomials are of the
+            different degrees, OR the degree is zero, OR the highest power
+            coefficient of any polynomial is zero, OR the Tolerance is not
+            positive
+    
+    Version 1.0.1.0
+    """
+    Rows = _ParseCoefficientsBatch(Coefficients)
+    _CheckTolerance(Tolerance)
+    if not isinstance(WarmStart, bool):
+        Error = UT_TypeError(WarmStart, bool, SkipFrames = 1)
+        Error.appendMessage('- WarmStart argument')
+        raise Error
+    Precision = ALMOST_ZERO if Tolerance is None else Tolerance
+    Rotation = rect(1, WARM_START_ROTATION)
+    Degree = len(Rows[0]) - 1
+    Result = list()
+    Seeds = None
+    if Degree < 3: #analytical solution
+        for Item in Rows:
+            Result.append(_SolvePolynomial(list(map(float, Item)), None, None))
+    elif np is None:
+        for Item in Rows:
+            if WarmStart and not (Seeds is None):
+                Guesses = [Seed * Rotation for Seed in Seeds]
+            else:
+                Guesses = None
+            Guesses, isConverged = _FindRootsAberth(Item, Precision,
+                                                        Guesses = Guesses)
+            if isConverged:
+                Roots = [_Round(Guess, ROOTS_PRECISION) for Guess in Guesses]
+            else:
+                Roots = _SolvePolynomial(Item, None, Tolerance)
+            Result.append(Roots)
+            Seeds = Roots
+    else:
+        for Start in range(0, len(Rows), BATCH_BLOCK):
+            Block = Rows[Start : Start + BATCH_BLOCK]
+            if WarmStart:
+                if Seeds is None:
+                    Seeds = _SolvePolynomial(Block[0].tolist(), None,
+                                                                    Tolerance)
+                Guesses = np.tile(np.array(Seeds, dtype = complex) * Rotation,
+                                                            (len(Block), 1))
+            else:
+                Guesses = None
+            Guesses, isConverged = _FindRootsAberthBatch(Block, Precision,
+                                                        Guesses = Guesses)
+            for Item, Values, Flag in zip(Block, Guesses.tolist(),
+                                                        isConverged.tolist()):
+                if Flag:
+                    Roots = [_Round(Guess, ROOTS_PRECISION) for Guess in Values]
+                else:
+                    Roots = _SolvePolynomial(Item.tolist(), None, Tolerance)
+                Result.append(Roots)
+            Seeds = Result[-1]
+    return Result
+
+def FindRealRoots(Poly: Polynomial, *,
+                    Interval: Union[Sequence[TReal], None] = None,
+                        Tolerance: Union[TReal, None] = None) -> List[TReal]:
+    """
+    Calculates only the real roots of a polynomial passed as an instance of
+    Polynomial class, optionally, only within the closed interval [a, b], and
+    returns them as a list of real numbers in the ascending order. Each root
+    with multiplicity K is included exactly K times.
+    
+    The distinct real roots are isolated by the bisection using the numbers of
+    the sign changes in the Sturm sequence, and refined by the Newton
+    iterations safeguarded by the bisection. If the Sturm sequence is not
+    reliable due to the multiple or very close roots, the roots are separated
+    by the real roots of the derivative found recursively instead. Only the
+    real arithmetics is involved, hence this function is much faster than
+    FindRoots(), especially for the high degree polynomials with few real
+    roots.
+    
+    Signature:
+        Polynomial/, *, seq(int OR float, int OR float) OR None,
+            int > 0 OR float > 0 OR None/ -> list(int OR float)
+    
+    Args:
+        Poly: Polynomial; instance of, the polynomial to be solved
+        Interval: (keyword) seq(int OR float, int OR float) OR None; the ends
+            a < b of the interval of the search, defaults to None - entire
+            real axis
+        Tolerance: (keyword) int > 0 OR float > 0 OR None; the required
+            relative precision of the roots, defaults to None - ALMOST_ZERO
+    
+    Returns:
+        list(int OR float): all real roots of the polynomial within the
+            interval, in the ascending order
+    
+    Raises:
+        UT_TypeError: argument is not an instance of Polynomial class, OR the
+            Interval is neither None nor a sequence of two real numbers, OR the
+            Tolerance is not a real number or None
+        UT_ValueError: the ends of the Interval are not in the ascending order,
+            OR the Tolerance is not positive
+    
+    Version 1.0.1.0
+    """
+    if not isinstance(Poly, Polynomial):
+        raise UT_TypeError(Poly, Polynomial, SkipFrames = 1)
+    _CheckInterval(Interval)
+    _CheckTolerance(Tolerance)
+    Precision = ALMOST_ZERO if Tolerance is None else Tolerance
+    Coefficients = Poly.getCoefficients()
+    HighestOrder = Coefficients[-1]
+    Coefficients = [Item / HighestOrder for Item in Coefficients]
+    Coefficients[-1] = 1
+    Result = list()
+    if Interval is None: #Cauchy bound
+        Upper = 1 + max(abs(Item) for Item in Coefficients[ : -1])
+        Lower = - Upper
+    else:
+        Lower, Upper = Interval
+        Derivative = Coefficients
+        while _IsRealRoot(Derivative, Lower): #root at the excluded lower end
+            Result.append(Lower)
+            Derivative = _Differentiate(Derivative)
+    for Root, Multiplicity in _SolveRealPolynomial(Coefficients, Lower, Upper,
+                                                                    Precision):
+        Result.extend(_Round(Root, ALMOST_ZERO) for _ in range(Multiplicity))
+    Result.sort()
     return Result
 
 def GetLagrangePolynomial(Node: TReal, Roots: Sequence[TReal]) -> Polynomial:
@@ -6,11 +6,12 @@ Implementation of the polynomials and releated arithmetics.
 
 Classes:
     Polynomial
+    CompactPolynomial
     RationalFunction
 """
 
-__version__= '1.0.0.0'
-__date__ = '20-04-2023'
+__version__= '1.1.1.0'
+__date__ = '18-10-2026'
 __status__ = 'Production'
 
 #imports
@@ -22,9 +23,20 @@ import os
 
 import collections.abc as c_abc
 
-from typing import Sequence, Union, Tuple
+from array import array
 
-from math import log2, factorial
+from itertools import zip_longest
+
+from typing import Sequence, Union, Tuple, Any, List
+
+from math import log2, factorial, cos, sin, pi, sqrt
+
+#+ 3rd party libraries (optional)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 #+ my libraries
 
@@ -52,12 +64,412 @@ TIntPoly = Union[int, TPolynomial]
 
 TRealTuple = Tuple[TReal, ...]
 
+TRealBatch = Union[TRealSequence, array, memoryview, Any]
+
+#globals - Python version related
+
+PYTHON_MAJOR = sys.version_info[0]
+
+PYTHON_MINOR = sys.version_info[1]
+
+IS_V3_8_PLUS = (PYTHON_MAJOR >= 3) and (PYTHON_MINOR >= 8)
+
 #globals - precission related
 
 NEAR_ZERO_SOFT = 1E-8
 
 NEAR_ZERO_HARD = 1E-12
 
+#globals - batch evaluation related
+
+HAS_NUMPY = not (np is None) #NumPy backend is used if it is installed
+
+REAL_TYPECODES = 'bBhHiIlLqQfd' #array / memoryview formats of real numbers
+
+NOT_BATCH = (str, bytes, bytearray)
+
+#globals - calculus related
+
+DERIVATIVES_CACHE_DEPTH = 8 #maximum order of the cached derivatives
+
+#globals - compact storage related
+
+COMPACT_TYPECODE = 'd' #array.array type code of the compact storage
+
+BUFFER_WRITABLE = 0x0001 #PyBUF_WRITABLE flag of the buffer protocol request
+
+#globals - multiplication related
+
+SCHOOLBOOK_MAX_LENGTH = 32 #shorter operand length to use the direct method
+
+FFT_MIN_LENGTH = 384 #shorter operand length to use FFT for floating point
+
+FAST_MAX_ERROR = 1.0E-10 #acceptable rounding error bound of the FFT and
+#+ Karatsuba methods relative to the smallest coefficient of the product of
+#+ the absolute values
+
+#helper functions
+
+def _ParseRealBatch(Values: Any, *, SkipFrames: int = 2) -> TRealBatch:
+    """
+    Helper function to check, only once for the entire batch, that the passed
+    argument is a flat sequence, array.array or a buffer-protocol object of
+    real numbers. The check is performed on the container type / typecode or
+    on the set of the unique types of the elements, and not on each element.
+    
+    With NumPy installed the batch is returned as a 1D numpy.ndarray of the
+    double precision floating point numbers, otherwise - as the same sequence
+    or as a 1D memoryview for the buffer-protocol objects.
+    
+    Signature:
+        type A/, *, int > 0/ -> seq(int OR float) OR numpy.ndarray
+    
+    Args:
+        Values: type A; the batch to be checked
+        SkipFrames: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function or method
+    
+    Raises:
+        UT_TypeError: the passed argument is not a flat sequence, array or
+            buffer of real numbers
+    
+    Version 1.0.0.0
+    """
+    if (not (np is None)) and isinstance(Values, np.ndarray):
+        if Values.ndim != 1 or not (Values.dtype.kind in 'biuf'):
+            raise UT_TypeError(Values, (list, tuple, array),
+                                                        SkipFrames = SkipFrames)
+        return Values.astype(float, copy = False)
+    if isinstance(Values, array):
+        if not (Values.typecode in REAL_TYPECODES):
+            raise UT_TypeError(Values, (list, tuple, array),
+                                                        SkipFrames = SkipFrames)
+        Batch = Values
+    elif isinstance(Values, NOT_BATCH):
+        raise UT_TypeError(Values, (list, tuple, array),
+                                                        SkipFrames = SkipFrames)
+    elif isinstance(Values, c_abc.Sequence):
+        for ItemType in set(map(type, Values)):
+            if not issubclass(ItemType, (int, float)):
+                Error = UT_TypeError(ItemType, (int, float),
+                                                        SkipFrames = SkipFrames)
+                Error.appendMessage('- type of an element of the batch')
+                raise Error
+        Batch = Values
+    else:
+        try:
+            Batch = memoryview(Values)
+        except TypeError:
+            raise UT_TypeError(Values, (list, tuple, array),
+                                            SkipFrames = SkipFrames) from None
+        if Batch.ndim != 1 or not (Batch.format in REAL_TYPECODES):
+            raise UT_TypeError(Values, (list, tuple, array),
+                                                        SkipFrames = SkipFrames)
+    if not (np is None):
+        Batch = np.asarray(Batch, dtype = float)
+    return Batch
+
+def _MultiplySchoolbook(First: TRealSequence,
+                        Second: TRealSequence) -> List[TReal]:
+    """
+    Helper function to calculate the coefficients of a product of two
+    polynomials using the direct (schoolbook) O(N*M) method. Does not perform
+    input data sanity checks.
+    
+    Signature:
+        seq(int OR float), seq(int OR float) -> list(int OR float)
+    
+    Args:
+        First: seq(int OR float); coefficients of the first polynomial
+        Second: seq(int OR float); coefficients of the second polynomial
+    
+    Returns:
+        list(int OR float): coefficients of the product
+    
+    Version 1.0.0.0
+    """
+    if len(First) < len(Second):
+        First, Second = Second, First
+    Result = [0] * (len(First) + len(Second) - 1)
+    for Shift, Coefficient in enumerate(Second):
+        if Coefficient:
+            for Index, Value in enumerate(First, Shift):
+                Result[Index] += Value * Coefficient
+    return Result
+
+def _MultiplyKaratsuba(First: TRealSequence,
+                        Second: TRealSequence) -> List[TReal]:
+    """
+    Helper function to calculate the coefficients of a product of two
+    polynomials using the recursive Karatsuba method, falling back to the
+    direct method for the short operands. Does not perform input data sanity
+    checks.
+    
+    Signature:
+        seq(int OR float), seq(int OR float) -> list(int OR float)
+    
+    Args:
+        First: seq(int OR float); coefficients of the first polynomial
+        Second: seq(int OR float); coefficients of the second polynomial
+    
+    Returns:
+        list(int OR float): coefficients of the product
+    
+    Version 1.0.0.0
+    """
+    Length1 = len(First)
+    Length2 = len(Second)
+    if min(Length1, Length2) <= SCHOOLBOOK_MAX_LENGTH:
+        return _MultiplySchoolbook(First, Second)
+    Result = [0] * (Length1 + Length2 - 1)
+    Half = max(Length1, Length2) // 2
+    if Length1 <= Half or Length2 <= Half: #unbalanced - split the longer one
+        if Length1 < Length2:
+            First, Second = Second, First
+        Lower = _MultiplyKaratsuba(First[:Half], Second)
+        Upper = _MultiplyKaratsuba(First[Half:], Second)
+        for Index, Value in enumerate(Lower):
+            Result[Index] += Value
+        for Index, Value in enumerate(Upper, Half):
+            Result[Index] += Value
+        return Result
+    Low1, High1 = First[:Half], First[Half:]
+    Low2, High2 = Second[:Half], Second[Half:]
+    Lower = _MultiplyKaratsuba(Low1, Low2)
+    Upper = _MultiplyKaratsuba(High1, High2)
+    Sum1 = [Item1 + Item2 for Item1, Item2
+                                    in zip_longest(Low1, High1, fillvalue = 0)]
+    Sum2 = [Item1 + Item2 for Item1, Item2
+                                    in zip_longest(Low2, High2, fillvalue = 0)]
+    Middle = _MultiplyKaratsuba(Sum1, Sum2)
+    for Index, Value in enumerate(Lower):
+        Result[Index] += Value
+        Middle[Index] -= Value
+    for Index, Value in enumerate(Upper):
+        Result[Index + 2 * Half] += Value
+        Middle[Index] -= Value
+    for Index, Value in enumerate(Middle, Half):
+        if Index >= len(Result):
+            break #zero padding terms
+        Result[Index] += Value
+    return Result
+
+def _MultiplyKronecker(First: Sequence[int],
+                                    Second: Sequence[int]) -> List[int]:
+    """
+    Helper function to calculate exactly the coefficients of a product of two
+    polynomials with integer coefficients using Kronecker substitution: both
+    polynomials are evaluated at x = 2^K (packed into big integers), the
+    resulting big integers are multiplied, and the coefficients of the
+    product are unpacked as K-bits wide signed digits. Does not perform input
+    data sanity checks.
+    
+    Signature:
+        seq(int), seq(int) -> list(int)
+    
+    Args:
+        First: seq(int); coefficients of the first polynomial
+        Second: seq(int); coefficients of the second polynomial
+    
+    Returns:
+        list(int): coefficients of the product
+    
+    Version 1.0.0.0
+    """
+    Length = len(First) + len(Second) - 1
+    Bound = (max(map(abs, First)) * max(map(abs, Second))
+                                                * min(len(First), len(Second)))
+    Width = Bound.bit_length() // 8 + 1 #bytes per digit, incl. sign bit
+    Zero = bytes(Width)
+    Packed = []
+    for Coefficients in (First, Second):
+        Positive = b''.join(Item.to_bytes(Width, 'little') if Item > 0 else Zero
+                                                    for Item in Coefficients)
+        Negative = b''.join((-Item).to_bytes(Width, 'little') if Item < 0
+                                            else Zero for Item in Coefficients)
+        Packed.append(int.from_bytes(Positive, 'little')
+                                        - int.from_bytes(Negative, 'little'))
+    #shift all digits by 2^(8*Width-1) to make them non-negative
+    Offset = int.from_bytes((bytes(Width - 1) + b'\x80') * Length, 'little')
+    Raw = (Packed[0] * Packed[1] + Offset).to_bytes(Width * Length, 'little')
+    Offset = 1 << (8 * Width - 1)
+    return [int.from_bytes(Raw[Index : Index + Width], 'little') - Offset
+                                for Index in range(0, Width * Length, Width)]
+
+def _FFT(Values: List[complex], *, Inverse: bool = False) -> List[complex]:
+    """
+    Helper function implementing the in-place iterative radix-2 Cooley-Tukey
+    fast Fourier transformation (not normalized). The length of the passed
+    list must be a power of 2. Does not perform input data sanity checks.
+    
+    Signature:
+        list(complex)/, *, bool/ -> list(complex)
+    
+    Args:
+        Values: list(complex); the data to be transformed in place
+        Inverse: (keyword) bool; flag if the inverse transformation is to be
+            performed, defaults to False
+    
+    Returns:
+        list(complex): the same, but modified list
+    
+    Version 1.0.0.0
+    """
+    Length = len(Values)
+    Target = 0
+    for Index in range(1, Length): #bit-reversal permutation
+        Bit = Length >> 1
+        while Target & Bit:
+            Target ^= Bit
+            Bit >>= 1
+        Target ^= Bit
+        if Index < Target:
+            Values[Index], Values[Target] = Values[Target], Values[Index]
+    Sign = 2 * pi if Inverse else - 2 * pi
+    Step = 2
+    while Step <= Length:
+        Half = Step >> 1
+        Angle = Sign / Step
+        Twiddles = [complex(cos(Angle * Index), sin(Angle * Index))
+                                                    for Index in range(Half)]
+        for Start in range(0, Length, Step):
+            for Index, Twiddle in enumerate(Twiddles, Start):
+                Left = Values[Index]
+                Right = Values[Index + Half] * Twiddle
+                Values[Index] = Left + Right
+                Values[Index + Half] = Left - Right
+        Step <<= 1
+    return Values
+
+def _MultiplyFFT(First: TRealSequence,
+                                Second: TRealSequence) -> List[float]:
+    """
+    Helper function to calculate the coefficients of a product of two
+    polynomials using the fast Fourier transformation, with NumPy if it is
+    installed. The result is subject to the floating point rounding errors
+    relative to the largest coefficient. Does not perform input data sanity
+    checks.
+    
+    Signature:
+        seq(int OR float), seq(int OR float) -> list(float)
+    
+    Args:
+        First: seq(int OR float); coefficients of the first polynomial
+        Second: seq(int OR float); coefficients of the second polynomial
+    
+    Returns:
+        list(float): coefficients of the product
+    
+    Version 1.0.0.0
+    """
+    Length = len(First) + len(Second) - 1
+    Size = 1 << (Length - 1).bit_length()
+    if not (np is None):
+        Product = np.fft.rfft(First, Size) * np.fft.rfft(Second, Size)
+        Result = np.fft.irfft(Product, Size)[:Length].tolist()
+    else:
+        Transform1 = [complex(Item) for Item in First]
+        Transform1.extend([0j] * (Size - len(First)))
+        Transform2 = [complex(Item) for Item in Second]
+        Transform2.extend([0j] * (Size - len(Second)))
+        _FFT(Transform1)
+        _FFT(Transform2)
+        Product = _FFT([Item1 * Item2 for Item1, Item2
+                                in zip(Transform1, Transform2)], Inverse = True)
+        Result = [Item.real / Size for Item in Product[:Length]]
+    #the lowest and the highest coefficients are known exactly
+    Result[0] = float(First[0] * Second[0])
+    Result[-1] = float(First[-1] * Second[-1])
+    return Result
+
+def _IsFastProductAccurate(First: TRealSequence,
+                                    Second: TRealSequence) -> bool:
+    """
+    Helper function to check if the product of two polynomials can be
+    calculated using the fast Fourier transformation or Karatsuba method
+    without the loss of the relative precision. The rounding errors of both
+    methods are bound by ~ eps * log2(N) * ||First|| * ||Second|| (Euclidean
+    norms) for each coefficient, whereas the rounding error of the direct
+    convolution for the K-th coefficient is relative to the K-th coefficient
+    of the product of the absolute values. The latter product is calculated
+    by FFT, which is accurate for the non-negative coefficients as long as
+    the check passes. Does not perform input data sanity checks.
+    
+    Signature:
+        seq(int OR float), seq(int OR float) -> bool
+    
+    Args:
+        First: seq(int OR float); coefficients of the first polynomial
+        Second: seq(int OR float); coefficients of the second polynomial
+    
+    Returns:
+        bool: True if the error bound does not exceed FAST_MAX_ERROR relative
+            to each coefficient of the product of the absolute values (except
+            for the lowest and the highest ones, which are always exact),
+            False otherwise
+    
+    Version 1.0.0.0
+    """
+    AbsFirst = [float(abs(Item)) for Item in First]
+    AbsSecond = [float(abs(Item)) for Item in Second]
+    Size = 1 << (len(First) + len(Second) - 2).bit_length()
+    Bound = (Size.bit_length() * sys.float_info.epsilon
+                                * sqrt(sum(Item * Item for Item in AbsFirst))
+                                * sqrt(sum(Item * Item for Item in AbsSecond)))
+    Scale = min(_MultiplyFFT(AbsFirst, AbsSecond)[1 : -1])
+    Result = Bound <= FAST_MAX_ERROR * Scale
+    return Result
+
+def _MultiplyCoefficients(First: TRealSequence,
+                                    Second: TRealSequence) -> List[TReal]:
+    """
+    Helper function to calculate the coefficients of a product of two
+    polynomials, selecting the algorithm based on the operands' lengths and
+    types of the coefficients:
+    
+    * short operands - direct (schoolbook) method
+    * only integer coefficients - exact Kronecker substitution
+    * long operands - fast Fourier transformation, if its rounding error bound
+      is acceptable, see _IsFastProductAccurate()
+    * otherwise - NumPy direct convolution if installed, or Karatsuba method
+      if its rounding error bound is acceptable, or the direct method
+    
+    Does not perform input data sanity checks.
+    
+    Signature:
+        seq(int OR float), seq(int OR float) -> list(int OR float)
+    
+    Args:
+        First: seq(int OR float); coefficients of the first polynomial
+        Second: seq(int OR float); coefficients of the second polynomial
+    
+    Returns:
+        list(int OR float): coefficients of the product
+    
+    Version 1.0.1.0
+    """
+    Shortest = min(len(First), len(Second))
+    if Shortest <= SCHOOLBOOK_MAX_LENGTH:
+        Result = _MultiplySchoolbook(First, Second)
+    elif all(isinstance(Item, int) for Item in First) and all(
+                                    isinstance(Item, int) for Item in Second):
+        Result = _MultiplyKronecker(First, Second)
+    else:
+        isLong = Shortest >= FFT_MIN_LENGTH
+        isAccurate = ((isLong or (np is None)) and
+                                        _IsFastProductAccurate(First, Second))
+        if isLong and isAccurate:
+            Result = _MultiplyFFT(First, Second)
+        elif not (np is None):
+            Result = np.convolve(np.asarray(First, dtype = float),
+                                np.asarray(Second, dtype = float)).tolist()
+        elif isAccurate:
+            Result = _MultiplyKaratsuba(First, Second)
+        else:
+            Result = _MultiplySchoolbook(First, Second)
+    return Result
+
 #classes
 
 class Polynomial:
@@ -90,10 +502,16 @@ class Polynomial:
             None -> Polynomial
         getConvolution(Other)
             Polynomial -> Polynomial
+        evaluateMany(Values)
+            seq(int OR float) -> list(int OR float) OR numpy.ndarray
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     
+    #class attributes
+    
+    __slots__ = ('_Coefficients', '_Derivatives', '_Antiderivative')
+    
     #public class methods
     
     @classmethod
@@ -153,7 +571,7 @@ class Polynomial:
             UT_ValueError: number of arguments is less than 2, OR the last
                 argument is zero
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         for Index, Value in enumerate(args):
             if not isinstance(Value, (int, float)):
@@ -167,6 +585,8 @@ class Polynomial:
             raise UT_ValueError(len(args), '<> 0 - highest power coefficient',
                                                                 SkipFrames = 1)
         self._Coefficients = tuple(args)
+        self._Derivatives = None #lazily created cache of derivatives
+        self._Antiderivative = None #lazily created cache of antiderivative
     
     def __str__(self) -> str:
         """
@@ -217,9 +637,9 @@ class Polynomial:
         Singature:
             None -> str
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        Result = f"'{self.__class__.__name__}{self._Coefficients}'"
+        Result = f"'{self.__class__.__name__}{tuple(self._Coefficients)}'"
         return Result
     
     def __call__(self, Value: TReal) -> TReal:
@@ -348,7 +768,7 @@ class Polynomial:
             Coefficients = [Item for Item in self._Coefficients]
             Coefficients[0] += Value
             Result = self.__class__(*Coefficients)
-        elif isinstance(Value, self.__class__):
+        elif isinstance(Value, Polynomial):
             Degree = max(self.Degree, Value.Degree)
             Left = list(self.getCoefficients())
             Right = list(Value.getCoefficients())
@@ -370,7 +790,7 @@ class Polynomial:
             else:
                 Result = self.__class__(*Sum)
         else:
-            raise UT_TypeError(Value, (int, float, self.__class__),
+            raise UT_TypeError(Value, (int, float, Polynomial),
                                                                 SkipFrames = 1)
         return Result
     
@@ -400,7 +820,7 @@ class Polynomial:
             Coefficients = [Item for Item in self._Coefficients]
             Coefficients[0] -= Value
             Result = self.__class__(*Coefficients)
-        elif isinstance(Value, self.__class__):
+        elif isinstance(Value, Polynomial):
             Degree = max(self.Degree, Value.Degree)
             Left = list(self.getCoefficients())
             Right = list(Value.getCoefficients())
@@ -422,14 +842,17 @@ class Polynomial:
             else:
                 Result = self.__class__(*Difference)
         else:
-            raise UT_TypeError(Value, (int, float, self.__class__),
+            raise UT_TypeError(Value, (int, float, Polynomial),
                                                                 SkipFrames = 1)
         return Result
     
     def __mul__(self, Value: TRealPoly) -> TIntPoly:
         """
         Magic method implementing right multiplication by another polynomial or
-        a scalar: P(x) * a OR P(x) * Q(X).
+        a scalar: P(x) * a OR P(x) * Q(X). The product of two polynomials is
+        calculated with the direct method for the low degrees, and with the
+        Kronecker substitution (exact, integer coefficients only), Karatsuba
+        or FFT methods for the high degrees.
 
         Signature:
             int OR float OR Polynomial -> Polynomial OR int
@@ -445,7 +868,7 @@ class Polynomial:
             UT_TypeError: arguments is not a real number neither another
                 polynomial
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         Result = None
         if isinstance(Value, (int, float)):
@@ -454,18 +877,12 @@ class Polynomial:
             else:
                 Coefficients = [Item * Value for Item in self._Coefficients]
                 Result = self.__class__(*Coefficients)
-        elif isinstance(Value, self.__class__):
-            Result = [Value[-1] * Item for Item in self._Coefficients]
-            Power = Value.Degree
-            for _ in range(Power):
-                Result.insert(0,0)
-            for Index in range(Power - 1, -1, -1):
-                Coeff = Value[Index]
-                for Pos, Val in enumerate(self._Coefficients):
-                    Result[Index + Pos] += Val * Coeff
+        elif isinstance(Value, Polynomial):
+            Result = _MultiplyCoefficients(self._Coefficients,
+                                                        Value._Coefficients)
             Result = self.__class__(*Result)
         else:
-            raise UT_TypeError(Value, (int, float, self.__class__),
+            raise UT_TypeError(Value, (int, float, Polynomial),
                                                                 SkipFrames = 1)
         return Result
     
@@ -522,8 +939,8 @@ class Polynomial:
         
         Version 1.0.0.0
         """
-        if not isinstance(Value, self.__class__):
-            raise UT_TypeError(Value, (self.__class__, ), SkipFrames = 1)
+        if not isinstance(Value, Polynomial):
+            raise UT_TypeError(Value, (Polynomial, ), SkipFrames = 1)
         Result, _ = self.__divmod__(Value)
         return Result
     
@@ -549,8 +966,8 @@ class Polynomial:
 
         Version 1.0.0.0
         """
-        if not isinstance(Value, self.__class__):
-            raise UT_TypeError(Value, (self.__class__, ), SkipFrames = 1)
+        if not isinstance(Value, Polynomial):
+            raise UT_TypeError(Value, (Polynomial, ), SkipFrames = 1)
         _, Result = self.__divmod__(Value)
         return Result
     
@@ -575,8 +992,8 @@ class Polynomial:
         
         Version 1.0.0.0
         """
-        if not isinstance(Value, self.__class__):
-            raise UT_TypeError(Value, (self.__class__, ), SkipFrames = 1)
+        if not isinstance(Value, Polynomial):
+            raise UT_TypeError(Value, (Polynomial, ), SkipFrames = 1)
         DegreeLeft = self.Degree
         DegreeRight = Value.Degree
         if DegreeLeft < DegreeRight:
@@ -770,6 +1187,9 @@ class Polynomial:
     def getDerivative(self, Degree: int = 1) -> TRealPoly:
         """
         Calculates the K-th (K >= 1) derivative of the polynomial of degree N.
+        The derivatives of the orders up to DERIVATIVES_CACHE_DEPTH are
+        calculated lazily, each from the previous one, and cached, thus the
+        repeated calls return the same objects.
         
         Signature:
             /int >= 1/ -> Polynomial OR int OR float
@@ -787,7 +1207,7 @@ class Polynomial:
             UT_TypeError: passed argument is not an integer
             UT_ValueError: passed argument is zero or negative
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if not isinstance(Degree, int):
             raise UT_TypeError(Degree, (int, ), SkipFrames = 1)
@@ -797,6 +1217,18 @@ class Polynomial:
             Result = 0
         elif Degree == self.Degree:
             Result = factorial(Degree) * self[-1]
+        elif Degree <= DERIVATIVES_CACHE_DEPTH:
+            #lazily extended tower of derivatives, each is the first
+            #+ derivative of the previous one
+            Cache = self._Derivatives
+            if Cache is None:
+                Cache = self._Derivatives = list()
+            while len(Cache) < Degree:
+                Previous = Cache[-1] if len(Cache) else self
+                Coefficients = [Index * Value for Index, Value
+                                in enumerate(Previous._Coefficients) if Index]
+                Cache.append(self.__class__(*Coefficients))
+            Result = Cache[Degree - 1]
         else:
             StartIndex = Degree
             Coefficients = list()
@@ -811,7 +1243,8 @@ class Polynomial:
     def getAntiderivative(self) -> TPolynomial:
         """
         Calculates the first antiderivate (primitive function) of the
-        polynomial.
+        polynomial. The result is cached, thus the repeated calls return the
+        same object.
         
         Signature:
             None -> Polynomial
@@ -820,12 +1253,14 @@ class Polynomial:
             Polynomial: instance of, the first antiderivate up to a constant
                 (free coefficient)
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        Coefficients = [Value / (Index + 1)
-                            for Index, Value in enumerate(self._Coefficients)]
-        Coefficients.insert(0, 0)
-        return self.__class__(*Coefficients)
+        if self._Antiderivative is None:
+            Coefficients = [0]
+            Coefficients.extend(Value / (Index + 1)
+                            for Index, Value in enumerate(self._Coefficients))
+            self._Antiderivative = self.__class__(*Coefficients)
+        return self._Antiderivative
     
     def getConvolution(self, Other: TPolynomial) -> TPolynomial:
         """
@@ -846,13 +1281,186 @@ class Polynomial:
         Raises:
             UT_TypeError: argument is not a polynomial
         
+        Version 1.1.0.0
+        """
+        if not isinstance(Other, Polynomial):
+            raise UT_TypeError(Other, (Polynomial, ), SkipFrames = 1)
+        #Horner scheme: P(Q) = a_0 + Q * (a_1 + Q * (... + Q * a_N))
+        Result = self.__class__(*Other._Coefficients) * self._Coefficients[-1]
+        for Index in range(self.Degree - 1, 0, -1):
+            Result = (Result + self._Coefficients[Index]) * Other
+        Result = Result + self._Coefficients[0]
+        return Result
+    
+    def evaluateMany(self, Values: TRealBatch) -> Union[List[TReal], Any]:
+        """
+        Evaluates the polynomial at each value of the argument in a batch. The
+        data type check is performed only once per batch. With NumPy installed
+        the vectorized Horner scheme is used, and the calculations are performed
+        in double precision; otherwise a plain Python loop is used.
+        
+        Signature:
+            seq(int OR float) OR array.array OR buffer
+                -> list(int OR float) OR numpy.ndarray
+        
+        Args:
+            Values: seq(int OR float) OR array.array OR buffer; any flat
+                sequence, array or buffer-protocol object of real numbers
+        
+        Returns:
+            list(int OR float): the values of the polynomial at each argument
+                value, in the same order
+            numpy.ndarray: the same values, if the argument is also a NumPy
+                array
+        
+        Raises:
+            UT_TypeError: argument is not a flat sequence, array or buffer of
+                real numbers
+        
         Version 1.0.0.0
         """
-        if not isinstance(Other, self.__class__):
-            raise UT_TypeError(Other, (self.__class__, ), SkipFrames = 1)
-        Result = self[0] + self[1] * Other
-        for Power in range(2, self.Degree + 1):
-            Result = Result + self[Power] * (Other ** Power)
+        Batch = _ParseRealBatch(Values)
+        Coefficients = self._Coefficients
+        if not (np is None):
+            Result = np.full(len(Batch), float(Coefficients[-1]))
+            for Index in range(self.Degree - 1, -1, -1):
+                Result *= Batch
+                Result += Coefficients[Index]
+            if not isinstance(Values, np.ndarray):
+                Result = Result.tolist()
+        else:
+            Highest = Coefficients[-1]
+            Reversed = Coefficients[-2::-1]
+            Result = list()
+            Append = Result.append
+            for Value in Batch:
+                Evaluated = Highest
+                for Coefficient in Reversed:
+                    Evaluated = Coefficient + Evaluated * Value
+                Append(Evaluated)
+        return Result
+
+class CompactPolynomial(Polynomial):
+    """
+    Implementation of a polynomial with the compact storage of the coefficients
+    as a contiguous array of double precision floating point numbers
+    (array.array('d')). All coefficients are converted into floating point
+    numbers, i.e. the integer coefficients beyond 2^53 lose exactness. The
+    results of the arithmetical operations, where the left operand is a
+    compact polynomial, are also compact polynomials.
+    
+    The coefficients can be exported without copying as a read-only
+    memoryview, e.g. to be wrapped by numpy.frombuffer(), via the method
+    getBuffer() or, with Python 3.12+, directly via the buffer protocol.
+    
+    Otherwise, the functionality is the same as of Polynomial class.
+    
+    Properties:
+        Degree: (read-only) int >= 1
+    
+    Class methods:
+        fromRoots(*args)
+            *tuple(int OR float) -> CompactPolynomial
+    
+    Methods:
+        getBuffer()
+            None -> memoryview
+        getCoefficients()
+            None -> tuple(float)
+        getAntiderivative(Degree = 1)
+            /int >= 1/ -> CompactPolynomial OR float
+        getAntiderivative()
+            None -> CompactPolynomial
+        getConvolution(Other)
+            Polynomial -> CompactPolynomial
+        evaluateMany(Values)
+            seq(int OR float) -> list(float) OR numpy.ndarray
+    
+    Version 1.0.0.0
+    """
+    
+    #class attributes
+    
+    __slots__ = ()
+    
+    #special methods
+    
+    def __init__(self, *args) -> None:
+        """
+        Initialization. Stores the passed coefficients in an internal state as
+        a contiguous array of floating point numbers. All passed arguments must
+        be real numbers, which are treated as the polynomial coefficients
+        sorted in the ascending order of the power. The last positional
+        argument must be non-zero.
+        
+        Signature:
+            *seq(int OR float) -> None
+        
+        Args:
+            *args: *seq(int OR float); any number of integer or floating
+                point arguments
+        
+        Raises:
+            UT_TypeError: any of the arguments is not a real number
+            UT_ValueError: number of arguments is less than 2, OR the last
+                argument is zero, OR any of the arguments is an integer too
+                large to be converted into a floating point number
+        
+        Version 1.0.0.0
+        """
+        super().__init__(*args)
+        try:
+            self._Coefficients = array(COMPACT_TYPECODE, args)
+        except OverflowError:
+            raise UT_ValueError(max(map(abs, args)), '< 2^1024 - coefficient',
+                                                    SkipFrames = 1) from None
+    
+    def __buffer__(self, Flags: int) -> memoryview:
+        """
+        Magic method implementing the buffer protocol (Python 3.12+), e.g.
+        memoryview(Poly). Only read-only buffers can be requested.
+        
+        Signature:
+            int -> memoryview
+        
+        Args:
+            Flags: int; the buffer request flags
+        
+        Returns:
+            memoryview: read-only view of the coefficients
+        
+        Raises:
+            BufferError: a writable buffer is requested
+        
+        Version 1.0.0.0
+        """
+        if Flags & BUFFER_WRITABLE:
+            raise BufferError(
+                        f'{self.__class__.__name__} is an immutable object')
+        return self.getBuffer()
+    
+    #public instance methods
+    
+    def getBuffer(self) -> memoryview:
+        """
+        Method to export the coefficients as a read-only one dimensional
+        memoryview of the double precision floating point numbers (format 'd')
+        from the zero-th towards the highest power. With Python 3.8+ the view
+        is created without copying of the data.
+        
+        Signature:
+            None -> memoryview
+        
+        Returns:
+            memoryview: read-only view of the coefficients
+        
+        Version 1.0.0.0
+        """
+        if IS_V3_8_PLUS:
+            Result = memoryview(self._Coefficients).toreadonly()
+        else:
+            Result = memoryview(self._Coefficients.tobytes()).cast(
+                                                            COMPACT_TYPECODE)
         return Result
 
 class RationalFunction:
@@ -869,8 +1477,10 @@ class RationalFunction:
     Methods:
         getCoefficients()
             None -> tuple(int OR float), tuple(int OR float)
+        evaluateMany(Values)
+            seq(int OR float) -> list(int OR float) OR numpy.ndarray
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     
     #special methods
@@ -963,7 +1573,7 @@ class RationalFunction:
             UT_ValueError: function has a singularity point at the value of
                 the argument - division by zero
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if not isinstance(Value, (int, float)):
             raise UT_TypeError(Value, (int, float), SkipFrames = 1)
@@ -972,30 +1582,11 @@ class RationalFunction:
         if abs(Divisor) > NEAR_ZERO_SOFT:
             Result = Divident / Divisor
         else:
-            if abs(Divident) > NEAR_ZERO_SOFT and abs(Divisor) < NEAR_ZERO_HARD:
+            Result = self._resolveSingularity(Value, Divident, Divisor)
+            if Result is None:
                 raise UT_ValueError(Value,
                                 'not a singularity point (division by zero)',
                                                                 SkipFrames = 1)
-            else:
-                MinDegree = min(self._Divident.Degree, self._Divisor.Degree)
-                Degree = 1
-                while Degree < (MinDegree + 1):
-                    Divident=self._Divident.getDerivative(Degree=Degree)
-                    if isinstance(Divident, Polynomial):
-                        Divident = Divident(Value)
-                    Divisor = self._Divisor.getDerivative(Degree=Degree)
-                    if isinstance(Divisor, Polynomial):
-                        Divisor = Divisor(Value)
-                    if (abs(Divident) > NEAR_ZERO_SOFT or
-                                                abs(Divisor) > NEAR_ZERO_SOFT):
-                        break
-                    Degree += 1
-                if Divisor:
-                    Result = Divident / Divisor
-                else:
-                    raise UT_ValueError(Value,
-                                'not a singularity point (division by zero)',
-                                                                SkipFrames = 1)
         return Result
     
     def __str__(self) -> str:
@@ -1022,10 +1613,53 @@ class RationalFunction:
         Singature:
             None -> str
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         Result = "'{}({}, {})'".format(self.__class__.__name__,
-                    self._Divident._Coefficients, self._Divisor._Coefficients)
+                *self.getCoefficients())
+        return Result
+    
+    #private instance methods
+    
+    def _resolveSingularity(self, Value: TReal, Divident: TReal,
+                                        Divisor: TReal) -> Union[TReal, None]:
+        """
+        Helper method to resolve the near zero divisor situation using the
+        L'Hospital's rule with the (cached) derivatives of the divident and the
+        divisor polynomials. Does not perform input data sanity checks.
+        
+        Signature:
+            int OR float, int OR float, int OR float -> int OR float OR None
+        
+        Args:
+            Value: int OR float; value of the argument
+            Divident: int OR float; value of the divident at this argument
+            Divisor: int OR float; value of the divisor at this argument
+        
+        Returns:
+            int OR float: the resolved value of the function
+            None: division by zero situation, i.e. not a removable singularity
+        
+        Version 1.0.0.0
+        """
+        if abs(Divident) > NEAR_ZERO_SOFT and abs(Divisor) < NEAR_ZERO_HARD:
+            return None
+        MinDegree = min(self._Divident.Degree, self._Divisor.Degree)
+        Degree = 1
+        while Degree < (MinDegree + 1):
+            Divident = self._Divident.getDerivative(Degree = Degree)
+            if isinstance(Divident, Polynomial):
+                Divident = Divident(Value)
+            Divisor = self._Divisor.getDerivative(Degree = Degree)
+            if isinstance(Divisor, Polynomial):
+                Divisor = Divisor(Value)
+            if abs(Divident) > NEAR_ZERO_SOFT or abs(Divisor) > NEAR_ZERO_SOFT:
+                break
+            Degree += 1
+        if Divisor:
+            Result = Divident / Divisor
+        else:
+            Result = None
         return Result
     
     #public instance methods
@@ -1044,6 +1678,84 @@ class RationalFunction:
                 polynomials respectively, from the zero-th to the highest
                 power sorted
         
+        Version 1.1.0.0
+        """
+        return (self._Divident.getCoefficients(),
+                                            self._Divisor.getCoefficients())
+    
+    def evaluateMany(self, Values: TRealBatch) -> Union[List[TReal], Any]:
+        """
+        Evaluates the rational function at each value of the argument in a
+        batch. The data type check is performed only once per batch. The
+        divident and the divisor are evaluated together in a single pass over
+        the batch (vectorized with NumPy if it is installed, and in double
+        precision), and only the points with the near zero divisor are
+        resolved individually using the L'Hospital's rule.
+        
+        Signature:
+            seq(int OR float) OR array.array OR buffer
+                -> list(int OR float) OR numpy.ndarray
+        
+        Args:
+            Values: seq(int OR float) OR array.array OR buffer; any flat
+                sequence, array or buffer-protocol object of real numbers
+        
+        Returns:
+            list(int OR float): the values of the function at each argument
+                value, in the same order
+            numpy.ndarray: the same values, if the argument is also a NumPy
+                array
+        
+        Raises:
+            UT_TypeError: argument is not a flat sequence, array or buffer of
+                real numbers
+            UT_ValueError: any of the values in the batch results in the
+                division by zero situation
+        
         Version 1.0.0.0
         """
-        return self._Divident._Coefficients, self._Divisor._Coefficients
\ No newline at end of file
+        Batch = _ParseRealBatch(Values)
+        if not (np is None):
+            Divident = self._Divident.evaluateMany(Batch)
+            Divisor = self._Divisor.evaluateMany(Batch)
+            IsSingular = np.abs(Divisor) <= NEAR_ZERO_SOFT
+            Result = np.divide(Divident, Divisor, where = ~IsSingular,
+                                                out = np.empty_like(Divident))
+            for Index in np.flatnonzero(IsSingular).tolist():
+                Value = Batch[Index].item()
+                Resolved = self._resolveSingularity(Value,
+                            Divident[Index].item(), Divisor[Index].item())
+                if Resolved is None:
+                    raise UT_ValueError(Value,
+                                'not a singularity point (division by zero)',
+                                                                SkipFrames = 1)
+                Result[Index] = Resolved
+            if not isinstance(Values, np.ndarray):
+                Result = Result.tolist()
+        else:
+            Coefficients = self._Divident._Coefficients
+            DividentHighest = Coefficients[-1]
+            DividentReversed = Coefficients[-2::-1]
+            Coefficients = self._Divisor._Coefficients
+            DivisorHighest = Coefficients[-1]
+            DivisorReversed = Coefficients[-2::-1]
+            Result = list()
+            Append = Result.append
+            for Value in Batch:
+                Divident = DividentHighest
+                for Coefficient in DividentReversed:
+                    Divident = Coefficient + Divident * Value
+                Divisor = DivisorHighest
+                for Coefficient in DivisorReversed:
+                    Divisor = Coefficient + Divisor * Value
+                if abs(Divisor) > NEAR_ZERO_SOFT:
+                    Append(Divident / Divisor)
+                else:
+                    Resolved = self._resolveSingularity(Value, Divident,
+                                                                    Divisor)
+                    if Resolved is None:
+                        raise UT_ValueError(Value,
+                                'not a singularity point (division by zero)',
+                                                                SkipFrames = 1)
+                    Append(Resolved)
+        return Result
@@ -15,6 +15,8 @@ Functions:
         int > 0 OR float > 0, int > 0 OR float > 0 -> float > 0
     inv_erf(x)
         int = 0 OR -1 < float < 1 -> float
+    inv_norm_cdf(p)
+        0 < float < 1 -> float
     lower_gamma(x, y)
         int > 0 OR float > 0, int >= 0 OR float > 0 -> float >= 0
     log_lower_gamma(x, y)
@@ -36,10 +38,43 @@ Functions:
     incomplete_beta_reg(z, x, y)
         0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
             int > 0 OR float > 0 -> 0 <= float <= 1
+    gamma_iterations(x, y, *, Tolerance = REL_PRECISION)
+        int > 0 OR float > 0, int >= 0 OR float > 0/, *, float OR str/
+            -> int >= 0
+    beta_iterations(z, x, y, *, Tolerance = REL_PRECISION)
+        0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
+            int > 0 OR float > 0/, *, float OR str/ -> int >= 0
+    log_beta_many(x, y)
+    beta_many(x, y)
+    inv_erf_many(x)
+    inv_norm_cdf_many(p)
+    lower_gamma_many(x, y)
+    log_lower_gamma_many(x, y)
+    lower_gamma_reg_many(x, y)
+    upper_gamma_many(x, y)
+    log_upper_gamma_many(x, y)
+    upper_gamma_reg_many(x, y)
+    beta_incomplete_many(z, x, y)
+    log_beta_incomplete_many(z, x, y)
+    beta_incomplete_reg_many(z, x, y)
+        batch versions of the respective functions above, each argument is
+        either a real number or a batch of real numbers (sequence, array or
+        buffer) -> list(float) OR numpy.ndarray
+
+Classes:
+    IncompleteGamma
+        incomplete gamma functions with the frozen power parameter
+    IncompleteBeta
+        incomplete beta functions with the frozen shape parameters
+
+All incomplete gamma and beta functions, including the batch versions,
+accept the optional keyword argument Tolerance - the relative precision of
+the convergence criteria, as a float or as the name of a preset: 'fast',
+'default' or 'precise'.
 """
 
-__version__= '1.0.0.0'
-__date__ = '20-04-2023'
+__version__= '1.5.0.0'
+__date__ = '17-10-2026'
 __status__ = 'Production'
 
 #imports
@@ -50,6 +85,17 @@ import sys
 import os
 import math
 
+from itertools import repeat
+
+from typing import Union, List, Tuple, Any, Callable, Sequence, Optional
+
+#+ 3rd party libraries (optional)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 #+ custom modules
 
 MODULE_PATH = os.path.realpath(__file__)
@@ -63,7 +109,15 @@ if not (ROOT_FOLDER in sys.path):
 
 from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
 
-from .polynomial import RationalFunction, TReal
+from .polynomial import TReal, TRealBatch, _ParseRealBatch
+
+#types
+
+TRealArgument = Union[TReal, TRealBatch]
+
+TRealResult = Union[List[float], Any]
+
+TTolerance = Union[float, str]
 
 #globals
 
@@ -151,6 +205,240 @@ Q2_INV_ERF = (
     2.04426310338993978564E-15,
 )
 
+#++ uniform asymptotic expansion of the incomplete gamma functions
+
+#+++ coefficients d(k, n) of C_k(eta) = sum(d(k, n) * eta^n), k = 0 .. 9
+
+TEMME_D = (
+    ( #C_0(eta)
+        -3.3333333333333333333E-1,
+        8.3333333333333333333E-2,
+        -1.4814814814814814815E-2,
+        1.1574074074074074074E-3,
+        3.5273368606701940035E-4,
+        -1.7875514403292181070E-4,
+        3.9192631785224377817E-5,
+        -2.1854485106799921615E-6,
+        -1.8540622107151599607E-6,
+        8.2967113409530860050E-7,
+        -1.7665952736826079304E-7,
+        6.7078535434014985804E-9,
+        1.0261809784240308043E-8,
+        -4.3820360184533531866E-9,
+        9.1476995822367902342E-10,
+        -2.5514193994946249767E-11,
+        -5.8307721325504250675E-11,
+        2.4361948020667416244E-11,
+        -5.0276692801141755891E-12,
+        1.1004392031956134771E-13,
+    ),
+    ( #C_1(eta)
+        -1.8518518518518518519E-3,
+        -3.4722222222222222222E-3,
+        2.6455026455026455026E-3,
+        -9.9022633744855967078E-4,
+        2.0576131687242798354E-4,
+        -4.0187757201646090535E-7,
+        -1.8098550334489977837E-5,
+        7.6491609160811100846E-6,
+        -1.6120900894563446004E-6,
+        4.6471278028074343423E-9,
+        1.3786334469157209593E-7,
+        -5.7525456035177049640E-8,
+        1.1951628599778147324E-8,
+        -1.7543241719747647624E-11,
+        -1.0091543710600412627E-9,
+        4.1627929918425826362E-10,
+        -8.5639070264929806381E-11,
+        6.0672151016047586151E-14,
+        7.1624989648114853901E-12,
+        -2.9331866437714371174E-12,
+    ),
+    ( #C_2(eta)
+        4.1335978835978835979E-3,
+        -2.6813271604938271605E-3,
+        7.7160493827160493827E-4,
+        2.0093878600823045267E-6,
+        -1.0736653226365160522E-4,
+        5.2923448829120125416E-5,
+        -1.2760635188618727713E-5,
+        3.4235787340961380742E-8,
+        1.3721957309062933206E-6,
+        -6.2989921383800550229E-7,
+        1.4280614206064241792E-7,
+        -2.0477098421990866015E-10,
+        -1.4092529910867521053E-8,
+        6.2289740849220220336E-9,
+        -1.3670488396617113499E-9,
+        9.4283561590146781955E-13,
+        1.2872252400089318060E-10,
+        -5.5645956134363321147E-11,
+        1.1975935546366981004E-11,
+        -4.1689782251838635040E-15,
+    ),
+    ( #C_3(eta)
+        6.4943415637860082305E-4,
+        2.2947209362139917695E-4,
+        -4.6918949439525571213E-4,
+        2.6772063206283885296E-4,
+        -7.5618016718839764107E-5,
+        -2.3965051138672966519E-7,
+        1.1082654115347302361E-5,
+        -5.6749528269915965675E-6,
+        1.4230900732435883915E-6,
+        -2.7861080291528142241E-11,
+        -1.6958404091930277290E-7,
+        8.0994649053880823634E-8,
+        -1.9111168485973654061E-8,
+        2.3928620439808117969E-12,
+        2.0620131815488798437E-9,
+        -9.4604966618551321738E-10,
+        2.1541049775774907838E-10,
+        -1.3888233368139030460E-14,
+        -2.1894761681963939406E-11,
+        9.7909989511716851257E-12,
+    ),
+    ( #C_4(eta)
+        -8.6188829091671169860E-4,
+        7.8403922172006662747E-4,
+        -2.9907248030319017973E-4,
+        -1.4638452578843418178E-6,
+        6.6414982154651221867E-5,
+        -3.9683650471794346644E-5,
+        1.1375726970678419098E-5,
+        2.5074972262375328017E-10,
+        -1.6954149536558306015E-6,
+        8.9075075322053096888E-7,
+        -2.2929348340008048706E-7,
+        2.9567941375440490470E-11,
+        2.8865829742708783630E-8,
+        -1.4189739437803219389E-8,
+        3.4463580499464897066E-9,
+        -2.3024517174528067132E-13,
+        -3.9409233028046405275E-10,
+        1.8602338968504501913E-10,
+        -4.3563230050566180438E-11,
+        1.2786001016296231266E-15,
+    ),
+    ( #C_5(eta)
+        -3.3679855336635815031E-4,
+        -6.9728137583658577743E-5,
+        2.7727532449593920787E-4,
+        -1.9932570516188847700E-4,
+        6.7977804779372078388E-5,
+        1.4190629206439670148E-7,
+        -1.3594048189768693278E-5,
+        8.0184702563342015397E-6,
+        -2.2914811765080951704E-6,
+        -3.2524735512984539517E-10,
+        3.4652846491085264956E-7,
+        -1.8447187191171343277E-7,
+        4.8240967037894180756E-8,
+        -1.7989466721743515303E-14,
+        -6.3061945000135234352E-9,
+        3.1624176287745679377E-9,
+        -7.8409242536974292900E-10,
+        5.1926791652540407238E-15,
+        9.3589442423067835846E-11,
+        -4.5134262161632782310E-11,
+    ),
+    ( #C_6(eta)
+        5.3130793646399222317E-4,
+        -5.9216643735369388286E-4,
+        2.7087820967180448277E-4,
+        7.9023532326603278721E-7,
+        -8.1539693675619687509E-5,
+        5.6116827531062496500E-5,
+        -1.8329116582843375567E-5,
+        -3.0796134506033047826E-9,
+        3.4651553688036090867E-6,
+        -2.0291327396058603727E-6,
+        5.7887928631490037089E-7,
+        2.3386306738266569893E-13,
+        -8.8286007463304835251E-8,
+        4.7435958880408127803E-8,
+        -1.2545415020710382446E-8,
+        8.6496488580102924713E-14,
+        1.6846058979264062708E-9,
+        -8.5754928235775947286E-10,
+        2.1598224929232125188E-10,
+        -7.6132305204761538683E-16,
+    ),
+    ( #C_7(eta)
+        3.4436760689237767125E-4,
+        5.1717909082605921934E-5,
+        -3.3493161081142236312E-4,
+        2.8126951547632370227E-4,
+        -1.0976582244684731024E-4,
+        -1.2741009095484485379E-7,
+        2.7744451511563644157E-5,
+        -1.8263488805711332661E-5,
+        5.7876949497350523989E-6,
+        4.9387589339362703998E-10,
+        -1.0595367014026042734E-6,
+        6.1667143761104074786E-7,
+        -1.7562973359060461938E-7,
+        -1.2974473287015438707E-12,
+        2.6954236062889659837E-8,
+        -1.4578352908731270977E-8,
+        3.8876459593861749981E-9,
+        -3.8810022510194121255E-17,
+        -5.3279941738772867209E-10,
+        2.7437977643314845126E-10,
+    ),
+    ( #C_8(eta)
+        -6.5262391859530941892E-4,
+        8.3949872067208727999E-4,
+        -4.3829709854172100506E-4,
+        -6.9690914584205519714E-7,
+        1.6644846642067547837E-4,
+        -1.2783517679769218585E-4,
+        4.6299532636913042906E-5,
+        4.5579098679227077116E-9,
+        -1.0595271125805195472E-5,
+        6.7833429048651666227E-6,
+        -2.1075476666258804247E-6,
+        -1.7213731432817144999E-11,
+        3.7735877416110979338E-7,
+        -2.1867506700122866558E-7,
+        6.2202288040189269058E-8,
+        6.5977038267330006134E-16,
+        -9.5903864974256857713E-9,
+        5.2132144922808077659E-9,
+        -1.3991589583935708555E-9,
+        5.3820589990605749639E-16,
+    ),
+    ( #C_9(eta)
+        -5.9676129019274625012E-4,
+        -7.2048954160200105591E-5,
+        6.7823088376673283616E-4,
+        -6.4014752602627584510E-4,
+        2.7750107634328704499E-4,
+        1.8197008380465151046E-7,
+        -8.4795071170685031824E-5,
+        6.1051920825015310176E-5,
+        -2.1073920183404862408E-5,
+        -8.8585890141255993892E-10,
+        4.5284535953805377111E-6,
+        -2.8427815022504407938E-6,
+        8.7082341778646411676E-7,
+        3.6886101871706965492E-12,
+        -1.5344695190702061038E-7,
+        8.8624667787906949757E-8,
+        -2.5184812301826817334E-8,
+        -1.0225912098215092431E-14,
+        3.8969470758154776713E-9,
+        -2.1267304792235634729E-9,
+    ),
+)
+
+#the coefficients are calculated exactly (as rational numbers) from the
+#+ recurrence C_k(eta) = C_(k-1)'(eta) / eta + (-1)^k * g_k / (lambda - 1),
+#+ see N.M. Temme. The asymptotic expansion of the incomplete gamma
+#+ functions. SIAM J. Math. Anal. 10 (1979), pp. 757-766; within the region
+#+ of application of the expansion the truncated terms are below the double
+#+ precision
+
 #+ precision and iteration related
 
 MAX_ITERATION = 10000
@@ -168,6 +456,20 @@ MIN_FLOAT = 1.0E-60
 #+ single precision float min value; no reason to set it near 2.2E-308 for
 #+ double precision.
 
+MIN_TOLERANCE = 1.0E-15
+
+#smallest acceptable relative precision of series convergence criteria, few
+#+ units of the double precision machine epsilon
+
+TOLERANCE_PRESETS = {
+    'fast' : 1.0E-4,
+    'default' : REL_PRECISION,
+    'precise' : 1.0E-14
+}
+
+#named relative precision values accepted by the incomplete gamma and beta
+#+ functions instead of an explicit float value
+
 #+ inverse error function boundaries
 
 IERF_SPLIT1 = 0.425E0
@@ -175,25 +477,76 @@ IERF_CONST1 = 0.180625E0
 IERF_SPLIT2 = 5.0E0
 IERF_CONST2 = 1.6E0
 
-#functions
+INV_SQRT2 = 1.0 / math.sqrt(2) #conversion of normal quantile into inv_erf
 
-#+ helper functions
+#+ uniform asymptotic expansion of the incomplete gamma functions boundaries
 
-#++ rational approximations for the inverse error function
+TEMME_MIN_X = 20.0 #minimum power parameter x
+
+TEMME_MAX_RATIO = 0.3 #maximum |y - x| / x
 
-#+++ central part abs(x) <= 0.85
+TEMME_MAX_DEVIATION = 30.0 #maximum |y - x| / sqrt(x), prevents underflow
 
-_InvErfRat0 = RationalFunction(P0_INV_ERF, Q0_INV_ERF)
+INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi) #normalization of the remainder
 
-#+++ tails  0.85 < abs(x) <= 1 - 2.77759E-11
+#+ batch processing related
+
+HAS_NUMPY = not (np is None) #NumPy backend is used if it is installed
+
+CHUNK_SIZE = 65536 #number of elements processed at once by NumPy backend
+
+#functions
 
-_InvErfRat1 = RationalFunction(P1_INV_ERF, Q1_INV_ERF)
+#+ helper functions
 
-#+++ far tails 1 - 2.77759E-11 < abs(x) < 1
+#++ rational approximations for the inverse error function
 
-_InvErfRat2 = RationalFunction(P2_INV_ERF, Q2_INV_ERF)
+def _invNormQuantile(q: float, Tail: float) -> float:
+    """
+    Calculates the quantile of the standard normal distribution using the
+    AS241 algorithm. The rational functions are evaluated with the inlined
+    Horner scheme on the flat tuples of the coefficients, since this function
+    is the computational kernel of both inv_erf() and inv_norm_cdf(). Note,
+    that the data sanity check is not implemented, but it is supposed to be
+    incorporated into the higher abstraction level functions.
+    
+    Signature:
+        -0.5 < float < 0.5, 0 < float <= 0.5 -> float
+    
+    Args:
+        q: -0.5 < float < 0.5; the probability minus 0.5
+        Tail: 0 < float <= 0.5; the tail probability, i.e. 0.5 - abs(q)
+    
+    Version 1.0.0.0
+    """
+    IsCentral = - IERF_SPLIT1 <= q <= IERF_SPLIT1
+    if IsCentral:
+        r = IERF_CONST1 - q * q
+        a0, a1, a2, a3, a4, a5, a6, a7 = P0_INV_ERF
+        b0, b1, b2, b3, b4, b5, b6, b7 = Q0_INV_ERF
+    else:
+        r = math.sqrt(- math.log(Tail))
+        if r <= IERF_SPLIT2:
+            r -= IERF_CONST2
+            a0, a1, a2, a3, a4, a5, a6, a7 = P1_INV_ERF
+            b0, b1, b2, b3, b4, b5, b6, b7 = Q1_INV_ERF
+        else:
+            r -= IERF_SPLIT2
+            a0, a1, a2, a3, a4, a5, a6, a7 = P2_INV_ERF
+            b0, b1, b2, b3, b4, b5, b6, b7 = Q2_INV_ERF
+    Numerator = (((((((a7 * r + a6) * r + a5) * r + a4) * r + a3) * r
+                                                  + a2) * r + a1) * r + a0)
+    Denominator = (((((((b7 * r + b6) * r + b5) * r + b4) * r + b3) * r
+                                                  + b2) * r + b1) * r + b0)
+    Result = Numerator / Denominator
+    if IsCentral:
+        Result *= q
+    elif q < 0:
+        Result = - Result
+    return Result
 
-def _gammaSeries(x: TReal, y : TReal) -> float:
+def _gammaSeries(x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION) -> Tuple[float, int]:
     """
     Calculates the series part of the lower incomplete gamma function. Note,
     that the data sanity check is not implemented, but it is supposed to be
@@ -206,32 +559,40 @@ def _gammaSeries(x: TReal, y : TReal) -> float:
     2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
     
     Signature:
-        int > 0 OR float > 0, int > 0 OR float > 0 -> float > 0
+        int > 0 OR float > 0, int > 0 OR float > 0/, 0 < float < 1/
+            -> tuple(float > 0, int > 0)
     
     Args:
         x: int > 0 OR float > 0; power parameter of the function
         y: int > 0 OR float > 0; the integeral boundary parameter of the
             function
+        Tolerance: (optional) 0 < float < 1; the relative precision of the
+            convergence criterion, defaults to REL_PRECISION
+    
+    Returns:
+        tuple(float > 0, int > 0): the calculated value and the number of
+            the performed iterations
     
     Raises:
         Exception: maximum number of iteration is reached
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     Coeff = x
     Term = 1.0 / x
     Sum = Term
-    for _ in range(1, MAX_ITERATION):
+    for Iteration in range(1, MAX_ITERATION):
         Coeff += 1
         Term *= y / Coeff
         Sum += Term
-        if math.fabs(Term) < REL_PRECISION * math.fabs(Sum):
+        if math.fabs(Term) < Tolerance * math.fabs(Sum):
             break
     else: #max number of iterations is reached - error
         raise Exception('Unable to converge the gamma series')
-    return Sum
+    return Sum, Iteration
 
-def _gammaContFraction(x: TReal, y : TReal) -> float:
+def _gammaContFraction(x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION) -> Tuple[float, int]:
     """
     Calculates the continued fraction part of the upper incomplete gamma
     function. Note, that the data sanity check is not implemented, but it is
@@ -244,17 +605,24 @@ def _gammaContFraction(x: TReal, y : TReal) -> float:
     2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
     
     Signature:
-        int > 0 OR float > 0, int > 0 OR float > 0 -> float > 0
+        int > 0 OR float > 0, int > 0 OR float > 0/, 0 < float < 1/
+            -> tuple(float > 0, int > 0)
     
     Args:
         x: int > 0 OR float > 0; power parameter of the function
         y: int > 0 OR float > 0; the integeral boundary parameter of the
             function
+        Tolerance: (optional) 0 < float < 1; the relative precision of the
+            convergence criterion, defaults to REL_PRECISION
+    
+    Returns:
+        tuple(float > 0, int > 0): the calculated value and the number of
+            the performed iterations
     
     Raises:
         Exception: maximum number of iteration is reached
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     b = 1.0 + y - x
     c = 1.0 / MIN_FLOAT
@@ -272,13 +640,14 @@ def _gammaContFraction(x: TReal, y : TReal) -> float:
         d = 1.0 / d
         res = d * c
         h *= res
-        if math.fabs(res - 1.0) < REL_PRECISION:
+        if math.fabs(res - 1.0) < Tolerance:
             break
     else: #max number of iterations is reached - error
         raise Exception('Unable to converge the gamma series')
-    return h
+    return h, i
 
-def _betaContFraction(z: float, x: TReal, y : TReal) -> float:
+def _betaContFraction(z: float, x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION) -> Tuple[float, int]:
     """
     Calculates the continued fraction part of the incomplete beta function.
     Note, that the data sanity check is not implemented, but it is supposed to
@@ -291,17 +660,24 @@ def _betaContFraction(z: float, x: TReal, y : TReal) -> float:
     2nd Ed. Cambridge University Press (1992), pp. 226-228. ISBN: 0-521-43108-5
     
     Signature:
-        0 < float < 1, int > 0 OR float > 0, int > 0 OR float > 0 -> float > 0
+        0 < float < 1, int > 0 OR float > 0, int > 0 OR float > 0
+            /, 0 < float < 1/ -> tuple(float > 0, int > 0)
     
     Args:
         z: 0 < float < 1; the integeral boundary parameter of the function
         x: int > 0 OR float > 0; the first power parameter of the function
         y: int > 0 OR float > 0; the second power parameter of the function
+        Tolerance: (optional) 0 < float < 1; the relative precision of the
+            convergence criterion, defaults to REL_PRECISION
+    
+    Returns:
+        tuple(float > 0, int > 0): the calculated value and the number of
+            the performed iterations
     
     Raises:
         Exception: maximum number of iteration is reached
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     qab = x + y
     qap = x + 1.0
@@ -333,11 +709,98 @@ def _betaContFraction(z: float, x: TReal, y : TReal) -> float:
         d = 1.0 / d
         res = d * c
         h *= res
-        if math.fabs(res - 1.0) < REL_PRECISION:
+        if math.fabs(res - 1.0) < Tolerance:
             break
     else: #max number of iterations is reached - error
         raise Exception('Unable to converge the gamma series')
-    return h
+    return h, m
+
+#++ uniform asymptotic expansion of the incomplete gamma functions
+
+def _isTemmeRegion(x: TReal, y: TReal) -> bool:
+    """
+    Checks if the uniform asymptotic expansion should be used instead of the
+    series or the continued fraction for the incomplete gamma functions, i.e.
+    the power parameter is large, and the integral boundary parameter is
+    close to it (near the transition region), where the number of iterations
+    of the series and continued fraction grows as the square root of x.
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float >= 0 -> bool
+    
+    Version 1.0.0.0
+    """
+    Result = x > TEMME_MIN_X
+    if Result:
+        Result = abs(y - x) < x * min(TEMME_MAX_RATIO,
+                                            TEMME_MAX_DEVIATION / math.sqrt(x))
+    return Result
+
+def _gammaTemme(x: TReal, y: TReal, IsUpper: bool,
+                    Tolerance: float = REL_PRECISION) -> Tuple[float, int]:
+    """
+    Calculates the regularized lower P(x, y) or upper Q(x, y) incomplete gamma
+    function using the uniform asymptotic expansion:
+    
+    Q(x, y) = erfc(eta * sqrt(x / 2)) / 2 + R(x, eta),
+    P(x, y) = erfc(- eta * sqrt(x / 2)) / 2 - R(x, eta),
+    R(x, eta) = exp(- x * eta^2 / 2) / sqrt(2 * pi * x) *
+                                                sum(C_k(eta) / x^k, k = 0 ...),
+    
+    where eta^2 / 2 = lambda - 1 - ln(lambda), lambda = y / x, and the sign of
+    eta is the sign of (lambda - 1). The summation stops when the relative
+    contribution of a term is less than the tolerance, or after the last term
+    defined in TEMME_D, thus the number of terms is bounded. Note, that the
+    data sanity check is not implemented, and the function is supposed to be
+    called only with the arguments in the region of application of the
+    expansion, see the function _isTemmeRegion().
+    
+    Based on the algorithm given in:
+    
+    N.M. Temme. The asymptotic expansion of the incomplete gamma functions.
+    SIAM J. Math. Anal. 10 (1979), pp. 757-766
+    
+    Signature:
+        int > 0 OR float > 0, int > 0 OR float > 0, bool/, 0 < float < 1/
+            -> tuple(0 < float < 1, int > 0)
+    
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int > 0 OR float > 0; the integeral boundary parameter of the
+            function
+        IsUpper: bool; flag if the upper (True) or lower (False) function is
+            calculated
+        Tolerance: (optional) 0 < float < 1; the relative precision of the
+            convergence criterion, defaults to REL_PRECISION
+    
+    Returns:
+        tuple(0 < float < 1, int > 0): the calculated value and the number of
+            the used terms of the expansion
+    
+    Version 1.0.0.0
+    """
+    Mu = (y - x) / x
+    Eta = math.sqrt(2.0 * (Mu - math.log1p(Mu)))
+    if Mu < 0:
+        Eta = - Eta
+    Sum = 0.0
+    Power = 1.0
+    for Iteration, Coefficients in enumerate(TEMME_D, 1):
+        Term = Coefficients[-1]
+        for Coefficient in Coefficients[-2::-1]:
+            Term = Term * Eta + Coefficient
+        Term *= Power
+        Sum += Term
+        if math.fabs(Term) < Tolerance * math.fabs(Sum):
+            break
+        Power /= x
+    Remainder = math.exp(-0.5 * x * Eta * Eta) * INV_SQRT_2PI * Sum
+    Remainder /= math.sqrt(x)
+    if IsUpper:
+        Result = 0.5 * math.erfc(Eta * math.sqrt(0.5 * x)) + Remainder
+    else:
+        Result = 0.5 * math.erfc(- Eta * math.sqrt(0.5 * x)) - Remainder
+    return Result, Iteration
 
 #++ input data checks for permutation and combination functions
 
@@ -370,58 +833,71 @@ def _checkSanity1(n: int, k: int) -> None:
 
 #++ input data check for log lower gamma, beta and log beta functions
 
-def _checkSanity2(x: TReal, y: TReal) -> None:
+def _checkSanity2(x: TReal, y: TReal, *,
+                                            SkipFrames: int = 2) -> None:
     """
     Performs the input data sanity check - the both arguments must be positive
     real numbers.
     
     Signature:
-        int > 0 OR float > 0, int > 0 OR float > 0 -> None
+        int > 0 OR float > 0, int > 0 OR float > 0 /, *, int > 0/ -> None
+    
+    Args:
+        SkipFrames: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
     
     Raises:
         UT_TypeError: either of the arguments is neither integer nor float
         UT_ValueError: either of the arguments is zero or negative
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(x, (int, float)):
-        raise UT_TypeError(x, (int, float), SkipFrames = 2)
+        raise UT_TypeError(x, (int, float), SkipFrames = SkipFrames)
     if not isinstance(y, (int, float)):
-        raise UT_TypeError(y, (int, float), SkipFrames = 2)
+        raise UT_TypeError(y, (int, float), SkipFrames = SkipFrames)
     if x <= 0:
-        raise UT_ValueError(x, '> 0, x argument', SkipFrames = 2)
+        raise UT_ValueError(x, '> 0, x argument', SkipFrames = SkipFrames)
     if y <= 0:
-        raise UT_ValueError(y, '> 0, y argument', SkipFrames = 2)
+        raise UT_ValueError(y, '> 0, y argument', SkipFrames = SkipFrames)
 
 #++ input data checks for the rest of gamma functions
 
-def _checkSanity3(x: TReal, y: TReal) -> None:
+def _checkSanity3(x: TReal, y: TReal, *,
+                                            SkipFrames: int = 2) -> None:
     """
     Performs the input data sanity check - the first argument must be positive
     real number, and the second - non-negative real number.
     
     Signature:
-        int > 0 OR float > 0, int >= 0 OR float > 0 -> None
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, *, int > 0/ -> None
+    
+    Args:
+        SkipFrames: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
     
     Raises:
         UT_TypeError: either of the arguments is neither integer nor float
         UT_ValueError: either of the arguments is negative, OR the first
             argument is zero
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(x, (int, float)):
-        raise UT_TypeError(x, (int, float), SkipFrames = 2)
+        raise UT_TypeError(x, (int, float), SkipFrames = SkipFrames)
     if not isinstance(y, (int, float)):
-        raise UT_TypeError(y, (int, float), SkipFrames = 2)
+        raise UT_TypeError(y, (int, float), SkipFrames = SkipFrames)
     if x <= 0:
-        raise UT_ValueError(x, '> 0, x argument', SkipFrames = 2)
+        raise UT_ValueError(x, '> 0, x argument', SkipFrames = SkipFrames)
     if y < 0:
-        raise UT_ValueError(y, '>= 0, y argument', SkipFrames = 2)
+        raise UT_ValueError(y, '>= 0, y argument', SkipFrames = SkipFrames)
 
 #++ input data checks for incomplete beta functions
 
-def _checkSanity4(z: TReal, x: TReal, y: TReal) -> None:
+def _checkSanity4(z: TReal, x: TReal, y: TReal, *,
+                                            SkipFrames: int = 2) -> None:
     """
     Performs the input data sanity check - the first argument must be a real
     number in the closed range [0, 1], the other two arguments must be positive
@@ -429,29 +905,36 @@ def _checkSanity4(z: TReal, x: TReal, y: TReal) -> None:
     
     Signature:
         0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
-            int > 0 OR float > 0 -> None
+            int > 0 OR float > 0 /, *, int > 0/ -> None
+    
+    Args:
+        SkipFrames: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
     
     Raises:
         UT_TypeError: either of the arguments is neither integer nor float
         UT_ValueError: the first argument is not in the range [0, 1], OR either
             of the other arguments is zero or negative
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(z, (int, float)):
-        raise UT_TypeError(z, (int, float), SkipFrames = 2)
+        raise UT_TypeError(z, (int, float), SkipFrames = SkipFrames)
     if not isinstance(x, (int, float)):
-        raise UT_TypeError(x, (int, float), SkipFrames = 2)
+        raise UT_TypeError(x, (int, float), SkipFrames = SkipFrames)
     if not isinstance(y, (int, float)):
-        raise UT_TypeError(y, (int, float), SkipFrames = 2)
+        raise UT_TypeError(y, (int, float), SkipFrames = SkipFrames)
     if z < 0 or z > 1:
-        raise UT_ValueError(z, 'in range [0, 1], z argument', SkipFrames = 2)
+        raise UT_ValueError(z, 'in range [0, 1], z argument',
+                                                    SkipFrames = SkipFrames)
     if x <= 0:
-        raise UT_ValueError(x, '> 0, x argument', SkipFrames = 2)
+        raise UT_ValueError(x, '> 0, x argument', SkipFrames = SkipFrames)
     if y <= 0:
-        raise UT_ValueError(y, '> 0, y argument', SkipFrames = 2)
+        raise UT_ValueError(y, '> 0, y argument', SkipFrames = SkipFrames)
 
-def _checkSanity5(z: TReal, x: TReal, y: TReal) -> None:
+def _checkSanity5(z: TReal, x: TReal, y: TReal, *,
+                                            SkipFrames: int = 2) -> None:
     """
     Performs the input data sanity check - the first argument must be a real
     number in the semi-closed range (0, 1], the other two arguments must be
@@ -459,529 +942,3014 @@ def _checkSanity5(z: TReal, x: TReal, y: TReal) -> None:
     
     Signature:
         0 < int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
-            int > 0 OR float > 0 -> None
+            int > 0 OR float > 0 /, *, int > 0/ -> None
+    
+    Args:
+        SkipFrames: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
     
     Raises:
         UT_TypeError: either of the arguments is neither integer nor float
         UT_ValueError: the first argument is not in the range (0, 1], OR either
             of the other arguments is zero or negative
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(z, (int, float)):
-        raise UT_TypeError(z, (int, float), SkipFrames = 2)
+        raise UT_TypeError(z, (int, float), SkipFrames = SkipFrames)
     if not isinstance(x, (int, float)):
-        raise UT_TypeError(x, (int, float), SkipFrames = 2)
+        raise UT_TypeError(x, (int, float), SkipFrames = SkipFrames)
     if not isinstance(y, (int, float)):
-        raise UT_TypeError(y, (int, float), SkipFrames = 2)
+        raise UT_TypeError(y, (int, float), SkipFrames = SkipFrames)
     if z <= 0 or z > 1:
-        raise UT_ValueError(z, 'in range (0, 1], z argument', SkipFrames = 2)
+        raise UT_ValueError(z, 'in range (0, 1], z argument',
+                                                    SkipFrames = SkipFrames)
     if x <= 0:
-        raise UT_ValueError(x, '> 0, x argument', SkipFrames = 2)
+        raise UT_ValueError(x, '> 0, x argument', SkipFrames = SkipFrames)
     if y <= 0:
-        raise UT_ValueError(y, '> 0, y argument', SkipFrames = 2)
+        raise UT_ValueError(y, '> 0, y argument', SkipFrames = SkipFrames)
 
-#+ main set of functions
+#++ input data check for inverse error function
 
-def permutation(n: int, k: int) -> int:
+def _checkSanity6(x: TReal, *, SkipFrames: int = 2) -> None:
     """
-    Calculates 'n permute k' value, i.e. n! / (n-k)!
-
+    Performs the input data sanity check - the argument must be a real number
+    in the open range (-1, 1).
+    
     Signature:
-        int >= 0 , int >= 0 -> int > 0
+        int = 0 OR -1 < float < 1 /, *, int > 0/ -> None
     
     Args:
-        n: int >= 0; the total number of objects available
-        k: int >= 0; the number of objects taken
+        SkipFrames: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
     
     Raises:
-        UT_TypeError: either of the arguments is not integer
-        UT_ValueError: either of the arguments is negative, or k > n
+        UT_TypeError: the argument is not integer or float
+        UT_ValueError: the argument is not in the range (-1, 1)
     
     Version 1.0.0.0
     """
-    _checkSanity1(n, k)
-    if IS_V3_8_PLUS:
-        Result = math.perm(n, k)
-    else:
-        if k > 0:
-            Result = n
-            for i in range(1, k):
-                Result *= (n - i)
-        else:
-            Result = 1
-    return Result
+    if not isinstance(x, (int, float)):
+        raise UT_TypeError(x, (int, float), SkipFrames = SkipFrames)
+    if (x >= 1) or (x <= -1):
+        raise UT_ValueError(x, 'in range (-1, 1)', SkipFrames = SkipFrames)
 
-def combination(n: int, k: int) -> int:
-    """
-    Calculates 'n chose k' value, i.e. n! / ((n-k)! k!)
+#++ input data check for inverse normal CDF
 
+def _checkSanity7(p: TReal, *, SkipFrames: int = 2) -> None:
+    """
+    Performs the input data sanity check - the argument must be a real number
+    in the open range (0, 1).
+    
     Signature:
-        int >= 0 , int >= 0 -> int > 0
+        0 < float < 1 /, *, int > 0/ -> None
     
     Args:
-        n: int >= 0; the total number of objects available
-        k: int >= 0; the number of objects taken
+        SkipFrames: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
     
     Raises:
-        UT_TypeError: either of the arguments is not integer
-        UT_ValueError: either of the arguments is negative, or k > n
+        UT_TypeError: the argument is not integer or float
+        UT_ValueError: the argument is not in the range (0, 1)
     
     Version 1.0.0.0
     """
-    _checkSanity1(n, k)
-    if IS_V3_8_PLUS:
-        Result = math.comb(n, k)
-    else:
-        if k > n - k:
-            Result = permutation(n, n - k) // math.factorial(n - k)
-        else:
-            Result = permutation(n, k) // math.factorial(k)
-    return Result
+    if not isinstance(p, (int, float)):
+        raise UT_TypeError(p, (int, float), SkipFrames = SkipFrames)
+    if (p >= 1) or (p <= 0):
+        raise UT_ValueError(p, 'in range (0, 1)', SkipFrames = SkipFrames)
 
-def log_beta(x: TReal, y: TReal) -> float:
-    """
-    The value of the natural logarithm of beta function ln(B(x, y)).
+#++ input data check and conversion of the convergence tolerance
 
+def _parseTolerance(Tolerance: TTolerance, *, SkipFrames: int = 2) -> float:
+    """
+    Checks the requested relative precision of the series and continued
+    fractions convergence criteria and converts it into a float value. The
+    tolerance is either a float in the range [MIN_TOLERANCE, 1) or the name
+    of one of the presets defined in TOLERANCE_PRESETS: 'fast', 'default' or
+    'precise'.
+    
     Signature:
-        int > 0 OR float > 0, int > 0 OR float > 0 -> float
+        MIN_TOLERANCE <= float < 1 OR str /, *, int > 0/ -> 0 < float < 1
     
     Args:
-        x: int > 0 OR float > 0; any real number first argument
-        y: int > 0 OR float > 0; any real number second argument
+        Tolerance: MIN_TOLERANCE <= float < 1 OR str; the relative precision
+            value or the name of the preset
+        SkipFrames: (keyword) int > 0; a number of frames to be hidden in the
+            raised exceptions, defaults to 2 as this function is supposed to
+            be called from another function
+    
+    Returns:
+        0 < float < 1: the relative precision value
     
     Raises:
-        UT_TypeError: either of the arguments is not integer or float
-        UT_ValueError: either of the arguments is not positive
+        UT_TypeError: the tolerance is neither float nor string
+        UT_ValueError: the tolerance is not in the range [MIN_TOLERANCE, 1),
+            OR it is not a name of a preset
     
     Version 1.0.0.0
     """
-    _checkSanity2(x, y)
-    Result = math.lgamma(x) + math.lgamma(y) - math.lgamma(x + y)
+    if isinstance(Tolerance, str):
+        if not (Tolerance in TOLERANCE_PRESETS):
+            raise UT_ValueError(Tolerance, 'one of {}, tolerance'.format(
+                        sorted(TOLERANCE_PRESETS)), SkipFrames = SkipFrames)
+        Result = TOLERANCE_PRESETS[Tolerance]
+    elif isinstance(Tolerance, float):
+        if (Tolerance < MIN_TOLERANCE) or (Tolerance >= 1):
+            raise UT_ValueError(Tolerance,
+                        'in range [{}, 1), tolerance'.format(MIN_TOLERANCE),
+                                                    SkipFrames = SkipFrames)
+        Result = Tolerance
+    else:
+        raise UT_TypeError(Tolerance, (float, str), SkipFrames = SkipFrames)
     return Result
 
-def beta(x: TReal, y: TReal) -> float:
-    """
-    The value of beta function B(x, y).
+#++ unchecked implementations of the main functions
 
+def _logBeta(x: TReal, y: TReal) -> float:
+    """
+    Unchecked implementation of the function log_beta(). The data sanity
+    check is not performed, it is supposed to be done by the caller.
+    
     Signature:
-        int > 0 OR float > 0, int > 0 OR float > 0 -> float > 0
+        int > 0 OR float > 0, int > 0 OR float > 0 -> float
     
-    Args:
-        x: int > 0 OR float > 0; any real number first argument
-        y: int > 0 OR float > 0; any real number second argument
+    Version 1.0.0.0
+    """
+    Result = math.lgamma(x) + math.lgamma(y) - math.lgamma(x + y)
+    return Result
+
+def _beta(x: TReal, y: TReal) -> float:
+    """
+    Unchecked implementation of the function beta(). The data sanity check
+    is not performed, it is supposed to be done by the caller.
     
-    Raises:
-        UT_TypeError: either of the arguments is not integer or float
-        UT_ValueError: either of the arguments is not positive
+    Signature:
+        int > 0 OR float > 0, int > 0 OR float > 0 -> float > 0
     
     Version 1.0.0.0
     """
-    _checkSanity2(x, y)
     Result = math.lgamma(x) + math.lgamma(y) - math.lgamma(x + y)
     return math.exp(Result)
 
-def inv_erf(x: TReal) -> float:
+def _invErf(x: TReal) -> float:
     """
-    Calculates the value of the inverse error function of the given argument.
-    
-    Based on the algorithm given in:
-    
-    Michael J. Wichura. Algorithm AS241: The Percentage Points of the Normal
-    Distribution. Journal of Royal Statistical Society. Series C (Applied
-    Statistics), Vol. 37, No. 3 (1988), pp. 477-484
-    
-    which is 3 ranges rational function approximation with double precision
-    (7th power polynomials).
+    Unchecked implementation of the function inv_erf(). The data sanity
+    check is not performed, it is supposed to be done by the caller.
     
     Signature:
         int = 0 OR -1 < float < 1 -> float
     
-    Raises:
-        UT_TypeError: the argument is not integer or float
-        UT_ValueError: the argument is not in the range (-1, 1)
-    
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    if not isinstance(x, (int, float)):
-        raise UT_TypeError(x, (int, float), SkipFrames = 1)
-    if (x >= 1) or (x <= -1):
-        raise UT_ValueError(x, 'in range (-1, 1)', SkipFrames = 1)
-    q = 0.5 * x
-    if abs(q) <= IERF_SPLIT1:
-        r = IERF_CONST1 - q*q
-        Result = q * _InvErfRat0(r)
-    else:
-        if x < 0:
-            r = math.sqrt(- math.log(0.5 * (x + 1.0)))
-        else:
-            r = math.sqrt(- math.log(0.5 * (1.0 - x)))
-        if r <= IERF_SPLIT2:
-            r -= IERF_CONST2
-            Result = _InvErfRat1(r)
-        else:
-            r -= IERF_SPLIT2
-            Result = _InvErfRat2(r)
-        if x < 0:
-            Result = - Result
-    return Result / math.sqrt(2)
+    return _invNormQuantile(0.5 * x, 0.5 * (1.0 - abs(x))) * INV_SQRT2
 
-def lower_gamma(x: TReal, y : TReal) -> float:
+def _invNormCdf(p: float) -> float:
     """
-    Calculates the lower incomplete gamma function.
-    
-    Based on the algorithm given in:
-    
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    Unchecked implementation of the function inv_norm_cdf(). The data sanity
+    check is not performed, it is supposed to be done by the caller.
     
     Signature:
-        int > 0 OR float > 0, int >= 0 OR float > 0 -> float >= 0
+        0 < float < 1 -> float
     
-    Args:
-        x: int > 0 OR float > 0; power parameter of the function
-        y: int >= 0 OR float > 0; the integeral boundary parameter of the
-            function
+    Version 1.0.0.0
+    """
+    return _invNormQuantile(p - 0.5, p if p < 0.5 else 1.0 - p)
+
+def _lowerGamma(x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        GammaLn: Optional[float] = None) -> float:
+    """
+    Unchecked implementation of the function lower_gamma(). The data sanity
+    check is not performed, it is supposed to be done by the caller. The
+    optional precomputed value of math.lgamma(x) can be passed.
     
-    Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
-        UT_ValueError: either of the arguments is negative, OR the first
-            argument is zero
-        Exception: maximum number of iteration is reached
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, 0 < float < 1, float/
+            -> float >= 0
     
-    Version 1.0.0.0
+    Version 1.3.0.0
     """
-    _checkSanity3(x, y)
+    if GammaLn is None:
+        GammaLn = math.lgamma(x)
     if y <= 0:
         Result = 0.0
+    elif _isTemmeRegion(x, y):
+        Regularized, _ = _gammaTemme(x, y, False, Tolerance)
+        Result = math.exp(GammaLn + math.log(Regularized))
     elif (y < x + 1.0):
-        Sum = _gammaSeries(x, y)
+        Sum, _ = _gammaSeries(x, y, Tolerance)
         Result = math.exp(-y + x * math.log(y)) * Sum
     else:
-        Sum = _gammaContFraction(x, y)
-        GammaLn = math.lgamma(x)
+        Sum, _ = _gammaContFraction(x, y, Tolerance)
         Factor = math.exp(-y + x * math.log(y) - GammaLn)
         Result = math.exp(GammaLn + math.log(1 - Factor * Sum))
     return Result
 
-def log_lower_gamma(x: TReal, y : TReal) -> float:
+def _logLowerGamma(x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        GammaLn: Optional[float] = None) -> float:
     """
-    Calculates the natural logarithm of the lower incomplete gamma function.
-    
-    Based on the algorithm given in:
-    
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    Unchecked implementation of the function log_lower_gamma(). The data
+    sanity check is not performed, it is supposed to be done by the caller.
+    The optional precomputed value of math.lgamma(x) can be passed.
     
     Signature:
-        int > 0 OR float > 0, int > 0 OR float > 0 -> float
-    
-    Args:
-        x: int > 0 OR float > 0; power parameter of the function
-        y: int > 0 OR float > 0; the integeral boundary parameter of the
-            function
-    
-    Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
-        UT_ValueError: either of the arguments is zero or negative
-        Exception: maximum number of iteration is reached
+        int > 0 OR float > 0, int > 0 OR float > 0 /, 0 < float < 1, float/
+            -> float
     
-    Version 1.0.0.0
+    Version 1.3.0.0
     """
-    _checkSanity2(x, y)
-    if (y < x + 1.0):
-        Sum = _gammaSeries(x, y)
+    if GammaLn is None:
+        GammaLn = math.lgamma(x)
+    if _isTemmeRegion(x, y):
+        Regularized, _ = _gammaTemme(x, y, False, Tolerance)
+        Result = GammaLn + math.log(Regularized)
+    elif (y < x + 1.0):
+        Sum, _ = _gammaSeries(x, y, Tolerance)
         Result = -y + x * math.log(y) + math.log(Sum)
     else:
-        Sum = _gammaContFraction(x, y)
-        GammaLn = math.lgamma(x)
+        Sum, _ = _gammaContFraction(x, y, Tolerance)
         Factor = math.exp(-y + x * math.log(y) - GammaLn)
         Result = GammaLn + math.log(1 - Factor * Sum)
     return Result
 
-def lower_gamma_reg(x: TReal, y : TReal) -> float:
+def _lowerGammaReg(x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        GammaLn: Optional[float] = None) -> float:
     """
-    Calculates the regularized lower incomplete gamma function.
-    
-    Based on the algorithm given in:
-    
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    Unchecked implementation of the function lower_gamma_reg(). The data
+    sanity check is not performed, it is supposed to be done by the caller.
+    The optional precomputed value of math.lgamma(x) can be passed.
     
     Signature:
-        int > 0 OR float > 0, int >= 0 OR float > 0 -> 0 <= float < 1
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, 0 < float < 1, float/
+            -> 0 <= float < 1
     
-    Args:
+    Version 1.3.0.0
+    """
+    if GammaLn is None:
+        GammaLn = math.lgamma(x)
+    if y <= 0:
+        Result = 0.0
+    elif _isTemmeRegion(x, y):
+        Result, _ = _gammaTemme(x, y, False, Tolerance)
+    else:
+        Factor = math.exp(-y + x * math.log(y) - GammaLn)
+        if (y < x + 1.0):
+            Sum, _ = _gammaSeries(x, y, Tolerance)
+            Result = Factor * Sum
+        else:
+            Sum, _ = _gammaContFraction(x, y, Tolerance)
+            Result = 1 - Factor * Sum
+    return Result
+
+def _upperGamma(x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        GammaLn: Optional[float] = None) -> float:
+    """
+    Unchecked implementation of the function upper_gamma(). The data sanity
+    check is not performed, it is supposed to be done by the caller. The
+    optional precomputed value of math.lgamma(x) can be passed.
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, 0 < float < 1, float/
+            -> float > 0
+    
+    Version 1.3.0.0
+    """
+    if GammaLn is None:
+        GammaLn = math.lgamma(x)
+    if y <= 0:
+        Result = math.gamma(x) 
+    elif _isTemmeRegion(x, y):
+        Regularized, _ = _gammaTemme(x, y, True, Tolerance)
+        Result = math.exp(GammaLn + math.log(Regularized))
+    elif (y > x + 1.0):
+        Sum, _ = _gammaContFraction(x, y, Tolerance)
+        Result = math.exp(-y + x * math.log(y)) * Sum
+    else:
+        Sum, _ = _gammaSeries(x, y, Tolerance)
+        Factor = math.exp(-y + x * math.log(y) - GammaLn)
+        Result = math.exp(GammaLn + math.log(1 - Factor * Sum))
+    return Result
+
+def _logUpperGamma(x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        GammaLn: Optional[float] = None) -> float:
+    """
+    Unchecked implementation of the function log_upper_gamma(). The data
+    sanity check is not performed, it is supposed to be done by the caller.
+    The optional precomputed value of math.lgamma(x) can be passed.
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, 0 < float < 1, float/
+            -> float
+    
+    Version 1.3.0.0
+    """
+    if GammaLn is None:
+        GammaLn = math.lgamma(x)
+    if y <= 0:
+        Result = GammaLn
+    elif _isTemmeRegion(x, y):
+        Regularized, _ = _gammaTemme(x, y, True, Tolerance)
+        Result = GammaLn + math.log(Regularized)
+    elif (y > x + 1.0):
+        Sum, _ = _gammaContFraction(x, y, Tolerance)
+        Result = -y + x * math.log(y) + math.log(Sum)
+    else:
+        Sum, _ = _gammaSeries(x, y, Tolerance)
+        Factor = math.exp(-y + x * math.log(y) - GammaLn)
+        Result = GammaLn + math.log(1 - Factor * Sum)
+    return Result
+
+def _upperGammaReg(x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        GammaLn: Optional[float] = None) -> float:
+    """
+    Unchecked implementation of the function upper_gamma_reg(). The data
+    sanity check is not performed, it is supposed to be done by the caller.
+    The optional precomputed value of math.lgamma(x) can be passed.
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, 0 < float < 1, float/
+            -> 0 < float <= 1
+    
+    Version 1.3.0.0
+    """
+    if GammaLn is None:
+        GammaLn = math.lgamma(x)
+    if y <= 0:
+        Result = 1.0
+    elif _isTemmeRegion(x, y):
+        Result, _ = _gammaTemme(x, y, True, Tolerance)
+    else:
+        Factor = math.exp(-y + x * math.log(y) - GammaLn)
+        if (y > x + 1.0):
+            Sum, _ = _gammaContFraction(x, y, Tolerance)
+            Result = Factor * Sum
+        else:
+            Sum, _ = _gammaSeries(x, y, Tolerance)
+            Result = 1 - Factor * Sum
+    return Result
+
+def _betaIncomplete(z: TReal, x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        LogBeta: Optional[float] = None) -> float:
+    """
+    Unchecked implementation of the function beta_incomplete(). The data
+    sanity check is not performed, it is supposed to be done by the caller.
+    The optional precomputed value of the log beta function can be passed.
+    
+    Signature:
+        0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
+            int > 0 OR float > 0 /, 0 < float < 1, float/ -> float >= 0
+    
+    Version 1.2.0.0
+    """
+    if LogBeta is None:
+        LogBeta = _logBeta(x, y)
+    if z < MIN_FLOAT:
+        Result = 0.0
+    elif (1 -z) < MIN_FLOAT:
+        Result = math.exp(LogBeta)
+    else:
+        Factor = math.exp(x * math.log(z) + y * math.log(1 - z))
+        if z < (x + 1.0) / (x + y + 2.0):
+            Sum, _ = _betaContFraction(z, x, y, Tolerance)
+            Factor /=  x
+            Result = Factor * Sum
+        else:
+            Sum, _ = _betaContFraction(1 - z, y, x, Tolerance)
+            Beta = math.exp(LogBeta)
+            Factor /= y
+            Result = Beta - Factor * Sum
+    return Result
+
+def _logBetaIncomplete(z: TReal, x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        LogBeta: Optional[float] = None) -> float:
+    """
+    Unchecked implementation of the function log_beta_incomplete(). The
+    data sanity check is not performed, it is supposed to be done by the
+    caller. The optional precomputed value of the log beta function can be
+    passed.
+    
+    Signature:
+        int = 1 OR 0 < float < 1, int > 0 OR float > 0,
+            int > 0 OR float > 0 /, 0 < float < 1, float/ -> float >= 0
+    
+    Version 1.2.0.0
+    """
+    if LogBeta is None:
+        LogBeta = _logBeta(x, y)
+    if (1 - z) < MIN_FLOAT:
+        Result = LogBeta
+    else:
+        Temp = _betaIncomplete(z, x, y, Tolerance, LogBeta)
+        if Temp < MIN_FLOAT:
+            Result = - math.inf
+        else:
+            Result = math.log(Temp)
+    return Result
+
+def _betaIncompleteReg(z: TReal, x: TReal, y : TReal,
+                    Tolerance: float = REL_PRECISION,
+                        LogBeta: Optional[float] = None) -> float:
+    """
+    Unchecked implementation of the function beta_incomplete_reg(). The
+    data sanity check is not performed, it is supposed to be done by the
+    caller. The optional precomputed value of the log beta function can be
+    passed.
+    
+    Signature:
+        0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
+            int > 0 OR float > 0 /, 0 < float < 1, float/ -> 0<= float <= 1
+    
+    Version 1.2.0.0
+    """
+    if LogBeta is None:
+        LogBeta = _logBeta(x, y)
+    if z < MIN_FLOAT:
+        Result = 0.0
+    elif (1 - z) < MIN_FLOAT :
+        Result = 1.0
+    else:
+        Factor = math.exp(x * math.log(z) + y * math.log(1 - z)
+                                                            - LogBeta)
+        if z < (x + 1.0) / (x + y + 2.0):
+            Sum, _ = _betaContFraction(z, x, y, Tolerance)
+            Factor /=  x
+            Result = Factor * Sum
+        else:
+            Sum, _ = _betaContFraction(1 - z, y, x, Tolerance)
+            Factor /= y
+            Result = 1 - Factor * Sum
+    return Result
+
+#++ NumPy backend of the batch versions of the main functions
+
+def _mapArray(Function: Callable[[float], float], x: Any) -> Any:
+    """
+    Applies a scalar function element-wise to a 1D array of floats. If all
+    elements are equal, as with a broadcast scalar, the function is called
+    only once.
+    
+    Signature:
+        (float) -> float, numpy.ndarray -> numpy.ndarray
+    
+    Version 1.0.0.0
+    """
+    Length = len(x)
+    if not Length:
+        Result = np.empty(0)
+    elif (x == x[0]).all():
+        Result = np.full(Length, Function(float(x[0])))
+    else:
+        Result = np.fromiter(map(Function, x.tolist()), dtype = float,
+                                                                count = Length)
+    return Result
+
+def _hornerArray(Coefficients: Sequence[float], x: Any) -> Any:
+    """
+    Evaluates a polynomial, defined by the coefficients in the ascending order
+    of the powers, on a 1D array of floats using the Horner scheme.
+    
+    Signature:
+        seq(float), numpy.ndarray -> numpy.ndarray
+    
+    Version 1.0.0.0
+    """
+    Result = np.full(len(x), Coefficients[-1])
+    for Coefficient in Coefficients[-2::-1]:
+        Result *= x
+        Result += Coefficient
+    return Result
+
+def _gammaSeriesArray(x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION) -> Any:
+    """
+    Array version of the function _gammaSeries(). All elements are iterated
+    in the lock-step, and the converged elements are removed from the active
+    set, thus each element undergoes exactly the same number of iterations
+    as with the scalar function.
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, 0 < float < 1/ -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    Result = np.empty(len(x))
+    if not len(x):
+        return Result
+    Index = np.arange(len(x))
+    Coeff = x.copy()
+    Term = 1.0 / x
+    Sum = Term.copy()
+    for _ in range(1, MAX_ITERATION):
+        Coeff += 1
+        Term *= y / Coeff
+        Sum += Term
+        IsDone = np.abs(Term) < Tolerance * np.abs(Sum)
+        if IsDone.any():
+            Result[Index[IsDone]] = Sum[IsDone]
+            IsActive = ~IsDone
+            Index = Index[IsActive]
+            if not len(Index):
+                break
+            Coeff = Coeff[IsActive]
+            Term = Term[IsActive]
+            Sum = Sum[IsActive]
+            y = y[IsActive]
+    else: #max number of iterations is reached - error
+        raise Exception('Unable to converge the gamma series')
+    return Result
+
+def _gammaContFractionArray(x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION) -> Any:
+    """
+    Array version of the function _gammaContFraction(), see also the function
+    _gammaSeriesArray().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, 0 < float < 1/ -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    Result = np.empty(len(x))
+    if not len(x):
+        return Result
+    Index = np.arange(len(x))
+    b = 1.0 + y - x
+    c = np.full(len(x), 1.0 / MIN_FLOAT)
+    d = 1.0 / b
+    h = d.copy()
+    for i in range(1, MAX_ITERATION):
+        an = - i * (i - x)
+        b += 2.0
+        d = an * d + b
+        d[np.abs(d) < MIN_FLOAT] = MIN_FLOAT
+        c = b + an / c
+        c[np.abs(c) < MIN_FLOAT] = MIN_FLOAT
+        d = 1.0 / d
+        res = d * c
+        h *= res
+        IsDone = np.abs(res - 1.0) < Tolerance
+        if IsDone.any():
+            Result[Index[IsDone]] = h[IsDone]
+            IsActive = ~IsDone
+            Index = Index[IsActive]
+            if not len(Index):
+                break
+            x = x[IsActive]
+            b = b[IsActive]
+            c = c[IsActive]
+            d = d[IsActive]
+            h = h[IsActive]
+    else: #max number of iterations is reached - error
+        raise Exception('Unable to converge the gamma series')
+    return Result
+
+def _betaContFractionArray(z: Any, x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION) -> Any:
+    """
+    Array version of the function _betaContFraction(), see also the function
+    _gammaSeriesArray().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray/, 0 < float < 1/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    Result = np.empty(len(z))
+    if not len(z):
+        return Result
+    Index = np.arange(len(z))
+    qab = x + y
+    qap = x + 1.0
+    qam = x - 1.0
+    c = np.ones(len(z))
+    d = 1.0 - qab * z / qap
+    d[np.abs(d) < MIN_FLOAT] = MIN_FLOAT
+    d = 1.0 / d
+    h = d.copy()
+    for m in range(1, MAX_ITERATION):
+        m2 = 2 * m
+        aa = m * (y - m) * z / ((qam + m2) * (x + m2))
+        d = 1.0 + aa * d
+        d[np.abs(d) < MIN_FLOAT] = MIN_FLOAT
+        c = 1.0 + aa / c
+        c[np.abs(c) < MIN_FLOAT] = MIN_FLOAT
+        d = 1.0 / d
+        h *= d * c
+        aa = - (x + m) * (qab + m) * z / ((x + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d[np.abs(d) < MIN_FLOAT] = MIN_FLOAT
+        c = 1.0 + aa / c
+        c[np.abs(c) < MIN_FLOAT] = MIN_FLOAT
+        d = 1.0 / d
+        res = d * c
+        h *= res
+        IsDone = np.abs(res - 1.0) < Tolerance
+        if IsDone.any():
+            Result[Index[IsDone]] = h[IsDone]
+            IsActive = ~IsDone
+            Index = Index[IsActive]
+            if not len(Index):
+                break
+            z = z[IsActive]
+            x = x[IsActive]
+            y = y[IsActive]
+            qab = qab[IsActive]
+            qap = qap[IsActive]
+            qam = qam[IsActive]
+            c = c[IsActive]
+            d = d[IsActive]
+            h = h[IsActive]
+    else: #max number of iterations is reached - error
+        raise Exception('Unable to converge the gamma series')
+    return Result
+
+def _isTemmeRegionArray(x: Any, y: Any) -> Any:
+    """
+    Array version of the function _isTemmeRegion().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray -> numpy.ndarray(bool)
+    
+    Version 1.0.0.0
+    """
+    Limit = x * np.minimum(TEMME_MAX_RATIO,
+                                        TEMME_MAX_DEVIATION / np.sqrt(x))
+    return (x > TEMME_MIN_X) & (np.abs(y - x) < Limit)
+
+def _gammaTemmeArray(x: Any, y: Any, IsUpper: bool,
+                                Tolerance: float = REL_PRECISION) -> Any:
+    """
+    Array version of the function _gammaTemme(). The summation is stopped
+    for each element individually, thus each element is calculated with
+    exactly the same number of terms as with the scalar function.
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray, bool/, 0 < float < 1/ -> numpy.ndarray
+    
+    Version 1.0.0.0
+    """
+    Mu = (y - x) / x
+    Eta = np.sqrt(2.0 * (Mu - np.log1p(Mu)))
+    Eta[Mu < 0] *= -1
+    Sum = np.zeros(len(x))
+    Power = np.ones(len(x))
+    IsActive = np.ones(len(x), dtype = bool)
+    for Coefficients in TEMME_D:
+        Term = _hornerArray(Coefficients, Eta) * Power
+        Sum[IsActive] += Term[IsActive]
+        IsActive &= ~ (np.abs(Term) < Tolerance * np.abs(Sum))
+        if not IsActive.any():
+            break
+        Power /= x
+    Remainder = np.exp(-0.5 * x * Eta * Eta) * INV_SQRT_2PI * Sum
+    Remainder /= np.sqrt(x)
+    if IsUpper:
+        Result = 0.5 * _mapArray(math.erfc, Eta * np.sqrt(0.5 * x))
+        Result += Remainder
+    else:
+        Result = 0.5 * _mapArray(math.erfc, - Eta * np.sqrt(0.5 * x))
+        Result -= Remainder
+    return Result
+
+def _logGammaArray(x: Any, GammaLn: Optional[float] = None) -> Any:
+    """
+    Array version of the function math.lgamma(). If the precomputed value is
+    passed, it is simply broadcast to the length of the array.
+    
+    Signature:
+        numpy.ndarray/, float/ -> numpy.ndarray
+    
+    Version 1.0.0.0
+    """
+    if GammaLn is None:
+        Result = _mapArray(math.lgamma, x)
+    else:
+        Result = np.full(len(x), GammaLn)
+    return Result
+
+def _logBetaArray(x: Any, y: Any, LogBeta: Optional[float] = None) -> Any:
+    """
+    Array version of the function _logBeta(). If the precomputed value is
+    passed, it is simply broadcast to the length of the array.
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, float/ -> numpy.ndarray
+    
+    Version 1.1.0.0
+    """
+    if LogBeta is None:
+        Result = _mapArray(math.lgamma, x) + _mapArray(math.lgamma, y)
+        Result -= _mapArray(math.lgamma, x + y)
+    else:
+        Result = np.full(len(x), LogBeta)
+    return Result
+
+def _betaArray(x: Any, y: Any, LogBeta: Optional[float] = None) -> Any:
+    """
+    Array version of the function _beta().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, float/ -> numpy.ndarray
+    
+    Version 1.1.0.0
+    """
+    return np.exp(_logBetaArray(x, y, LogBeta))
+
+def _invNormArray(q: Any, Tail: Any) -> Any:
+    """
+    Calculates the standard normal distribution quantiles using the AS241
+    algorithm - array version of the function _invNormQuantile(), which is
+    also the kernel of _invNormCdf().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray -> numpy.ndarray
+    
+    Args:
+        q: numpy.ndarray; the probabilities minus 0.5
+        Tail: numpy.ndarray; the tail probabilities, i.e. min(p, 1 - p)
+    
+    Version 1.0.0.0
+    """
+    Result = np.empty(len(q))
+    IsCentral = np.abs(q) <= IERF_SPLIT1
+    if IsCentral.any():
+        qc = q[IsCentral]
+        r = IERF_CONST1 - qc * qc
+        Result[IsCentral] = qc * (_hornerArray(P0_INV_ERF, r)
+                                                / _hornerArray(Q0_INV_ERF, r))
+    IsTail = ~IsCentral
+    if IsTail.any():
+        qt = q[IsTail]
+        r = np.sqrt(- np.log(Tail[IsTail]))
+        Values = np.empty(len(qt))
+        IsNear = r <= IERF_SPLIT2
+        rn = r[IsNear] - IERF_CONST2
+        Values[IsNear] = (_hornerArray(P1_INV_ERF, rn)
+                                                / _hornerArray(Q1_INV_ERF, rn))
+        IsFar = ~IsNear
+        rf = r[IsFar] - IERF_SPLIT2
+        Values[IsFar] = (_hornerArray(P2_INV_ERF, rf)
+                                                / _hornerArray(Q2_INV_ERF, rf))
+        Result[IsTail] = np.where(qt < 0, - Values, Values)
+    return Result
+
+def _invErfArray(x: Any) -> Any:
+    """
+    Array version of the function _invErf().
+    
+    Signature:
+        numpy.ndarray -> numpy.ndarray
+    
+    Version 1.1.0.0
+    """
+    return _invNormArray(0.5 * x, 0.5 * (1.0 - np.abs(x))) * INV_SQRT2
+
+def _invNormCdfArray(p: Any) -> Any:
+    """
+    Array version of the function _invNormCdf().
+    
+    Signature:
+        numpy.ndarray -> numpy.ndarray
+    
+    Version 1.0.0.0
+    """
+    return _invNormArray(p - 0.5, np.minimum(p, 1.0 - p))
+
+def _lowerGammaArray(x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            GammaLn: Optional[float] = None) -> Any:
+    """
+    Array version of the function _lowerGamma().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.3.0.0
+    """
+    Result = np.zeros(len(y))
+    IsTemme = _isTemmeRegionArray(x, y)
+    IsSeries = (y > 0) & (y < x + 1.0) & (~ IsTemme)
+    IsFraction = (y > 0) & (~ (IsSeries | IsTemme))
+    if IsTemme.any():
+        xt, yt = x[IsTemme], y[IsTemme]
+        Regularized = _gammaTemmeArray(xt, yt, False, Tolerance)
+        Result[IsTemme] = np.exp(_logGammaArray(xt, GammaLn)
+                                                    + np.log(Regularized))
+    if IsSeries.any():
+        xs, ys = x[IsSeries], y[IsSeries]
+        Sum = _gammaSeriesArray(xs, ys, Tolerance)
+        Result[IsSeries] = np.exp(-ys + xs * np.log(ys)) * Sum
+    if IsFraction.any():
+        xf, yf = x[IsFraction], y[IsFraction]
+        Sum = _gammaContFractionArray(xf, yf, Tolerance)
+        LogGamma = _logGammaArray(xf, GammaLn)
+        Factor = np.exp(-yf + xf * np.log(yf) - LogGamma)
+        Result[IsFraction] = np.exp(LogGamma + np.log(1 - Factor * Sum))
+    return Result
+
+def _logLowerGammaArray(x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            GammaLn: Optional[float] = None) -> Any:
+    """
+    Array version of the function _logLowerGamma().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.3.0.0
+    """
+    Result = np.empty(len(y))
+    IsTemme = _isTemmeRegionArray(x, y)
+    IsSeries = (y < x + 1.0) & (~ IsTemme)
+    IsFraction = ~ (IsSeries | IsTemme)
+    if IsTemme.any():
+        xt, yt = x[IsTemme], y[IsTemme]
+        Regularized = _gammaTemmeArray(xt, yt, False, Tolerance)
+        Result[IsTemme] = _logGammaArray(xt, GammaLn) + np.log(Regularized)
+    if IsSeries.any():
+        xs, ys = x[IsSeries], y[IsSeries]
+        Sum = _gammaSeriesArray(xs, ys, Tolerance)
+        Result[IsSeries] = -ys + xs * np.log(ys) + np.log(Sum)
+    if IsFraction.any():
+        xf, yf = x[IsFraction], y[IsFraction]
+        Sum = _gammaContFractionArray(xf, yf, Tolerance)
+        LogGamma = _logGammaArray(xf, GammaLn)
+        Factor = np.exp(-yf + xf * np.log(yf) - LogGamma)
+        Result[IsFraction] = LogGamma + np.log(1 - Factor * Sum)
+    return Result
+
+def _lowerGammaRegArray(x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            GammaLn: Optional[float] = None) -> Any:
+    """
+    Array version of the function _lowerGammaReg().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.3.0.0
+    """
+    Result = np.zeros(len(y))
+    IsTemme = _isTemmeRegionArray(x, y)
+    IsPositive = (y > 0) & (~ IsTemme)
+    if IsTemme.any():
+        Result[IsTemme] = _gammaTemmeArray(x[IsTemme], y[IsTemme], False,
+                                                                    Tolerance)
+    if IsPositive.any():
+        xp, yp = x[IsPositive], y[IsPositive]
+        LogGamma = _logGammaArray(xp, GammaLn)
+        Factor = np.exp(-yp + xp * np.log(yp) - LogGamma)
+        Values = np.empty(len(yp))
+        IsSeries = yp < xp + 1.0
+        IsFraction = ~ IsSeries
+        Sum = _gammaSeriesArray(xp[IsSeries], yp[IsSeries], Tolerance)
+        Values[IsSeries] = Factor[IsSeries] * Sum
+        Sum = _gammaContFractionArray(xp[IsFraction], yp[IsFraction],
+                                                                    Tolerance)
+        Values[IsFraction] = 1 - Factor[IsFraction] * Sum
+        Result[IsPositive] = Values
+    return Result
+
+def _upperGammaArray(x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            GammaLn: Optional[float] = None) -> Any:
+    """
+    Array version of the function _upperGamma().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.3.0.0
+    """
+    Result = np.empty(len(y))
+    IsZero = y <= 0
+    IsTemme = _isTemmeRegionArray(x, y)
+    IsFraction = (~ (IsZero | IsTemme)) & (y > x + 1.0)
+    IsSeries = ~ (IsZero | IsTemme | IsFraction)
+    if IsZero.any():
+        Result[IsZero] = _mapArray(math.gamma, x[IsZero])
+    if IsTemme.any():
+        xt, yt = x[IsTemme], y[IsTemme]
+        Regularized = _gammaTemmeArray(xt, yt, True, Tolerance)
+        Result[IsTemme] = np.exp(_logGammaArray(xt, GammaLn)
+                                                    + np.log(Regularized))
+    if IsFraction.any():
+        xf, yf = x[IsFraction], y[IsFraction]
+        Sum = _gammaContFractionArray(xf, yf, Tolerance)
+        Result[IsFraction] = np.exp(-yf + xf * np.log(yf)) * Sum
+    if IsSeries.any():
+        xs, ys = x[IsSeries], y[IsSeries]
+        Sum = _gammaSeriesArray(xs, ys, Tolerance)
+        LogGamma = _logGammaArray(xs, GammaLn)
+        Factor = np.exp(-ys + xs * np.log(ys) - LogGamma)
+        Result[IsSeries] = np.exp(LogGamma + np.log(1 - Factor * Sum))
+    return Result
+
+def _logUpperGammaArray(x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            GammaLn: Optional[float] = None) -> Any:
+    """
+    Array version of the function _logUpperGamma().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.3.0.0
+    """
+    Result = np.empty(len(y))
+    IsZero = y <= 0
+    IsTemme = _isTemmeRegionArray(x, y)
+    IsFraction = (~ (IsZero | IsTemme)) & (y > x + 1.0)
+    IsSeries = ~ (IsZero | IsTemme | IsFraction)
+    if IsZero.any():
+        Result[IsZero] = _logGammaArray(x[IsZero], GammaLn)
+    if IsTemme.any():
+        xt, yt = x[IsTemme], y[IsTemme]
+        Regularized = _gammaTemmeArray(xt, yt, True, Tolerance)
+        Result[IsTemme] = _logGammaArray(xt, GammaLn) + np.log(Regularized)
+    if IsFraction.any():
+        xf, yf = x[IsFraction], y[IsFraction]
+        Sum = _gammaContFractionArray(xf, yf, Tolerance)
+        Result[IsFraction] = -yf + xf * np.log(yf) + np.log(Sum)
+    if IsSeries.any():
+        xs, ys = x[IsSeries], y[IsSeries]
+        Sum = _gammaSeriesArray(xs, ys, Tolerance)
+        LogGamma = _logGammaArray(xs, GammaLn)
+        Factor = np.exp(-ys + xs * np.log(ys) - LogGamma)
+        Result[IsSeries] = LogGamma + np.log(1 - Factor * Sum)
+    return Result
+
+def _upperGammaRegArray(x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            GammaLn: Optional[float] = None) -> Any:
+    """
+    Array version of the function _upperGammaReg().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.3.0.0
+    """
+    Result = np.ones(len(y))
+    IsTemme = _isTemmeRegionArray(x, y)
+    IsPositive = (y > 0) & (~ IsTemme)
+    if IsTemme.any():
+        Result[IsTemme] = _gammaTemmeArray(x[IsTemme], y[IsTemme], True,
+                                                                    Tolerance)
+    if IsPositive.any():
+        xp, yp = x[IsPositive], y[IsPositive]
+        LogGamma = _logGammaArray(xp, GammaLn)
+        Factor = np.exp(-yp + xp * np.log(yp) - LogGamma)
+        Values = np.empty(len(yp))
+        IsFraction = yp > xp + 1.0
+        IsSeries = ~ IsFraction
+        Sum = _gammaContFractionArray(xp[IsFraction], yp[IsFraction],
+                                                                    Tolerance)
+        Values[IsFraction] = Factor[IsFraction] * Sum
+        Sum = _gammaSeriesArray(xp[IsSeries], yp[IsSeries], Tolerance)
+        Values[IsSeries] = 1 - Factor[IsSeries] * Sum
+        Result[IsPositive] = Values
+    return Result
+
+def _betaIncompleteArray(z: Any, x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            LogBeta: Optional[float] = None) -> Any:
+    """
+    Array version of the function _betaIncomplete().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    Result = np.zeros(len(z))
+    IsZero = z < MIN_FLOAT
+    IsOne = (~ IsZero) & ((1 - z) < MIN_FLOAT)
+    IsInner = ~ (IsZero | IsOne)
+    if IsOne.any():
+        Result[IsOne] = _betaArray(x[IsOne], y[IsOne], LogBeta)
+    if IsInner.any():
+        zi, xi, yi = z[IsInner], x[IsInner], y[IsInner]
+        Factor = np.exp(xi * np.log(zi) + yi * np.log(1 - zi))
+        Values = np.empty(len(zi))
+        IsLower = zi < (xi + 1.0) / (xi + yi + 2.0)
+        IsUpper = ~ IsLower
+        zl, xl, yl = zi[IsLower], xi[IsLower], yi[IsLower]
+        Sum = _betaContFractionArray(zl, xl, yl, Tolerance)
+        Values[IsLower] = (Factor[IsLower] / xl) * Sum
+        zu, xu, yu = zi[IsUpper], xi[IsUpper], yi[IsUpper]
+        Sum = _betaContFractionArray(1 - zu, yu, xu, Tolerance)
+        Values[IsUpper] = (_betaArray(xu, yu, LogBeta)
+                                            - (Factor[IsUpper] / yu) * Sum)
+        Result[IsInner] = Values
+    return Result
+
+def _logBetaIncompleteArray(z: Any, x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            LogBeta: Optional[float] = None) -> Any:
+    """
+    Array version of the function _logBetaIncomplete().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    Result = np.empty(len(z))
+    IsOne = (1 - z) < MIN_FLOAT
+    IsInner = ~ IsOne
+    if IsOne.any():
+        Result[IsOne] = _logBetaArray(x[IsOne], y[IsOne], LogBeta)
+    if IsInner.any():
+        Temp = _betaIncompleteArray(z[IsInner], x[IsInner], y[IsInner],
+                                                        Tolerance, LogBeta)
+        Result[IsInner] = np.where(Temp < MIN_FLOAT, - math.inf,
+                                        np.log(np.maximum(Temp, MIN_FLOAT)))
+    return Result
+
+def _betaIncompleteRegArray(z: Any, x: Any, y: Any,
+                        Tolerance: float = REL_PRECISION,
+                            LogBeta: Optional[float] = None) -> Any:
+    """
+    Array version of the function _betaIncompleteReg().
+    
+    Signature:
+        numpy.ndarray, numpy.ndarray, numpy.ndarray/, 0 < float < 1, float/
+            -> numpy.ndarray
+    
+    Raises:
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    Result = np.zeros(len(z))
+    IsZero = z < MIN_FLOAT
+    IsOne = (~ IsZero) & ((1 - z) < MIN_FLOAT)
+    IsInner = ~ (IsZero | IsOne)
+    Result[IsOne] = 1.0
+    if IsInner.any():
+        zi, xi, yi = z[IsInner], x[IsInner], y[IsInner]
+        Factor = np.exp(xi * np.log(zi) + yi * np.log(1 - zi)
+                                            - _logBetaArray(xi, yi, LogBeta))
+        Values = np.empty(len(zi))
+        IsLower = zi < (xi + 1.0) / (xi + yi + 2.0)
+        IsUpper = ~ IsLower
+        zl, xl, yl = zi[IsLower], xi[IsLower], yi[IsLower]
+        Sum = _betaContFractionArray(zl, xl, yl, Tolerance)
+        Values[IsLower] = (Factor[IsLower] / xl) * Sum
+        zu, xu, yu = zi[IsUpper], xi[IsUpper], yi[IsUpper]
+        Sum = _betaContFractionArray(1 - zu, yu, xu, Tolerance)
+        Values[IsUpper] = 1 - (Factor[IsUpper] / yu) * Sum
+        Result[IsInner] = Values
+    return Result
+
+#++ batch processing
+
+def _evaluateBatch(Function: Callable[..., float], ArrayFunction: Callable,
+                        Checker: Callable, *Args: TRealArgument,
+                        Parameters: Sequence[Any] = ()
+                                                ) -> Union[List[float], Any]:
+    """
+    Helper function implementing the batch versions of the main functions.
+    Each of the positional arguments is either a real number, which is
+    broadcast over the batch, or a batch of real numbers (see the function
+    polynomial._ParseRealBatch()); all batches must be of the same length.
+    
+    The data type check is performed only once per batch, and the data value
+    check - only twice per batch, on the minimum and on the maximum values of
+    each argument. With NumPy installed the calculations are performed by the
+    array function in chunks of CHUNK_SIZE elements, otherwise the unchecked
+    scalar function is mapped over the batches.
+    
+    The optional parameters are passed as they are into both the scalar and
+    the array functions after the arguments, without the sanity checks and
+    broadcasting.
+    
+    Signature:
+        (*float) -> float, (*numpy.ndarray) -> numpy.ndarray, (*float) -> None,
+            *type A/, *, seq(type B)/ -> list(float) OR numpy.ndarray
+    
+    Args:
+        Function: (*float) -> float; unchecked scalar implementation
+        ArrayFunction: (*numpy.ndarray) -> numpy.ndarray; array implementation
+        Checker: (*float) -> None; input data sanity check function
+        *Args: type A; real numbers or batches of real numbers
+        Parameters: (keyword) seq(type B); additional parameters of both the
+            scalar and array functions, already checked, defaults to empty
+    
+    Returns:
+        list(float): the calculated values, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
+    
+    Raises:
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers
+        UT_ValueError: the batches are of different lengths, OR any of the
+            elements is out of the acceptable range
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    Batches = list()
+    Length = None
+    IsArray = False
+    for Item in Args:
+        if not isinstance(Item, (int, float)):
+            if (not (np is None)) and isinstance(Item, np.ndarray):
+                IsArray = True
+            Item = _ParseRealBatch(Item, SkipFrames = 3)
+            if Length is None:
+                Length = len(Item)
+            elif len(Item) != Length:
+                raise UT_ValueError(len(Item),
+                            '== {}, length of the batch'.format(Length),
+                                                                SkipFrames = 2)
+        Batches.append(Item)
+    if Length is None:
+        Length = 1
+    if not Length:
+        Result = list()
+        if IsArray:
+            Result = np.empty(0)
+        return Result
+    Minimums = list()
+    Maximums = list()
+    for Item in Batches:
+        if isinstance(Item, (int, float)):
+            Minimums.append(Item)
+            Maximums.append(Item)
+        elif not (np is None):
+            Minimums.append(Item.min().item())
+            Maximums.append(Item.max().item())
+        else:
+            Minimums.append(min(Item))
+            Maximums.append(max(Item))
+    Checker(*Minimums, SkipFrames = 3)
+    Checker(*Maximums, SkipFrames = 3)
+    if np is None:
+        Iterables = [repeat(Item, Length) if isinstance(Item, (int, float))
+                                                else Item for Item in Batches]
+        Iterables.extend(repeat(Item, Length) for Item in Parameters)
+        Result = list(map(Function, *Iterables))
+    else:
+        Batches = [np.broadcast_to(np.asarray(Item, dtype = float),
+                                            (Length, )) for Item in Batches]
+        Result = np.empty(Length)
+        for Start in range(0, Length, CHUNK_SIZE):
+            Stop = Start + CHUNK_SIZE
+            Result[Start : Stop] = ArrayFunction(*(Item[Start : Stop]
+                                            for Item in Batches), *Parameters)
+        if not IsArray:
+            Result = Result.tolist()
+    return Result
+
+#+ main set of functions
+
+def permutation(n: int, k: int) -> int:
+    """
+    Calculates 'n permute k' value, i.e. n! / (n-k)!
+
+    Signature:
+        int >= 0 , int >= 0 -> int > 0
+    
+    Args:
+        n: int >= 0; the total number of objects available
+        k: int >= 0; the number of objects taken
+    
+    Raises:
+        UT_TypeError: either of the arguments is not integer
+        UT_ValueError: either of the arguments is negative, or k > n
+    
+    Version 1.0.0.0
+    """
+    _checkSanity1(n, k)
+    if IS_V3_8_PLUS:
+        Result = math.perm(n, k)
+    else:
+        if k > 0:
+            Result = n
+            for i in range(1, k):
+                Result *= (n - i)
+        else:
+            Result = 1
+    return Result
+
+def combination(n: int, k: int) -> int:
+    """
+    Calculates 'n chose k' value, i.e. n! / ((n-k)! k!)
+
+    Signature:
+        int >= 0 , int >= 0 -> int > 0
+    
+    Args:
+        n: int >= 0; the total number of objects available
+        k: int >= 0; the number of objects taken
+    
+    Raises:
+        UT_TypeError: either of the arguments is not integer
+        UT_ValueError: either of the arguments is negative, or k > n
+    
+    Version 1.0.0.0
+    """
+    _checkSanity1(n, k)
+    if IS_V3_8_PLUS:
+        Result = math.comb(n, k)
+    else:
+        if k > n - k:
+            Result = permutation(n, n - k) // math.factorial(n - k)
+        else:
+            Result = permutation(n, k) // math.factorial(k)
+    return Result
+
+def log_beta(x: TReal, y: TReal) -> float:
+    """
+    The value of the natural logarithm of beta function ln(B(x, y)).
+
+    Signature:
+        int > 0 OR float > 0, int > 0 OR float > 0 -> float
+    
+    Args:
+        x: int > 0 OR float > 0; any real number first argument
+        y: int > 0 OR float > 0; any real number second argument
+    
+    Raises:
+        UT_TypeError: either of the arguments is not integer or float
+        UT_ValueError: either of the arguments is not positive
+    
+    Version 1.1.0.0
+    """
+    _checkSanity2(x, y)
+    return _logBeta(x, y)
+
+def beta(x: TReal, y: TReal) -> float:
+    """
+    The value of beta function B(x, y).
+
+    Signature:
+        int > 0 OR float > 0, int > 0 OR float > 0 -> float > 0
+    
+    Args:
+        x: int > 0 OR float > 0; any real number first argument
+        y: int > 0 OR float > 0; any real number second argument
+    
+    Raises:
+        UT_TypeError: either of the arguments is not integer or float
+        UT_ValueError: either of the arguments is not positive
+    
+    Version 1.1.0.0
+    """
+    _checkSanity2(x, y)
+    return _beta(x, y)
+
+def inv_erf(x: TReal) -> float:
+    """
+    Calculates the value of the inverse error function of the given argument.
+    
+    Based on the algorithm given in:
+    
+    Michael J. Wichura. Algorithm AS241: The Percentage Points of the Normal
+    Distribution. Journal of Royal Statistical Society. Series C (Applied
+    Statistics), Vol. 37, No. 3 (1988), pp. 477-484
+    
+    which is 3 ranges rational function approximation with double precision
+    (7th power polynomials).
+    
+    Signature:
+        int = 0 OR -1 < float < 1 -> float
+    
+    Raises:
+        UT_TypeError: the argument is not integer or float
+        UT_ValueError: the argument is not in the range (-1, 1)
+    
+    Version 1.1.0.0
+    """
+    if not isinstance(x, (int, float)):
+        raise UT_TypeError(x, (int, float), SkipFrames = 1)
+    if (x >= 1) or (x <= -1):
+        raise UT_ValueError(x, 'in range (-1, 1)', SkipFrames = 1)
+    return _invNormQuantile(0.5 * x, 0.5 * (1.0 - abs(x))) * INV_SQRT2
+
+def inv_norm_cdf(p: TReal) -> float:
+    """
+    Calculates the quantile of the standard normal distribution, i.e. the
+    inverse of its cumulative distribution function (probit function), for
+    the given probability.
+    
+    Based on the algorithm given in:
+    
+    Michael J. Wichura. Algorithm AS241: The Percentage Points of the Normal
+    Distribution. Journal of Royal Statistical Society. Series C (Applied
+    Statistics), Vol. 37, No. 3 (1988), pp. 477-484
+    
+    Signature:
+        0 < float < 1 -> float
+    
+    Args:
+        p: 0 < float < 1; the probability
+    
+    Raises:
+        UT_TypeError: the argument is not integer or float
+        UT_ValueError: the argument is not in the range (0, 1)
+    
+    Version 1.0.0.0
+    """
+    if not isinstance(p, (int, float)):
+        raise UT_TypeError(p, (int, float), SkipFrames = 1)
+    if (p >= 1) or (p <= 0):
+        raise UT_ValueError(p, 'in range (0, 1)', SkipFrames = 1)
+    return _invNormQuantile(p - 0.5, p if p < 0.5 else 1.0 - p)
+
+def lower_gamma(x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the lower incomplete gamma function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> float >= 0
+    
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int >= 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: either of the arguments is negative, OR the first
+            argument is zero, OR the tolerance is out of the range, OR it is an
+            unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity3(x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _lowerGamma(x, y, Precision)
+
+def log_lower_gamma(x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the natural logarithm of the lower incomplete gamma function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    
+    Signature:
+        int > 0 OR float > 0, int > 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> float
+    
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int > 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: either of the arguments is zero or negative, OR the
+            tolerance is out of the range, OR it is an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity2(x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _logLowerGamma(x, y, Precision)
+
+def lower_gamma_reg(x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the regularized lower incomplete gamma function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> 0 <= float < 1
+    
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int >= 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: either of the arguments is negative, OR the first
+            argument is zero, OR the tolerance is out of the range, OR it is an
+            unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity3(x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _lowerGammaReg(x, y, Precision)
+
+def upper_gamma(x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the upper incomplete gamma function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> float > 0
+    
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int >= 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: either of the arguments is zero or negative, OR the
+            tolerance is out of the range, OR it is an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity3(x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _upperGamma(x, y, Precision)
+
+def log_upper_gamma(x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the natural logarithm of the upper incomplete gamma function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> float
+    
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int >= 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: either of the arguments is zero or negative, OR the
+            tolerance is out of the range, OR it is an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity3(x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _logUpperGamma(x, y, Precision)
+
+def upper_gamma_reg(x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the regularized upper incomplete gamma function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> 0 < float <= 1
+    
+    Args:
         x: int > 0 OR float > 0; power parameter of the function
         y: int >= 0 OR float > 0; the integeral boundary parameter of the
             function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: either of the arguments is zero or negative, OR the
+            tolerance is out of the range, OR it is an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity3(x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _upperGammaReg(x, y, Precision)
+
+def beta_incomplete(z: TReal, x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the incomplete beta function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 226-228. ISBN: 0-521-43108-5
+    
+    Signature:
+        0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
+            int > 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> float >= 0
+    
+    Args:
+        z: 0 <= int <= 1 OR 0 < float < 1; the integeral boundary parameter of
+            the function
+        x: int > 0 OR float > 0; the first power parameter of the function
+        y: int > 0 OR float > 0; the second power parameter of the function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: the first argument is not in the range [0, 1], OR either
+            of the other arguments is zero or negative, OR the tolerance is out
+            of the range, OR it is an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity4(z, x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _betaIncomplete(z, x, y, Precision)
+
+def log_beta_incomplete(z: TReal, x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the natural logarithm of the incomplete beta function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 226-228. ISBN: 0-521-43108-5
+    
+    Signature:
+        int = 1 OR 0 < float < 1, int > 0 OR float > 0,
+            int > 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> float >= 0
+    
+    Args:
+        z: int = 1 OR 0 < float <= 1; the integeral boundary parameter of
+            the function
+        x: int > 0 OR float > 0; the first power parameter of the function
+        y: int > 0 OR float > 0; the second power parameter of the function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: the first argument is not in the range (0, 1], OR either
+            of the other arguments is zero or negative, OR the tolerance is out
+            of the range, OR it is an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity5(z, x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _logBetaIncomplete(z, x, y, Precision)
+
+def beta_incomplete_reg(z: TReal, x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> float:
+    """
+    Calculates the regularized incomplete beta function.
+    
+    Based on the algorithm given in:
+    
+    William H. Press, Saul A. Teukolsky, William T. Vetterling and
+    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
+    2nd Ed. Cambridge University Press (1992), pp. 226-228. ISBN: 0-521-43108-5
+    
+    Signature:
+        0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
+            int > 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> 0<= float <= 1
+    
+    Args:
+        z: 0 <= int <= 1 OR 0 < float < 1; the integeral boundary parameter of
+            the function
+        x: int > 0 OR float > 0; the first power parameter of the function
+        y: int > 0 OR float > 0; the second power parameter of the function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: the first argument is not in the range [0, 1], OR either
+            of the other arguments is zero or negative, OR the tolerance is out
+            of the range, OR it is an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.2.0.0
+    """
+    _checkSanity4(z, x, y)
+    Precision = _parseTolerance(Tolerance)
+    return _betaIncompleteReg(z, x, y, Precision)
+
+#+ batch versions of the main functions
+
+def log_beta_many(x: TRealArgument, y: TRealArgument) -> TRealResult:
+    """
+    Batch version of the function log_beta(). Any argument can be a real
+    number, which is broadcast over the batch, or a batch of real numbers - a
+    flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
+    
+    Signature:
+        int > 0 OR float > 0, int > 0 OR float > 0 (each OR a batch thereof)
+            -> list(float) OR numpy.ndarray
+    
+    Args:
+        x: int > 0 OR float > 0; any real number first argument
+        y: int > 0 OR float > 0; any real number second argument
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
+    
+    Raises:
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function log_beta(), OR the batches are of
+            different lengths
+    
+    Version 1.0.0.0
+    """
+    return _evaluateBatch(_logBeta, _logBetaArray, _checkSanity2, x, y)
+
+def beta_many(x: TRealArgument, y: TRealArgument) -> TRealResult:
+    """
+    Batch version of the function beta(). Any argument can be a real number,
+    which is broadcast over the batch, or a batch of real numbers - a flat
+    sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
+    
+    Signature:
+        int > 0 OR float > 0, int > 0 OR float > 0 (each OR a batch thereof)
+            -> list(float > 0) OR numpy.ndarray
+    
+    Args:
+        x: int > 0 OR float > 0; any real number first argument
+        y: int > 0 OR float > 0; any real number second argument
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
     
     Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
-        UT_ValueError: either of the arguments is negative, OR the first
-            argument is zero
-        Exception: maximum number of iteration is reached
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function beta(), OR the batches are of different
+            lengths
     
     Version 1.0.0.0
     """
-    _checkSanity3(x, y)
-    if y <= 0:
-        Result = 0.0
-    else:
-        GammaLn = math.lgamma(x)
-        Factor = math.exp(-y + x * math.log(y) - GammaLn)
-        if (y < x + 1.0):
-            Sum = _gammaSeries(x, y)
-            Result = Factor * Sum
-        else:
-            Sum = _gammaContFraction(x, y)
-            Result = 1 - Factor * Sum
-    return Result
+    return _evaluateBatch(_beta, _betaArray, _checkSanity2, x, y)
 
-def upper_gamma(x: TReal, y : TReal) -> float:
+def inv_erf_many(x: TRealArgument) -> TRealResult:
     """
-    Calculates the upper incomplete gamma function.
+    Batch version of the function inv_erf(). Any argument can be a real number,
+    which is broadcast over the batch, or a batch of real numbers - a flat
+    sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
     
-    Based on the algorithm given in:
+    Signature:
+        int = 0 OR -1 < float < 1 (each OR a batch thereof)
+            -> list(float) OR numpy.ndarray
     
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    Args:
+        x: int = 0 OR -1 < float < 1; the argument of the function
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
+    
+    Raises:
+        UT_TypeError: the argument is neither a real number nor a flat
+            sequence, array or buffer of real numbers
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function inv_erf(), OR the batches are of
+            different lengths
+    
+    Version 1.0.0.0
+    """
+    return _evaluateBatch(_invErf, _invErfArray, _checkSanity6, x)
+
+def inv_norm_cdf_many(p: TRealArgument) -> TRealResult:
+    """
+    Batch version of the function inv_norm_cdf(). The argument can be a real
+    number or a batch of real numbers - a flat sequence, array.array,
+    buffer-protocol object or 1D numpy.ndarray. The data sanity checks are
+    performed only once per batch.
     
     Signature:
-        int > 0 OR float > 0, int >= 0 OR float > 0 -> float > 0
+        0 < float < 1 (OR a batch thereof) -> list(float) OR numpy.ndarray
+    
+    Args:
+        p: 0 < float < 1; the probability
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if the argument is a NumPy array
+    
+    Raises:
+        UT_TypeError: the argument is neither a real number nor a flat
+            sequence, array or buffer of real numbers
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function inv_norm_cdf()
+    
+    Version 1.0.0.0
+    """
+    return _evaluateBatch(_invNormCdf, _invNormCdfArray, _checkSanity7, p)
+
+def lower_gamma_many(x: TRealArgument, y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
+    """
+    Batch version of the function lower_gamma(). Any argument can be a real
+    number, which is broadcast over the batch, or a batch of real numbers - a
+    flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(float >= 0) OR numpy.ndarray
     
     Args:
         x: int > 0 OR float > 0; power parameter of the function
         y: int >= 0 OR float > 0; the integeral boundary parameter of the
             function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
     
     Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
-        UT_ValueError: either of the arguments is zero or negative
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function lower_gamma(), OR the batches are of
+            different lengths, OR the tolerance is out of the range, OR it is
+            an unknown preset
         Exception: maximum number of iteration is reached
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    _checkSanity3(x, y)
-    if y <= 0:
-        Result = math.gamma(x) 
-    elif (y > x + 1.0):
-        Sum = _gammaContFraction(x, y)
-        Result = math.exp(-y + x * math.log(y)) * Sum
-    else:
-        Sum = _gammaSeries(x, y)
-        GammaLn = math.lgamma(x)
-        Factor = math.exp(-y + x * math.log(y) - GammaLn)
-        Result = math.exp(GammaLn + math.log(1 - Factor * Sum))
-    return Result
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_lowerGamma, _lowerGammaArray, _checkSanity3, x, y,
+                                                    Parameters = (Precision, ))
 
-def log_upper_gamma(x: TReal, y : TReal) -> float:
+def log_lower_gamma_many(x: TRealArgument, y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
     """
-    Calculates the natural logarithm of the upper incomplete gamma function.
+    Batch version of the function log_lower_gamma(). Any argument can be a real
+    number, which is broadcast over the batch, or a batch of real numbers - a
+    flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
     
-    Based on the algorithm given in:
+    Signature:
+        int > 0 OR float > 0, int > 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(float) OR numpy.ndarray
     
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int > 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
+    
+    Raises:
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function log_lower_gamma(), OR the batches are of
+            different lengths, OR the tolerance is out of the range, OR it is
+            an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_logLowerGamma, _logLowerGammaArray, _checkSanity2,
+                                              x, y, Parameters = (Precision, ))
+
+def lower_gamma_reg_many(x: TRealArgument, y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
+    """
+    Batch version of the function lower_gamma_reg(). Any argument can be a real
+    number, which is broadcast over the batch, or a batch of real numbers - a
+    flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
     
     Signature:
-        int > 0 OR float > 0, int >= 0 OR float > 0 -> float
+        int > 0 OR float > 0, int >= 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(0 <= float < 1) OR numpy.ndarray
     
     Args:
         x: int > 0 OR float > 0; power parameter of the function
         y: int >= 0 OR float > 0; the integeral boundary parameter of the
             function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
     
     Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
-        UT_ValueError: either of the arguments is zero or negative
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function lower_gamma_reg(), OR the batches are of
+            different lengths, OR the tolerance is out of the range, OR it is
+            an unknown preset
         Exception: maximum number of iteration is reached
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    _checkSanity3(x, y)
-    if y <= 0:
-        Result = math.lgamma(x) 
-    elif (y > x + 1.0):
-        Sum = _gammaContFraction(x, y)
-        Result = -y + x * math.log(y) + math.log(Sum)
-    else:
-        Sum = _gammaSeries(x, y)
-        GammaLn = math.lgamma(x)
-        Factor = math.exp(-y + x * math.log(y) - GammaLn)
-        Result = GammaLn + math.log(1 - Factor * Sum)
-    return Result
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_lowerGammaReg, _lowerGammaRegArray, _checkSanity3,
+                                              x, y, Parameters = (Precision, ))
 
-def upper_gamma_reg(x: TReal, y : TReal) -> float:
+def upper_gamma_many(x: TRealArgument, y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
     """
-    Calculates the regularized upper incomplete gamma function.
+    Batch version of the function upper_gamma(). Any argument can be a real
+    number, which is broadcast over the batch, or a batch of real numbers - a
+    flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
     
-    Based on the algorithm given in:
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(float > 0) OR numpy.ndarray
     
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 216-219. ISBN: 0-521-43108-5
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int >= 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
+    
+    Raises:
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function upper_gamma(), OR the batches are of
+            different lengths, OR the tolerance is out of the range, OR it is
+            an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_upperGamma, _upperGammaArray, _checkSanity3, x, y,
+                                                    Parameters = (Precision, ))
+
+def log_upper_gamma_many(x: TRealArgument, y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
+    """
+    Batch version of the function log_upper_gamma(). Any argument can be a real
+    number, which is broadcast over the batch, or a batch of real numbers - a
+    flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
     
     Signature:
-        int > 0 OR float > 0, int >= 0 OR float > 0 -> 0 < float <= 1
+        int > 0 OR float > 0, int >= 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(float) OR numpy.ndarray
     
     Args:
         x: int > 0 OR float > 0; power parameter of the function
         y: int >= 0 OR float > 0; the integeral boundary parameter of the
             function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
     
     Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
-        UT_ValueError: either of the arguments is zero or negative
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function log_upper_gamma(), OR the batches are of
+            different lengths, OR the tolerance is out of the range, OR it is
+            an unknown preset
         Exception: maximum number of iteration is reached
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    _checkSanity3(x, y)
-    if y <= 0:
-        Result = 1.0
-    else:
-        GammaLn = math.lgamma(x)
-        Factor = math.exp(-y + x * math.log(y) - GammaLn)
-        if (y > x + 1.0):
-            Sum = _gammaContFraction(x, y)
-            Result = Factor * Sum
-        else:
-            Sum = _gammaSeries(x, y)
-            Result = 1 - Factor * Sum
-    return Result
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_logUpperGamma, _logUpperGammaArray, _checkSanity3,
+                                              x, y, Parameters = (Precision, ))
 
-def beta_incomplete(z: TReal, x: TReal, y : TReal) -> float:
+def upper_gamma_reg_many(x: TRealArgument, y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
     """
-    Calculates the incomplete beta function.
+    Batch version of the function upper_gamma_reg(). Any argument can be a real
+    number, which is broadcast over the batch, or a batch of real numbers - a
+    flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
     
-    Based on the algorithm given in:
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(0 < float <= 1) OR numpy.ndarray
     
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 226-228. ISBN: 0-521-43108-5
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int >= 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
+    
+    Raises:
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function upper_gamma_reg(), OR the batches are of
+            different lengths, OR the tolerance is out of the range, OR it is
+            an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_upperGammaReg, _upperGammaRegArray, _checkSanity3,
+                                              x, y, Parameters = (Precision, ))
+
+def beta_incomplete_many(z: TRealArgument, x: TRealArgument,
+                                              y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
+    """
+    Batch version of the function beta_incomplete(). Any argument can be a real
+    number, which is broadcast over the batch, or a batch of real numbers - a
+    flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray; all
+    batches must be of the same length. The data sanity checks are performed
+    only once per batch.
     
     Signature:
         0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
-            int > 0 OR float > 0 -> float >= 0
+            int > 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(float >= 0) OR numpy.ndarray
     
     Args:
         z: 0 <= int <= 1 OR 0 < float < 1; the integeral boundary parameter of
             the function
         x: int > 0 OR float > 0; the first power parameter of the function
         y: int > 0 OR float > 0; the second power parameter of the function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
     
     Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
-        UT_ValueError: the first argument is not in the range [0, 1], OR either
-            of the other arguments is zero or negative
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function beta_incomplete(), OR the batches are of
+            different lengths, OR the tolerance is out of the range, OR it is
+            an unknown preset
         Exception: maximum number of iteration is reached
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    _checkSanity4(z, x, y)
-    if z < MIN_FLOAT:
-        Result = 0.0
-    elif (1 -z) < MIN_FLOAT:
-        Result = beta(x, y)
-    else:
-        Factor = math.exp(x * math.log(z) + y * math.log(1 - z))
-        if z < (x + 1.0) / (x + y + 2.0):
-            Sum = _betaContFraction(z, x, y)
-            Factor /=  x
-            Result = Factor * Sum
-        else:
-            Sum = _betaContFraction(1 - z, y, x)
-            Beta = beta(x, y)
-            Factor /= y
-            Result = Beta - Factor * Sum
-    return Result
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_betaIncomplete, _betaIncompleteArray, _checkSanity4,
+                                           z, x, y, Parameters = (Precision, ))
 
-def log_beta_incomplete(z: TReal, x: TReal, y : TReal) -> float:
+def log_beta_incomplete_many(z: TRealArgument, x: TRealArgument,
+                                              y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
     """
-    Calculates the natural logarithm of the incomplete beta function.
-    
-    Based on the algorithm given in:
-    
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 226-228. ISBN: 0-521-43108-5
+    Batch version of the function log_beta_incomplete(). Any argument can be a
+    real number, which is broadcast over the batch, or a batch of real numbers
+    - a flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray;
+    all batches must be of the same length. The data sanity checks are
+    performed only once per batch.
     
     Signature:
         int = 1 OR 0 < float < 1, int > 0 OR float > 0,
-            int > 0 OR float > 0 -> float >= 0
+            int > 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(float >= 0) OR numpy.ndarray
     
     Args:
         z: int = 1 OR 0 < float <= 1; the integeral boundary parameter of
             the function
         x: int > 0 OR float > 0; the first power parameter of the function
         y: int > 0 OR float > 0; the second power parameter of the function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
     
     Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
-        UT_ValueError: the first argument is not in the range (0, 1], OR either
-            of the other arguments is zero or negative
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function log_beta_incomplete(), OR the batches
+            are of different lengths, OR the tolerance is out of the range, OR
+            it is an unknown preset
         Exception: maximum number of iteration is reached
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
-    _checkSanity5(z, x, y)
-    if (1 - z) < MIN_FLOAT:
-        Result = log_beta(x, y)
-    else:
-        Temp = beta_incomplete(z, x, y)
-        if Temp < MIN_FLOAT:
-            Result = - math.inf
-        else:
-            Result = math.log(Temp)
-    return Result
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_logBetaIncomplete, _logBetaIncompleteArray,
+                            _checkSanity5, z, x, y, Parameters = (Precision, ))
 
-def beta_incomplete_reg(z: TReal, x: TReal, y : TReal) -> float:
+def beta_incomplete_reg_many(z: TRealArgument, x: TRealArgument,
+                                              y: TRealArgument, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> TRealResult:
     """
-    Calculates the regularized incomplete beta function.
+    Batch version of the function beta_incomplete_reg(). Any argument can be a
+    real number, which is broadcast over the batch, or a batch of real numbers
+    - a flat sequence, array.array, buffer-protocol object or 1D numpy.ndarray;
+    all batches must be of the same length. The data sanity checks are
+    performed only once per batch.
     
-    Based on the algorithm given in:
+    Signature:
+        0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
+            int > 0 OR float > 0 (each OR a batch thereof)
+            /, *, 0 < float < 1 OR str/
+            -> list(0<= float <= 1) OR numpy.ndarray
     
-    William H. Press, Saul A. Teukolsky, William T. Vetterling and
-    Brian P. Flannery. Numerical Recipes in C: The Art of Scientific Computing.
-    2nd Ed. Cambridge University Press (1992), pp. 226-228. ISBN: 0-521-43108-5
+    Args:
+        z: 0 <= int <= 1 OR 0 < float < 1; the integeral boundary parameter of
+            the function
+        x: int > 0 OR float > 0; the first power parameter of the function
+        y: int > 0 OR float > 0; the second power parameter of the function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        list(float): the values of the function, in the same order
+        numpy.ndarray: the same values, if any of the arguments is a NumPy
+            array
+    
+    Raises:
+        UT_TypeError: any of the arguments is neither a real number nor a flat
+            sequence, array or buffer of real numbers, OR the tolerance is
+            neither float nor string
+        UT_ValueError: any element of a batch / scalar argument violates the
+            conditions of the function beta_incomplete_reg(), OR the batches
+            are of different lengths, OR the tolerance is out of the range, OR
+            it is an unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    Precision = _parseTolerance(Tolerance)
+    return _evaluateBatch(_betaIncompleteReg, _betaIncompleteRegArray,
+                            _checkSanity4, z, x, y, Parameters = (Precision, ))
+
+#+ convergence diagnostics
+
+def gamma_iterations(x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> int:
+    """
+    Calculates the number of iterations required by the series or by the
+    continued fraction used in the calculation of the incomplete gamma
+    functions with the same arguments, e.g. lower_gamma(x, y), with the given
+    tolerance. For the large values of the first argument near the transition
+    region, where the uniform asymptotic expansion is used instead, the number
+    of the used terms of the expansion is returned. The zero value of the
+    second argument does not require any iterations.
+    
+    Signature:
+        int > 0 OR float > 0, int >= 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> int >= 0
+    
+    Args:
+        x: int > 0 OR float > 0; power parameter of the function
+        y: int >= 0 OR float > 0; the integeral boundary parameter of the
+            function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        int >= 0: the number of the performed iterations
+    
+    Raises:
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
+        UT_ValueError: either of the arguments is negative, OR the first
+            argument is zero, OR the tolerance is out of the range, OR it is an
+            unknown preset
+        Exception: maximum number of iteration is reached
+    
+    Version 1.1.0.0
+    """
+    _checkSanity3(x, y)
+    Precision = _parseTolerance(Tolerance)
+    if y <= 0:
+        Result = 0
+    elif _isTemmeRegion(x, y):
+        _, Result = _gammaTemme(x, y, True, Precision)
+    elif (y < x + 1.0):
+        _, Result = _gammaSeries(x, y, Precision)
+    else:
+        _, Result = _gammaContFraction(x, y, Precision)
+    return Result
+
+def beta_iterations(z: TReal, x: TReal, y : TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> int:
+    """
+    Calculates the number of iterations required by the continued fraction
+    used in the calculation of the incomplete beta functions with the same
+    arguments, e.g. beta_incomplete(z, x, y), with the given tolerance. The
+    boundary values 0 and 1 of the first argument do not require any
+    iterations.
     
     Signature:
         0 <= int <= 1 OR 0 < float < 1, int > 0 OR float > 0,
-            int > 0 OR float > 0 -> 0<= float <= 1
+            int > 0 OR float > 0 /, *, 0 < float < 1 OR str/
+            -> int >= 0
     
     Args:
         z: 0 <= int <= 1 OR 0 < float < 1; the integeral boundary parameter of
             the function
         x: int > 0 OR float > 0; the first power parameter of the function
         y: int > 0 OR float > 0; the second power parameter of the function
+        Tolerance: (keyword) 0 < float < 1 OR str; the relative precision of
+            the convergence criteria or the name of its preset - 'fast',
+            'default' or 'precise', defaults to REL_PRECISION
+    
+    Returns:
+        int >= 0: the number of the performed iterations
     
     Raises:
-        UT_TypeError: either of the arguments is neither integer nor float
+        UT_TypeError: either of the arguments is neither integer nor float, OR
+            the tolerance is neither float nor string
         UT_ValueError: the first argument is not in the range [0, 1], OR either
-            of the other arguments is zero or negative
+            of the other arguments is zero or negative, OR the tolerance is out
+            of the range, OR it is an unknown preset
         Exception: maximum number of iteration is reached
     
     Version 1.0.0.0
     """
     _checkSanity4(z, x, y)
-    if z < MIN_FLOAT:
-        Result = 0.0
-    elif (1 - z) < MIN_FLOAT :
-        Result = 1.0
+    Precision = _parseTolerance(Tolerance)
+    if (z < MIN_FLOAT) or ((1 - z) < MIN_FLOAT):
+        Result = 0
+    elif z < (x + 1.0) / (x + y + 2.0):
+        _, Result = _betaContFraction(z, x, y, Precision)
     else:
-        Factor = math.exp(x * math.log(z) + y * math.log(1 - z) - log_beta(x,y))
-        if z < (x + 1.0) / (x + y + 2.0):
-            Sum = _betaContFraction(z, x, y)
-            Factor /=  x
-            Result = Factor * Sum
-        else:
-            Sum = _betaContFraction(1 - z, y, x)
-            Factor /= y
-            Result = 1 - Factor * Sum
+        _, Result = _betaContFraction(1 - z, y, x, Precision)
     return Result
+
+#classes
+
+class IncompleteGamma:
+    """
+    Incomplete gamma functions with the frozen power parameter x, e.g. the
+    CDF of the gamma or chi-squared distribution with the fixed shape. The
+    sanity check of the power parameter, the parsing of the tolerance and the
+    calculation of the log gamma function of the power parameter are
+    performed only once, at the instantiation; the methods check only the
+    integral boundary parameter y.
+    
+    The results of the methods are exactly the same as of the respective
+    module functions called with the same power parameter and tolerance.
+    
+    Properties:
+        Parameters: (read-only) tuple(int > 0 OR float > 0)
+        Tolerance: (read-only) 0 < float < 1
+    
+    Methods:
+        lower(y)
+            int >= 0 OR float > 0 -> float >= 0
+        logLower(y)
+            int > 0 OR float > 0 -> float
+        lowerReg(y)
+            int >= 0 OR float > 0 -> 0 <= float < 1
+        upper(y)
+            int >= 0 OR float > 0 -> float > 0
+        logUpper(y)
+            int >= 0 OR float > 0 -> float
+        upperReg(y)
+            int >= 0 OR float > 0 -> 0 < float <= 1
+        lowerMany(y)
+        logLowerMany(y)
+        lowerRegMany(y)
+        upperMany(y)
+        logUpperMany(y)
+        upperRegMany(y)
+            batch versions of the respective methods above, the argument is
+            either a real number or a batch of real numbers (sequence, array
+            or buffer) -> list(float) OR numpy.ndarray
+    
+    Version 1.0.0.0
+    """
+    
+    #class attributes
+    
+    __slots__ = ('_x', '_GammaLn', '_Tolerance')
+    
+    #special methods
+    
+    def __init__(self, x: TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> None:
+        """
+        Initialization. Checks and stores the power parameter and the
+        convergence tolerance, and precomputes the log gamma function of the
+        power parameter.
+        
+        Signature:
+            int > 0 OR float > 0/, *, 0 < float < 1 OR str/ -> None
+        
+        Args:
+            x: int > 0 OR float > 0; power parameter of the functions
+            Tolerance: (keyword) 0 < float < 1 OR str; the relative precision
+                of the convergence criteria or the name of its preset -
+                'fast', 'default' or 'precise', defaults to REL_PRECISION
+        
+        Raises:
+            UT_TypeError: the power parameter is neither integer nor float, OR
+                the tolerance is neither float nor string
+            UT_ValueError: the power parameter is zero or negative, OR the
+                tolerance is out of the range, OR it is an unknown preset
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(x, (int, float)):
+            raise UT_TypeError(x, (int, float), SkipFrames = 1)
+        if x <= 0:
+            raise UT_ValueError(x, '> 0, x argument', SkipFrames = 1)
+        self._Tolerance = _parseTolerance(Tolerance)
+        self._x = x
+        self._GammaLn = math.lgamma(x)
+    
+    #public properties
+    
+    @property
+    def Parameters(self) -> Tuple[TReal]:
+        """
+        Read-only property returning the frozen power parameter.
+        
+        Signature:
+            None -> tuple(int > 0 OR float > 0)
+        
+        Version 1.0.0.0
+        """
+        return (self._x, )
+    
+    @property
+    def Tolerance(self) -> float:
+        """
+        Read-only property returning the relative precision of the convergence
+        criteria.
+        
+        Signature:
+            None -> 0 < float < 1
+        
+        Version 1.0.0.0
+        """
+        return self._Tolerance
+    
+    #public instance methods
+    
+    def lower(self, y: TReal) -> float:
+        """
+        Calculates the lower incomplete gamma function, see lower_gamma().
+        
+        Signature:
+            int >= 0 OR float > 0 -> float >= 0
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary parameter of the
+                function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity3(self._x, y)
+        return _lowerGamma(self._x, y, self._Tolerance, self._GammaLn)
+    
+    def logLower(self, y: TReal) -> float:
+        """
+        Calculates the natural logarithm of the lower incomplete gamma
+        function, see log_lower_gamma().
+        
+        Signature:
+            int > 0 OR float > 0 -> float
+        
+        Args:
+            y: int > 0 OR float > 0; the integral boundary parameter of the
+                function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is zero or negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity2(self._x, y)
+        return _logLowerGamma(self._x, y, self._Tolerance, self._GammaLn)
+    
+    def lowerReg(self, y: TReal) -> float:
+        """
+        Calculates the regularized lower incomplete gamma function, see
+        lower_gamma_reg().
+        
+        Signature:
+            int >= 0 OR float > 0 -> 0 <= float < 1
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary parameter of the
+                function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity3(self._x, y)
+        return _lowerGammaReg(self._x, y, self._Tolerance, self._GammaLn)
+    
+    def upper(self, y: TReal) -> float:
+        """
+        Calculates the upper incomplete gamma function, see upper_gamma().
+        
+        Signature:
+            int >= 0 OR float > 0 -> float > 0
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary parameter of the
+                function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity3(self._x, y)
+        return _upperGamma(self._x, y, self._Tolerance, self._GammaLn)
+    
+    def logUpper(self, y: TReal) -> float:
+        """
+        Calculates the natural logarithm of the upper incomplete gamma
+        function, see log_upper_gamma().
+        
+        Signature:
+            int >= 0 OR float > 0 -> float
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary parameter of the
+                function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity3(self._x, y)
+        return _logUpperGamma(self._x, y, self._Tolerance, self._GammaLn)
+    
+    def upperReg(self, y: TReal) -> float:
+        """
+        Calculates the regularized upper incomplete gamma function, see
+        upper_gamma_reg().
+        
+        Signature:
+            int >= 0 OR float > 0 -> 0 < float <= 1
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary parameter of the
+                function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity3(self._x, y)
+        return _upperGammaReg(self._x, y, self._Tolerance, self._GammaLn)
+    
+    def lowerMany(self, y: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method lower(). The argument can be a real number
+        or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            int >= 0 OR float > 0 (OR a batch thereof)
+                -> list(float >= 0) OR numpy.ndarray
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_lowerGamma, _lowerGammaArray,
+                                _checkSanity3, self._x, y,
+                                Parameters = (self._Tolerance, self._GammaLn))
+    
+    def logLowerMany(self, y: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method logLower(). The argument can be a real
+        number or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            int > 0 OR float > 0 (OR a batch thereof)
+                -> list(float) OR numpy.ndarray
+        
+        Args:
+            y: int > 0 OR float > 0; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is zero or negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_logLowerGamma, _logLowerGammaArray,
+                                _checkSanity2, self._x, y,
+                                Parameters = (self._Tolerance, self._GammaLn))
+    
+    def lowerRegMany(self, y: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method lowerReg(). The argument can be a real
+        number or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            int >= 0 OR float > 0 (OR a batch thereof)
+                -> list(0 <= float < 1) OR numpy.ndarray
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_lowerGammaReg, _lowerGammaRegArray,
+                                _checkSanity3, self._x, y,
+                                Parameters = (self._Tolerance, self._GammaLn))
+    
+    def upperMany(self, y: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method upper(). The argument can be a real number
+        or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            int >= 0 OR float > 0 (OR a batch thereof)
+                -> list(float > 0) OR numpy.ndarray
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_upperGamma, _upperGammaArray,
+                                _checkSanity3, self._x, y,
+                                Parameters = (self._Tolerance, self._GammaLn))
+    
+    def logUpperMany(self, y: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method logUpper(). The argument can be a real
+        number or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            int >= 0 OR float > 0 (OR a batch thereof)
+                -> list(float) OR numpy.ndarray
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_logUpperGamma, _logUpperGammaArray,
+                                _checkSanity3, self._x, y,
+                                Parameters = (self._Tolerance, self._GammaLn))
+    
+    def upperRegMany(self, y: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method upperReg(). The argument can be a real
+        number or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            int >= 0 OR float > 0 (OR a batch thereof)
+                -> list(0 < float <= 1) OR numpy.ndarray
+        
+        Args:
+            y: int >= 0 OR float > 0; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is negative
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_upperGammaReg, _upperGammaRegArray,
+                                _checkSanity3, self._x, y,
+                                Parameters = (self._Tolerance, self._GammaLn))
+
+class IncompleteBeta:
+    """
+    Incomplete beta functions with the frozen shape parameters x and y, e.g.
+    the CDF of the beta, Student's t or F distribution with the fixed degrees
+    of freedom. The sanity check of the shape parameters, the parsing of the
+    tolerance and the calculation of the log beta function of the shape
+    parameters are performed only once, at the instantiation; the methods
+    check only the integral boundary parameter z.
+    
+    The results of the methods are exactly the same as of the respective
+    module functions called with the same shape parameters and tolerance.
+    
+    Properties:
+        Parameters: (read-only) tuple(int > 0 OR float > 0,
+            int > 0 OR float > 0)
+        Tolerance: (read-only) 0 < float < 1
+    
+    Methods:
+        value(z)
+            0 <= int <= 1 OR 0 < float < 1 -> float >= 0
+        logValue(z)
+            int = 1 OR 0 < float < 1 -> float
+        valueReg(z)
+            0 <= int <= 1 OR 0 < float < 1 -> 0 <= float <= 1
+        valueMany(z)
+        logValueMany(z)
+        valueRegMany(z)
+            batch versions of the respective methods above, the argument is
+            either a real number or a batch of real numbers (sequence, array
+            or buffer) -> list(float) OR numpy.ndarray
+    
+    Version 1.0.0.0
+    """
+    
+    #class attributes
+    
+    __slots__ = ('_x', '_y', '_LogBeta', '_Tolerance')
+    
+    #special methods
+    
+    def __init__(self, x: TReal, y: TReal, *,
+                        Tolerance: TTolerance = REL_PRECISION) -> None:
+        """
+        Initialization. Checks and stores the shape parameters and the
+        convergence tolerance, and precomputes the log beta function of the
+        shape parameters.
+        
+        Signature:
+            int > 0 OR float > 0, int > 0 OR float > 0/, *,
+                0 < float < 1 OR str/ -> None
+        
+        Args:
+            x: int > 0 OR float > 0; first shape parameter of the functions
+            y: int > 0 OR float > 0; second shape parameter of the functions
+            Tolerance: (keyword) 0 < float < 1 OR str; the relative precision
+                of the convergence criteria or the name of its preset -
+                'fast', 'default' or 'precise', defaults to REL_PRECISION
+        
+        Raises:
+            UT_TypeError: either of the shape parameters is neither integer
+                nor float, OR the tolerance is neither float nor string
+            UT_ValueError: either of the shape parameters is zero or negative,
+                OR the tolerance is out of the range, OR it is an unknown
+                preset
+        
+        Version 1.0.0.0
+        """
+        _checkSanity2(x, y)
+        self._Tolerance = _parseTolerance(Tolerance)
+        self._x = x
+        self._y = y
+        self._LogBeta = _logBeta(x, y)
+    
+    #public properties
+    
+    @property
+    def Parameters(self) -> Tuple[TReal, TReal]:
+        """
+        Read-only property returning the frozen shape parameters.
+        
+        Signature:
+            None -> tuple(int > 0 OR float > 0, int > 0 OR float > 0)
+        
+        Version 1.0.0.0
+        """
+        return (self._x, self._y)
+    
+    @property
+    def Tolerance(self) -> float:
+        """
+        Read-only property returning the relative precision of the convergence
+        criteria.
+        
+        Signature:
+            None -> 0 < float < 1
+        
+        Version 1.0.0.0
+        """
+        return self._Tolerance
+    
+    #public instance methods
+    
+    def value(self, z: TReal) -> float:
+        """
+        Calculates the incomplete beta function, see beta_incomplete().
+        
+        Signature:
+            0 <= int <= 1 OR 0 < float < 1 -> float >= 0
+        
+        Args:
+            z: 0 <= int <= 1 OR 0 < float < 1; the integral boundary
+                parameter of the function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is not in the range [0, 1]
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity4(z, self._x, self._y)
+        return _betaIncomplete(z, self._x, self._y, self._Tolerance,
+                                                                self._LogBeta)
+    
+    def logValue(self, z: TReal) -> float:
+        """
+        Calculates the natural logarithm of the incomplete beta function, see
+        log_beta_incomplete().
+        
+        Signature:
+            int = 1 OR 0 < float < 1 -> float
+        
+        Args:
+            z: int = 1 OR 0 < float < 1; the integral boundary parameter of
+                the function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is not in the range (0, 1]
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity5(z, self._x, self._y)
+        return _logBetaIncomplete(z, self._x, self._y, self._Tolerance,
+                                                                self._LogBeta)
+    
+    def valueReg(self, z: TReal) -> float:
+        """
+        Calculates the regularized incomplete beta function, see
+        beta_incomplete_reg().
+        
+        Signature:
+            0 <= int <= 1 OR 0 < float < 1 -> 0 <= float <= 1
+        
+        Args:
+            z: 0 <= int <= 1 OR 0 < float < 1; the integral boundary
+                parameter of the function
+        
+        Raises:
+            UT_TypeError: the argument is neither integer nor float
+            UT_ValueError: the argument is not in the range [0, 1]
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        _checkSanity4(z, self._x, self._y)
+        return _betaIncompleteReg(z, self._x, self._y, self._Tolerance,
+                                                                self._LogBeta)
+    
+    def valueMany(self, z: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method value(). The argument can be a real number
+        or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            0 <= int <= 1 OR 0 < float < 1 (OR a batch thereof)
+                -> list(float >= 0) OR numpy.ndarray
+        
+        Args:
+            z: 0 <= int <= 1 OR 0 < float < 1; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is not in the range [0, 1]
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_betaIncomplete, _betaIncompleteArray,
+                                _checkSanity4, z, self._x, self._y,
+                                Parameters = (self._Tolerance, self._LogBeta))
+    
+    def logValueMany(self, z: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method logValue(). The argument can be a real
+        number or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            int = 1 OR 0 < float < 1 (OR a batch thereof)
+                -> list(float) OR numpy.ndarray
+        
+        Args:
+            z: int = 1 OR 0 < float < 1; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is not in the range (0, 1]
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_logBetaIncomplete, _logBetaIncompleteArray,
+                                _checkSanity5, z, self._x, self._y,
+                                Parameters = (self._Tolerance, self._LogBeta))
+    
+    def valueRegMany(self, z: TRealArgument) -> TRealResult:
+        """
+        Batch version of the method valueReg(). The argument can be a real
+        number or a batch of real numbers - a flat sequence, array.array,
+        buffer-protocol object or 1D numpy.ndarray. The data sanity check is
+        performed only once per batch.
+        
+        Signature:
+            0 <= int <= 1 OR 0 < float < 1 (OR a batch thereof)
+                -> list(0 <= float <= 1) OR numpy.ndarray
+        
+        Args:
+            z: 0 <= int <= 1 OR 0 < float < 1; the integral boundary
+                parameter of the function
+        
+        Returns:
+            list(float): the values of the function, in the same order
+            numpy.ndarray: the same values, if the argument is a NumPy array
+        
+        Raises:
+            UT_TypeError: the argument is neither a real number nor a flat
+                sequence, array or buffer of real numbers
+            UT_ValueError: any element of the batch is not in the range [0, 1]
+            Exception: maximum number of iteration is reached
+        
+        Version 1.0.0.0
+        """
+        return _evaluateBatch(_betaIncompleteReg, _betaIncompleteRegArray,
+                                _checkSanity4, z, self._x, self._y,
+                                Parameters = (self._Tolerance, self._LogBeta))
\ No newline at end of file
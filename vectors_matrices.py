@@ -6,16 +6,24 @@ Imlements matrices, generic vectors, column and row vectors as well as
 arithmetics involving instances of these classes and real number as operands.
 
 Classes:
+    ArrayView
     Array2D
     Vector
     Column
     Row
     Matrix
     SquareMatrix
+    LUFactorization
+    SparseMatrix
+    CSRMatrix
+    COOMatrix
+    SparseLUFactorization
+    BandedMatrix
+    BandedLUFactorization
 """
 
-__version__= '1.0.0.0'
-__date__ = '02-10-2023'
+__version__= '1.9.1.0'
+__date__ = '18-10-2026'
 __status__ = 'Production'
 
 #imports
@@ -26,8 +34,19 @@ import sys
 import os
 import collections.abc as c_abc
 
-from math import sqrt, floor
+from math import sqrt, floor, hypot
+from array import array
+from bisect import bisect_left
+from operator import mul
 from typing import Sequence, Union, Tuple, Any, List, Optional, Dict, NoReturn
+from typing import Iterator
+
+#+ 3rd party libraries (optional)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 #+ custom modules
 
@@ -53,6 +72,8 @@ TSequenceRealSequence = Sequence[Sequence[TReal]]
 
 TRealTuple = Tuple[TReal, ...]
 
+TStorage = Union[TRealTuple, array]
+
 TArray = "Array2D"
 
 TVector = "Vector"
@@ -65,14 +86,36 @@ TMatrix = "Matrix"
 
 TSquareMatrix = "SquareMatrix"
 
+TLUFactorization = "LUFactorization"
+
+TSparseMatrix = "SparseMatrix"
+
+TCSRMatrix = "CSRMatrix"
+
+TCOOMatrix = "COOMatrix"
+
+TSparseLUFactorization = "SparseLUFactorization"
+
+TBandedMatrix = "BandedMatrix"
+
+TBandedLUFactorization = "BandedLUFactorization"
+
 #globals
 
-MAX_ITER = 100000 #maximum number of iterations for the QR-algorithm
+MAX_ITER = 30 #maximum number of QR-iterations per eigenvalue(s)
 
 ALMOST_ZERO = 1.0E-14 #threshold for the convergence of the QR-algorithm
 
 DEBUG_MODE = False #if True - will print fault messages of the QR-algorithm
 
+STORAGE_TYPECODE = 'd' #type code of the compact flat storage of the matrices
+
+MATMUL_BLOCK = 32 #tile size (rows and columns) of the pure Python mat. product
+
+MATMUL_NUMPY_MIN = 4096 #minimum number of multiplications to use NumPy backend
+
+SPARSE_PIVOT_THRESHOLD = 0.1 #relative pivot acceptance level of the sparse LU
+
 #helper functions
 
 #+ input data types
@@ -129,6 +172,252 @@ def _CheckIfSequenceRealSequence(Value: Any) -> None:
                 Error.appendMessage(f'at index [{Index}][{Inner}] in {Value}')
                 raise Error
 
+#+ flat storage of arrays and matrices
+
+def _PackElements(Elements: Sequence[TReal]) -> TStorage:
+    """
+    Packs the elements of an array or matrix, already flattened in the
+    rows-first order, into the internal flat storage: a compact array.array of
+    C doubles if all elements are floating point numbers, or a tuple otherwise,
+    thus the integer elements are never converted into floats. An array of the
+    proper type code is used as it is, without copying. It does not any data
+    sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        seq(int OR float) -> tuple(int OR float) OR array.array
+    
+    Version 1.0.0.0
+    """
+    if isinstance(Elements, array) and Elements.typecode == STORAGE_TYPECODE:
+        Result = Elements
+    elif all(isinstance(Item, float) for Item in Elements):
+        Result = array(STORAGE_TYPECODE, Elements)
+    else:
+        Result = tuple(Elements)
+    return Result
+
+#+ matrix multiplication engine
+
+def _MultiplyPython(Left: Sequence[TReal], Right: Sequence[TReal],
+                        Height: int, Inner: int, Width: int) -> List[TReal]:
+    """
+    Reference, pure Python implementation of the matrix product of the two
+    flat rows-first storages. The right operand is transposed once (sliced into
+    the columns), and the result is computed in square tiles of MATMUL_BLOCK
+    rows by MATMUL_BLOCK columns, so the same rows and columns are re-used
+    while they are hot. Each element is the sum of the products in the natural
+    order, thus the result is exactly the same as by the textbook definition.
+    It does not any data sanity checks! It is not supposed to be used outside
+    the module.
+    
+    Signature:
+        seq(int OR float), seq(int OR float), int >= 1, int >= 1, int >= 1
+            -> list(int OR float)
+    
+    Args:
+        Left: seq(int OR float); Height x Inner elements of the left operand
+        Right: seq(int OR float); Inner x Width elements of the right operand
+        Height: int >= 1; number of rows of the left operand
+        Inner: int >= 1; number of columns of the left operand = number of rows
+            of the right operand
+        Width: int >= 1; number of columns of the right operand
+    
+    Returns:
+        list(int OR float): Height x Width elements of the product in the
+            rows-first order
+    
+    Version 1.0.0.0
+    """
+    Rows = [Left[Index : Index + Inner]
+                                for Index in range(0, Height * Inner, Inner)]
+    Columns = [Right[Index : : Width] for Index in range(Width)]
+    Result = [0] * (Height * Width)
+    for RowStart in range(0, Height, MATMUL_BLOCK):
+        RowStop = min(RowStart + MATMUL_BLOCK, Height)
+        for ColStart in range(0, Width, MATMUL_BLOCK):
+            Block = Columns[ColStart : ColStart + MATMUL_BLOCK]
+            for RowIdx in range(RowStart, RowStop):
+                RowItems = Rows[RowIdx]
+                Offset = RowIdx * Width + ColStart
+                Result[Offset : Offset + len(Block)] = [
+                                            sum(map(mul, RowItems, ColItems))
+                                                    for ColItems in Block]
+    return Result
+
+def _MultiplyNumPy(Left: Sequence[TReal], Right: Sequence[TReal],
+                            Height: int, Inner: int, Width: int) -> array:
+    """
+    NumPy (BLAS) backed implementation of the matrix product of the two flat
+    rows-first storages. The storages of the array.array type are wrapped
+    without copying. The result is computed in the double precision floating
+    point arithmetics. It does not any data sanity checks! It is not supposed
+    to be used outside the module.
+    
+    Signature:
+        seq(int OR float), seq(int OR float), int >= 1, int >= 1, int >= 1
+            -> array.array
+    
+    Args:
+        Left: seq(int OR float); Height x Inner elements of the left operand
+        Right: seq(int OR float); Inner x Width elements of the right operand
+        Height: int >= 1; number of rows of the left operand
+        Inner: int >= 1; number of columns of the left operand = number of rows
+            of the right operand
+        Width: int >= 1; number of columns of the right operand
+    
+    Returns:
+        array.array: Height x Width elements of the product in the rows-first
+            order, as an array of C doubles
+    
+    Version 1.0.0.0
+    """
+    Operands = []
+    for Storage in (Left, Right):
+        if isinstance(Storage, array):
+            Operands.append(np.frombuffer(Storage, dtype = float))
+        else:
+            Operands.append(np.array(Storage, dtype = float))
+    Product = np.matmul(Operands[0].reshape(Height, Inner),
+                                            Operands[1].reshape(Inner, Width))
+    return array(STORAGE_TYPECODE, Product.tobytes())
+
+def _Multiply(Left: Sequence[TReal], Right: Sequence[TReal],
+                Height: int, Inner: int, Width: int) -> Sequence[TReal]:
+    """
+    Calculates the matrix product of the two flat rows-first storages. Uses
+    the NumPy (BLAS) backend if it is installed, the product is large enough
+    (at least MATMUL_NUMPY_MIN multiplications), and, at least, one of the
+    operands is stored as an array of floating point numbers, thus the result
+    is floating point anyway. Otherwise, falls back to the pure Python
+    implementation, which keeps the integer results exact. It does not any
+    data sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        seq(int OR float), seq(int OR float), int >= 1, int >= 1, int >= 1
+            -> seq(int OR float)
+    
+    Version 1.0.0.0
+    """
+    if ((not (np is None)) and (Height * Inner * Width >= MATMUL_NUMPY_MIN)
+                and (isinstance(Left, array) or isinstance(Right, array))):
+        Result = _MultiplyNumPy(Left, Right, Height, Inner, Width)
+    else:
+        Result = _MultiplyPython(Left, Right, Height, Inner, Width)
+    return Result
+
+#+ LU-decomposition related
+
+def _DecomposeLU(Elements: Sequence[TReal], Size: int,
+                        isPartialPivoting: bool = False) -> Tuple[List[TReal],
+                                        List[int], List[int], int]:
+    """
+    Compact in-place LUP-decomposition kernel. The elements are copied once
+    into a flat rows-first working buffer, which is transformed in place into
+    the packed form: the multipliers of the lower-triangular matrix (with the
+    implied unit main diagonal) are stored below the main diagonal, and the
+    upper-triangular matrix is stored on and above it. The rows and columns
+    are swapped physically within the buffer, and each row is updated by a
+    single slice assignment.
+    
+    By default, the columns pivoting is used: the element with the maximum
+    absolute value in the current row is selected as the pivot, and the rows
+    are swapped only if the current row becomes all zeroes (singular matrix).
+    With the partial pivoting flag set (GEPP), the element with the maximum
+    absolute value in the current column among the remaining rows is selected
+    as the pivot, and the columns are never swapped. It does not any data
+    sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        seq(int OR float), int >= 2/, bool/
+            -> list(int OR float), list(int), list(int), int
+    
+    Args:
+        Elements: seq(int OR float); Size x Size elements of the matrix in the
+            rows-first order
+        Size: int >= 2; size of the matrix
+        isPartialPivoting: (optional) bool; flag if the rows pivoting by the
+            maximum element in the column is to be used, defaults to False
+    
+    Returns:
+        list(int OR float), list(int), list(int), int: unpacked tuple of the
+            packed L and U elements in the rows-first order, followed by the
+            order of the rows (index of the original row for each row of the
+            buffer), followed by the order of the columns (index of the
+            original column for each column of the buffer), followed by +1 or
+            -1 number as the permutation sign
+    
+    Version 1.0.0.0
+    """
+    Buffer = list(Elements)
+    RowsOrder = list(range(Size))
+    ColsOrder = list(range(Size))
+    Sign = 1
+    for BaseIndex in range(Size - 1):
+        Start = BaseIndex * Size
+        if isPartialPivoting:
+            #maximum absolute value in the column, among the remaining rows
+            MaxIndex = BaseIndex
+            MaxValue = abs(Buffer[Start + BaseIndex])
+            for RowIdx in range(BaseIndex + 1, Size):
+                Value = abs(Buffer[RowIdx * Size + BaseIndex])
+                if Value > MaxValue:
+                    MaxValue = Value
+                    MaxIndex = RowIdx
+            SwapRow = MaxIndex
+        elif not any(Buffer[Start + BaseIndex : Start + Size]):
+            #current row is all zeroes - use the first non-zero row below
+            SwapRow = BaseIndex
+            for RowIdx in range(BaseIndex + 1, Size):
+                Offset = RowIdx * Size
+                if any(Buffer[Offset + BaseIndex : Offset + Size]):
+                    SwapRow = RowIdx
+                    break
+        else:
+            SwapRow = BaseIndex
+        if SwapRow != BaseIndex:
+            #swap the entire rows, including the stored multipliers
+            Offset = SwapRow * Size
+            Current = Buffer[Start : Start + Size]
+            Buffer[Start : Start + Size] = Buffer[Offset : Offset + Size]
+            Buffer[Offset : Offset + Size] = Current
+            RowsOrder[BaseIndex], RowsOrder[SwapRow] = (RowsOrder[SwapRow],
+                                                        RowsOrder[BaseIndex])
+            Sign *= -1
+        if not isPartialPivoting:
+            #maximum absolute value in the row - columns pivoting
+            MaxIndex = BaseIndex
+            MaxValue = abs(Buffer[Start + BaseIndex])
+            for ColIdx in range(BaseIndex + 1, Size):
+                Value = abs(Buffer[Start + ColIdx])
+                if Value > MaxValue:
+                    MaxValue = Value
+                    MaxIndex = ColIdx
+            if MaxIndex != BaseIndex:
+                #all elements in both columns belong to U or the remaining
+                #+ sub-matrix, not to the stored multipliers
+                for Offset in range(0, Size * Size, Size):
+                    First = Offset + BaseIndex
+                    Second = Offset + MaxIndex
+                    Buffer[First], Buffer[Second] = (Buffer[Second],
+                                                                Buffer[First])
+                ColsOrder[BaseIndex], ColsOrder[MaxIndex] = (
+                                    ColsOrder[MaxIndex], ColsOrder[BaseIndex])
+                Sign *= -1
+        #Gauss elimination, in place
+        Base = Buffer[Start + BaseIndex]
+        if Base != 0:
+            PivotRow = Buffer[Start + BaseIndex + 1 : Start + Size]
+            for Offset in range(Start + Size, Size * Size, Size):
+                Coefficient = Buffer[Offset + BaseIndex] / Base
+                Buffer[Offset + BaseIndex] = Coefficient
+                if Coefficient:
+                    Buffer[Offset + BaseIndex + 1 : Offset + Size] = [
+                                        Item - Coefficient * PivotItem
+                                        for Item, PivotItem in zip(
+                                Buffer[Offset + BaseIndex + 1 : Offset + Size],
+                                                                    PivotRow)]
+    return Buffer, RowsOrder, ColsOrder, Sign
+
 #+ Gram-Schmidt and QR decomposition related
 
 def _Dot(Vector1: Sequence[TReal], Vector2: Sequence[TReal]) -> TReal:
@@ -235,95 +524,675 @@ def _GetOrthonormal(Vectors: Sequence[Sequence[TReal]]) -> List[List[float]]:
 
 #+ QR-algorithm related (Francis, Kublanovskaya)
 
-def _FindEigenValuesQR(Vectors: Sequence[Sequence[TReal]]) -> Tuple[
-                                                Union[List[TReal], None], str]:
+def _ReduceHessenberg(Rows: List[List[float]]) -> None:
+    """
+    Reduces a square matrix to the upper Hessenberg form (all zeroes below the
+    first sub-diagonal) by the orthogonal similarity transformations with the
+    Householder reflections, thus the eigenvalues are not changed. The passed
+    nested lists are modified in place. It does not any data sanity checks! It
+    is not supposed to be used outside the module.
+    
+    Signature:
+        list(list(float)) -> None
+    
+    Args:
+        Rows: list(list(float)); the matrix elements packed into nested lists
+            in the rows-first order
+    
+    Version 1.0.0.0
+    """
+    Size = len(Rows)
+    for Index in range(Size - 2):
+        Vector = [Rows[RowIdx][Index] for RowIdx in range(Index + 1, Size)]
+        Alpha = sqrt(sum(Item * Item for Item in Vector[1 : ]))
+        if not Alpha: #already zeroes below the sub-diagonal
+            continue
+        Alpha = sqrt(Alpha * Alpha + Vector[0] * Vector[0])
+        if Vector[0] > 0:
+            Alpha = - Alpha
+        Vector[0] -= Alpha
+        Norm = sqrt(sum(Item * Item for Item in Vector))
+        Vector = [Item / Norm for Item in Vector]
+        Start = Index + 1
+        #H * A: reflect the rows below the current one
+        for ColIdx in range(Index, Size):
+            Projection = 2 * sum(Item * Rows[Start + Pos][ColIdx]
+                                        for Pos, Item in enumerate(Vector))
+            if Projection:
+                for Pos, Item in enumerate(Vector):
+                    Rows[Start + Pos][ColIdx] -= Projection * Item
+        #(H * A) * H: reflect the columns to the right of the current one
+        for RowItems in Rows:
+            Projection = 2 * sum(map(mul, RowItems[Start : ], Vector))
+            if Projection:
+                RowItems[Start : ] = [Item - Projection * Component
+                                        for Item, Component in zip(
+                                                RowItems[Start : ], Vector)]
+        Rows[Start][Index] = Alpha
+        for RowIdx in range(Start + 1, Size):
+            Rows[RowIdx][Index] = 0.0
+
+def _FindEigenValuesQR(Rows: List[List[float]]) -> Tuple[
+                            Union[List[Union[TReal, complex]], None], str]:
     """
     Implementation of the QR-algorithm by Francis and Kublanovskaya for finding
-    the eigenvalues of a square matrix.
+    all eigenvalues of a square matrix, including the complex ones. The matrix
+    is reduced to the upper Hessenberg form first, then the implicit Francis
+    double shift QR iterations with the deflation are applied to the active
+    (unreduced) block, with the exceptional (Wilkinson's ad hoc) shifts at the
+    10-th and 20-th iterations for the same eigenvalue. Each iteration costs
+    O(N^2) operations, and, usually, only few iterations per eigenvalue are
+    required. The passed nested lists are modified in place. It does not any
+    data sanity checks! It is not supposed to be used outside the module.
     
     Signature:
-        seq(seq(int OR float)) -> list(int OR float) OR None, str
+        list(list(float)) -> list(int OR float OR complex) OR None, str
     
     Args:
-        seq(seq(int OR float)): the matrix elements packed into nested sequences
-            in the columns-first order
+        Rows: list(list(float)); the matrix elements packed into nested lists
+            in the rows-first order
     
     Returns:
-        list(int OR float), str: unpacked tuple of the list of the unique real
-            number value eigenvalues and a string message ('Ok')
+        list(int OR float OR complex), str: unpacked tuple of the list of all
+            eigenvalues, each repeated according to its algebraic
+            multiplicity, sorted by the descending absolute value, and a string
+            message ('Ok!'); the real eigenvalues are returned as real numbers,
+            rounded to integers if the rounding error is within the estimated
+            precision, the complex eigenvalues - as complex conjugated pairs
         None, str: unpacked tuple of the None value to indicate the failure of
             the algorithm and a string message explaining the reason
     
-    Version 1.0.0.0
+    Version 2.0.0.0
     """
-    DoStop = False
-    Counter = 0
-    Size = len(Vectors)
-    A = Vectors #orginal matrix in the columns-first order
-    while (not DoStop) and (Counter < MAX_ITER):
-        try:
-            Q = _GetOrthonormal(A) #Q-matrix as the set of orthonormal vectors
-        except UT_Exception:
+    _ReduceHessenberg(Rows)
+    a = Rows
+    Size = len(a)
+    Precision = Size * Size * Size * ALMOST_ZERO
+    Norm = sum(abs(a[RowIdx][ColIdx]) for RowIdx in range(Size)
+                            for ColIdx in range(max(RowIdx - 1, 0), Size))
+    Values = []
+    Last = Size - 1 #last row / column of the active block
+    Shift = 0.0 #accumulated exceptional shifts
+    Message = 'Ok!'
+    while Last >= 0:
+        Iteration = 0
+        while True:
+            #look for a single negligible sub-diagonal element - deflation
+            First = Last
+            while First > 0:
+                Scale = abs(a[First - 1][First - 1]) + abs(a[First][First])
+                if Scale == 0.0:
+                    Scale = Norm
+                if abs(a[First][First - 1]) + Scale == Scale:
+                    a[First][First - 1] = 0.0
+                    break
+                First -= 1
+            x = a[Last][Last]
+            if First == Last: #single real eigenvalue is found
+                Values.append(x + Shift)
+                Last -= 1
+                break
+            y = a[Last - 1][Last - 1]
+            w = a[Last][Last - 1] * a[Last - 1][Last]
+            if First == Last - 1: #a pair of eigenvalues is found
+                p = 0.5 * (y - x)
+                q = p * p + w
+                z = sqrt(abs(q))
+                x += Shift
+                if q >= 0.0: #real pair
+                    z = p + (z if p >= 0 else -z)
+                    Values.append(x + z)
+                    Values.append(x - w / z if z else x + z)
+                else: #complex conjugated pair
+                    Values.append(complex(x + p, z))
+                    Values.append(complex(x + p, -z))
+                Last -= 2
+                break
+            if Iteration == MAX_ITER:
+                Values = None
+                Message = 'Maximum number of iterations is reached.'
+                break
+            if Iteration in (10, 20): #exceptional shift
+                Shift += x
+                for Index in range(Last + 1):
+                    a[Index][Index] -= x
+                s = abs(a[Last][Last - 1]) + abs(a[Last - 1][Last - 2])
+                x = y = 0.75 * s
+                w = -0.4375 * s * s
+            Iteration += 1
+            #look for two consecutive small sub-diagonal elements
+            m = Last - 2
+            while True:
+                z = a[m][m]
+                r = x - z
+                s = y - z
+                p = (r * s - w) / a[m + 1][m] + a[m][m + 1]
+                q = a[m + 1][m + 1] - z - r - s
+                r = a[m + 2][m + 1]
+                s = abs(p) + abs(q) + abs(r)
+                p /= s
+                q /= s
+                r /= s
+                if m == First:
+                    break
+                u = abs(a[m][m - 1]) * (abs(q) + abs(r))
+                v = abs(p) * (abs(a[m - 1][m - 1]) + abs(z)
+                                                    + abs(a[m + 1][m + 1]))
+                if u + v == v:
+                    break
+                m -= 1
+            for Index in range(m + 2, Last + 1):
+                a[Index][Index - 2] = 0.0
+                if Index != m + 2:
+                    a[Index][Index - 3] = 0.0
+            #double shift QR step on rows First to Last and columns m to Last
+            for k in range(m, Last):
+                if k != m:
+                    p = a[k][k - 1]
+                    q = a[k + 1][k - 1]
+                    r = a[k + 2][k - 1] if k != Last - 1 else 0.0
+                    x = abs(p) + abs(q) + abs(r)
+                    if x != 0.0:
+                        p /= x
+                        q /= x
+                        r /= x
+                s = sqrt(p * p + q * q + r * r)
+                if p < 0:
+                    s = - s
+                if s != 0.0:
+                    if k == m:
+                        if First != m:
+                            a[k][k - 1] = - a[k][k - 1]
+                    else:
+                        a[k][k - 1] = - s * x
+                    p += s
+                    x = p / s
+                    y = q / s
+                    z = r / s
+                    q /= p
+                    r /= p
+                    for j in range(k, Last + 1):
+                        p = a[k][j] + q * a[k + 1][j]
+                        if k != Last - 1:
+                            p += r * a[k + 2][j]
+                            a[k + 2][j] -= p * z
+                        a[k + 1][j] -= p * y
+                        a[k][j] -= p * x
+                    for i in range(First, min(Last, k + 3) + 1):
+                        p = x * a[i][k] + y * a[i][k + 1]
+                        if k != Last - 1:
+                            p += z * a[i][k + 2]
+                            a[i][k + 2] -= p * r
+                        a[i][k + 1] -= p * q
+                        a[i][k] -= p
+        if Values is None:
             break
-        #Q-matrix convergence test - check if it is almost an identity matrix
-        IsIdentity = True
-        for ColIdx in range(Size):
-            for RowIdx, Item in enumerate(Q[ColIdx]):
-                if RowIdx == ColIdx:
-                    Check = abs(Q[ColIdx][RowIdx]-1) < ALMOST_ZERO
+    if not (Values is None):
+        Result = []
+        for Item in Values:
+            if isinstance(Item, complex):
+                if abs(Item.imag) < Precision * max(1.0, abs(Item.real)):
+                    Item = Item.real #rounding error, actually real
                 else:
-                    Check = abs(Q[ColIdx][RowIdx]) < ALMOST_ZERO
-                IsIdentity = Check
-                if not Check:
+                    Result.append(Item)
+                    continue
+            if abs(Item - round(Item)) < Precision:
+                Item = int(round(Item))
+            Result.append(Item)
+        Result.sort(key = lambda Value: (-abs(Value), -Value.real,
+                                                        -Value.imag))
+        Values = Result
+    return Values, Message
+
+def _FindEigenSymmetric(Rows: List[List[float]]) -> Tuple[
+                    Union[List[TReal], None], Union[List[List[float]], None],
+                                                                        str]:
+    """
+    Implementation of the symmetric eigenvalue algorithm: the matrix is
+    reduced to the tridiagonal form by the Householder reflections, then the
+    implicit QL iterations with the Wilkinson's shifts and deflation are
+    applied to the tridiagonal matrix. The orthogonal transformations of the
+    both stages are accumulated, thus all eigenvalues and the orthonormal
+    eigenbasis are found in a single pass. The passed nested lists are
+    modified in place, and only their symmetry is assumed. It does not any
+    data sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(list(float)) -> list(int OR float) OR None,
+            list(list(float)) OR None, str
+    
+    Args:
+        Rows: list(list(float)); the elements of a symmetric matrix packed
+            into nested lists in the rows-first order
+    
+    Returns:
+        list(int OR float), list(list(float)), str: unpacked tuple of the list
+            of all eigenvalues, each repeated according to its algebraic
+            multiplicity, sorted by the descending absolute value, followed by
+            the list of the respective normalized eigenvectors and a string
+            message ('Ok!'); the eigenvalues are rounded to integers if the
+            rounding error is within the estimated precision
+        None, None, str: unpacked tuple of the None values to indicate the
+            failure of the algorithm and a string message explaining the
+            reason
+    
+    Version 1.0.0.0
+    """
+    a = Rows
+    Size = len(a)
+    #transposed matrix of the accumulated transformations - the rows are
+    #+ the eigenvectors at the end
+    Vectors = [[1.0 if ColIdx == RowIdx else 0.0 for ColIdx in range(Size)]
+                                                    for RowIdx in range(Size)]
+    #Householder tridiagonalization, the trailing block is updated by rows
+    for Index in range(Size - 2):
+        Start = Index + 1
+        Vector = [a[RowIdx][Index] for RowIdx in range(Start, Size)]
+        Alpha = sqrt(sum(Item * Item for Item in Vector[1 : ]))
+        if not Alpha: #already zeroes below the sub-diagonal
+            continue
+        Alpha = sqrt(Alpha * Alpha + Vector[0] * Vector[0])
+        if Vector[0] > 0:
+            Alpha = - Alpha
+        Vector[0] -= Alpha
+        Beta = 2.0 / sum(Item * Item for Item in Vector)
+        Block = [a[RowIdx][Start : ] for RowIdx in range(Start, Size)]
+        Product = [Beta * sum(map(mul, RowItems, Vector))
+                                                    for RowItems in Block]
+        Coefficient = 0.5 * Beta * sum(map(mul, Product, Vector))
+        Product = [Item - Coefficient * Component
+                                for Item, Component in zip(Product, Vector)]
+        for Pos, RowItems in enumerate(Block):
+            First = Vector[Pos]
+            Second = Product[Pos]
+            a[Start + Pos][Start : ] = [Item - First * Other - Second * Comp
+                                for Item, Comp, Other in zip(RowItems,
+                                                            Vector, Product)]
+        a[Start][Index] = a[Index][Start] = Alpha
+        for RowIdx in range(Start + 1, Size):
+            a[RowIdx][Index] = a[Index][RowIdx] = 0.0
+        Projection = [0.0] * Size
+        for Component, RowItems in zip(Vector, Vectors[Start : ]):
+            if Component:
+                Projection = [Item + Component * Other
+                                for Item, Other in zip(Projection, RowItems)]
+        for Pos, Component in enumerate(Vector, start = Start):
+            Component *= Beta
+            if Component:
+                Vectors[Pos] = [Item - Component * Other
+                            for Item, Other in zip(Vectors[Pos], Projection)]
+    d = [a[Index][Index] for Index in range(Size)]
+    e = [a[Index + 1][Index] for Index in range(Size - 1)]
+    e.append(0.0)
+    #implicit QL iterations on the tridiagonal matrix
+    Message = 'Ok!'
+    for l in range(Size):
+        Iteration = 0
+        while True:
+            m = l
+            while m < Size - 1: #look for a negligible off-diagonal element
+                Scale = abs(d[m]) + abs(d[m + 1])
+                if abs(e[m]) + Scale == Scale:
                     break
-            if not IsIdentity:
+                m += 1
+            if m == l:
                 break
-        if IsIdentity:
-            DoStop = True
-        else:
-            R = [[_Dot(A[ColIdx], Q[RowIdx]) if RowIdx <= ColIdx else 0
-                        for RowIdx in range(Size)] for ColIdx in range(Size)]
-            #R-matrix, projection, such that A{k-1} = Q{k-1} * R{k-1}
-            A = [[sum([R[Idx][RowIdx] * Q[ColIdx][Idx] for Idx in range(Size)])
-                        for RowIdx in range(Size)] for ColIdx in range(Size)]
-            #next iteration A{k} = R{k-1} * Q{k-1}
-        Counter += 1
-    if DoStop:
-        Elements = [A[Idx][Idx] for Idx in range(Size)]
-        Elements = [int(round(Item))
-                        if abs(Item - round(Item)) < Size*Size*Size*ALMOST_ZERO
-                                                else Item for Item in Elements]
-        #QR convergence is ~ O(N^3), hence the estimation of rounding error
-        Result = []
-        for Item in Elements:
-            if not Item:
-                continue
-            IsNotPresent = True
-            for AddedItem in Result:
-                if abs((AddedItem - Item)/(AddedItem)) < ALMOST_ZERO:
-                    IsNotPresent = False
+            if Iteration == MAX_ITER:
+                Message = 'Maximum number of iterations is reached.'
+                break
+            Iteration += 1
+            g = (d[l + 1] - d[l]) / (2.0 * e[l])
+            r = hypot(g, 1.0)
+            g = d[m] - d[l] + e[l] / (g + (r if g >= 0 else -r))
+            s = c = 1.0
+            p = 0.0
+            IsUnderflow = False
+            for i in range(m - 1, l - 1, -1):
+                f = s * e[i]
+                b = c * e[i]
+                r = hypot(f, g)
+                e[i + 1] = r
+                if r == 0.0:
+                    d[i + 1] -= p
+                    e[m] = 0.0
+                    IsUnderflow = True
                     break
-            if IsNotPresent:
-                Result.append(Item)
-        Message = 'Ok!'
-    elif Counter < MAX_ITER:
-        Result = None
-        Message = 'Matrix cannot be orthogonolized - linear dependent columns.'
+                s = f / r
+                c = g / r
+                g = d[i + 1] - p
+                r = (d[i] - g) * s + 2.0 * c * b
+                p = s * r
+                d[i + 1] = g + p
+                g = c * r - b
+                First = Vectors[i]
+                Second = Vectors[i + 1]
+                Vectors[i] = [c * Item - s * Other
+                                    for Item, Other in zip(First, Second)]
+                Vectors[i + 1] = [s * Item + c * Other
+                                    for Item, Other in zip(First, Second)]
+            if IsUnderflow:
+                continue
+            d[l] -= p
+            e[l] = g
+            e[m] = 0.0
+        if Iteration == MAX_ITER:
+            break
+    if Message == 'Ok!':
+        Precision = Size * Size * Size * ALMOST_ZERO
+        Values = []
+        for Item in d:
+            if abs(Item - round(Item)) < Precision:
+                Item = int(round(Item))
+            Values.append(Item)
+        Order = sorted(range(Size), key = lambda Index: (
+                                        -abs(Values[Index]), -Values[Index]))
+        Values = [Values[Index] for Index in Order]
+        Vectors = [Vectors[Index] for Index in Order]
     else:
-        Result = None
-        Message = 'Maximum number of iterations is reached - not converging.'
-    return Result, Message
+        Values = None
+        Vectors = None
+    return Values, Vectors, Message
+
+def _GroupEigenValues(Values: Sequence[TReal]) -> List[Tuple[TReal,
+                                                                List[int]]]:
+    """
+    Groups the real eigenvalues, which are equal within the estimated
+    precision. It does not any data sanity checks! It is not supposed to be
+    used outside the module.
+    
+    Signature:
+        seq(int OR float) -> list(tuple(int OR float, list(int)))
+    
+    Returns:
+        list(tuple(int OR float, list(int))): list of pairs of an unique
+            eigenvalue (the first found of the group) and the list of the
+            indexes of all eigenvalues equal to it
+    
+    Version 1.0.0.0
+    """
+    Size = len(Values)
+    Precision = Size * Size * Size * ALMOST_ZERO
+    Result = []
+    for Index, Item in enumerate(Values):
+        IsNotPresent = True
+        for AddedItem, Indexes in Result:
+            if abs(AddedItem - Item) < Precision * abs(AddedItem):
+                Indexes.append(Index)
+                IsNotPresent = False
+                break
+        if IsNotPresent:
+            Result.append((Item, [Index]))
+    return Result
+
+#+ sparse matrices related
+
+def _CompressRows(Rows: Sequence[Dict[int, TReal]]) -> Tuple[List[int],
+                                                    List[int], List[TReal]]:
+    """
+    Converts the rows of a sparse matrix, each represented by a dictionary
+    mapping the column index onto the value of the element, into the
+    compressed sparse rows (CSR) form: the row pointers, the column indexes and
+    the values of the non-zero elements in the rows-first order, with the
+    column indexes sorted within each row. The zero values are dropped. It does
+    not any data sanity checks! It is not supposed to be used outside the
+    module.
+    
+    Signature:
+        seq(dict(int -> int OR float))
+            -> tuple(list(int), list(int), list(int OR float))
+    
+    Version 1.0.0.0
+    """
+    Pointers = [0]
+    Indexes = []
+    Values = []
+    for Row in Rows:
+        for Index in sorted(Row):
+            Value = Row[Index]
+            if Value:
+                Indexes.append(Index)
+                Values.append(Value)
+        Pointers.append(len(Indexes))
+    return Pointers, Indexes, Values
+
+def _GetPermutationSign(Order: Sequence[int]) -> int:
+    """
+    Calculates the sign of a permutation of the indexes 0 to N-1 by counting
+    its cycles. It does not any data sanity checks! It is not supposed to be
+    used outside the module.
+    
+    Signature:
+        seq(int >= 0) -> int = 1 OR -1
+    
+    Version 1.0.0.0
+    """
+    Result = 1
+    isVisited = [False] * len(Order)
+    for Start in range(len(Order)):
+        if not isVisited[Start]:
+            Index = Order[Start]
+            isVisited[Start] = True
+            while Index != Start:
+                isVisited[Index] = True
+                Index = Order[Index]
+                Result = - Result
+    return Result
+
+def _DecomposeBanded(Rows: List[List[TReal]], Size: int, Lower: int,
+                                    isPivoting: bool) -> Tuple[List[int],
+                    List[List[TReal]], List[Tuple[TReal, List[TReal]]],
+                                                                    TReal]:
+    """
+    Performs the Gaussian elimination of a banded matrix with Lower non-zero
+    sub-diagonals. Each row is passed as a non-empty list of the elements
+    starting from the column max(0, RowIndex - Lower), and the rows are
+    modified in place. With the partial (rows) pivoting the upper-triangular
+    factor gains up to Lower extra super-diagonals; without pivoting, which is
+    safe for the diagonally dominant matrices, there is no fill-in at all, and
+    for a tridiagonal matrix it is exactly the Thomas algorithm. It does not
+    any data sanity checks! It is not supposed to be used outside the module.
+    
+    Signature:
+        list(list(int OR float)), int >= 2, int >= 0, bool
+            -> tuple(list(int >= 0), list(list(int OR float)),
+                list(tuple(int OR float, list(int OR float))), int OR float)
+    
+    Returns:
+        tuple(list(int >= 0), list(list(int OR float)),
+                list(tuple(int OR float, list(int OR float))), int OR float):
+            the index of the row swapped with the current one at each step,
+            the multipliers of the lower-triangular factor for each step (the
+            rows below the pivot one), the diagonal element and the rest of the
+            row of the upper-triangular factor for each step, and the
+            determinant; the determinant is zero and the factors are
+            incomplete if the matrix is singular (or a zero pivot is met
+            without pivoting)
+    
+    Version 1.0.0.0
+    """
+    Swaps = []
+    Multipliers = []
+    Upper = []
+    Determinant = 1
+    for Step in range(Size):
+        Last = min(Size - 1, Step + Lower)
+        Pivot = Step
+        if isPivoting:
+            Maximum = abs(Rows[Step][0])
+            for Index in range(Step + 1, Last + 1):
+                Value = abs(Rows[Index][0])
+                if Value > Maximum:
+                    Pivot = Index
+                    Maximum = Value
+        if Pivot != Step:
+            Rows[Step], Rows[Pivot] = Rows[Pivot], Rows[Step]
+            Determinant = - Determinant
+        Swaps.append(Pivot)
+        PivotRow = Rows[Step]
+        Diagonal = PivotRow[0]
+        if not Diagonal:
+            Determinant = 0
+            break
+        Determinant *= Diagonal
+        Tail = PivotRow[1 : ]
+        Length = len(Tail)
+        Factors = []
+        for Index in range(Step + 1, Last + 1):
+            Row = Rows[Index]
+            Factor = Row[0] / Diagonal
+            Row = Row[1 : ] or [0]
+            if len(Row) < Length:
+                Row.extend([0] * (Length - len(Row)))
+            if Factor:
+                Row[ : Length] = [Value - Factor * Item
+                                        for Value, Item in zip(Row, Tail)]
+            Rows[Index] = Row
+            Factors.append(Factor)
+        Multipliers.append(Factors)
+        Upper.append((Diagonal, Tail))
+    return Swaps, Multipliers, Upper, Determinant
 
 #classes
 
+class ArrayView(c_abc.Sequence):
+    """
+    Read-only, zero-copy view onto a strided subset of the flat storage of an
+    array or matrix, e.g. a single row or a single column. The elements are not
+    copied, but read directly from the underlying storage on request.
+    
+    Supports the read-only integer indexing (including negative values),
+    iteration, 'contains' check, len() function as well as the methods index()
+    and count() of the generic sequence. Slice notation is not supported.
+    
+    Not supposed to be instantiated directly, but via the methods getRowView()
+    and getColumnView() of the class Array2D and its sub-classes.
+    
+    Properties:
+        Data: (read-only) list(int OR float)
+    
+    Version 1.0.0.0
+    """
+    
+    __slots__ = ('_Storage', '_Start', '_Length', '_Step')
+    
+    #special methods
+    
+    def __init__(self, Storage: Sequence[TReal], Start: int, Length: int,
+                                                        Step: int = 1) -> None:
+        """
+        Initialization method. Stores the reference to the storage and the
+        stride metadata. It does not any data sanity checks!
+        
+        Signature:
+            seq(int OR float), int >= 0, int >= 0/, int > 0/ -> None
+        
+        Args:
+            Storage: seq(int OR float); the flat storage to be viewed
+            Start: int >= 0; index of the first viewed element in the storage
+            Length: int >= 0; number of the viewed elements
+            Step: (optional) int > 0; index stride between the consequitive
+                viewed elements, defaults to 1
+        
+        Version 1.0.0.0
+        """
+        self._Storage = Storage
+        self._Start = Start
+        self._Length = Length
+        self._Step = Step
+    
+    def __repr__(self) -> str:
+        """
+        Magic method to support repr() function with the view as its argument.
+        
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return "'{}({})'".format(self.__class__.__name__, list(self))
+    
+    def __len__(self) -> int:
+        """
+        Magic method to support len() function with the view as its argument.
+        
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Length
+    
+    def __getitem__(self, Index: int) -> TReal:
+        """
+        Magic method to hook the index read access.
+        
+        Signature:
+            int -> int OR float
+        
+        Args:
+            Index: int; the required element index
+        
+        Returns:
+            int OR float: the value of the respective element
+        
+        Raises:
+            UT_TypeError: index is not an integer number
+            UT_ValueError: index is an integer outside the range
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Index, int):
+            raise UT_TypeError(Index, int, SkipFrames = 1)
+        Size = self._Length
+        if (Index < - Size) or (Index >= Size):
+            raise UT_ValueError(Index,
+                f'in range [{-Size}, {Size - 1}] - indexing', SkipFrames = 1)
+        if Index < 0:
+            Index += Size
+        return self._Storage[self._Start + Index * self._Step]
+    
+    def __iter__(self) -> Iterator[TReal]:
+        """
+        Magic method to hook the iterator protocol.
+        
+        Signature:
+            None -> iterator(int OR float)
+        
+        Version 1.0.0.0
+        """
+        Start = self._Start
+        Step = self._Step
+        Stop = Start + self._Length * Step
+        return map(self._Storage.__getitem__, range(Start, Stop, Step))
+    
+    #public properties
+    
+    @property
+    def Data(self) -> List[TReal]:
+        """
+        Read-only property to copy all viewed elements into a list.
+        
+        Signature:
+            None -> list(int OR float)
+        
+        Version 1.0.0.0
+        """
+        return list(self)
+
 class Array2D:
     """
     A prototype class for the generic and square matrices, implementing the
     data storage and read-access in the form of a 2-D array.
     
-    The data is stored and returned (property Data) as a sequence of the nested
-    equal length sub-sequences of real numbers, each sub-sequence representing a
-    single row of the array, i.e. in the rows-first order.
+    The data is stored internally as a single flat, contiguous sequence in the
+    rows-first order together with the width and height of the array, so an
+    element is accessed via index arithmetic, and a row or a column can be
+    viewed without copying (methods getRowView() and getColumnView()). If all
+    elements are floating point numbers, they are packed into a compact
+    array.array of C doubles, otherwise a flat tuple is used to preserve the
+    exact integer values. The data is returned (property Data) as a list of
+    the nested equal length lists of real numbers, each sub-list representing
+    a single row of the array, i.e. in the rows-first order.
     
     The instances of this class are immutable objects, and are not considered
     to be sequences, thus not supporting iteration and 'contains' check. But
@@ -354,27 +1223,66 @@ class Array2D:
         Height: (read-only) int >= 2
         Data: (read-only) list(list(int OR float))
     
-    Version 1.0.0.0
+    Methods:
+        getRowView(Index):
+            int -> ArrayView
+        getColumnView(Index):
+            int -> ArrayView
+    
+    Version 1.1.0.0
     """
     
-    #special methods
+    __slots__ = ('_Elements', '_Width', '_Height')
     
-    def __init__(self, seqValues: Union[TRealSequence, TSequenceRealSequence],
-                                *, Width : Optional[int] = None,
-                                    Height : Optional[int] = None,
-                                        isColumnsFirst : bool = False) -> None:
+    #private class methods
+    
+    @classmethod
+    def _fromFlat(cls, Elements: Sequence[TReal], Width: int,
+                                                        Height: int) -> TArray:
         """
-        Instantiation method. Parses the passed data sequence and packs it into
-        the internally stored nested tuple structure representing a 2D array or
-        a matrix, with each tuple element representing a single row of that
-        array or matrix.
+        Creates a new instance directly from the elements already flattened in
+        the rows-first order, bypassing the input data sanity checks and
+        parsing. Designed for the internal use by the arithmetics and the
+        decomposition methods; it is not supposed to be used outside the
+        module.
         
         Signature:
-            seq(int OR float) OR seq(seq(int OR float))/, int >= 2 OR None,
-                int >= 2 OR None, bool/ -> None
+            seq(int OR float), int >= 2, int >= 2 -> 'Array2D
         
         Args:
-            seqValues: seq(int OR float) OR seq(seq(int OR float)); elements
+            Elements: seq(int OR float); exactly Width * Height elements in the
+                rows-first order
+            Width: int >= 2; width of the array or matrix
+            Height: int >= 2; height of the array or matrix
+        
+        Returns:
+            'Array2D: a new instance of the class the method is called from
+        
+        Version 1.0.0.0
+        """
+        Result = cls.__new__(cls)
+        Result._Elements = _PackElements(Elements)
+        Result._Width = Width
+        Result._Height = Height
+        return Result
+    
+    #special methods
+    
+    def __init__(self, seqValues: Union[TRealSequence, TSequenceRealSequence],
+                                *, Width : Optional[int] = None,
+                                    Height : Optional[int] = None,
+                                        isColumnsFirst : bool = False) -> None:
+        """
+        Instantiation method. Parses the passed data sequence and packs it into
+        the internally stored flat structure (in the rows-first order)
+        representing a 2D array or a matrix, and stores its dimensions.
+        
+        Signature:
+            seq(int OR float) OR seq(seq(int OR float))/, int >= 2 OR None,
+                int >= 2 OR None, bool/ -> None
+        
+        Args:
+            seqValues: seq(int OR float) OR seq(seq(int OR float)); elements
                 of the array / matrix, in the flat form the total number of
                 elements must be equal to or greater than 2 * Width if only
                 width is specified, or 2 * Height if only height is specified,
@@ -412,7 +1320,7 @@ class Array2D:
                 sub-sequence element is less than 2, OR the sub-sequence
                 elements differ in length.
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if not isinstance(isColumnsFirst, bool):
             Error = UT_TypeError(isColumnsFirst, bool, SkipFrames = 1)
@@ -479,13 +1387,11 @@ class Array2D:
                                 '>= {} - sequence length'.format(MinLength),
                                                                 SkipFrames = 1)
             if not isColumnsFirst:
-                self._Elements = tuple(
-                            tuple(seqValues[Index*_Width : (Index+1)*_Width])
-                                                    for Index in range(_Height))
+                Elements = [seqValues[Index] for Index in range(MinLength)]
             else:
-                self._Elements = tuple(tuple(seqValues[Outer + _Height * Inner]
-                                                    for Inner in range(_Width))
-                                                    for Outer in range(_Height))
+                Elements = [seqValues[Outer + _Height * Inner]
+                                                for Outer in range(_Height)
+                                                    for Inner in range(_Width)]
         except UT_TypeError as err:
             _CheckIfSequenceRealSequence(seqValues)
             NItems = len(seqValues)
@@ -504,12 +1410,19 @@ class Array2D:
                                 '!= {} - sub-sequence index {} length'.format(
                                             FirstLength, Index), SkipFrames = 1)
             if not isColumnsFirst:
-                self._Elements = tuple(tuple(seqValues[Index])
-                                                    for Index in range(NItems))
+                Elements = [Item for Index in range(NItems)
+                                                for Item in seqValues[Index]]
+                _Width = FirstLength
+                _Height = NItems
             else:
-                self._Elements = tuple(tuple(seqValues[HIndex][WIndex]
-                                        for HIndex in range(NItems))
-                                            for WIndex in range(FirstLength))
+                Elements = [seqValues[HIndex][WIndex]
+                                            for WIndex in range(FirstLength)
+                                                for HIndex in range(NItems)]
+                _Width = NItems
+                _Height = FirstLength
+        self._Elements = _PackElements(Elements)
+        self._Width = _Width
+        self._Height = _Height
     
     def __str__(self) -> str:
         """
@@ -518,11 +1431,11 @@ class Array2D:
         Signature:
             None -> str
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         return '\n{}\n'.format('\n'.join(['|{}|'.format(
                                         ', '.join([str(Item) for Item in Row]))
-                                                    for Row in self._Elements]))
+                                                for Row in self._getRows()]))
     
     def __repr__(self) -> str:
         """
@@ -532,10 +1445,10 @@ class Array2D:
         Signature:
             None -> str
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         return "'{}(Width={}, Height={})'".format(self.__class__.__name__,
-                                    len(self._Elements[0]), len(self._Elements))
+                                                    self._Width, self._Height)
     
     def __iter__(self) -> NoReturn:
         """
@@ -566,7 +1479,7 @@ class Array2D:
                 [-Width, Width - 1], OR the row index values is not in the
                 inclusive range [-Height, Height - 1]
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if not isinstance(Indexes, tuple):
             raise UT_TypeError(Indexes, tuple, SkipFrames = 1)
@@ -574,8 +1487,8 @@ class Array2D:
             raise UT_ValueError(len(Indexes), '== 2 - number of indexes',
                                                                 SkipFrames = 1)
         Column, Row = Indexes
-        Height = len(self._Elements)
-        Width = len(self._Elements[0])
+        Height = self._Height
+        Width = self._Width
         if not isinstance(Column, int):
             Error = UT_TypeError(Column, int, SkipFrames = 1)
             Error.appendMessage('- column index')
@@ -588,9 +1501,13 @@ class Array2D:
             Error.appendMessage('- row index')
             raise Error
         if (Row < -Height) or (Row >= Height):
-            raise UT_ValueError(Column, f'in range [{-Height}, {Height - 1}]',
+            raise UT_ValueError(Row, f'in range [{-Height}, {Height - 1}]',
                                                                 SkipFrames = 1)
-        return self._Elements[Row][Column]
+        if Column < 0:
+            Column += Width
+        if Row < 0:
+            Row += Height
+        return self._Elements[Row * Width + Column]
     
     def __copy__(self) -> TArray:
         """
@@ -603,9 +1520,10 @@ class Array2D:
             'Array2D: another instance of the same class with the identical
                 elements
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return self.__class__(self._Elements)
+        return self.__class__._fromFlat(self._Elements, self._Width,
+                                                                self._Height)
     
     def __pos__(self) -> TArray:
         """
@@ -618,9 +1536,10 @@ class Array2D:
             'Array2D: another instance of the same class with the identical
                 elements
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return self.__class__(self._Elements)
+        return self.__class__._fromFlat(self._Elements, self._Width,
+                                                                self._Height)
     
     def __neg__(self) -> TArray:
         """
@@ -633,10 +1552,43 @@ class Array2D:
             'Array2D: another instance of the same class with the identical
                 elements
         
+        Version 1.1.0.0
+        """
+        return self.__class__._fromFlat([-Value for Value in self._Elements],
+                                                    self._Width, self._Height)
+    
+    #private instance methods
+    
+    def _getRows(self) -> List[Sequence[TReal]]:
+        """
+        Slices the flat storage into the rows. The returned slices are copies
+        of the same type as the storage itself. Not supposed to be used outside
+        the module.
+        
+        Signature:
+            None -> list(seq(int OR float))
+        
+        Version 1.0.0.0
+        """
+        Elements = self._Elements
+        Width = self._Width
+        return [Elements[Index : Index + Width]
+                                for Index in range(0, len(Elements), Width)]
+    
+    def _getColumns(self) -> List[Sequence[TReal]]:
+        """
+        Slices the flat storage into the columns using the strided slices. The
+        returned slices are copies of the same type as the storage itself. Not
+        supposed to be used outside the module.
+        
+        Signature:
+            None -> list(seq(int OR float))
+        
         Version 1.0.0.0
         """
-        return self.__class__([[-Value for Value in Item]
-                                                    for Item in self._Elements])
+        Elements = self._Elements
+        Width = self._Width
+        return [Elements[Index : : Width] for Index in range(Width)]
     
     #public properties
     
@@ -649,9 +1601,9 @@ class Array2D:
         Signature:
             None -> int >= 2
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return len(self._Elements[0])
+        return self._Width
     
     @property
     def Height(self) -> int:
@@ -662,10 +1614,10 @@ class Array2D:
         Signature:
             None -> int >= 2
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return len(self._Elements)
-
+        return self._Height
+    
     @property
     def Data(self) -> List[List[TReal]]:
         """
@@ -675,9 +1627,75 @@ class Array2D:
         Signature:
             None -> list(list(int OR float))
         
+        Version 1.1.0.0
+        """
+        return [Row.tolist() if isinstance(Row, array) else list(Row)
+                                                    for Row in self._getRows()]
+    
+    #public instance methods
+    
+    def getRowView(self, Index: int) -> ArrayView:
+        """
+        Returns a read-only, zero-copy view of the single row of the array or
+        matrix.
+        
+        Signature:
+            int -> ArrayView
+        
+        Args:
+            Index: int; index of the row, must be in the inclusive range
+                [-Height, Height - 1]
+        
+        Returns:
+            ArrayView: view of the elements of the row
+        
+        Raises:
+            UT_TypeError: index is not an integer number
+            UT_ValueError: index is an integer outside the range
+        
         Version 1.0.0.0
         """
-        return [list(Item) for Item in self._Elements]
+        if not isinstance(Index, int):
+            raise UT_TypeError(Index, int, SkipFrames = 1)
+        Height = self._Height
+        if (Index < -Height) or (Index >= Height):
+            raise UT_ValueError(Index, f'in range [{-Height}, {Height - 1}]',
+                                                                SkipFrames = 1)
+        if Index < 0:
+            Index += Height
+        Width = self._Width
+        return ArrayView(self._Elements, Index * Width, Width)
+    
+    def getColumnView(self, Index: int) -> ArrayView:
+        """
+        Returns a read-only, zero-copy view of the single column of the array
+        or matrix.
+        
+        Signature:
+            int -> ArrayView
+        
+        Args:
+            Index: int; index of the column, must be in the inclusive range
+                [-Width, Width - 1]
+        
+        Returns:
+            ArrayView: view of the elements of the column
+        
+        Raises:
+            UT_TypeError: index is not an integer number
+            UT_ValueError: index is an integer outside the range
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Index, int):
+            raise UT_TypeError(Index, int, SkipFrames = 1)
+        Width = self._Width
+        if (Index < -Width) or (Index >= Width):
+            raise UT_ValueError(Index, f'in range [{-Width}, {Width - 1}]',
+                                                                SkipFrames = 1)
+        if Index < 0:
+            Index += Width
+        return ArrayView(self._Elements, Index, self._Height, Width)
 
 class Vector:
     """
@@ -1433,7 +2451,7 @@ class Row(Vector):
             UT_ValueError: different sizes of the vectors in the case of the
                 row x column product
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         Result = None
         if isinstance(Other, (int, float)):
@@ -1445,8 +2463,8 @@ class Row(Vector):
                         f'{self.Size} - vectors dimensions', SkipFrames = 1)
             Result = sum(Item * Other[Index]
                                 for Index, Item in enumerate(self._Elements))
-        elif isinstance(Other, Array2D):
-            Result = NotImplemented #responsibility of the Matrix class
+        elif isinstance(Other, (Array2D, SparseMatrix)):
+            Result = NotImplemented #responsibility of the Matrix classes
         else:
             raise UT_TypeError(Other, (int, float, self.__class__),
                                                                 SkipFrames = 1)
@@ -1506,8 +2524,9 @@ class Matrix(Array2D):
     """
     Implementation of a generic matrix.
     
-    The data is stored and returned (property Data) as a sequence of the nested
-    equal length sub-sequences of real numbers, each sub-sequence representing a
+    The data is stored internally as a single flat sequence in the rows-first
+    order (see Array2D), and is returned (property Data) as a list of the
+    nested equal length lists of real numbers, each sub-list representing a
     single row of the matrix, i.e. in the rows-first order.
     
     The instances of this class are immutable objects, and are not considered
@@ -1549,10 +2568,16 @@ class Matrix(Array2D):
             int -> Column
         getRow(Index):
             int -> Row
+        getRowView(Index):
+            int -> ArrayView
+        getColumnView(Index):
+            int -> ArrayView
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     
+    __slots__ = ()
+    
     #special methods
 
     def __str__(self) -> str:
@@ -1562,11 +2587,11 @@ class Matrix(Array2D):
         Signature:
             None -> str
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         return '\n{}\n'.format('\n'.join(['||{}||'.format(
                                         ', '.join([str(Item) for Item in Row]))
-                                                    for Row in self._Elements]))
+                                                for Row in self._getRows()]))
     
     def __add__(self, Other: TMatrix) -> TMatrix:
         """
@@ -1589,7 +2614,7 @@ class Matrix(Array2D):
                 (sub-) class
             UT_ValueError: different sizes of the matrices
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if (not isinstance(Other, self.__class__)) and (
                                         not isinstance(self, Other.__class__)):
@@ -1603,22 +2628,19 @@ class Matrix(Array2D):
             ResultClass = Other.__class__
         else:
             ResultClass = self.__class__
-        selfWidth = len(self._Elements)
-        selfHeight = len(self._Elements[0])
-        otherWidth = len(Other._Elements)
-        otherHeight = len(Other._Elements[0])
+        selfWidth = self._Width
+        selfHeight = self._Height
+        otherWidth = Other._Width
+        otherHeight = Other._Height
         if selfWidth != otherWidth:
-            raise UT_ValueError(otherWidth, f'={otherWidth} - matrices widths',
+            raise UT_ValueError(otherWidth, f'={selfWidth} - matrices widths',
                                                                 SkipFrames = 1)
         elif selfHeight != otherHeight:
             raise UT_ValueError(otherHeight,
-                        f'={otherHeight} - matrices heights', SkipFrames = 1)
-        Elements = list()
-        for Row in range(self.Height):
-            RowItems = list([Item + Other._Elements[Row][Index]
-                             for Index, Item in enumerate(self._Elements[Row])])
-            Elements.append(RowItems)
-        return ResultClass(Elements)
+                        f'={selfHeight} - matrices heights', SkipFrames = 1)
+        Elements = [Item + OtherItem
+                for Item, OtherItem in zip(self._Elements, Other._Elements)]
+        return ResultClass._fromFlat(Elements, selfWidth, selfHeight)
     
     def __sub__(self, Other: TMatrix) -> TMatrix:
         """
@@ -1641,7 +2663,7 @@ class Matrix(Array2D):
                 (sub-) class
             UT_ValueError: different sizes of the matrices
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if (not isinstance(Other, self.__class__)) and (
                                         not isinstance(self, Other.__class__)):
@@ -1655,22 +2677,19 @@ class Matrix(Array2D):
             ResultClass = Other.__class__
         else:
             ResultClass = self.__class__
-        selfWidth = len(self._Elements)
-        selfHeight = len(self._Elements[0])
-        otherWidth = len(Other._Elements)
-        otherHeight = len(Other._Elements[0])
+        selfWidth = self._Width
+        selfHeight = self._Height
+        otherWidth = Other._Width
+        otherHeight = Other._Height
         if selfWidth != otherWidth:
-            raise UT_ValueError(otherWidth, f'={otherWidth} - matrices widths',
+            raise UT_ValueError(otherWidth, f'={selfWidth} - matrices widths',
                                                                 SkipFrames = 1)
         elif selfHeight != otherHeight:
             raise UT_ValueError(otherHeight,
-                        f'={otherHeight} - matrices heights', SkipFrames = 1)
-        Elements = list()
-        for Row in range(self.Height):
-            RowItems = list([Item - Other._Elements[Row][Index]
-                             for Index, Item in enumerate(self._Elements[Row])])
-            Elements.append(RowItems)
-        return ResultClass(Elements)
+                        f'={selfHeight} - matrices heights', SkipFrames = 1)
+        Elements = [Item - OtherItem
+                for Item, OtherItem in zip(self._Elements, Other._Elements)]
+        return ResultClass._fromFlat(Elements, selfWidth, selfHeight)
     
     # Is overloaded later
     def __mul__(self, Other: Union[TReal, Column, TMatrix]
@@ -1732,25 +2751,23 @@ class Matrix(Array2D):
             UT_ValueError: the length of the column vector is not equal to the
                 height of the matrix
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         Result = None
         if isinstance(Other, (int, float)):
-            Elements = [[Item * Other for Item in tupRow]
-                                                for tupRow in self._Elements]
-            Result = self.__class__(Elements)
+            Elements = [Item * Other for Item in self._Elements]
+            Result = self.__class__._fromFlat(Elements, self._Width,
+                                                                self._Height)
         elif isinstance(Other, Row):
-            Height = len(self._Elements)
-            Width = len(self._Elements[0])
+            Height = self._Height
             Length = len(Other._Elements)
             if Length != Height:
                 raise UT_ValueError(Length,
                             f'== {Height} - row vector size != matrix height',
                                                                 SkipFrames = 1)
-            Elements = [sum(
-                        self._Elements[RowIndex][ColumnIndex] * Other[RowIndex]
-                                    for RowIndex in range(Height))
-                                                for ColumnIndex in range(Width)]
+            RowItems = Other._Elements
+            Elements = [sum(map(mul, ColItems, RowItems))
+                                            for ColItems in self._getColumns()]
             Result = Row(*Elements)
         else:
             raise UT_TypeError(Other, (int, float, Row), SkipFrames = 1)
@@ -1774,15 +2791,16 @@ class Matrix(Array2D):
             UT_TypeError: the second operand is not a real number
             UT_ValueError: the divisor is zero
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         Result = None
         if isinstance(Other, (int, float)):
             if Other == 0:
                 raise UT_ValueError(Other, '!= 0 - division by zero',
                                                                 SkipFrames = 1)
-            Elements= [[Item / Other for Item in Row] for Row in self._Elements]
-            Result = self.__class__(Elements)
+            Elements = [Item / Other for Item in self._Elements]
+            Result = self.__class__._fromFlat(Elements, self._Width,
+                                                                self._Height)
         else:
             raise UT_TypeError(Other, (int, float), SkipFrames = 1)
         return Result
@@ -1857,9 +2875,10 @@ class Matrix(Array2D):
         Signature:
             None -> 'Matrix
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return self.__class__(self._Elements, isColumnsFirst = True)
+        Elements = [Item for Column in self._getColumns() for Item in Column]
+        return self.__class__._fromFlat(Elements, self._Height, self._Width)
     
     def getColumn(self, Index: int) -> Column:
         """
@@ -1877,16 +2896,17 @@ class Matrix(Array2D):
             UT_ValueError: argument value is not in the inclusive range
                 [-Width, Width - 1]
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if not isinstance(Index, int):
             raise UT_TypeError(Index, int, SkipFrames = 1)
-        Width = len(self._Elements[0])
+        Width = self._Width
         if (Index < - Width) or (Index >= Width):
             raise UT_ValueError(Index, f'in range[{-Width}, {Width - 1}]',
                                                                 SkipFrames = 1)
-        Elements = [RowItem[Index] for RowItem in self._Elements]
-        return Column(*Elements)
+        if Index < 0:
+            Index += Width
+        return Column(*(self._Elements[Index : : Width]))
     
     def getRow(self, Index: int) -> Row:
         """
@@ -1903,23 +2923,27 @@ class Matrix(Array2D):
             UT_ValueError: argument value is not in the inclusive range
                 [-Height, Height - 1]
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if not isinstance(Index, int):
             raise UT_TypeError(Index, int, SkipFrames = 1)
-        Height = len(self._Elements)
+        Height = self._Height
         if (Index < - Height) or (Index >= Height):
             raise UT_ValueError(Index, f'in range[{-Height}, {Height - 1}]',
                                                                 SkipFrames = 1)
-        return Row(*(self._Elements[Index]))
+        if Index < 0:
+            Index += Height
+        Width = self._Width
+        return Row(*(self._Elements[Index * Width : (Index + 1) * Width]))
 
 class SquareMatrix(Matrix):
     """
     Implementation of a square matrix, for which width equals height, and is
     referred to as simply size.
     
-    The data is stored and returned (property Data) as a sequence of the nested
-    equal length sub-sequences of real numbers, each sub-sequence representing a
+    The data is stored internally as a single flat sequence in the rows-first
+    order (see Array2D), and is returned (property Data) as a list of the
+    nested equal length lists of real numbers, each sub-list representing a
     single row of the matrix, i.e. in the rows-first order.
     
     The instances of this class are immutable objects, and are not considered
@@ -1974,10 +2998,16 @@ class SquareMatrix(Matrix):
             int -> Column
         getRow(Index):
             int -> Row
+        getRowView(Index):
+            int -> ArrayView
+        getColumnView(Index):
+            int -> ArrayView
         getTrace():
             None -> int OR float
-        getLUPdecomposition():
-            None -> SquareMatrix, SquareMatrix, tuple(int), tuple(int), int
+        getBandwidths():
+            None -> tuple(int >= 0, int >= 0)
+        getLUPdecomposition(*, isPartialPivoting = False):
+            /bool/ -> SquareMatrix, SquareMatrix, tuple(int), tuple(int), int
         getFullDecomposition():
             None -> SquareMatrix, SquareMatrix, tuple(int OR float), tuple(int),
                 tuple(int), int
@@ -1985,15 +3015,21 @@ class SquareMatrix(Matrix):
             None -> int OR float
         getInverse():
             None -> SquareMatrix OR None
-        getEigenValues():
-            None -> tuple(int OR float) OR None
-        getEigenVectors():
-            /int OR float OR None/
+        getEigenValues(*, isSymmetric = None):
+            /bool OR None/ -> tuple(int OR float) OR None
+        getAllEigenValues(*, isSymmetric = None):
+            /bool OR None/ -> tuple(int OR float OR complex) OR None
+        getEigenVectors(*, Eigenvalue = None, isSymmetric = None):
+            /int OR float OR None, bool OR None/
                 -> dict(int OR float -> tuple(Column) OR None) OR None
+        factorize(*, isPartialPivoting = False):
+            /bool/ -> LUFactorization
     
-    Version 1.0.0.0
+    Version 1.7.0.0
     """
     
+    __slots__ = ()
+    
     #public class methods
     
     @classmethod
@@ -2117,8 +3153,8 @@ class SquareMatrix(Matrix):
                                         isColumnsFirst : bool = False) -> None:
         """
         Instantiation method. Parses the passed data sequence and packs it into
-        the internally stored nested tuple structure representing a matrix, with
-        each tuple element representing a single row of that matrix.
+        the internally stored flat structure (in the rows-first order)
+        representing a matrix, and stores its size.
         
         Signature:
             seq(int OR float) OR seq(seq(int OR float))/, int >= 2 OR None,
@@ -2154,7 +3190,7 @@ class SquareMatrix(Matrix):
                 elements differ in length, OR length of the sub-sequence element
                 is not equal to their number
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if not isinstance(isColumnsFirst, bool):
             Error = UT_TypeError(isColumnsFirst, bool, SkipFrames = 1)
@@ -2186,13 +3222,11 @@ class SquareMatrix(Matrix):
                                                                 SkipFrames = 1)
                 _Size = Size
             if not isColumnsFirst:
-                self._Elements = tuple(
-                            tuple(seqValues[Index*_Size : (Index+1)*_Size])
-                                                    for Index in range(_Size))
+                Elements = [seqValues[Index] for Index in range(_Size * _Size)]
             else:
-                self._Elements = tuple(tuple(seqValues[Outer + _Size * Inner]
-                                                    for Inner in range(_Size))
-                                                    for Outer in range(_Size))
+                Elements = [seqValues[Outer + _Size * Inner]
+                                                for Outer in range(_Size)
+                                                    for Inner in range(_Size)]
         except UT_TypeError as err:
             _CheckIfSequenceRealSequence(seqValues)
             NItems = len(seqValues)
@@ -2214,13 +3248,17 @@ class SquareMatrix(Matrix):
                 raise UT_ValueError(FirstLength,
                     f'= {NItems} - mismatching width and height of the matrix',
                                                                 SkipFrames = 1)
+            _Size = NItems
             if not isColumnsFirst:
-                self._Elements = tuple(tuple(seqValues[Index])
-                                                    for Index in range(NItems))
+                Elements = [Item for Index in range(NItems)
+                                                for Item in seqValues[Index]]
             else:
-                self._Elements = tuple(tuple(seqValues[HIndex][WIndex]
-                                        for HIndex in range(NItems))
-                                            for WIndex in range(FirstLength))
+                Elements = [seqValues[HIndex][WIndex]
+                                            for WIndex in range(FirstLength)
+                                                for HIndex in range(NItems)]
+        self._Elements = _PackElements(Elements)
+        self._Width = _Size
+        self._Height = _Size
     
     def __repr__(self) -> str:
         """
@@ -2229,10 +3267,214 @@ class SquareMatrix(Matrix):
         Signature:
             None -> str
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return f"'{self.__class__.__name__}(Size={self._Elements})'"
+        return f"'{self.__class__.__name__}(Size={self._Width})'"
 
+    #private instance methods
+    
+    def _checkSymmetric(self, isSymmetric: Any) -> bool:
+        """
+        Checks the optional flag of the symmetric matrix algorithms and
+        resolves its default value (None) by the comparison of the elements
+        symmetric with respect to the main diagonal.
+        
+        Signature:
+            type A -> bool
+        
+        Raises:
+            UT_TypeError: the argument is neither boolean nor None
+        
+        Version 1.0.0.0
+        """
+        if isSymmetric is None:
+            Size = self._Width
+            Elements = self._Elements
+            Result = all(Elements[RowIdx * Size + ColIdx] ==
+                                            Elements[ColIdx * Size + RowIdx]
+                                    for RowIdx in range(Size - 1)
+                                        for ColIdx in range(RowIdx + 1, Size))
+        elif isinstance(isSymmetric, bool):
+            Result = isSymmetric
+        else:
+            Error = UT_TypeError(isSymmetric, (bool, type(None)),
+                                                                SkipFrames = 2)
+            Error.appendMessage('- isSymmetric argument')
+            raise Error
+        return Result
+    
+    def _getSymmetricRows(self) -> List[List[float]]:
+        """
+        Copies the symmetric part (A + A^T) / 2 of the matrix into new nested
+        lists of floating point numbers in the rows-first order. For a
+        symmetric matrix the elements are copied as they are.
+        
+        Signature:
+            None -> list(list(float))
+        
+        Version 1.0.0.0
+        """
+        Size = self._Width
+        Elements = self._Elements
+        return [[0.5 * (Elements[RowIdx * Size + ColIdx] +
+                                        Elements[ColIdx * Size + RowIdx])
+                                                for ColIdx in range(Size)]
+                                                    for RowIdx in range(Size)]
+    
+    def _getSymmetricEigenVectors(self, Eigenvalue: Optional[TReal]
+                        ) -> Union[Dict[TReal, Tuple[TColumn, ...]], None]:
+        """
+        Calculates the eigenvalues and the respective orthonormal eigenbasis
+        of a symmetric matrix in a single pass by the Householder reduction to
+        the tridiagonal form followed by the implicit QL iterations.
+        
+        Signature:
+            int OR float OR None
+                -> dict(int OR float -> tuple(Column)) OR None
+        
+        Args:
+            Eigenvalue: int OR float OR None; an a priori known eigenvalue of
+                the matrix, or None for all eigenvalues
+        
+        Returns:
+            dict(int OR float -> tuple(Column)): dictionary mapping all unique
+                eigenvalues (or only the passed one) to the respective
+                orthonormal set of eigenvectors
+            None: the matrix is singular (zero eigenvalue) and no eigenvalue is
+                passed, OR the passed value is not an eigenvalue of the
+                matrix, OR the algorithm fails to converge
+        
+        Version 1.0.0.0
+        """
+        Values, Vectors, Message = _FindEigenSymmetric(
+                                                    self._getSymmetricRows())
+        Result = None
+        if Values is None:
+            pass
+        elif Eigenvalue is None:
+            if all(Values):
+                Result = {Item : tuple(Column(*Vectors[Index])
+                                                    for Index in Indexes)
+                            for Item, Indexes in _GroupEigenValues(Values)}
+            else:
+                Message = 'Matrix is singular - zero eigenvalue.'
+        else:
+            Precision = self._Width * self._Width * self._Width * ALMOST_ZERO
+            Precision *= max(1, abs(Eigenvalue))
+            Found = tuple(Column(*Vectors[Index])
+                            for Index, Item in enumerate(Values)
+                                if abs(Item - Eigenvalue) < Precision)
+            if len(Found):
+                Result = {Eigenvalue : Found}
+            else:
+                Message = 'The passed value is not an eigenvalue.'
+        if (Result is None) and DEBUG_MODE:
+            print(Message)
+        return Result
+    
+    def _getGeneralEigenVectors(self, Eigenvalue: Optional[TReal]
+                        ) -> Union[Dict[TReal, Tuple[TColumn, ...]], None]:
+        """
+        Calculates the real number valued eigenvalues by the Francis
+        QR-algorithm, unless one is passed, and the respective orthonormal
+        eigenvectors by the LUP-decomposition with the back-substitution and
+        Gram-Schmidt orthogonalization.
+        
+        Signature:
+            int OR float OR None
+                -> dict(int OR float -> tuple(Column) OR None) OR None
+        
+        Args:
+            Eigenvalue: int OR float OR None; an a priori known eigenvalue of
+                the matrix, or None for all eigenvalues
+        
+        Returns:
+            dict(int OR float -> tuple(Column) OR None): dictionary mapping all
+                unique real number valued eigenvalues to the respective
+                orthonormal set of eigenvectors, or to None if it is not
+                possible to calculate, at least, one eigenvector
+            None: no real number valued eigenvalues are found, OR the passed
+                value is not an eigenvalue of the matrix
+        
+        Version 1.0.0.0
+        """
+        if Eigenvalue is None:
+            #find all real eigenvalue by QR
+            Values = self.getEigenValues(isSymmetric = False)
+        else:
+            Values = [Eigenvalue] #use passed value as a single found one
+        Size = self._Width
+        if not (Values is None):
+            Result = {EigenValue : tuple() for EigenValue in Values}
+            for EigenValue in Values:
+                #construct singular matrix
+                Data = list(self._Elements)
+                for Idx in range(0, Size * Size, Size + 1):
+                    Data[Idx] -= EigenValue
+                Data = self.__class__._fromFlat(Data, Size, Size)
+                #compute LUP-decomposition, U is in the row echelon form
+                _, Upper, ColPerm, _, _ = Data.getLUPdecomposition()
+                #lower-triangular matrix, rows permutation and sign can be
+                #+ ignored
+                del Data
+                Data = Upper.Data
+                del Upper
+                #LUP complexitity is O(N^2), hence the estimation of the
+                #+ rounding error
+                Diag = [Data[Idx][Idx]
+                        if abs(Data[Idx][Idx]) > Size * Size * ALMOST_ZERO
+                                                else 0 for Idx in range(Size-1)]
+                if abs(Data[Size - 1][Size - 1]) > Size*Size*Size*ALMOST_ZERO:
+                    #all diagonal elements are not 0 (wrong value passed or
+                    #+ too much of the rounding error
+                    if len(Values) == 1:
+                        Result = None
+                    else:
+                        Result[EigenValue] = None
+                    continue
+                elif not any(Diag): #all diagonal elements are zero
+                    #it can happen only if there is only one eigenvalue
+                    EigenVectors = tuple(Column.generateOrthogonal(Size, Idx)
+                                                        for Idx in range(Size))
+                    Result[EigenValue] = EigenVectors
+                else:
+                    EigenVectors = []
+                    ZeroesCount = Diag.count(0) + 1
+                    #there must be ZeroesCount orthonormal eigenvectors set
+                    ReducedSize = Size - ZeroesCount
+                    ReducedData = [[Data[RowIdx][ColIdx]
+                                        for ColIdx in range(ReducedSize)]
+                                            for RowIdx in range(ReducedSize)]
+                    FreeCoeffs = [[Data[RowIdx][ColIdx]
+                                    for RowIdx in range(ReducedSize)]
+                                        for ColIdx in range(ReducedSize, Size)]
+                    #back-substitution algorithm
+                    for FreeIdx in range(ZeroesCount):
+                        BoundCoefficients = []
+                        FreeColumn = FreeCoeffs[FreeIdx]
+                        for BoundIndex in range(ReducedSize - 1, -1, -1):
+                            Component = - FreeColumn[BoundIndex]
+                            Row = ReducedData[BoundIndex]
+                            for TempIndex, Coefficient in enumerate(
+                                                            BoundCoefficients):
+                                NextElement = Row[BoundIndex + TempIndex + 1]
+                                Component -= NextElement * Coefficient
+                            Component /= Row[BoundIndex]
+                            BoundCoefficients.insert(0, Component)
+                        SolutionVector = list(BoundCoefficients)
+                        SolutionVector.extend([0 for _ in range(ZeroesCount)])
+                        SolutionVector[ReducedSize + FreeIdx] = 1
+                        EigenVector = [0 for _ in range(Size)]
+                        for PosIndex, Component in enumerate(SolutionVector):
+                            EigenVector[ColPerm[PosIndex]] = Component
+                        EigenVectors.append(EigenVector)
+                    EigenVectors = _GetOrthonormal(EigenVectors)
+                    Result[EigenValue] = tuple(Column(*Value)
+                                                    for Value in EigenVectors)
+        else: #no real eigenvalues are found by QR algorithm
+            Result = None #+ or passed by user value is not an eigenvalue
+        return Result
+    
     #public properties
     
     @property
@@ -2244,9 +3486,9 @@ class SquareMatrix(Matrix):
         Signature:
             None -> int >= 2
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        return len(self._Elements)
+        return self._Width
     
     #public instance methods
     
@@ -2258,20 +3500,49 @@ class SquareMatrix(Matrix):
         Signature:
             None -> int OR float
         
+        Version 1.1.0.0
+        """
+        return sum(self._Elements[ : : self._Width + 1])
+    
+    def getBandwidths(self) -> Tuple[int, int]:
+        """
+        Detects the lower and upper bandwidths of the matrix, i.e. the number
+        of the sub-diagonals below and of the super-diagonals above the main
+        diagonal, which contain non-zero elements. Both are zero for a
+        diagonal matrix, and both are one for a tridiagonal matrix.
+        
+        Signature:
+            None -> tuple(int >= 0, int >= 0)
+        
         Version 1.0.0.0
         """
-        Size = len(self._Elements)
-        return sum(self._Elements[Idx][Idx] for Idx in range(Size))
+        Size = self._Width
+        Elements = self._Elements
+        Lower = 0
+        Upper = 0
+        for RowIndex in range(Size):
+            Offset = RowIndex * Size
+            for Index in range(RowIndex - Lower):
+                if Elements[Offset + Index]:
+                    Lower = RowIndex - Index
+                    break
+            for Index in range(Size - 1, RowIndex + Upper, -1):
+                if Elements[Offset + Index]:
+                    Upper = Index - RowIndex
+                    break
+        return Lower, Upper
     
-    def getLUPdecomposition(self) -> Tuple[TSquareMatrix, TSquareMatrix,
+    def getLUPdecomposition(self, *, isPartialPivoting: bool = False
+                                ) -> Tuple[TSquareMatrix, TSquareMatrix,
                                         Tuple[int, ...], Tuple[int, ...], int]:
         """
         Calculates the decomposion of a matrix into a product of four matrices:
         the rows permutation matrix (which is identity unless some rows are not
         linear independent), the lower-triangular (with all main diagonal
         elements being 1), the upper-triangular matrix and the rows and columns
-        permutation matrices. Uses Gauss-Jordan elimination algorithm with full
-        pivoting.
+        permutation matrices. Uses Gauss elimination algorithm with the pivot
+        selected as the element with the maximum absolute value in the current
+        row (columns pivoting).
         
         Note that the rows pivoting occurs only if a row becomes all zeroes in
         the elimination process, which means, that the determinant is zero and
@@ -2279,14 +3550,26 @@ class SquareMatrix(Matrix):
         ignored. The columns permutations are used for the numerical stability
         even if no zeroes appear on the main diagonal during elimination.
         
+        With the optional keyword flag isPartialPivoting set to True the
+        classical partial pivoting (GEPP) is used instead: the pivot is the
+        element with the maximum absolute value in the current column among
+        the remaining rows, thus the rows permutation is generally not the
+        identity, whereas the columns permutation is always the identity.
+        
         Naming the initial matrix A, lower-triangular L, upper-triangular U,
         columns permutation Pc and rows permutation matrix Pr, for any
         non-singular matrix A = L * U * Pc, with Pr == I - identity matrix. Even
         for a singular matrix A = Pr * L * U * Pc with U being the row echelon
-        form with all zeroes rows at the bottom.
+        form with all zeroes rows at the bottom. In the partial pivoting mode
+        A = Pr * L * U with Pc == I.
         
         Signature:
-            None -> SquareMatrix, SquareMatrix, tuple(int), tuple(int), int
+            /bool/ -> SquareMatrix, SquareMatrix, tuple(int), tuple(int), int
+        
+        Args:
+            isPartialPivoting: (keyword) bool; flag if the rows pivoting by the
+                maximum element in the column is to be used instead of the
+                columns pivoting, defaults to False
         
         Returns:
             SquareMatrix, SquareMatrix, tuple(int), tuple(int), int: unpacked
@@ -2297,87 +3580,67 @@ class SquareMatrix(Matrix):
                 permutation of rows, followed by +1 or -1 number as the
                 permutation sign.
         
-        Version 1.0.0.0
+        Raises:
+            UT_TypeError: the optional keyword argument isPartialPivoting is
+                not boolean
+        
+        Version 1.2.0.0
         """
-        Size = len(self._Elements)
-        Sign = 1
-        #look-up table for the columns swapping
-        ColsPerm = [Item for Item in range(Size)]
-        #look-up table for the rows swapping
-        RowsPerm = [Item for Item in range(Size)]
-        #future upper-triangular matrix, indexed via pivoting look-up tables
-        Upper = [list(tupRow) for tupRow in self._Elements]
-        #future lower-triangular matrix, index using real indexes
-        Lower = [[1 if ColIdx == RowIdx else 0 for ColIdx in range(Size)]
-                                                    for RowIdx in range(Size)]
-        #go along the main diagonal, moving one row lower at each step
-        for BaseIndex in range(Size - 1):
-            RealRowIndex = RowsPerm[BaseIndex] #in upper matrix coordinates
-            RealColIdx = ColsPerm[BaseIndex]
-            CurrentRow = Upper[RealRowIndex]
-            if not any(CurrentRow ): #all elements in the current row are 0
-                #rows pivoting is required, use the first found below
-                for RowIdx in range(BaseIndex + 1, Size):
-                    NextRow = Upper[RowsPerm[RowIdx]]
-                    if any(NextRow):
-                        #swap indexes in the look-up table, not real rows!
-                        OldIndex = RowsPerm[RowIdx]
-                        RowsPerm[RowIdx] = RealRowIndex
-                        RowsPerm[BaseIndex] = OldIndex
-                        #swapping elements in the Lower matrix as well
-                        #+ real data, but only two 'partial' rows - from the
-                        #+ column index 0 to the current position - 1 on the
-                        #+ main diagonal
-                        for ColIdx in range(BaseIndex):
-                            OldValue = Lower[BaseIndex][ColIdx]
-                            Lower[BaseIndex][ColIdx]= Lower[RowIdx][ColIdx]
-                            Lower[RowIdx][ColIdx] = OldValue
-                        Sign *= -1
-                        RealRowIndex = RowsPerm[BaseIndex]
-                        break
-            #check if extra column swapping is required
-            MaxIndex = BaseIndex
-            Item = Upper[RealRowIndex][ColsPerm[MaxIndex]]
-            #selecting maximum element (abs) in the row - columns pivoting
-            for ColIdx in range(BaseIndex, Size):
-                NewIndex = ColsPerm[ColIdx]
-                NewItem = Upper[RealRowIndex][NewIndex]
-                if abs(NewItem) > abs(Item):
-                    Item = NewItem
-                    MaxIndex = ColIdx
-                    break
-            #swapping columns (look-up table not actual data!)
-            if MaxIndex != BaseIndex:
-                OldIndex = ColsPerm[BaseIndex]
-                ColsPerm[BaseIndex] = ColsPerm[MaxIndex]
-                ColsPerm[MaxIndex] = OldIndex
-                Sign *= -1
-                RealColIdx = ColsPerm[BaseIndex]
-            #Gauss elimination, inline data modification
-            Base = Upper[RealRowIndex][RealColIdx]
-            if Base != 0:
-                for Index in range(BaseIndex + 1, Size):
-                    MRowIndex = RowsPerm[Index]
-                    Coefficient = Upper[MRowIndex][RealColIdx] / Base
-                    Lower[Index][BaseIndex] = Coefficient
-                    Upper[MRowIndex][RealColIdx] = 0
-                    for ColIdx in range(BaseIndex + 1, Size):
-                        RealIdx = ColsPerm[ColIdx]
-                        Value = (Upper[MRowIndex][RealIdx] - Coefficient *
-                                                Upper[RealRowIndex][RealIdx])
-                        Upper[MRowIndex][RealIdx] = Value
-        #covert lower matrix into the square matrix class instance directly
-        LowerMatrix = self.__class__(Lower)
-        #convert upper matrix into the suqare matrix class instance with the
-        #+ rows and columns re-arrangement according the made pivoting
-        UpperElements = [[Upper[RowIdx][ColIdx] for ColIdx in ColsPerm]
-                                                        for RowIdx in RowsPerm]
-        UpperMatrix = self.__class__(UpperElements)
-        #columns and rows permutations are already in the right format and order
-        ColsPerm = tuple(ColsPerm)
-        RowsPerm = tuple(RowsPerm)
+        if not isinstance(isPartialPivoting, bool):
+            Error = UT_TypeError(isPartialPivoting, bool, SkipFrames = 1)
+            Error.appendMessage('- isPartialPivoting argument')
+            raise Error
+        Size = self._Width
+        Packed, RowsOrder, ColsPerm, Sign = _DecomposeLU(self._Elements, Size,
+                                                            isPartialPivoting)
+        #unpack the lower-triangular matrix with the unit main diagonal
+        LowerElements = [Packed[RowIdx * Size + ColIdx] if ColIdx < RowIdx
+                                        else (1 if ColIdx == RowIdx else 0)
+                                            for RowIdx in range(Size)
+                                                for ColIdx in range(Size)]
+        LowerMatrix = self.__class__._fromFlat(LowerElements, Size, Size)
+        #unpack the upper-triangular matrix, already in the pivoted order
+        UpperElements = [Packed[RowIdx * Size + ColIdx] if ColIdx >= RowIdx
+                                                                        else 0
+                                            for RowIdx in range(Size)
+                                                for ColIdx in range(Size)]
+        UpperMatrix = self.__class__._fromFlat(UpperElements, Size, Size)
+        #the rows permutation matrix is the inverse of the rows order
+        RowsPerm = [0] * Size
+        for Index, RowIdx in enumerate(RowsOrder):
+            RowsPerm[RowIdx] = Index
+        ColsPerm = tuple(ColsPerm)
+        RowsPerm = tuple(RowsPerm)
         return LowerMatrix, UpperMatrix, ColsPerm, RowsPerm, Sign
     
+    def factorize(self, *, isPartialPivoting: bool = False
+                                                        ) -> TLUFactorization:
+        """
+        Calculates the LUP-decomposition of the matrix once and wraps it into
+        a re-usable factorization object, which solves the systems of linear
+        equations with this matrix of the bound coefficients for any number of
+        the free coefficients vectors at O(N^2) cost per vector.
+        
+        Signature:
+            /bool/ -> LUFactorization
+        
+        Args:
+            isPartialPivoting: (keyword) bool; flag if the rows pivoting by the
+                maximum element in the column (GEPP) is to be used instead of
+                the columns pivoting, defaults to False
+        
+        Raises:
+            UT_TypeError: the optional keyword argument isPartialPivoting is
+                not boolean
+        
+        Version 1.1.0.0
+        """
+        if not isinstance(isPartialPivoting, bool):
+            Error = UT_TypeError(isPartialPivoting, bool, SkipFrames = 1)
+            Error.appendMessage('- isPartialPivoting argument')
+            raise Error
+        return LUFactorization(self, isPartialPivoting = isPartialPivoting)
+    
     def getFullDecomposition(self) -> Tuple[TSquareMatrix, TSquareMatrix,
                                     Tuple[TReal, ...], Tuple[int, ...],
                                     Tuple[int, ...], int]:
@@ -2423,14 +3686,14 @@ class SquareMatrix(Matrix):
                 from it directly), followed by the rows permutation tuple,
                 followed by +1 or -1 number as the permutation sign.
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         LowerMtrx, UpperMtrx, ColsPrm, RowsPrm, Sign= self.getLUPdecomposition()
-        Size = len(self._Elements)
+        Size = self._Width
         #the algorithm is wrong for the singular matrices, due to the taken
         #+ shortcuts!
-        Diagonal = tuple([UpperMtrx._Elements[Idx][Idx] for Idx in range(Size)])
-        Upper = [list(tupRow) for tupRow in UpperMtrx._Elements]
+        Diagonal = tuple(UpperMtrx._Elements[ : : Size + 1])
+        Upper = UpperMtrx.Data
         del UpperMtrx
         for RowIdx in range(Size - 1, 0, -1):
             Base = Upper[RowIdx][RowIdx]
@@ -2443,7 +3706,9 @@ class SquareMatrix(Matrix):
                     Upper[Index][RowIdx] = 0
             Upper[RowIdx][RowIdx] = 1
         Upper[0][0] = 1
-        UpperMtrx = self.__class__(Upper)
+        UpperMtrx = self.__class__._fromFlat(
+                        [Item for RowItems in Upper for Item in RowItems],
+                                                                Size, Size)
         return LowerMtrx, UpperMtrx, Diagonal, ColsPrm, RowsPrm, Sign
     
     def getDeterminant(self) -> TReal:
@@ -2455,11 +3720,11 @@ class SquareMatrix(Matrix):
         Signature:
             None -> int OR float
         
-        Version 1.0.0.0
+        Version 1.2.0.0
         """
-        Size = len(self._Elements)
+        Size = self._Width
         if Size < 4:
-            a = self._Elements
+            a = self.Data
             if Size == 2:
                 Result = a[0][0] * a[1][1] - a[0][1] * a[1][0]
             else:
@@ -2470,18 +3735,19 @@ class SquareMatrix(Matrix):
                 Result -= a[0][1] * a[1][0] * a[2][2]
                 Result -= a[0][0] * a[1][2] * a[2][1]
         else:
-            _, Upper, _, _, Sign = self.getLUPdecomposition()
+            Packed, _, _, Sign = _DecomposeLU(self._Elements, Size)
             Result = Sign
-            for Index in range(Size):
-                Result *= Upper._Elements[Index][Index]
+            for Item in Packed[ : : Size + 1]:
+                Result *= Item
         if not Result:
             Result = 0
         return Result
     
     def getInverse(self) -> Union[TSquareMatrix, None]:
         """
-        Calculates the inverse matrix if one exists using full (LUDP)
-        decomposition.
+        Calculates the inverse matrix if one exists using the LUP-decomposition
+        and the batched forward and back substitution for all columns of the
+        identity matrix at once.
         
         Signature:
             None -> SquareMatrix OR None
@@ -2492,82 +3758,126 @@ class SquareMatrix(Matrix):
             None: the current matrix is singular, so the inverse does not
                 exist
         
-        Version 1.0.0.0
+        Version 1.2.0.0
         """
-        Size = len(self._Elements)
-        Lower, Upper, Diag, Perm, _, _ = self.getFullDecomposition()
-        Low = [list(lstRow) for lstRow in Lower._Elements]
-        Up = [list(lstRow) for lstRow in Upper._Elements]
-        del Lower
-        del Upper
-        Det = 1 #NB - use math.prod() with Python v3.8+ (!!!)
-        for Idx in range(Size):
-            Det *= Diag[Idx]
-        if Det:
-            #inverse modifications applied to an identity matrix
-            Data = [[1 if ColIdx == RowIdx else 0 for ColIdx in range(Size)]
+        Size = self._Width
+        Factorization = LUFactorization(self)
+        if Factorization.Determinant:
+            #columns of the inverse matrix are the solutions for the columns
+            #+ of the identity matrix
+            Identity = [[1 if ColIdx == RowIdx else 0
                                                     for RowIdx in range(Size)]
-            for ColIdx in range(Size - 1):
-                for RowIdx in range(ColIdx + 1, Size):
-                    Coeff = Low[RowIdx][ColIdx]
-                    for Idx in range(Size):
-                        Data[RowIdx][Idx] -= Coeff * Data[ColIdx][Idx]
-            for ColIdx in range(Size - 1, 0, -1):
-                for RowIdx in range(0, ColIdx):
-                    Coeff = Up[RowIdx][ColIdx]
-                    for Idx in range(Size):
-                        Data[RowIdx][Idx] -= Coeff * Data[ColIdx][Idx]
-            for RowIdx in range(Size):
-                for ColIdx in range(Size):
-                    Data[RowIdx][ColIdx] /= Diag[RowIdx]
-            #re-arrange the rows according the columns permutations tuple
-            #+ find the inverse permutation, equivalent to the matrix transpose
-            PermIndexes = [Pos[0] for Pos in sorted([(Idx, Item)
-                                            for Idx, Item in enumerate(Perm)],
-                                                key = lambda Value: Value[1])]
-            #+ re-arrange the rows
-            Data = [Data[PermIndexes[Idx]] for Idx in range(Size)]
-            Result = self.__class__(Data)
+                                                    for ColIdx in range(Size)]
+            Columns = Factorization._substituteMany(Identity)
+            Data = [Item for Row in zip(*Columns) for Item in Row]
+            Result = self.__class__._fromFlat(Data, Size, Size)
         else:
             Result = None
         return Result
 
-    def getEigenValues(self) -> Union[TRealTuple, None]:
+    def getEigenValues(self, *, isSymmetric: Optional[bool] = None
+                                            ) -> Union[TRealTuple, None]:
         """
         Calculates the real number valued eigenvalues. Based on the Francis
-        QR-algorithm with Gram-Schmidt orthogonalization method.
+        double shift QR-algorithm applied to the upper Hessenberg form of the
+        matrix, or on the implicit QL-algorithm applied to the tridiagonal
+        form of a symmetric matrix.
         
         Signature:
-            None -> tuple(int OR float) OR None
+            /bool OR None/ -> tuple(int OR float) OR None
+        
+        Args:
+            isSymmetric: (keyword) bool OR None; flag if the symmetric matrix
+                algorithm is to be used (True) or not (False), defaults to
+                None, in which case the matrix is checked for the symmetry
         
         Returns:
             tuple(int OR float): all unique real number valued eigenvalues
-            None: no real number valued eigenvalues are found
+            None: not all eigenvalues are real numbers, OR the matrix is
+                singular (zero eigenvalue), OR the algorithm fails to converge
         
-        Version 1.0.0.0
+        Raises:
+            UT_TypeError: the optional keyword argument isSymmetric is neither
+                boolean nor None
+        
+        Version 1.3.0.0
         """
-        #re-pack data into columns-first order
-        Original = self._Elements
-        Size = len(Original)
-        Data = [[Original[RowIdx][ColIdx] for RowIdx in range(Size)]
-                                                    for ColIdx in range(Size)]
-        #use Francis QR-algorithm
-        Result, Message = _FindEigenValuesQR(Data)
-        if not (Result is None):
-            Result = tuple(Result)
-        elif DEBUG_MODE:
+        if self._checkSymmetric(isSymmetric):
+            Values, _, Message = _FindEigenSymmetric(self._getSymmetricRows())
+        else:
+            Values, Message = _FindEigenValuesQR([[float(Item)
+                                for Item in RowItems]
+                                    for RowItems in self._getRows()])
+        Result = None
+        if Values is None:
+            pass
+        elif any(isinstance(Item, complex) for Item in Values):
+            Message = 'Not all eigenvalues are real numbers.'
+        elif not all(Values):
+            Message = 'Matrix is singular - zero eigenvalue.'
+        else:
+            Result = tuple(Item for Item, _ in _GroupEigenValues(Values))
+        if (Result is None) and DEBUG_MODE:
             print(Message)
         return Result
     
-    def getEigenVectors(self, *, Eigenvalue: Optional[TReal] = None
+    def getAllEigenValues(self, *, isSymmetric: Optional[bool] = None
+                        ) -> Union[Tuple[Union[TReal, complex], ...], None]:
+        """
+        Calculates all eigenvalues, including the complex ones and zeroes, each
+        repeated according to its algebraic multiplicity. Based on the Francis
+        double shift QR-algorithm applied to the upper Hessenberg form of the
+        matrix, or on the implicit QL-algorithm applied to the tridiagonal
+        form of a symmetric matrix.
+        
+        Signature:
+            /bool OR None/ -> tuple(int OR float OR complex) OR None
+        
+        Args:
+            isSymmetric: (keyword) bool OR None; flag if the symmetric matrix
+                algorithm is to be used (True) or not (False), defaults to
+                None, in which case the matrix is checked for the symmetry
+        
+        Returns:
+            tuple(int OR float OR complex): all N eigenvalues sorted by the
+                descending absolute value, the real ones as real numbers, the
+                complex ones as the complex conjugated pairs
+            None: the algorithm fails to converge
+        
+        Raises:
+            UT_TypeError: the optional keyword argument isSymmetric is neither
+                boolean nor None
+        
+        Version 1.1.0.0
+        """
+        if self._checkSymmetric(isSymmetric):
+            Values, _, Message = _FindEigenSymmetric(self._getSymmetricRows())
+        else:
+            Values, Message = _FindEigenValuesQR([[float(Item)
+                                for Item in RowItems]
+                                    for RowItems in self._getRows()])
+        if not (Values is None):
+            Result = tuple(Values)
+        else:
+            Result = None
+            if DEBUG_MODE:
+                print(Message)
+        return Result
+    
+    def getEigenVectors(self, *, Eigenvalue: Optional[TReal] = None,
+                        isSymmetric: Optional[bool] = None
                         ) -> Union[Dict[TReal, Tuple[TColumn, ...]], None]:
         """
         Calculates the real number valued eigenvalues and the respective eigen
         vectors, which form orthonormal basis for each eigenvalue. Based on the
-        Francis QR-algorithm with Gram-Schmidt orthogonalization method.
+        Francis QR-algorithm, LUP-decomposition and Gram-Schmidt
+        orthogonalization method. For a symmetric matrix all eigenvalues and
+        the orthonormal eigenbasis are calculated in a single pass by the
+        Householder reduction to the tridiagonal form followed by the implicit
+        QL iterations.
         
         Signature:
-            /int OR float OR None/
+            /int OR float OR None, bool OR None/
                 -> dict(int OR float -> tuple(Column) OR None) OR None
         
         Args:
@@ -2575,6 +3885,9 @@ class SquareMatrix(Matrix):
                 of the matrix, for which the eigenvectors are to be found.
                 Defaults to None, in which case the method attemts to calculate
                 all eigenvalues first.
+            isSymmetric: (keyword) bool OR None; flag if the symmetric matrix
+                algorithm is to be used (True) or not (False), defaults to
+                None, in which case the matrix is checked for the symmetry
         
         Returns:
             dict(int OR float -> tuple(Column) OR None): dictionary mapping all
@@ -2587,212 +3900,1809 @@ class SquareMatrix(Matrix):
                 value is not an eigenvalue of the matrix
         
         Raises:
-            UT_TypeError: the passed optional value is not a real number
+            UT_TypeError: the passed optional value is not a real number, OR
+                the optional keyword argument isSymmetric is neither boolean
+                nor None
         
-        Version 1.0.0.1
+        Version 1.2.0.0
         """
-        if Eigenvalue is None:
-            Values = self.getEigenValues() #find all real eigenvalue by QR
-        elif (not isinstance(Eigenvalue, (int, float))
-                                            or isinstance(Eigenvalue, bool)):
+        if not ((Eigenvalue is None) or (isinstance(Eigenvalue, (int, float))
+                                        and not isinstance(Eigenvalue, bool))):
             raise UT_TypeError(Eigenvalue, (int, float), SkipFrames = 1)
+        if self._checkSymmetric(isSymmetric):
+            Result = self._getSymmetricEigenVectors(Eigenvalue)
         else:
-            Values = [Eigenvalue] #use passed value as a single found one
-        Size = len(self._Elements)
-        if not (Values is None):
-            Result = {EigenValue : tuple() for EigenValue in Values}
-            for EigenValue in Values:
-                #construct singular matrix
-                Data = [[Item - EigenValue if ColIdx == RowIdx else Item
-                            for ColIdx, Item in enumerate(tupRow)]
-                                for RowIdx, tupRow in enumerate(self._Elements)]
-                Data = self.__class__(Data)
-                #compute LUP-decomposition, U is in the row echelon form
-                _, Upper, ColPerm, _, _ = Data.getLUPdecomposition()
-                #lower-triangular matrix, rows permutation and sign can be
-                #+ ignored
-                del Data
-                Data = [list(tupRow) for tupRow in Upper._Elements]
-                del Upper
-                #LUP complexitity is O(N^2), hence the estimation of the
-                #+ rounding error
-                Diag = [Data[Idx][Idx]
-                        if abs(Data[Idx][Idx]) > Size * Size * ALMOST_ZERO
-                                                else 0 for Idx in range(Size-1)]
-                if abs(Data[Size - 1][Size - 1]) > Size*Size*Size*ALMOST_ZERO:
-                    #all diagonal elements are not 0 (wrong value passed or
-                    #+ too much of the rounding error
-                    if len(Values) == 1:
-                        Result = None
-                    else:
-                        Result[EigenValue] = None
-                    continue
-                elif not any(Diag): #all diagonal elements are zero
-                    #it can happen only if there is only one eigenvalue
-                    EigenVectors = tuple(Column.generateOrthogonal(Size, Idx)
-                                                        for Idx in range(Size))
-                    Result[EigenValue] = EigenVectors
-                else:
-                    EigenVectors = []
-                    ZeroesCount = Diag.count(0) + 1
-                    #there must be ZeroesCount orthonormal eigenvectors set
-                    ReducedSize = Size - ZeroesCount
-                    ReducedData = [[Data[RowIdx][ColIdx]
-                                        for ColIdx in range(ReducedSize)]
-                                            for RowIdx in range(ReducedSize)]
-                    FreeCoeffs = [[Data[RowIdx][ColIdx]
-                                    for RowIdx in range(ReducedSize)]
-                                        for ColIdx in range(ReducedSize, Size)]
-                    #back-substitution algorithm
-                    for FreeIdx in range(ZeroesCount):
-                        BoundCoefficients = []
-                        FreeColumn = FreeCoeffs[FreeIdx]
-                        for BoundIndex in range(ReducedSize - 1, -1, -1):
-                            Component = - FreeColumn[BoundIndex]
-                            Row = ReducedData[BoundIndex]
-                            for TempIndex, Coefficient in enumerate(
-                                                            BoundCoefficients):
-                                NextElement = Row[BoundIndex + TempIndex + 1]
-                                Component -= NextElement * Coefficient
-                            Component /= Row[BoundIndex]
-                            BoundCoefficients.insert(0, Component)
-                        SolutionVector = list(BoundCoefficients)
-                        SolutionVector.extend([0 for _ in range(ZeroesCount)])
-                        SolutionVector[ReducedSize + FreeIdx] = 1
-                        EigenVector = [0 for _ in range(Size)]
-                        for PosIndex, Component in enumerate(SolutionVector):
-                            EigenVector[ColPerm[PosIndex]] = Component
-                        EigenVectors.append(EigenVector)
-                    EigenVectors = _GetOrthonormal(EigenVectors)
-                    Result[EigenValue] = tuple(Column(*Value)
-                                                    for Value in EigenVectors)
-        else: #no real eigenvalues are found by QR algorithm
-            Result = None #+ or passed by user value is not an eigenvalue
+            Result = self._getGeneralEigenVectors(Eigenvalue)
         return Result
 
-#Dynamic patching of the Column class, instance method __mul__()
-
-def _Column__mul__(self: Column,
-                            Other: Union[Row, TReal]) -> Union[Column, Matrix]:
+class LUFactorization:
     """
-    Special helper function to patch the right multiplication of a Column vector
-    hook magical method.
+    Re-usable LUP-decomposition of a square matrix, which solves the systems
+    of linear equations A * x = b with the same matrix A of the bound
+    coefficients and the different vectors b of the free coefficients. The
+    decomposition is calculated only once, at the instantiation, and each
+    solution costs only O(N^2) operations (forward and back substitution).
     
-    Signature:
-        Column, Row OR int OR float -> Column OR Matrix
+    Is supposed to be created via the method factorize() of the SquareMatrix
+    class, but can be also instantiated directly with an instance of the
+    SquareMatrix class as the only positional argument.
     
-    Args:
-        self: Column; instance of Column class as the left operand
-        Other: Row OR int OR float; an instance of the row vector class or a
-            real number as the right operand
+    Both triangular matrices are kept packed in a single flat buffer: the
+    multipliers of the lower-triangular matrix below the main diagonal, and
+    the upper-triangular matrix on and above it.
     
-    Returns:
-        Column: instance of the Column class, which is the result of the
-            operation with the real number right operand
-        Matrix: result of the column x row multiplication
+    The instances of this class are immutable objects.
     
-    Raises:
-        UT_TypeError: the second operand is not an instance of the Row vector
-            vector class nor a real number
-        
-    Version 1.0.0.0
-    """
-    Result = None
-    if isinstance(Other, (int, float)):
-        Elements = [Item * Other for Item in self._Elements]
-        Result = self.__class__(*Elements)
-    elif isinstance(Other, Row):
-        Elements = [[Item * Element for Element in Other._Elements]
-                                                    for Item in self._Elements]
-        Result = Matrix(Elements)
-    else:
-        raise UT_TypeError(Other, (int, float), SkipFrames = 1)
-    return Result
-
-#Dynamic patching of the Column class, instance method transpose()
-
-def _Column_transpose(self: Column) -> Row:
+    Properties:
+        Size: (read-only) int >= 2
+        Determinant: (read-only) int OR float
+    
+    Methods:
+        solve(FreeCoeffs):
+            Column OR seq(int OR float) -> list(int OR float) OR None
+        solveMany(FreeCoeffs):
+            seq(Column OR seq(int OR float))
+                -> list(list(int OR float)) OR None
+        solveMatrix(FreeCoeffs):
+            Matrix -> Matrix OR None
+    
+    Version 1.3.0.0
     """
-    Special helper function to patch the transpose() method of the Column class.
+    
+    __slots__ = ('_Size', '_Packed', '_RowsOrder', '_ColsPerm',
+                                                                '_Determinant')
+    
+    #special methods
+    
+    def __init__(self, Matrix: TSquareMatrix, *,
+                                    isPartialPivoting: bool = False) -> None:
+        """
+        Initialization method. Calculates and stores the packed LU-elements as
+        well as the rows and columns permutations.
         
-    Signature:
-        Column -> Row
+        Signature:
+            SquareMatrix/, bool/ -> None
+        
+        Args:
+            Matrix: SquareMatrix; the matrix of the bound coefficients
+            isPartialPivoting: (keyword) bool; flag if the rows pivoting by the
+                maximum element in the column (GEPP) is to be used instead of
+                the columns pivoting, defaults to False
+        
+        Raises:
+            UT_TypeError: the argument is not an instance of SquareMatrix
+                class, OR the optional keyword argument isPartialPivoting is
+                not boolean
+        
+        Version 1.1.0.0
+        """
+        if not isinstance(Matrix, SquareMatrix):
+            raise UT_TypeError(Matrix, SquareMatrix, SkipFrames = 1)
+        if not isinstance(isPartialPivoting, bool):
+            Error = UT_TypeError(isPartialPivoting, bool, SkipFrames = 1)
+            Error.appendMessage('- isPartialPivoting argument')
+            raise Error
+        Size = Matrix.Size
+        Packed, RowsOrder, ColsPerm, Sign = _DecomposeLU(Matrix._Elements,
+                                                    Size, isPartialPivoting)
+        self._Size = Size
+        self._Packed = _PackElements(Packed)
+        self._RowsOrder = tuple(RowsOrder)
+        self._ColsPerm = tuple(ColsPerm)
+        Determinant = Sign
+        for Item in self._Packed[ : : Size + 1]:
+            Determinant *= Item
+        if not Determinant:
+            Determinant = 0
+        self._Determinant = Determinant
     
-    Args:
-        self: Column; an instance of the class.
+    def __repr__(self) -> str:
+        """
+        Magic method to support repr() function with the factorization as its
+        argument.
+        
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return f"'{self.__class__.__name__}(Size={self._Size})'"
     
-    Version 1.0.0.0
-    """
-    return Row(*(self._Elements))
-
-#Dynamic patching of the Matrix class, instance method __mul__()
-
-def _Matrix__mul__(self: Matrix,
-                Other: Union[Matrix, Column, TReal]) -> Union[Column, Matrix]:
-    """
-    Special helper function to patch the right multiplication of a Matrix hook
-    magical method.
+    #private instance methods
     
-    Signature:
-        'Matrix, 'Matrix OR Column OR int OR float -> Column OR 'Matrix
+    def _parseVector(self, FreeCoeffs: Any) -> List[TReal]:
+        """
+        Checks the vector of the free coefficients and copies its elements into
+        a new list.
+        
+        Signature:
+            type A -> list(int OR float)
+        
+        Raises:
+            UT_TypeError: the argument is neither an instance of Column class
+                nor a flat sequence of real numbers
+            UT_ValueError: the length of the vector does not match the size of
+                the matrix
+        
+        Version 1.0.0.0
+        """
+        if isinstance(FreeCoeffs, Column):
+            Result = FreeCoeffs.Data
+        else:
+            try:
+                _CheckIfRealSequence(FreeCoeffs)
+            except UT_TypeError as err:
+                Error = UT_TypeError(FreeCoeffs, Column, SkipFrames = 2)
+                Error.setMessage(err.getMessage())
+                raise Error from None
+            Result = list(FreeCoeffs)
+        if len(Result) != self._Size:
+            raise UT_ValueError(len(Result),
+                        f'={self._Size} - mismatching sizes', SkipFrames = 2)
+        return Result
     
-    Args:
-        self: 'Matrix; instance of Matrix (sub-) class as the left operand
-        Other: 'Matrix OR Column OR int OR float; an instance of the Matrix
-            (sub-) class or an instance of Column vector class or a real number
-            as the right operand
+    def _isSingular(self) -> bool:
+        """
+        Checks if the factorized matrix is singular, i.e. the systems have no
+        unique solution.
+        
+        Signature:
+            None -> bool
+        
+        Version 1.0.0.0
+        """
+        return not self._Determinant
     
-    Returns:
-        Column: instance of the Column class, which is the result of the
-            operation with the Column right operand
-        'Matrix: result of the matrix x matrix or matrix x scalar multiplication
-            with an instance of SquareMatrix class returned if the width of the
-            resulting (generic) matrix equal its height
+    def _substituteMany(self, Vectors: List[List[TReal]]
+                                                    ) -> List[List[TReal]]:
+        """
+        Performs the batched forward and back substitution for any number of
+        the vectors of the free coefficients at once, with a single pass over
+        the rows of the lower- and upper-triangular matrices, each row being
+        applied to all vectors before moving to the next one. The vectors are
+        re-arranged according to the rows permutation, and the solutions -
+        according to the columns permutation. Supposed to be called only for a
+        non-singular matrix.
+        
+        Signature:
+            list(list(int OR float)) -> list(list(int OR float))
+        
+        Version 1.0.0.0
+        """
+        Size = self._Size
+        Packed = self._Packed
+        Order = self._RowsOrder
+        Vectors = [[Free[Index] for Index in Order] for Free in Vectors]
+        #forward substitution with the lower-triangular matrix (unit diagonal)
+        for Index in range(1, Size):
+            Offset = Index * Size
+            Lower = Packed[Offset : Offset + Index]
+            for Free in Vectors:
+                Free[Index] -= sum(map(mul, Lower, Free))
+        #back-substitution with the upper-triangular matrix
+        Solutions = [[0] * Size for _ in Vectors]
+        for Index in range(Size - 1, -1, -1):
+            Offset = Index * Size
+            Upper = Packed[Offset + Index + 1 : Offset + Size]
+            Diagonal = Packed[Offset + Index]
+            for Free, Solution in zip(Vectors, Solutions):
+                Resolved = sum(map(mul, Upper, Solution[Index + 1 : ]))
+                Solution[Index] = (Free[Index] - Resolved) / Diagonal
+        #apply reverse columns permuation
+        Result = []
+        for Solution in Solutions:
+            Reordered = [0] * Size
+            for Index, Value in zip(self._ColsPerm, Solution):
+                Reordered[Index] = Value
+            Result.append(Reordered)
+        return Result
     
-    Raises:
-        UT_TypeError: the second operand is not an instance of the Column vector
-            vector class nor a real number nor an instance of Matrix (sub-)
-            class
-        UT_ValueError: for two matrices left operand width is not equal to
-                the right operand height, OR the length of the column is not
-                equal to the width of the matrix
+    #public properties
+    
+    @property
+    def Size(self) -> int:
+        """
+        Read-only property to access the size of the factorized matrix.
         
-    Version 1.0.0.0
-    """
-    Result = None
-    if isinstance(Other, (int, float)):
-        Elements = [[Item * Other for Item in Row] for Row in self._Elements]
-        Result = self.__class__(Elements)
+        Signature:
+            None -> int >= 2
+        
+        Version 1.0.0.0
+        """
+        return self._Size
+    
+    @property
+    def Determinant(self) -> TReal:
+        """
+        Read-only property to access the determinant of the factorized matrix.
+        
+        Signature:
+            None -> int OR float
+        
+        Version 1.0.0.0
+        """
+        return self._Determinant
+    
+    #public instance methods
+    
+    def solve(self, FreeCoeffs: Union[Column, TRealSequence]
+                                                ) -> Union[List[TReal], None]:
+        """
+        Solves the system of linear equations with the factorized matrix of the
+        bound coefficients and the passed vector of the free coefficients.
+        
+        Signature:
+            Column OR seq(int OR float) -> list(int OR float) OR None
+        
+        Args:
+            FreeCoeffs: Column OR seq(int OR float); the free coefficients of
+                the system
+        
+        Returns:
+            list(int OR float): the found solution of the system
+            None: the system is undertermined (no solution or multiple
+                solutions), i.e. the matrix is singular
+        
+        Raises:
+            UT_TypeError: the argument is neither an instance of Column class
+                nor a flat sequence of real numbers
+            UT_ValueError: the length of the vector does not match the size of
+                the matrix
+        
+        Version 1.1.0.0
+        """
+        Free = self._parseVector(FreeCoeffs)
+        if not self._isSingular():
+            Result = self._substituteMany([Free])[0]
+        else:
+            Result = None
+        return Result
+    
+    def solveMany(self, FreeCoeffs: Sequence[Union[Column, TRealSequence]]
+                                        ) -> Union[List[List[TReal]], None]:
+        """
+        Solves the systems of linear equations with the factorized matrix of
+        the bound coefficients and each of the passed vectors of the free
+        coefficients.
+        
+        Signature:
+            seq(Column OR seq(int OR float))
+                -> list(list(int OR float)) OR None
+        
+        Args:
+            FreeCoeffs: seq(Column OR seq(int OR float)); the free coefficients
+                vectors, one per system
+        
+        Returns:
+            list(list(int OR float)): the found solutions, in the same order as
+                the vectors of the free coefficients
+            None: the systems are undertermined (no solution or multiple
+                solutions), i.e. the matrix is singular
+        
+        Raises:
+            UT_TypeError: the argument is not a sequence, OR any of its
+                elements is neither an instance of Column class nor a flat
+                sequence of real numbers
+            UT_ValueError: the length of any of the vectors does not match the
+                size of the matrix
+        
+        Version 1.2.0.0
+        """
+        if ((not isinstance(FreeCoeffs, c_abc.Sequence))
+                                            or isinstance(FreeCoeffs, str)):
+            raise UT_TypeError(FreeCoeffs, (list, tuple), SkipFrames = 1)
+        Vectors = [self._parseVector(Item) for Item in FreeCoeffs]
+        if not self._isSingular():
+            Result = self._substituteMany(Vectors)
+        else:
+            Result = None
+        return Result
+    
+    def solveMatrix(self, FreeCoeffs: Matrix) -> Union[Matrix, None]:
+        """
+        Solves the matrix equation A * X = B with the factorized matrix A of
+        the bound coefficients and the passed matrix B, each column of which is
+        a vector of the free coefficients. All columns are solved at once by
+        the batched forward and back substitution.
+        
+        Signature:
+            Matrix -> Matrix OR None
+        
+        Args:
+            FreeCoeffs: Matrix; the matrix B, with the height equal to the size
+                of the factorized matrix
+        
+        Returns:
+            Matrix: the found solution X, an instance of the same class as the
+                passed argument, with the same dimensions
+            None: the systems are undertermined (no solution or multiple
+                solutions), i.e. the matrix is singular
+        
+        Raises:
+            UT_TypeError: the argument is not an instance of Matrix class
+            UT_ValueError: the height of the passed matrix does not match the
+                size of the factorized matrix
+        
+        Version 1.1.0.0
+        """
+        if not isinstance(FreeCoeffs, Matrix):
+            raise UT_TypeError(FreeCoeffs, Matrix, SkipFrames = 1)
+        Size = self._Size
+        if FreeCoeffs._Height != Size:
+            raise UT_ValueError(FreeCoeffs._Height,
+                        f'={Size} - mismatching sizes', SkipFrames = 1)
+        if not self._isSingular():
+            Width = FreeCoeffs._Width
+            Elements = FreeCoeffs._Elements
+            Vectors = [list(Elements[Index : : Width])
+                                                    for Index in range(Width)]
+            Solutions = self._substituteMany(Vectors)
+            Result = FreeCoeffs.__class__._fromFlat(
+                        [Value for Row in zip(*Solutions) for Value in Row],
+                                                                Width, Size)
+        else:
+            Result = None
+        return Result
+
+class SparseMatrix:
+    """
+    Base class for the sparse matrices, which store only the non-zero
+    elements. Intended for the large matrices with the overwhelming majority
+    of zero elements, e.g. banded or graph Laplacian matrices, since both the
+    memory footprint and the cost of the matrix x vector product scale with
+    the number of the non-zero elements instead of Width * Height.
+    
+    All arithmetics, transposition and conversion are implemented via the
+    compressed sparse rows (CSR) representation: the column indexes and values
+    of the non-zero elements in the rows-first order together with the row
+    pointers, i.e. the position of the first element of each row in these
+    sequences. This class stores the row pointers as they are, and the
+    sub-classes may re-define how the positions of the rows are stored.
+    
+    The instances of the sub-classes are immutable objects, and are not
+    considered to be sequences. Individual element can be read-only accessed
+    using double indexing as obj[col_index, row_index], exactly as for the
+    dense matrices. Duplicate entries passed at the instantiation are summed,
+    and the zero values are not stored.
+    
+    Thus, the supported instantiation call signatures are:
+        * 'SparseMatrix(seq(tuple(int, int, int OR float)), Width = int >= 2,
+            Height = int >= 2)
+        * 'SparseMatrix(dict(tuple(int, int) -> int OR float),
+            Width = int >= 2, Height = int >= 2)
+    where each element of a sequence is a triplet (column index, row index,
+    value), and each key of a dictionary is a pair (column index, row index).
+    
+    Properties:
+        Width: (read-only) int >= 2
+        Height: (read-only) int >= 2
+        NonZeros: (read-only) int >= 0
+        Data: (read-only) list(list(int OR float))
+    
+    Class methods:
+        fromDense(Value):
+            Matrix OR seq(seq(int OR float)) -> 'SparseMatrix
+    
+    Methods:
+        transpose():
+            None -> 'SparseMatrix
+        toDense():
+            None -> Matrix OR SquareMatrix
+        toCSR():
+            None -> CSRMatrix
+        toCOO():
+            None -> COOMatrix
+        getEntries():
+            None -> list(tuple(int >= 0, int >= 0, int OR float))
+        factorize():
+            None -> SparseLUFactorization
+    
+    Version 1.0.1.0
+    """
+    
+    __slots__ = ('_Width', '_Height', '_Indexes', '_Values', '_Pointers')
+    
+    #private class methods
+    
+    @classmethod
+    def _fromCSR(cls, Pointers: Sequence[int], Indexes: Sequence[int],
+                        Values: Sequence[TReal], Width: int, Height: int
+                                                        ) -> TSparseMatrix:
+        """
+        Creates a new instance directly from the compressed sparse rows form,
+        bypassing the input data sanity checks and parsing. Designed for the
+        internal use by the arithmetics and the conversion methods; it is not
+        supposed to be used outside the module.
+        
+        Signature:
+            seq(int >= 0), seq(int >= 0), seq(int OR float), int >= 2,
+                int >= 2 -> 'SparseMatrix
+        
+        Args:
+            Pointers: seq(int >= 0); Height + 1 positions of the rows starts
+            Indexes: seq(int >= 0); column indexes of the non-zero elements,
+                sorted within each row
+            Values: seq(int OR float); the non-zero elements
+            Width: int >= 2; width of the matrix
+            Height: int >= 2; height of the matrix
+        
+        Returns:
+            'SparseMatrix: a new instance of the class the method is called
+                from
+        
+        Version 1.0.0.0
+        """
+        Result = cls.__new__(cls)
+        Result._Width = Width
+        Result._Height = Height
+        Result._Indexes = tuple(Indexes)
+        Result._Values = _PackElements(Values)
+        Result._setPointers(Pointers)
+        return Result
+    
+    #special methods
+    
+    def __init__(self, Entries: Union[Sequence[Tuple[int, int, TReal]],
+                                        Dict[Tuple[int, int], TReal]], *,
+                                            Width: int, Height: int) -> None:
+        """
+        Instantiation method. Parses the passed non-zero elements and stores
+        them in the compressed form.
+        
+        Signature:
+            seq(tuple(int, int, int OR float))
+                OR dict(tuple(int, int) -> int OR float)/, *, int >= 2,
+                    int >= 2/ -> None
+        
+        Args:
+            Entries: seq(tuple(int, int, int OR float))
+                OR dict(tuple(int, int) -> int OR float); the elements as the
+                triplets (column index, row index, value) or as a mapping of
+                the pairs (column index, row index) onto the values
+            Width: (keyword) int >= 2; width of the matrix
+            Height: (keyword) int >= 2; height of the matrix
+        
+        Raises:
+            UT_TypeError: the mandatory argument is neither a sequence nor a
+                dictionary, OR any of its elements (keys) is not a sequence,
+                OR any index is not an integer number, OR any value is not a
+                real number, OR the keyword arguments Width or Height are not
+                integer numbers
+            UT_ValueError: Width or Height argument is an integer < 2, OR any
+                element is not a triplet (any key is not a pair), OR any of the
+                indexes is out of range
+        
+        Version 1.0.0.0
+        """
+        for Name, Value in (('Width', Width), ('Height', Height)):
+            if (not isinstance(Value, int)) or isinstance(Value, bool):
+                Error = UT_TypeError(Value, int, SkipFrames = 1)
+                Error.appendMessage(f'- {Name} argument')
+                raise Error
+            if Value < 2:
+                raise UT_ValueError(Value, f'>= 2 - {Name} argument',
+                                                                SkipFrames = 1)
+        if isinstance(Entries, c_abc.Mapping):
+            Items = []
+            for Key, Value in Entries.items():
+                if not isinstance(Key, tuple):
+                    raise UT_TypeError(Key, tuple, SkipFrames = 1)
+                Items.append((*Key, Value))
+        elif (isinstance(Entries, c_abc.Sequence)
+                                        and (not isinstance(Entries, str))):
+            Items = Entries
+        else:
+            raise UT_TypeError(Entries, (list, tuple, dict), SkipFrames = 1)
+        Rows = [dict() for _ in range(Height)]
+        for Item in Items:
+            if ((not isinstance(Item, c_abc.Sequence))
+                                                or isinstance(Item, str)):
+                raise UT_TypeError(Item, tuple, SkipFrames = 1)
+            if len(Item) != 3:
+                raise UT_ValueError(len(Item),
+                        '== 3 - (column index, row index, value) triplet',
+                                                                SkipFrames = 1)
+            ColIndex, RowIndex, Value = Item
+            for Index, Size, Name in ((ColIndex, Width, 'column'),
+                                                (RowIndex, Height, 'row')):
+                if (not isinstance(Index, int)) or isinstance(Index, bool):
+                    Error = UT_TypeError(Index, int, SkipFrames = 1)
+                    Error.appendMessage(f'- {Name} index')
+                    raise Error
+                if (Index < 0) or (Index >= Size):
+                    raise UT_ValueError(Index,
+                            f'in range [0, {Size - 1}] - {Name} index',
+                                                                SkipFrames = 1)
+            if (not isinstance(Value, (int, float))) or isinstance(Value,
+                                                                        bool):
+                raise UT_TypeError(Value, (int, float), SkipFrames = 1)
+            Row = Rows[RowIndex]
+            Row[ColIndex] = Row.get(ColIndex, 0) + Value
+        Pointers, Indexes, Values = _CompressRows(Rows)
+        self._Width = Width
+        self._Height = Height
+        self._Indexes = tuple(Indexes)
+        self._Values = _PackElements(Values)
+        self._setPointers(Pointers)
+    
+    def __repr__(self) -> str:
+        """
+        Magic method to support repr() function with the matrix as its
+        argument.
+        
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return "'{}(Width={}, Height={}, NonZeros={})'".format(
+                                self.__class__.__name__, self._Width,
+                                            self._Height, len(self._Values))
+    
+    def __getitem__(self, Indexes: Tuple[int, int]) -> TReal:
+        """
+        Magic method to hook index access to a single element of the matrix in
+        the form obj[i,j], where i is the column index, and j is the row index.
+        The elements, which are not stored, are zeroes.
+        
+        Signature:
+            tuple(int, int) -> int OR float
+        
+        Raises:
+            UT_TypeError: either of the indexes is not an integer number, OR
+                less or more than 2 indexes are provided
+            UT_ValueError: the column index value is not in the inclusive range
+                [-Width, Width - 1], OR the row index values is not in the
+                inclusive range [-Height, Height - 1]
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Indexes, tuple):
+            raise UT_TypeError(Indexes, tuple, SkipFrames = 1)
+        if len(Indexes) != 2:
+            raise UT_ValueError(len(Indexes), '== 2 - number of indexes',
+                                                                SkipFrames = 1)
+        ColIndex, RowIndex = Indexes
+        Height = self._Height
+        Width = self._Width
+        if not isinstance(ColIndex, int):
+            Error = UT_TypeError(ColIndex, int, SkipFrames = 1)
+            Error.appendMessage('- column index')
+            raise Error
+        if (ColIndex < -Width) or (ColIndex >= Width):
+            raise UT_ValueError(ColIndex, f'in range [{-Width}, {Width - 1}]',
+                                                                SkipFrames = 1)
+        if not isinstance(RowIndex, int):
+            Error = UT_TypeError(RowIndex, int, SkipFrames = 1)
+            Error.appendMessage('- row index')
+            raise Error
+        if (RowIndex < -Height) or (RowIndex >= Height):
+            raise UT_ValueError(RowIndex,
+                                    f'in range [{-Height}, {Height - 1}]',
+                                                                SkipFrames = 1)
+        if ColIndex < 0:
+            ColIndex += Width
+        if RowIndex < 0:
+            RowIndex += Height
+        Start, End = self._getRowRange(RowIndex)
+        Position = bisect_left(self._Indexes, ColIndex, Start, End)
+        if Position < End and self._Indexes[Position] == ColIndex:
+            Result = self._Values[Position]
+        else:
+            Result = 0
+        return Result
+    
+    def __mul__(self, Other: Union[TReal, Column, Matrix, TSparseMatrix]
+                        ) -> Union[TSparseMatrix, Column, Matrix]:
+        """
+        Magic method implementing the right multiplication of a sparse matrix
+        by a scalar, column vector, dense or sparse matrix. The cost of the
+        product is proportional to the number of the non-zero elements instead
+        of the full size of the matrix.
+        
+        Signature:
+            int OR float OR Column OR Matrix OR SparseMatrix
+                -> 'SparseMatrix OR Column OR Matrix
+        
+        Args:
+            Other: int OR float OR Column OR Matrix OR SparseMatrix; the right
+                operand
+        
+        Returns:
+            'SparseMatrix: instance of the same class, which is the result of
+                the operation with a real number or a sparse matrix
+            Column: result of the matrix x column multiplication
+            Matrix: result of the sparse x dense matrices multiplication, an
+                instance of SquareMatrix class if the result is square
+        
+        Raises:
+            UT_TypeError: the right operand is neither a real number nor an
+                instance of Column, Matrix or SparseMatrix classes
+            UT_ValueError: mismatching dimensions of the operands
+        
+        Version 1.0.0.0
+        """
+        Width = self._Width
+        Height = self._Height
+        if isinstance(Other, (int, float)) and not isinstance(Other, bool):
+            Result = self._scale(Other)
+        elif isinstance(Other, Column):
+            Length = len(Other._Elements)
+            if Length != Width:
+                raise UT_ValueError(Length,
+                            f'== {Width} - column vector size != matrix width',
+                                                                SkipFrames = 1)
+            Result = Column(*self._multiplyRight(Other._Elements))
+        elif isinstance(Other, Matrix):
+            OtherWidth = Other._Width
+            if Other._Height != Width:
+                raise UT_ValueError(Width,
+                    f'== {Other._Height} - left matrix width != right height',
+                                                                SkipFrames = 1)
+            Elements = Other._Elements
+            Columns = [self._multiplyRight(Elements[Index : : OtherWidth])
+                                                for Index in range(OtherWidth)]
+            Elements = [Value for Row in zip(*Columns) for Value in Row]
+            if Height == OtherWidth:
+                Result = SquareMatrix._fromFlat(Elements, OtherWidth, Height)
+            else:
+                Result = Matrix._fromFlat(Elements, OtherWidth, Height)
+        elif isinstance(Other, SparseMatrix):
+            if Other._Height != Width:
+                raise UT_ValueError(Width,
+                    f'== {Other._Height} - left matrix width != right height',
+                                                                SkipFrames = 1)
+            Pointers, Indexes, Values = self._getCSR()
+            OtherPointers, OtherIndexes, OtherValues = Other._getCSR()
+            Rows = []
+            for RowIndex in range(Height):
+                Accumulator = {}
+                for Position in range(Pointers[RowIndex],
+                                                    Pointers[RowIndex + 1]):
+                    Index = Indexes[Position]
+                    Value = Values[Position]
+                    for OtherPosition in range(OtherPointers[Index],
+                                                    OtherPointers[Index + 1]):
+                        ColIndex = OtherIndexes[OtherPosition]
+                        Accumulator[ColIndex] = (Accumulator.get(ColIndex, 0)
+                                        + Value * OtherValues[OtherPosition])
+                Rows.append(Accumulator)
+            Result = self.__class__._fromCSR(*_CompressRows(Rows),
+                                                        Other._Width, Height)
+        else:
+            raise UT_TypeError(Other, (int, float, Column, Matrix,
+                                            SparseMatrix), SkipFrames = 1)
+        return Result
+    
+    def __rmul__(self, Other: Union[TReal, Row, Matrix]
+                                ) -> Union[TSparseMatrix, Row, Matrix]:
+        """
+        Magic method implementing the left multiplication of a sparse matrix
+        by a scalar, row vector or a dense matrix.
+        
+        Signature:
+            int OR float OR Row OR Matrix -> 'SparseMatrix OR Row OR Matrix
+        
+        Args:
+            Other: int OR float OR Row OR Matrix; the left operand
+        
+        Returns:
+            'SparseMatrix: instance of the same class, which is the result of
+                the operation with a real number
+            Row: result of the row x matrix multiplication
+            Matrix: result of the dense x sparse matrices multiplication, an
+                instance of SquareMatrix class if the result is square
+        
+        Raises:
+            UT_TypeError: the left operand is neither a real number nor an
+                instance of Row or Matrix classes
+            UT_ValueError: mismatching dimensions of the operands
+        
+        Version 1.0.0.0
+        """
+        Width = self._Width
+        Height = self._Height
+        if isinstance(Other, (int, float)) and not isinstance(Other, bool):
+            Result = self._scale(Other)
+        elif isinstance(Other, Row):
+            Length = len(Other._Elements)
+            if Length != Height:
+                raise UT_ValueError(Length,
+                            f'== {Height} - row vector size != matrix height',
+                                                                SkipFrames = 1)
+            Result = Row(*self._multiplyLeft(Other._Elements))
+        elif isinstance(Other, Matrix):
+            OtherWidth = Other._Width
+            OtherHeight = Other._Height
+            if OtherWidth != Height:
+                raise UT_ValueError(OtherWidth,
+                            f'== {Height} - left matrix width != right height',
+                                                                SkipFrames = 1)
+            Elements = Other._Elements
+            Elements = [Value for Index in range(OtherHeight)
+                            for Value in self._multiplyLeft(
+                                    Elements[Index * OtherWidth :
+                                                (Index + 1) * OtherWidth])]
+            if OtherHeight == Width:
+                Result = SquareMatrix._fromFlat(Elements, Width, OtherHeight)
+            else:
+                Result = Matrix._fromFlat(Elements, Width, OtherHeight)
+        else:
+            raise UT_TypeError(Other, (int, float, Row, Matrix),
+                                                                SkipFrames = 1)
+        return Result
+    
+    #private instance methods
+    
+    def _setPointers(self, Pointers: Sequence[int]) -> None:
+        """
+        Stores the positions of the rows starts as they are. The sub-classes
+        may re-define the format of the storage.
+        
+        Signature:
+            seq(int >= 0) -> None
+        
+        Version 1.1.0.0
+        """
+        self._Pointers = tuple(Pointers)
+    
+    def _getPointers(self) -> Sequence[int]:
+        """
+        Returns the Height + 1 positions of the rows starts in the sequences
+        of the column indexes and values of the non-zero elements.
+        
+        Signature:
+            None -> seq(int >= 0)
+        
+        Version 1.1.0.0
+        """
+        return self._Pointers
+    
+    def _getRowRange(self, Index: int) -> Tuple[int, int]:
+        """
+        Returns the positions of the first and past the last non-zero elements
+        of the row with the given (non-negative) index.
+        
+        Signature:
+            int >= 0 -> tuple(int >= 0, int >= 0)
+        
+        Version 1.0.0.0
+        """
+        Pointers = self._getPointers()
+        return Pointers[Index], Pointers[Index + 1]
+    
+    def _getCSR(self) -> Tuple[Sequence[int], Sequence[int],
+                                                        Sequence[TReal]]:
+        """
+        Returns the compressed sparse rows representation of the matrix: the
+        row pointers, the column indexes and the values of the non-zero
+        elements.
+        
+        Signature:
+            None -> tuple(seq(int >= 0), seq(int >= 0), seq(int OR float))
+        
+        Version 1.0.0.0
+        """
+        return self._getPointers(), self._Indexes, self._Values
+    
+    def _scale(self, Value: TReal) -> TSparseMatrix:
+        """
+        Multiplies all elements of the matrix by a real number.
+        
+        Signature:
+            int OR float -> 'SparseMatrix
+        
+        Version 1.0.0.0
+        """
+        Pointers, Indexes, Values = self._getCSR()
+        if Value:
+            Values = [Item * Value for Item in Values]
+        else:
+            Pointers = [0] * (self._Height + 1)
+            Indexes = []
+            Values = []
+        return self.__class__._fromCSR(Pointers, Indexes, Values,
+                                                    self._Width, self._Height)
+    
+    def _multiplyRight(self, Vector: Sequence[TReal]) -> List[TReal]:
+        """
+        Calculates the product of the matrix and a column vector represented
+        by a flat sequence of real numbers of the length equal to the matrix
+        width. Designed for the internal use by the arithmetics and the
+        iterative solvers; it does not any data sanity checks!
+        
+        Signature:
+            seq(int OR float) -> list(int OR float)
+        
+        Version 1.0.0.0
+        """
+        Pointers, Indexes, Values = self._getCSR()
+        Getter = Vector.__getitem__
+        Result = []
+        Start = 0
+        for End in Pointers[1 : ]:
+            Result.append(sum(map(mul, Values[Start : End],
+                                        map(Getter, Indexes[Start : End]))))
+            Start = End
+        return Result
+    
+    def _multiplyLeft(self, Vector: Sequence[TReal]) -> List[TReal]:
+        """
+        Calculates the product of a row vector represented by a flat sequence
+        of real numbers of the length equal to the matrix height and the
+        matrix. Designed for the internal use by the arithmetics; it does not
+        any data sanity checks!
+        
+        Signature:
+            seq(int OR float) -> list(int OR float)
+        
+        Version 1.0.0.0
+        """
+        Pointers, Indexes, Values = self._getCSR()
+        Result = [0] * self._Width
+        for RowIndex, Item in enumerate(Vector):
+            if Item:
+                for Position in range(Pointers[RowIndex],
+                                                    Pointers[RowIndex + 1]):
+                    Result[Indexes[Position]] += Item * Values[Position]
+        return Result
+    
+    #public properties
+    
+    @property
+    def Width(self) -> int:
+        """
+        Read-only property to access the width of the matrix.
+        
+        Signature:
+            None -> int >= 2
+        
+        Version 1.0.0.0
+        """
+        return self._Width
+    
+    @property
+    def Height(self) -> int:
+        """
+        Read-only property to access the height of the matrix.
+        
+        Signature:
+            None -> int >= 2
+        
+        Version 1.0.0.0
+        """
+        return self._Height
+    
+    @property
+    def NonZeros(self) -> int:
+        """
+        Read-only property to access the number of the stored (non-zero)
+        elements of the matrix.
+        
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return len(self._Values)
+    
+    @property
+    def Data(self) -> List[List[TReal]]:
+        """
+        Read-only property to access all elements of the matrix, including the
+        zeroes, as a nested list of lists of real numbers in the rows-first
+        order.
+        
+        Signature:
+            None -> list(list(int OR float))
+        
+        Version 1.0.0.0
+        """
+        Width = self._Width
+        Elements = self.toDense()._Elements
+        return [list(Elements[Index : Index + Width])
+                            for Index in range(0, len(Elements), Width)]
+    
+    #public class methods
+    
+    @classmethod
+    def fromDense(cls, Value: Union[Matrix, TSequenceRealSequence]
+                                                        ) -> TSparseMatrix:
+        """
+        Creates a new sparse matrix from a dense matrix or a nested sequence
+        of real numbers in the rows-first order, storing only its non-zero
+        elements.
+        
+        Signature:
+            Matrix OR seq(seq(int OR float)) -> 'SparseMatrix
+        
+        Args:
+            Value: Matrix OR seq(seq(int OR float)); the dense matrix
+        
+        Returns:
+            'SparseMatrix: a new instance of the class the method is called
+                from
+        
+        Raises:
+            UT_TypeError: the argument is neither an instance of Matrix class
+                nor a nested sequence of real numbers
+            UT_ValueError: the sequence is flat, OR the nested sequence has
+                less than 2 elements, or any of its elements has less than 2
+                elements, or they differ in length
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Value, Array2D):
+            if ((not isinstance(Value, c_abc.Sequence))
+                                                or isinstance(Value, str)):
+                raise UT_TypeError(Value, Matrix, SkipFrames = 1)
+            try:
+                Value = Matrix(Value)
+            except UT_TypeError as err:
+                Error = UT_TypeError(Value, Matrix, SkipFrames = 1)
+                Error.setMessage(err.getMessage())
+                raise Error from None
+            except UT_ValueError as err1:
+                Error = UT_ValueError(Value, 'whatever', SkipFrames = 1)
+                Error.setMessage(err1.getMessage())
+                raise Error from None
+        Width = Value._Width
+        Height = Value._Height
+        Elements = Value._Elements
+        Pointers = [0]
+        Indexes = []
+        Values = []
+        for Offset in range(0, Width * Height, Width):
+            for Index in range(Width):
+                Item = Elements[Offset + Index]
+                if Item:
+                    Indexes.append(Index)
+                    Values.append(Item)
+            Pointers.append(len(Indexes))
+        return cls._fromCSR(Pointers, Indexes, Values, Width, Height)
+    
+    #public instance methods
+    
+    def transpose(self) -> TSparseMatrix:
+        """
+        Method to generate a transposition of the current matrix (new instance
+        of the same class) with the cost proportional to the number of the
+        non-zero elements.
+        
+        Signature:
+            None -> 'SparseMatrix
+        
+        Version 1.0.0.0
+        """
+        Width = self._Width
+        Height = self._Height
+        Pointers, Indexes, Values = self._getCSR()
+        NewPointers = [0] * (Width + 1)
+        for Index in Indexes:
+            NewPointers[Index + 1] += 1
+        for Index in range(Width):
+            NewPointers[Index + 1] += NewPointers[Index]
+        Positions = NewPointers[ : -1]
+        NewIndexes = [0] * len(Indexes)
+        NewValues = [0] * len(Indexes)
+        for RowIndex in range(Height):
+            for Position in range(Pointers[RowIndex], Pointers[RowIndex + 1]):
+                Index = Indexes[Position]
+                NewPosition = Positions[Index]
+                NewIndexes[NewPosition] = RowIndex
+                NewValues[NewPosition] = Values[Position]
+                Positions[Index] += 1
+        return self.__class__._fromCSR(NewPointers, NewIndexes, NewValues,
+                                                                Height, Width)
+    
+    def toDense(self) -> Matrix:
+        """
+        Converts the sparse matrix into a dense one, with an instance of
+        SquareMatrix class returned if the width equals the height.
+        
+        Signature:
+            None -> Matrix OR SquareMatrix
+        
+        Version 1.0.0.0
+        """
+        Width = self._Width
+        Height = self._Height
+        Pointers, Indexes, Values = self._getCSR()
+        Elements = [0] * (Width * Height)
+        for RowIndex in range(Height):
+            Offset = RowIndex * Width
+            for Position in range(Pointers[RowIndex], Pointers[RowIndex + 1]):
+                Elements[Offset + Indexes[Position]] = Values[Position]
+        if Width == Height:
+            Result = SquareMatrix._fromFlat(Elements, Width, Height)
+        else:
+            Result = Matrix._fromFlat(Elements, Width, Height)
+        return Result
+    
+    def toCSR(self) -> TCSRMatrix:
+        """
+        Converts the matrix into the compressed sparse rows format.
+        
+        Signature:
+            None -> CSRMatrix
+        
+        Version 1.0.0.0
+        """
+        return CSRMatrix._fromCSR(*self._getCSR(), self._Width, self._Height)
+    
+    def toCOO(self) -> TCOOMatrix:
+        """
+        Converts the matrix into the coordinate (triplets) format.
+        
+        Signature:
+            None -> COOMatrix
+        
+        Version 1.0.0.0
+        """
+        return COOMatrix._fromCSR(*self._getCSR(), self._Width, self._Height)
+    
+    def getEntries(self) -> List[Tuple[int, int, TReal]]:
+        """
+        Returns all stored (non-zero) elements of the matrix as the triplets
+        (column index, row index, value) in the rows-first order, which can be
+        used to instantiate a new sparse matrix.
+        
+        Signature:
+            None -> list(tuple(int >= 0, int >= 0, int OR float))
+        
+        Version 1.0.0.0
+        """
+        Pointers, Indexes, Values = self._getCSR()
+        return [(Indexes[Position], RowIndex, Values[Position])
+                        for RowIndex in range(self._Height)
+                            for Position in range(Pointers[RowIndex],
+                                                    Pointers[RowIndex + 1])]
+    
+    def factorize(self) -> TSparseLUFactorization:
+        """
+        Calculates the sparse LUP-decomposition of a square matrix once and
+        wraps it into a re-usable factorization object.
+        
+        Signature:
+            None -> SparseLUFactorization
+        
+        Raises:
+            UT_ValueError: the matrix is not square
+        
+        Version 1.0.0.0
+        """
+        if self._Width != self._Height:
+            raise UT_ValueError(self._Width,
+                            f'== {self._Height} - width of a square matrix',
+                                                                SkipFrames = 1)
+        return SparseLUFactorization(self)
+
+class CSRMatrix(SparseMatrix):
+    """
+    Sparse matrix in the compressed sparse rows (CSR) format: the column
+    indexes and the values of the non-zero elements in the rows-first order,
+    and the positions of the first element of each row in these sequences.
+    Provides direct (O(1)) access to the rows, thus it is the preferred
+    format for the arithmetics and the solvers. The storage is inherited from
+    the SparseMatrix class as it is, this class explicitly names the format.
+    
+    See the documentation of the SparseMatrix class for the instantiation,
+    properties and methods.
+    
+    Version 1.1.0.0
+    """
+    
+    __slots__ = ()
+
+class COOMatrix(SparseMatrix):
+    """
+    Sparse matrix in the coordinate (COO) format: the explicit triplets of the
+    column index, row index and value of each non-zero element, kept sorted in
+    the rows-first order. The simplest exchange format, which is converted
+    into the row pointers form on the fly by the arithmetics and the solvers.
+    
+    See the documentation of the SparseMatrix class for the instantiation,
+    properties and methods.
+    
+    Version 1.0.0.0
+    """
+    
+    __slots__ = ('_Rows', )
+    
+    #private instance methods
+    
+    def _setPointers(self, Pointers: Sequence[int]) -> None:
+        """
+        Expands the positions of the rows starts into the explicit row index
+        of each non-zero element.
+        
+        Signature:
+            seq(int >= 0) -> None
+        
+        Version 1.0.0.0
+        """
+        self._Rows = tuple(RowIndex for RowIndex in range(self._Height)
+                        for _ in range(Pointers[RowIndex],
+                                                    Pointers[RowIndex + 1]))
+    
+    def _getPointers(self) -> Sequence[int]:
+        """
+        Calculates the Height + 1 positions of the rows starts by counting the
+        elements in each row.
+        
+        Signature:
+            None -> list(int >= 0)
+        
+        Version 1.0.0.0
+        """
+        Height = self._Height
+        Result = [0] * (Height + 1)
+        for RowIndex in self._Rows:
+            Result[RowIndex + 1] += 1
+        for Index in range(Height):
+            Result[Index + 1] += Result[Index]
+        return Result
+    
+    def _getRowRange(self, Index: int) -> Tuple[int, int]:
+        """
+        Returns the positions of the first and past the last non-zero elements
+        of the row with the given (non-negative) index using the binary search
+        in the sorted row indexes.
+        
+        Signature:
+            int >= 0 -> tuple(int >= 0, int >= 0)
+        
+        Version 1.0.0.0
+        """
+        return (bisect_left(self._Rows, Index),
+                                            bisect_left(self._Rows, Index + 1))
+
+class BandedMatrix(CSRMatrix):
+    """
+    Sparse matrix with all non-zero elements concentrated within a band
+    around the main diagonal, as produced by the spline fitting, the finite
+    differences and the interpolation schemes. The elements are stored in the
+    compressed sparse rows format (see CSRMatrix), and the lower and upper
+    bandwidths, i.e. the numbers of the sub-diagonals below and of the
+    super-diagonals above the main diagonal containing non-zero elements, are
+    detected automatically at the instantiation, including the results of the
+    arithmetics. The factorization of a square banded matrix works only within
+    the band, and costs O(N * L * (L + U)) operations instead of O(N^3), where
+    L and U are the lower and upper bandwidths.
+    
+    Besides the instantiation signatures of the SparseMatrix class, can be
+    created from the list of its diagonals, see the class method
+    fromDiagonals().
+    
+    Properties:
+        Width: (read-only) int >= 2
+        Height: (read-only) int >= 2
+        NonZeros: (read-only) int >= 0
+        Data: (read-only) list(list(int OR float))
+        LowerWidth: (read-only) int >= 0
+        UpperWidth: (read-only) int >= 0
+    
+    Class methods:
+        fromDense(Value):
+            Matrix OR seq(seq(int OR float)) -> BandedMatrix
+        fromDiagonals(Diagonals, *, Lower):
+            seq(seq(int OR float))/, *, int >= 0/ -> BandedMatrix
+    
+    Methods:
+        transpose():
+            None -> BandedMatrix
+        toDense():
+            None -> Matrix OR SquareMatrix
+        toCSR():
+            None -> CSRMatrix
+        toCOO():
+            None -> COOMatrix
+        getEntries():
+            None -> list(tuple(int >= 0, int >= 0, int OR float))
+        factorize():
+            None -> BandedLUFactorization
+    
+    Version 1.0.0.0
+    """
+    
+    __slots__ = ('_LowerWidth', '_UpperWidth')
+    
+    #private instance methods
+    
+    def _setPointers(self, Pointers: Sequence[int]) -> None:
+        """
+        Stores the positions of the rows starts as they are, and detects the
+        lower and upper bandwidths from the first and the last column index
+        in each row.
+        
+        Signature:
+            seq(int >= 0) -> None
+        
+        Version 1.0.0.0
+        """
+        super()._setPointers(Pointers)
+        Indexes = self._Indexes
+        Lower = 0
+        Upper = 0
+        for RowIndex in range(self._Height):
+            Start = Pointers[RowIndex]
+            End = Pointers[RowIndex + 1]
+            if End > Start:
+                Lower = max(Lower, RowIndex - Indexes[Start])
+                Upper = max(Upper, Indexes[End - 1] - RowIndex)
+        self._LowerWidth = Lower
+        self._UpperWidth = Upper
+    
+    #public properties
+    
+    @property
+    def LowerWidth(self) -> int:
+        """
+        Read-only property to access the lower bandwidth of the matrix, i.e.
+        the number of the sub-diagonals containing non-zero elements.
+        
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._LowerWidth
+    
+    @property
+    def UpperWidth(self) -> int:
+        """
+        Read-only property to access the upper bandwidth of the matrix, i.e.
+        the number of the super-diagonals containing non-zero elements.
+        
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._UpperWidth
+    
+    #public class methods
+    
+    @classmethod
+    def fromDiagonals(cls, Diagonals: TSequenceRealSequence, *,
+                                                Lower: int) -> TBandedMatrix:
+        """
+        Creates a new square banded matrix from its diagonals, listed from the
+        lowest sub-diagonal to the highest super-diagonal. The size of the
+        matrix is defined by the length of the main diagonal, and each of the
+        other diagonals must be shorter by its distance from the main one.
+        E.g. a tridiagonal matrix of the size N is created from the lists of
+        N - 1 sub-diagonal, N diagonal and N - 1 super-diagonal elements with
+        Lower = 1.
+        
+        Signature:
+            seq(seq(int OR float))/, *, int >= 0/ -> BandedMatrix
+        
+        Args:
+            Diagonals: seq(seq(int OR float)); the diagonals of the matrix
+            Lower: (keyword) int >= 0; the number of the sub-diagonals, i.e.
+                the index of the main diagonal in the passed sequence
+        
+        Returns:
+            BandedMatrix: a new instance of the class the method is called
+                from
+        
+        Raises:
+            UT_TypeError: the mandatory argument is not a sequence of
+                sequences of real numbers, OR the keyword argument Lower is not
+                an integer number
+            UT_ValueError: Lower is negative or not less than the number of
+                the diagonals, OR the main diagonal has less than 2 elements,
+                OR the length of any other diagonal is inconsistent with it
+        
+        Version 1.0.0.0
+        """
+        _CheckIfSequenceRealSequence(Diagonals)
+        if (not isinstance(Lower, int)) or isinstance(Lower, bool):
+            Error = UT_TypeError(Lower, int, SkipFrames = 1)
+            Error.appendMessage('- Lower argument')
+            raise Error
+        if (Lower < 0) or (Lower >= len(Diagonals)):
+            raise UT_ValueError(Lower,
+                        f'in range [0, {len(Diagonals) - 1}] - Lower argument',
+                                                                SkipFrames = 1)
+        Size = len(Diagonals[Lower])
+        if Size < 2:
+            raise UT_ValueError(Size, '>= 2 - main diagonal length',
+                                                                SkipFrames = 1)
+        Rows = [dict() for _ in range(Size)]
+        for Index, Diagonal in enumerate(Diagonals):
+            Offset = Index - Lower
+            if len(Diagonal) != Size - abs(Offset):
+                raise UT_ValueError(len(Diagonal),
+                        f'== {Size - abs(Offset)} - diagonal {Offset} length',
+                                                                SkipFrames = 1)
+            Start = max(0, - Offset)
+            for RowIndex, Value in enumerate(Diagonal, Start):
+                Rows[RowIndex][RowIndex + Offset] = Value
+        Pointers, Indexes, Values = _CompressRows(Rows)
+        return cls._fromCSR(Pointers, Indexes, Values, Size, Size)
+    
+    #public instance methods
+    
+    def factorize(self) -> TBandedLUFactorization:
+        """
+        Calculates the banded LUP-decomposition of a square matrix once and
+        wraps it into a re-usable factorization object.
+        
+        Signature:
+            None -> BandedLUFactorization
+        
+        Raises:
+            UT_ValueError: the matrix is not square
+        
+        Version 1.0.0.0
+        """
+        if self._Width != self._Height:
+            raise UT_ValueError(self._Width,
+                            f'== {self._Height} - width of a square matrix',
+                                                                SkipFrames = 1)
+        return BandedLUFactorization(self)
+
+class SparseLUFactorization(LUFactorization):
+    """
+    Re-usable LUP-decomposition of a square sparse matrix, which solves the
+    systems of linear equations A * x = b with the same matrix A of the bound
+    coefficients and the different vectors b of the free coefficients.
+    
+    The elimination is performed on the rows stored as dictionaries of the
+    non-zero elements with the threshold partial pivoting: among the rows with
+    the absolute value of the element in the pivot column not less than
+    SPARSE_PIVOT_THRESHOLD times the maximum one, the row with the least number
+    of the non-zero elements is chosen, which limits the fill-in. The lower-
+    and upper-triangular factors are kept as the sparse rows, thus both the
+    memory and the cost of a solution are proportional to the number of the
+    non-zero elements of the factors instead of N^2. For the banded matrices
+    the fill-in does not leave the band.
+    
+    Is supposed to be created via the method factorize() of the sparse matrix
+    classes, but can be also instantiated directly with an instance of a
+    square sparse matrix as the only argument.
+    
+    The instances of this class are immutable objects.
+    
+    Properties:
+        Size: (read-only) int >= 2
+        Determinant: (read-only) int OR float
+    
+    Methods:
+        solve(FreeCoeffs):
+            Column OR seq(int OR float) -> list(int OR float) OR None
+        solveMany(FreeCoeffs):
+            seq(Column OR seq(int OR float))
+                -> list(list(int OR float)) OR None
+        solveMatrix(FreeCoeffs):
+            Matrix -> Matrix OR None
+    
+    Version 1.1.0.0
+    """
+    
+    __slots__ = ('_Lower', '_Upper')
+    
+    #special methods
+    
+    def __init__(self, Matrix: SparseMatrix) -> None:
+        """
+        Initialization method. Calculates and stores the sparse factors as well
+        as the rows permutation.
+        
+        Signature:
+            SparseMatrix -> None
+        
+        Args:
+            Matrix: SparseMatrix; the square matrix of the bound coefficients
+        
+        Raises:
+            UT_TypeError: the argument is not an instance of SparseMatrix class
+            UT_ValueError: the matrix is not square
+        
+        Version 1.1.0.0
+        """
+        if not isinstance(Matrix, SparseMatrix):
+            raise UT_TypeError(Matrix, SparseMatrix, SkipFrames = 1)
+        Size = Matrix._Height
+        if Matrix._Width != Size:
+            raise UT_ValueError(Matrix._Width,
+                                f'== {Size} - width of a square matrix',
+                                                                SkipFrames = 1)
+        Pointers, Indexes, Values = Matrix._getCSR()
+        Rows = [dict(zip(Indexes[Pointers[Index] : Pointers[Index + 1]],
+                            Values[Pointers[Index] : Pointers[Index + 1]]))
+                                                    for Index in range(Size)]
+        Multipliers = [dict() for _ in range(Size)]
+        ColumnRows = [set() for _ in range(Size)]
+        for RowIndex, Row in enumerate(Rows):
+            for Index in Row:
+                ColumnRows[Index].add(RowIndex)
+        Order = []
+        Determinant = 1
+        for Step in range(Size):
+            Candidates = ColumnRows[Step]
+            Maximum = max((abs(Rows[RowIndex][Step])
+                                    for RowIndex in Candidates), default = 0)
+            if not Maximum:
+                Determinant = 0
+                break
+            Threshold = SPARSE_PIVOT_THRESHOLD * Maximum
+            Pivot = min((RowIndex for RowIndex in Candidates
+                                if abs(Rows[RowIndex][Step]) >= Threshold),
+                            key = lambda RowIndex: (len(Rows[RowIndex]),
+                                        - abs(Rows[RowIndex][Step]), RowIndex))
+            PivotRow = Rows[Pivot]
+            for Index in PivotRow:
+                ColumnRows[Index].discard(Pivot)
+            Order.append(Pivot)
+            Diagonal = PivotRow[Step]
+            Determinant *= Diagonal
+            Updates = [(Index, Value) for Index, Value in PivotRow.items()
+                                                            if Index > Step]
+            for RowIndex in list(Candidates):
+                Row = Rows[RowIndex]
+                Factor = Row.pop(Step) / Diagonal
+                Multipliers[RowIndex][Step] = Factor
+                for Index, Value in Updates:
+                    if Index in Row:
+                        Row[Index] -= Factor * Value
+                    else:
+                        Row[Index] = - Factor * Value
+                        ColumnRows[Index].add(RowIndex)
+            Candidates.clear()
+        self._Size = Size
+        self._Packed = None
+        self._ColsPerm = tuple(range(Size))
+        if len(Order) == Size:
+            self._RowsOrder = tuple(Order)
+            Lower = []
+            Upper = []
+            for Step, RowIndex in enumerate(Order):
+                Row = Multipliers[RowIndex]
+                Columns = sorted(Row)
+                Lower.append((tuple(Columns),
+                                    _PackElements([Row[Index]
+                                                    for Index in Columns])))
+                Row = Rows[RowIndex]
+                Columns = sorted(Index for Index in Row if Index > Step)
+                Upper.append((tuple(Columns),
+                                    _PackElements([Row[Index]
+                                                    for Index in Columns]),
+                                                                Row[Step]))
+            self._Lower = tuple(Lower)
+            self._Upper = tuple(Upper)
+            Determinant *= _GetPermutationSign(Order)
+        else:
+            self._RowsOrder = tuple(range(Size))
+            self._Lower = None
+            self._Upper = None
+            Determinant = 0
+        self._Determinant = Determinant
+    
+    #private instance methods
+    
+    def _isSingular(self) -> bool:
+        """
+        Checks if the factorized matrix is singular, i.e. a zero pivot has been
+        met during the elimination. Unlike the check of the determinant, it is
+        not affected by its underflow for the large matrices.
+        
+        Signature:
+            None -> bool
+        
+        Version 1.0.0.0
+        """
+        return self._Lower is None
+    
+    def _substituteMany(self, Vectors: List[List[TReal]]
+                                                    ) -> List[List[TReal]]:
+        """
+        Performs the sparse forward and back substitution for any number of
+        the vectors of the free coefficients, which are re-arranged according
+        to the rows permutation. Supposed to be called only for a non-singular
+        matrix.
+        
+        Signature:
+            list(list(int OR float)) -> list(list(int OR float))
+        
+        Version 1.0.0.0
+        """
+        Size = self._Size
+        Order = self._RowsOrder
+        Result = []
+        for Free in Vectors:
+            Solution = [Free[Index] for Index in Order]
+            Getter = Solution.__getitem__
+            for Index, (Columns, Values) in enumerate(self._Lower):
+                if Columns:
+                    Solution[Index] -= sum(map(mul, Values,
+                                                        map(Getter, Columns)))
+            for Index in range(Size - 1, -1, -1):
+                Columns, Values, Diagonal = self._Upper[Index]
+                Solution[Index] = (Solution[Index] - sum(map(mul, Values,
+                                        map(Getter, Columns)))) / Diagonal
+            Result.append(Solution)
+        return Result
+
+class BandedLUFactorization(LUFactorization):
+    """
+    Re-usable LUP-decomposition of a square banded matrix, which solves the
+    systems of linear equations A * x = b with the same matrix A of the bound
+    coefficients and the different vectors b of the free coefficients.
+    
+    The elimination works only within the band with L sub-diagonals and U
+    super-diagonals, thus the factorization costs O(N * L * (L + U)) and each
+    solution - O(N * (L + U)) operations. For a diagonally dominant matrix the
+    pivoting is skipped, and the factors keep the band of the matrix itself,
+    which for a tridiagonal matrix is exactly the Thomas algorithm. Otherwise,
+    or if a zero pivot is met without pivoting, the partial (rows) pivoting is
+    used, with the upper-triangular factor gaining up to L extra
+    super-diagonals.
+    
+    Is supposed to be created via the method factorize() of the BandedMatrix
+    class, but can be also instantiated directly with an instance of a square
+    banded matrix as the only argument.
+    
+    The instances of this class are immutable objects.
+    
+    Properties:
+        Size: (read-only) int >= 2
+        Determinant: (read-only) int OR float
+    
+    Methods:
+        solve(FreeCoeffs):
+            Column OR seq(int OR float) -> list(int OR float) OR None
+        solveMany(FreeCoeffs):
+            seq(Column OR seq(int OR float))
+                -> list(list(int OR float)) OR None
+        solveMatrix(FreeCoeffs):
+            Matrix -> Matrix OR None
+    
+    Version 1.0.0.0
+    """
+    
+    __slots__ = ('_Swaps', '_Lower', '_Upper')
+    
+    #special methods
+    
+    def __init__(self, Matrix: BandedMatrix) -> None:
+        """
+        Initialization method. Calculates and stores the banded factors as well
+        as the rows interchanges.
+        
+        Signature:
+            BandedMatrix -> None
+        
+        Args:
+            Matrix: BandedMatrix; the square matrix of the bound coefficients
+        
+        Raises:
+            UT_TypeError: the argument is not an instance of BandedMatrix class
+            UT_ValueError: the matrix is not square
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Matrix, BandedMatrix):
+            raise UT_TypeError(Matrix, BandedMatrix, SkipFrames = 1)
+        Size = Matrix._Height
+        if Matrix._Width != Size:
+            raise UT_ValueError(Matrix._Width,
+                                f'== {Size} - width of a square matrix',
+                                                                SkipFrames = 1)
+        Lower = Matrix._LowerWidth
+        Upper = Matrix._UpperWidth
+        Pointers, Indexes, Values = Matrix._getCSR()
+        Rows = []
+        isDominant = True
+        for RowIndex in range(Size):
+            Start = max(0, RowIndex - Lower)
+            Row = [0] * (min(Size - 1, RowIndex + Upper) - Start + 1)
+            for Position in range(Pointers[RowIndex], Pointers[RowIndex + 1]):
+                Row[Indexes[Position] - Start] = Values[Position]
+            if isDominant:
+                isDominant = (2 * abs(Row[RowIndex - Start])
+                                                    >= sum(map(abs, Row)))
+            Rows.append(Row)
+        if isDominant:
+            Swaps, Multipliers, Factors, Determinant = _DecomposeBanded(
+                            [list(Row) for Row in Rows], Size, Lower, False)
+        if (not isDominant) or (len(Factors) < Size):
+            Swaps, Multipliers, Factors, Determinant = _DecomposeBanded(
+                                                    Rows, Size, Lower, True)
+        self._Size = Size
+        self._Packed = None
+        self._ColsPerm = tuple(range(Size))
+        if len(Factors) == Size:
+            Order = list(range(Size))
+            for Step, Pivot in enumerate(Swaps):
+                Order[Step], Order[Pivot] = Order[Pivot], Order[Step]
+            self._RowsOrder = tuple(Order)
+            self._Swaps = tuple(Swaps)
+            self._Lower = tuple(map(tuple, Multipliers))
+            self._Upper = tuple((Diagonal, tuple(Tail))
+                                                for Diagonal, Tail in Factors)
+        else:
+            self._RowsOrder = tuple(range(Size))
+            self._Swaps = None
+            self._Lower = None
+            self._Upper = None
+            Determinant = 0
+        self._Determinant = Determinant
+    
+    #private instance methods
+    
+    def _isSingular(self) -> bool:
+        """
+        Checks if the factorized matrix is singular, i.e. a zero pivot has been
+        met during the elimination. Unlike the check of the determinant, it is
+        not affected by its underflow for the large matrices.
+        
+        Signature:
+            None -> bool
+        
+        Version 1.0.0.0
+        """
+        return self._Upper is None
+    
+    def _substituteMany(self, Vectors: List[List[TReal]]
+                                                    ) -> List[List[TReal]]:
+        """
+        Performs the banded forward substitution, interleaved with the rows
+        interchanges, and the banded back substitution for any number of the
+        vectors of the free coefficients. Supposed to be called only for a
+        non-singular matrix.
+        
+        Signature:
+            list(list(int OR float)) -> list(list(int OR float))
+        
+        Version 1.0.0.0
+        """
+        Size = self._Size
+        Result = []
+        for Free in Vectors:
+            Solution = list(Free)
+            for Step, (Pivot, Factors) in enumerate(zip(self._Swaps,
+                                                                self._Lower)):
+                if Pivot != Step:
+                    Solution[Step], Solution[Pivot] = (Solution[Pivot],
+                                                            Solution[Step])
+                Value = Solution[Step]
+                if Value and Factors:
+                    End = Step + 1 + len(Factors)
+                    Solution[Step + 1 : End] = [Item - Factor * Value
+                                for Item, Factor in zip(
+                                        Solution[Step + 1 : End], Factors)]
+            for Step in range(Size - 1, -1, -1):
+                Diagonal, Tail = self._Upper[Step]
+                Solution[Step] = (Solution[Step] - sum(map(mul, Tail,
+                            Solution[Step + 1 : Step + 1 + len(Tail)]))
+                                                                ) / Diagonal
+            Result.append(Solution)
+        return Result
+
+#Dynamic patching of the Column class, instance method __mul__()
+
+def _Column__mul__(self: Column,
+                            Other: Union[Row, TReal]) -> Union[Column, Matrix]:
+    """
+    Special helper function to patch the right multiplication of a Column vector
+    hook magical method.
+    
+    Signature:
+        Column, Row OR int OR float -> Column OR Matrix
+    
+    Args:
+        self: Column; instance of Column class as the left operand
+        Other: Row OR int OR float; an instance of the row vector class or a
+            real number as the right operand
+    
+    Returns:
+        Column: instance of the Column class, which is the result of the
+            operation with the real number right operand
+        Matrix: result of the column x row multiplication
+    
+    Raises:
+        UT_TypeError: the second operand is not an instance of the Row vector
+            vector class nor a real number
+        
+    Version 1.0.0.0
+    """
+    Result = None
+    if isinstance(Other, (int, float)):
+        Elements = [Item * Other for Item in self._Elements]
+        Result = self.__class__(*Elements)
+    elif isinstance(Other, Row):
+        Elements = [[Item * Element for Element in Other._Elements]
+                                                    for Item in self._Elements]
+        Result = Matrix(Elements)
+    else:
+        raise UT_TypeError(Other, (int, float), SkipFrames = 1)
+    return Result
+
+#Dynamic patching of the Column class, instance method transpose()
+
+def _Column_transpose(self: Column) -> Row:
+    """
+    Special helper function to patch the transpose() method of the Column class.
+        
+    Signature:
+        Column -> Row
+    
+    Args:
+        self: Column; an instance of the class.
+    
+    Version 1.0.0.0
+    """
+    return Row(*(self._Elements))
+
+#Dynamic patching of the Matrix class, instance method __mul__()
+
+def _Matrix__mul__(self: Matrix,
+                Other: Union[Matrix, Column, TReal]) -> Union[Column, Matrix]:
+    """
+    Special helper function to patch the right multiplication of a Matrix hook
+    magical method.
+    
+    Signature:
+        'Matrix, 'Matrix OR Column OR int OR float -> Column OR 'Matrix
+    
+    Args:
+        self: 'Matrix; instance of Matrix (sub-) class as the left operand
+        Other: 'Matrix OR Column OR int OR float; an instance of the Matrix
+            (sub-) class or an instance of Column vector class or a real number
+            as the right operand
+    
+    Returns:
+        Column: instance of the Column class, which is the result of the
+            operation with the Column right operand
+        'Matrix: result of the matrix x matrix or matrix x scalar multiplication
+            with an instance of SquareMatrix class returned if the width of the
+            resulting (generic) matrix equal its height
+    
+    Raises:
+        UT_TypeError: the second operand is not an instance of the Column vector
+            vector class nor a real number nor an instance of Matrix (sub-)
+            class
+        UT_ValueError: for two matrices left operand width is not equal to
+                the right operand height, OR the length of the column is not
+                equal to the width of the matrix
+        
+    Version 1.3.0.0
+    """
+    Result = None
+    if isinstance(Other, (int, float)):
+        Elements = [Item * Other for Item in self._Elements]
+        Result = self.__class__._fromFlat(Elements, self._Width, self._Height)
     elif isinstance(Other, Column):
-        Height = len(self._Elements)
-        Width = len(self._Elements[0])
+        Width = self._Width
         Length = len(Other._Elements)
         if Length != Width:
             raise UT_ValueError(Length,
                             f'== {Width} - column vector size != matrix width',
                                                                 SkipFrames = 1)
-        Elements = [sum(Item * Other._Elements[Index]
-                        for Index, Item in enumerate(self._Elements[RowIndex]))
-                                                for RowIndex in range(Height)]
+        ColItems = Other._Elements
+        Elements = [sum(map(mul, RowItems, ColItems))
+                                            for RowItems in self._getRows()]
         Result = Column(*Elements)
     elif isinstance(Other, Matrix):
-        SelfWidth = len(self._Elements[0])
-        SelfHeight = len(self._Elements)
-        Width = len(Other._Elements[0])
-        Height = len(Other._Elements)
+        SelfWidth = self._Width
+        SelfHeight = self._Height
+        Width = Other._Width
+        Height = Other._Height
         if SelfWidth != Height:
             raise UT_ValueError(SelfWidth,
                             f'== {Height} - left matrix width != right height',
                                                                 SkipFrames = 1)
-        Elements = [[sum(
-                self._Elements[RowIndex][Index]*Other._Elements[Index][ColIndex]
-                                    for Index in range(SelfWidth))
-                                        for ColIndex in range(Width)]
-                                            for RowIndex in range(SelfHeight)]
+        Elements = _Multiply(self._Elements, Other._Elements, SelfHeight,
+                                                            SelfWidth, Width)
         if SelfHeight == Width:
-            Result = SquareMatrix(Elements)
+            Result = SquareMatrix._fromFlat(Elements, Width, SelfHeight)
         else:
-            Result = Matrix(Elements)
+            Result = Matrix._fromFlat(Elements, Width, SelfHeight)
+    elif isinstance(Other, SparseMatrix):
+        Result = NotImplemented #responsibility of the SparseMatrix class
     else:
         raise UT_TypeError(Other, (int, float, Column, Matrix), SkipFrames = 1)
     return Result